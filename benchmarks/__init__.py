@@ -0,0 +1,11 @@
+"""
+Micro-benchmarks of every layer of the user stack.
+
+The suites time the user records and their conversions, the `route` of every controller, every
+method of `UserRepository` on in-memory SQLite, and every endpoint through `TestClient`:
+
+    python -m benchmarks --output before.json
+    python -m benchmarks --output after.json --baseline before.json --threshold 0.25
+
+A run compared with a baseline exits with status 1 when a benchmark got slower than the threshold.
+"""
@@ -0,0 +1,96 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from benchmarks import environment
+from benchmarks.regression import DEFAULT_THRESHOLD, STATISTICS, find_regressions
+from benchmarks.suites import SUITES
+from benchmarks.timer import BenchmarkResult
+
+
+def parse_arguments(arguments: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse the command line of the benchmark suite.
+
+    Args:
+        arguments (List[str], optional): The arguments, read from `sys.argv` when omitted.
+
+    Returns:
+        (argparse.Namespace): The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Benchmark every layer of the user stack."
+    )
+    parser.add_argument("suites", nargs="*", help=f"The suites to run among {', '.join(SUITES)}, all by default.")
+    parser.add_argument("-k", "--filter", help="Only run the benchmarks whose name contains this text.")
+    parser.add_argument("-o", "--output", help="Write the results to this JSON file.")
+    parser.add_argument("-b", "--baseline", help="Compare the results with this JSON file of an earlier run.")
+    parser.add_argument(
+        "-t", "--threshold", type=float, default=DEFAULT_THRESHOLD, help="The slowdown tolerated, 0.25 for 25%%."
+    )
+    parser.add_argument("--statistic", choices=STATISTICS, default="min", help="The statistic compared.")
+    parser.add_argument("--rounds", type=int, default=7, help="The number of timed rounds of each benchmark.")
+    parser.add_argument("--round-time", type=float, default=0.05, help="The targeted duration of a round, in seconds.")
+    options = parser.parse_args(arguments)
+    unknown = [suite for suite in options.suites if suite not in SUITES]
+    if unknown:
+        parser.error(f"unknown suites {', '.join(unknown)}, expected some of {', '.join(SUITES)}")
+    options.suites = options.suites or list(SUITES)
+    return options
+
+
+def print_result(result: BenchmarkResult) -> None:
+    """
+    Print a result on one line, with the bytes allocated per call when they were measured.
+
+    Args:
+        result (BenchmarkResult): The result.
+    """
+    allocated = "" if result.allocated is None else f" {result.allocated:>8.0f} B/call"
+    print(
+        f"{result.name:<55} {result.median * 1e6:>12.2f} us median {result.min * 1e6:>12.2f} us min "
+        f"±{result.stdev / result.mean * 100 if result.mean else 0:>4.1f}% ({result.rounds}x{result.iterations})"
+        f"{allocated}",
+        flush=True,
+    )
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmarks, write their results and check them against a baseline.
+
+    Args:
+        arguments (List[str], optional): The arguments, read from `sys.argv` when omitted.
+
+    Returns:
+        (int): 0 on success, 1 when a benchmark regressed beyond the threshold.
+    """
+    options = parse_arguments(arguments)
+    environment.configure()
+
+    from benchmarks.runner import read_results, run_suites, write_results
+
+    results = run_suites(
+        options.suites,
+        rounds=options.rounds,
+        round_time=options.round_time,
+        name_filter=options.filter,
+        report=print_result,
+    )
+    if options.output:
+        write_results(options.output, results)
+    if not options.baseline:
+        return 0
+    regressions = find_regressions(
+        {name: result.to_dict() for name, result in results.items()},
+        read_results(options.baseline),
+        threshold=options.threshold,
+        statistic=options.statistic,
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+import atexit
+import os
+import shutil
+import tempfile
+
+DEFAULTS = {
+    "PASSWORD_HASH_ALGORITHM": "pbkdf2_sha256",
+    "PASSWORD_HASH_PBKDF2_ITERATIONS": "1000",
+    "PASSWORD_HASH_WORKERS": "0",
+    "DATA_ACCESS_MODE": "sync",
+}
+
+
+def configure() -> None:
+    """
+    Point the application at the benchmark database and make password hashing cheap.
+
+    The application reads its database from `SQLALCHEMY_DATABASE_URL` when its modules are imported,
+    so this must run before anything from `src` is imported. The variable is always overridden, with
+    `BENCHMARK_DATABASE_URL` or a SQLite file in a temporary directory removed at exit, so a run never
+    writes to the database the environment is configured for. Password hashing is a cost of its own,
+    made cheap unless the `PASSWORD_HASH_*` variables are set, so the numbers measure the rest of the stack.
+    """
+    database_url = os.getenv("BENCHMARK_DATABASE_URL")
+    if database_url is None:
+        directory = tempfile.mkdtemp(prefix="benchmarks-")
+        atexit.register(shutil.rmtree, directory, ignore_errors=True)
+        database_url = f"sqlite:///{os.path.join(directory, 'benchmarks.db')}"
+    os.environ["SQLALCHEMY_DATABASE_URL"] = database_url
+    os.environ.pop("SQLALCHEMY_ASYNC_DATABASE_URL", None)
+    for name, value in DEFAULTS.items():
+        os.environ.setdefault(name, value)
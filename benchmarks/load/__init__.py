@@ -0,0 +1,9 @@
+"""
+Load generator of the application.
+
+Run `python -m benchmarks.load` to send a mix of create, get and delete requests to the FastAPI
+application from concurrent workers, and report the requests per second, the p50, p95 and p99
+latencies and the error rate of each route as JSON. The application runs in this process by
+default, called through its ASGI interface; `--uvicorn` serves it with uvicorn in a child process,
+and `--url` targets a server that is already running.
+"""
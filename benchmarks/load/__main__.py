@@ -0,0 +1,131 @@
+import argparse
+import asyncio
+import json
+import sys
+from contextlib import nullcontext
+from typing import List, Optional
+
+from benchmarks import environment
+from benchmarks.load.runner import run_load
+from benchmarks.load.scenario import DEFAULT_MIX, TrafficMix
+
+
+def parse_arguments(arguments: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse the command line of the load generator.
+
+    Args:
+        arguments (List[str], optional): The arguments, read from `sys.argv` when omitted.
+
+    Returns:
+        (argparse.Namespace): The parsed arguments, with the traffic mix parsed as `mix`.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.load", description="Send a mix of requests to the application and report per route."
+    )
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", help="Load the application served at this URL instead of running it in this process.")
+    target.add_argument("--uvicorn", action="store_true", help="Serve the application with uvicorn in a child process.")
+    parser.add_argument("--host", default="127.0.0.1", help="The address uvicorn binds with --uvicorn.")
+    parser.add_argument("--port", type=int, default=8001, help="The port uvicorn binds with --uvicorn.")
+    parser.add_argument("--workers", type=int, default=1, help="The number of uvicorn processes with --uvicorn.")
+    parser.add_argument("-c", "--concurrency", type=int, default=16, help="The number of requests in flight.")
+    parser.add_argument("-d", "--duration", type=float, default=10.0, help="The measured time, in seconds.")
+    parser.add_argument("-w", "--warmup", type=float, default=2.0, help="The unmeasured time first, in seconds.")
+    parser.add_argument(
+        "-m", "--mix", default=DEFAULT_MIX, help=f"The weighted operations to send, {DEFAULT_MIX} by default."
+    )
+    parser.add_argument("--seed-users", type=int, default=100, help="The number of users created before the run.")
+    parser.add_argument("--random-seed", type=int, default=0, help="The seed of the operations drawn.")
+    parser.add_argument("-o", "--output", help="Write the report to this JSON file instead of the standard output.")
+    options = parser.parse_args(arguments)
+    if options.concurrency < 1:
+        parser.error("the concurrency must be at least 1")
+    if options.duration <= 0 or options.warmup < 0:
+        parser.error("the duration must be positive and the warm-up not negative")
+    try:
+        options.mix = TrafficMix.parse(options.mix)
+    except ValueError as exception:
+        parser.error(str(exception))
+    return options
+
+
+def prepare_database() -> None:
+    """
+    Point the application at the benchmark database and create its tables.
+
+    This must run before anything from `src` is imported, see `benchmarks.environment.configure`.
+    """
+    environment.configure()
+
+    from src.infra import models  # noqa: F401, registers the tables
+    from src.infra.db.settings import Base, DBConnectionHandler
+
+    connection = DBConnectionHandler()
+    Base.metadata.create_all(bind=connection.engine)
+    connection.engine.dispose()
+
+
+async def load(options: argparse.Namespace, url: Optional[str]) -> dict:
+    """
+    Open a client of the application and run the load against it.
+
+    Args:
+        options (argparse.Namespace): The parsed arguments.
+        url (str, optional): The base URL of the application, None to run it in this process.
+
+    Returns:
+        (dict): The report of the run.
+    """
+    from benchmarks.load.targets import in_process_client, remote_client
+
+    if url is None:
+        client_context = in_process_client(options.concurrency)
+    else:
+        client_context = remote_client(url, options.concurrency)
+    async with client_context as client:
+        return await run_load(
+            client,
+            options.mix,
+            concurrency=options.concurrency,
+            duration=options.duration,
+            warmup=options.warmup,
+            seed_users=options.seed_users,
+            random_seed=options.random_seed,
+        )
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    """
+    Run the load generator and write its report.
+
+    Args:
+        arguments (List[str], optional): The arguments, read from `sys.argv` when omitted.
+
+    Returns:
+        (int): 0 when every request got its expected status, 1 otherwise.
+    """
+    options = parse_arguments(arguments)
+    if options.url is None:
+        prepare_database()
+
+    from benchmarks.load.targets import uvicorn_server
+
+    server = (
+        uvicorn_server(options.host, options.port, options.workers) if options.uvicorn else nullcontext(options.url)
+    )
+    with server as url:
+        report = asyncio.run(load(options, url))
+    report["settings"]["target"] = "uvicorn" if options.uvicorn else options.url or "in-process"
+
+    text = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+    return 1 if report["total"]["error_rate"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
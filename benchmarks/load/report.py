@@ -0,0 +1,129 @@
+import math
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: Sequence[float], rank: float) -> float:
+    """
+    Get a percentile of sorted values with the nearest-rank method.
+
+    Args:
+        sorted_values (Sequence[float]): The values, in ascending order.
+        rank (float): The percentile, between 0 and 100.
+
+    Returns:
+        (float): The smallest value that at least `rank` percent of the values are lower than or equal to,
+            0 when there are no values.
+    """
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(rank / 100 * len(sorted_values)) - 1)]
+
+
+class RouteStats:
+    """
+    Latencies and outcomes of the requests of one route.
+
+    Attributes:
+        latencies (List[float]): The duration of each request, in seconds.
+        errors (int): The number of requests that failed or got an unexpected status code.
+        status_codes (Counter): The number of responses per status code, `error` for failed requests.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new, empty RouteStats."""
+        self.latencies: List[float] = []
+        self.errors = 0
+        self.status_codes: Counter = Counter()
+
+    def record(self, latency: float, status_code: Optional[int], ok: bool) -> None:
+        """
+        Record a request.
+
+        Args:
+            latency (float): The duration of the request, in seconds.
+            status_code (int, optional): The status code of the response, None when the request failed.
+            ok (bool): Whether the status code is the expected one.
+        """
+        self.latencies.append(latency)
+        self.status_codes["error" if status_code is None else str(status_code)] += 1
+        if not ok:
+            self.errors += 1
+
+    def summary(self, duration: float) -> dict:
+        """
+        Summarize the requests of the route.
+
+        Args:
+            duration (float): The duration of the measurement, in seconds.
+
+        Returns:
+            (dict): The number of requests, the requests per second, the error rate, the latency percentiles in
+                milliseconds and the number of responses per status code, rounded for reading.
+        """
+        latencies = sorted(self.latencies)
+        requests = len(latencies)
+        return {
+            "requests": requests,
+            "requests_per_second": round(requests / duration, 2) if duration else 0.0,
+            "error_rate": round(self.errors / requests, 4) if requests else 0.0,
+            "latency_ms": {
+                **{f"p{rank}": round(percentile(latencies, rank) * 1e3, 3) for rank in PERCENTILES},
+                "mean": round(sum(latencies) / requests * 1e3, 3) if requests else 0.0,
+                "max": round(latencies[-1] * 1e3, 3) if latencies else 0.0,
+            },
+            "status_codes": dict(sorted(self.status_codes.items())),
+        }
+
+
+class LoadReport:
+    """
+    The outcome of a load run, per route and in total.
+
+    Attributes:
+        routes (Dict[str, RouteStats]): The statistics of each route.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new, empty LoadReport."""
+        self.routes: Dict[str, RouteStats] = {}
+
+    def record(self, route: str, latency: float, status_code: Optional[int], ok: bool) -> None:
+        """
+        Record a request.
+
+        Args:
+            route (str): The route requested.
+            latency (float): The duration of the request, in seconds.
+            status_code (int, optional): The status code of the response, None when the request failed.
+            ok (bool): Whether the status code is the expected one.
+        """
+        stats = self.routes.get(route)
+        if stats is None:
+            stats = self.routes[route] = RouteStats()
+        stats.record(latency, status_code, ok)
+
+    def to_dict(self, duration: float, settings: dict) -> dict:
+        """
+        Convert the report to a JSON-compatible dictionary.
+
+        Args:
+            duration (float): The duration of the measurement, in seconds.
+            settings (dict): The settings of the run, reported as they are.
+
+        Returns:
+            (dict): The settings, the duration, the totals and the summary of each route.
+        """
+        total = RouteStats()
+        for stats in self.routes.values():
+            total.latencies.extend(stats.latencies)
+            total.errors += stats.errors
+            total.status_codes.update(stats.status_codes)
+        return {
+            "settings": settings,
+            "duration": round(duration, 3),
+            "total": total.summary(duration),
+            "routes": {route: stats.summary(duration) for route, stats in sorted(self.routes.items())},
+        }
@@ -0,0 +1,72 @@
+import asyncio
+import time
+from random import Random
+
+import httpx
+
+from benchmarks.load.report import LoadReport
+from benchmarks.load.scenario import Scenario, TrafficMix
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    mix: TrafficMix,
+    concurrency: int = 16,
+    duration: float = 10.0,
+    warmup: float = 2.0,
+    seed_users: int = 100,
+    random_seed: int = 0,
+) -> dict:
+    """
+    Send the traffic mix to the application from concurrent workers and report the outcome.
+
+    Each worker sends one request at a time and the next as soon as the response arrives, so
+    `concurrency` is the number of requests in flight. The requests answered during the warm-up are
+    not recorded; the measurement starts after it and lasts `duration` seconds.
+
+    Args:
+        client (httpx.AsyncClient): The client of the application.
+        mix (TrafficMix): The traffic mix.
+        concurrency (int): The number of workers.
+        duration (float): The duration of the measurement, in seconds.
+        warmup (float): The duration of the warm-up, in seconds.
+        seed_users (int): The number of users created before the run for the reads to target.
+        random_seed (int): The seed of the random number generator, so a run can be replayed.
+
+    Returns:
+        (dict): The report of the run, as built by `LoadReport.to_dict`.
+    """
+    scenario = Scenario(client, mix, Random(random_seed))
+    await scenario.seed(seed_users)
+    report = LoadReport()
+    recording = False
+    stopping = False
+
+    async def worker() -> None:
+        while not stopping:
+            started = time.perf_counter()
+            route, status_code, ok = await scenario.step()
+            if recording:
+                report.record(route, time.perf_counter() - started, status_code, ok)
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        await asyncio.sleep(warmup)
+        recording = True
+        started = time.perf_counter()
+        await asyncio.sleep(duration)
+        elapsed = time.perf_counter() - started
+        recording = False
+    finally:
+        stopping = True
+        await asyncio.gather(*workers)
+
+    settings = {
+        "mix": mix.to_dict(),
+        "concurrency": concurrency,
+        "duration": duration,
+        "warmup": warmup,
+        "seed_users": seed_users,
+        "random_seed": random_seed,
+    }
+    return report.to_dict(elapsed, settings)
@@ -0,0 +1,198 @@
+from dataclasses import dataclass
+from itertools import accumulate, count
+from random import Random
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+PASSWORD = "load-test-password"
+DEFAULT_MIX = "create=2,get=7,delete=1"
+
+# The route each operation of the traffic mix requests, and the status code it expects.
+OPERATIONS: Dict[str, Tuple[str, int]] = {
+    "create": ("POST /api/users/", 201),
+    "get": ("GET /api/users/", 200),
+    "delete": ("DELETE /api/users/{user_id}", 200),
+    "list": ("GET /api/users/list", 200),
+    "search": ("GET /api/users/search", 200),
+    "login": ("POST /api/auth/login", 200),
+}
+
+
+@dataclass(frozen=True)
+class TrafficMix:
+    """
+    The weighted operations a load run sends.
+
+    Attributes:
+        operations (Tuple[str, ...]): The names of the operations, keys of `OPERATIONS`.
+        cumulative_weights (Tuple[float, ...]): The running sums of the weights of the operations.
+    """
+
+    operations: Tuple[str, ...]
+    cumulative_weights: Tuple[float, ...]
+
+    @classmethod
+    def parse(cls, text: str) -> "TrafficMix":
+        """
+        Parse a traffic mix written as `operation=weight` pairs, such as `create=2,get=7,delete=1`.
+
+        Args:
+            text (str): The traffic mix.
+
+        Returns:
+            (TrafficMix): The parsed traffic mix.
+
+        Raises:
+            ValueError: If an operation is unknown, a weight is not a positive number, or the mix is empty.
+        """
+        weights: Dict[str, float] = {}
+        for pair in filter(None, (part.strip() for part in text.split(","))):
+            operation, _, weight = pair.partition("=")
+            operation = operation.strip()
+            if operation not in OPERATIONS:
+                raise ValueError(f"Unknown operation {operation!r}, expected one of {', '.join(OPERATIONS)}.")
+            try:
+                weights[operation] = float(weight or 1)
+            except ValueError:
+                raise ValueError(f"The weight of {operation!r} must be a number.") from None
+            if weights[operation] <= 0:
+                raise ValueError(f"The weight of {operation!r} must be positive.")
+        if not weights:
+            raise ValueError("The traffic mix has no operation.")
+        return cls(operations=tuple(weights), cumulative_weights=tuple(accumulate(weights.values())))
+
+    def to_dict(self) -> Dict[str, float]:
+        """
+        Convert the traffic mix to a dictionary.
+
+        Returns:
+            (Dict[str, float]): The weight of each operation.
+        """
+        previous = (0.0, *self.cumulative_weights)
+        return {
+            operation: current - before
+            for operation, before, current in zip(self.operations, previous, self.cumulative_weights)
+        }
+
+    def choose(self, random: Random) -> str:
+        """
+        Draw the next operation.
+
+        Args:
+            random (Random): The random number generator of the run.
+
+        Returns:
+            (str): The name of the operation.
+        """
+        return random.choices(self.operations, cum_weights=self.cumulative_weights)[0]
+
+
+class Scenario:
+    """
+    Sends the operations of a traffic mix, keeping track of the users it created.
+
+    The reads, deletes and logins target the users created by the run, so an operation that needs a
+    user creates one instead when there is none left. The scenario is shared by the workers of a
+    run, which are tasks of one event loop, so it needs no lock.
+
+    Attributes:
+        client (httpx.AsyncClient): The client of the application.
+        mix (TrafficMix): The traffic mix.
+        random (Random): The random number generator of the run.
+        users (List[Tuple[int, str]]): The ID and email of the users that are still in the database.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, mix: TrafficMix, random: Random) -> None:
+        """
+        Initialize a new instance of Scenario.
+
+        Args:
+            client (httpx.AsyncClient): The client of the application.
+            mix (TrafficMix): The traffic mix.
+            random (Random): The random number generator of the run.
+        """
+        self.client = client
+        self.mix = mix
+        self.random = random
+        self.users: List[Tuple[int, str]] = []
+        self._prefix = f"load-{random.getrandbits(32):08x}"
+        self._indexes = count()
+
+    async def seed(self, user_count: int) -> None:
+        """
+        Create users for the reads, deletes and logins to target, with the bulk import.
+
+        Args:
+            user_count (int): The number of users to create.
+
+        Raises:
+            RuntimeError: If the import fails.
+        """
+        if user_count <= 0:
+            return
+        response = await self.client.post("/api/users/bulk", json=[self._new_user() for _ in range(user_count)])
+        if response.status_code != 200:
+            raise RuntimeError(f"Seeding the users failed with {response.status_code}: {response.text}")
+        self.users.extend((created["id"], created["email"]) for created in response.json()["created"])
+
+    async def step(self) -> Tuple[str, Optional[int], bool]:
+        """
+        Send the next operation of the traffic mix.
+
+        Returns:
+            (Tuple[str, Optional[int], bool]): The route requested, the status code of the response (None when
+                the request failed) and whether the status code is the expected one.
+        """
+        operation = self.mix.choose(self.random)
+        if operation in ("get", "delete", "login") and not self.users:
+            operation = "create"
+        route, expected_status = OPERATIONS[operation]
+        try:
+            response = await getattr(self, operation)()
+        except httpx.HTTPError:
+            return route, None, False
+        return route, response.status_code, response.status_code == expected_status
+
+    async def create(self) -> httpx.Response:
+        """Create a new user and remember it."""
+        response = await self.client.post("/api/users/", json=self._new_user())
+        if response.status_code == 201:
+            attributes = response.json()["attributes"]
+            self.users.append((attributes["id"], attributes["email"]))
+        return response
+
+    async def get(self) -> httpx.Response:
+        """Get a user created by the run, by email."""
+        return await self.client.get("/api/users/", params={"email": self.random.choice(self.users)[1]})
+
+    async def delete(self) -> httpx.Response:
+        """Delete a user created by the run, and forget it."""
+        index = self.random.randrange(len(self.users))
+        self.users[index], self.users[-1] = self.users[-1], self.users[index]
+        user_id, _ = self.users.pop()
+        return await self.client.delete(f"/api/users/{user_id}")
+
+    async def list(self) -> httpx.Response:
+        """Get the first page of users."""
+        return await self.client.get("/api/users/list", params={"limit": 50})
+
+    async def search(self) -> httpx.Response:
+        """Search the users created by the run."""
+        return await self.client.get("/api/users/search", params={"q": self._prefix, "limit": 20})
+
+    async def login(self) -> httpx.Response:
+        """Log in as a user created by the run."""
+        return await self.client.post(
+            "/api/auth/login", json={"email": self.random.choice(self.users)[1], "password": PASSWORD}
+        )
+
+    def _new_user(self) -> dict:
+        """
+        Build the body of a user no other request of the run created.
+
+        Returns:
+            (dict): The user to create.
+        """
+        index = next(self._indexes)
+        return {"name": f"Load User {index}", "email": f"{self._prefix}-{index}@example.com", "password": PASSWORD}
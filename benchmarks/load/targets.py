@@ -0,0 +1,135 @@
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator
+
+import httpx
+
+TIMEOUT = 30.0
+
+
+def limits(concurrency: int) -> httpx.Limits:
+    """
+    Size the connection pool of a client for the number of requests in flight.
+
+    Args:
+        concurrency (int): The number of workers of the run.
+
+    Returns:
+        (httpx.Limits): One connection, kept alive, per worker.
+    """
+    return httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+
+@asynccontextmanager
+async def in_process_client(concurrency: int) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Start the application in this process and open a client that calls it through its ASGI interface.
+
+    The lifespan of the application runs as under a server, so its dependency container is built
+    before the first request and shut down after the last one. No socket is involved: the numbers
+    measure the application, without the server and the network.
+
+    Args:
+        concurrency (int): The number of workers of the run.
+
+    Yields:
+        (httpx.AsyncClient): The client of the application.
+    """
+    from src.main.fast_api.configs.server import app
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://load-test",
+            limits=limits(concurrency),
+            timeout=TIMEOUT,
+        ) as client:
+            yield client
+
+
+@asynccontextmanager
+async def remote_client(url: str, concurrency: int) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Open a client of an application served at a URL.
+
+    Args:
+        url (str): The base URL of the application, such as `http://127.0.0.1:8000`.
+        concurrency (int): The number of workers of the run.
+
+    Yields:
+        (httpx.AsyncClient): The client of the application.
+    """
+    async with httpx.AsyncClient(base_url=url, limits=limits(concurrency), timeout=TIMEOUT) as client:
+        yield client
+
+
+@contextmanager
+def uvicorn_server(host: str, port: int, workers: int) -> Iterator[str]:
+    """
+    Serve the application with uvicorn in a child process, for the time of the run.
+
+    The child process inherits the environment, so it uses the database configured for the run.
+
+    Args:
+        host (str): The address to bind.
+        port (int): The port to bind.
+        workers (int): The number of uvicorn worker processes.
+
+    Yields:
+        (str): The base URL of the application, once it answers.
+
+    Raises:
+        RuntimeError: If the server exits or does not answer within `TIMEOUT` seconds.
+    """
+    command = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "src.main.fast_api.configs.server:app",
+        "--host",
+        host,
+        "--port",
+        str(port),
+        "--workers",
+        str(workers),
+        "--log-level",
+        "warning",
+        "--no-access-log",
+    ]
+    url = f"http://{host}:{port}"
+    process = subprocess.Popen(command)
+    try:
+        wait_until_ready(process, url)
+        yield url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def wait_until_ready(process: subprocess.Popen, url: str) -> None:
+    """
+    Wait for a server to answer, whatever the status of its answer.
+
+    Args:
+        process (subprocess.Popen): The process of the server.
+        url (str): The base URL of the server.
+
+    Raises:
+        RuntimeError: If the server exits or does not answer within `TIMEOUT` seconds.
+    """
+    deadline = time.monotonic() + TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"The server exited with {process.returncode} before answering.")
+        try:
+            httpx.get(f"{url}/docs", timeout=1.0)
+            return
+        except httpx.TransportError:
+            time.sleep(0.1)
+    raise RuntimeError(f"The server did not answer at {url} within {TIMEOUT:.0f} seconds.")
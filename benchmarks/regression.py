@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+from typing import Dict, List
+
+DEFAULT_THRESHOLD = 0.25
+STATISTICS = ("min", "median", "mean")
+
+
+@dataclass(frozen=True)
+class Regression:
+    """
+    A benchmark that got slower than its baseline by more than the threshold.
+
+    Attributes:
+        name (str): The name of the benchmark.
+        baseline (float): The baseline time of a call, in seconds.
+        current (float): The current time of a call, in seconds.
+    """
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """
+        Get the slowdown of the benchmark.
+
+        Returns:
+            (float): The current time divided by the baseline time.
+        """
+        return self.current / self.baseline
+
+    def __str__(self) -> str:
+        """
+        Describe the regression.
+
+        Returns:
+            (str): The name, the baseline and current times in microseconds, and the slowdown.
+        """
+        return (
+            f"{self.name}: {self.baseline * 1e6:.2f} us -> {self.current * 1e6:.2f} us "
+            f"({(self.ratio - 1) * 100:+.0f}%)"
+        )
+
+
+def find_regressions(
+    current: Dict[str, dict], baseline: Dict[str, dict], threshold: float = DEFAULT_THRESHOLD, statistic: str = "min"
+) -> List[Regression]:
+    """
+    Compare the results of a run with the results of a baseline run.
+
+    Benchmarks missing from either run are not compared.
+
+    Args:
+        current (Dict[str, dict]): The results of the run, keyed by benchmark name.
+        baseline (Dict[str, dict]): The results of the baseline run, keyed by benchmark name.
+        threshold (float): The slowdown tolerated, 0.25 for 25% slower.
+        statistic (str): The statistic compared, one of `min`, `median` and `mean`.
+
+    Returns:
+        (List[Regression]): The benchmarks slower than their baseline by more than the threshold, worst first.
+
+    Raises:
+        ValueError: If the statistic is not supported.
+    """
+    if statistic not in STATISTICS:
+        raise ValueError(f"Unsupported statistic {statistic!r}, expected one of {', '.join(STATISTICS)}.")
+    regressions = [
+        Regression(name=name, baseline=baseline[name][statistic], current=result[statistic])
+        for name, result in current.items()
+        if name in baseline and result[statistic] > baseline[name][statistic] * (1 + threshold)
+    ]
+    return sorted(regressions, key=lambda regression: regression.ratio, reverse=True)
@@ -0,0 +1,87 @@
+import importlib
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Optional
+
+from benchmarks.timer import BenchmarkResult, measure
+
+
+def run_suites(
+    suites: Iterable[str],
+    rounds: int = 5,
+    round_time: float = 0.05,
+    name_filter: Optional[str] = None,
+    report: Callable[[BenchmarkResult], None] = lambda result: None,
+) -> Dict[str, BenchmarkResult]:
+    """
+    Run the benchmarks of the given suites.
+
+    The suites are imported only here, after `benchmarks.environment.configure` has pointed the
+    application at the benchmark database.
+
+    Args:
+        suites (Iterable[str]): The names of the suites, modules of `benchmarks.suites`.
+        rounds (int): The number of timed rounds of each benchmark.
+        round_time (float): The targeted duration of a round, in seconds.
+        name_filter (str, optional): Only the benchmarks whose name contains this text are run.
+        report (Callable[[BenchmarkResult], None]): Called with each result as soon as it is measured.
+
+    Returns:
+        (Dict[str, BenchmarkResult]): The results, keyed by benchmark name.
+    """
+    results: Dict[str, BenchmarkResult] = {}
+    for suite in suites:
+        module = importlib.import_module(f"benchmarks.suites.{suite}")
+
+        def bench(
+            subject: str, function: Callable[[], object], setup: Callable[[int], None] = None, allocations: bool = False
+        ) -> None:
+            name = f"{suite}.{subject}"
+            if name_filter and name_filter not in name:
+                return
+            result = measure(name, function, rounds=rounds, round_time=round_time, setup=setup, allocations=allocations)
+            results[name] = result
+            report(result)
+
+        module.run(bench)
+    return results
+
+
+def write_results(path: str, results: Dict[str, BenchmarkResult]) -> None:
+    """
+    Write the results of a run to a JSON file, with the interpreter and machine they were measured on.
+
+    Args:
+        path (str): The path of the file.
+        results (Dict[str, BenchmarkResult]): The results, keyed by benchmark name.
+    """
+    document = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "machine": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "processor": platform.machine(),
+        },
+        "unit": "seconds per call, allocated bytes per call",
+        "benchmarks": {name: result.to_dict() for name, result in results.items()},
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2)
+        file.write("\n")
+
+
+def read_results(path: str) -> Dict[str, dict]:
+    """
+    Read the results of a run from a JSON file written by `write_results`.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        (Dict[str, dict]): The results, keyed by benchmark name.
+    """
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["benchmarks"]
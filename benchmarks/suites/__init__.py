@@ -0,0 +1,8 @@
+from typing import Callable
+
+# Times a function under a name: `bench(subject, function, setup=None, allocations=False)`, where the
+# optional setup prepares the given number of calls outside of the timing, and `allocations` also
+# measures the bytes held by the results of the calls.
+Bench = Callable[..., None]
+
+SUITES = ("records", "controllers", "repositories", "endpoints")
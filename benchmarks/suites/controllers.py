@@ -0,0 +1,197 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from starlette.requests import Request
+
+from src.applications.dtos import AccessTokenDTO, TokenClaimsDTO, UserDTO
+from src.main.fast_api.schemas import LoginRequest, UserBatchLookup, UserCreate
+from src.presenters.controllers.auth import LoginController, LogoutController
+from src.presenters.controllers.user.async_create_user import AsyncCreateUserController
+from src.presenters.controllers.user.async_delete_user import AsyncDeleteUserController
+from src.presenters.controllers.user.async_get_user import AsyncGetUserController
+from src.presenters.controllers.user.batch_get_users import BatchGetUsersController
+from src.presenters.controllers.user.bulk_create_users import BulkCreateUsersController
+from src.presenters.controllers.user.create_user import CreateUserController
+from src.presenters.controllers.user.delete_user import DeleteUserController
+from src.presenters.controllers.user.export_users import ExportUsersController
+from src.presenters.controllers.user.get_user import GetUserController
+from src.presenters.controllers.user.list_users import ListUsersController
+from src.presenters.controllers.user.search_users import SearchUsersController
+from src.presenters.helpers.http_types import HttpRequest, Lazy
+
+from benchmarks.suites import Bench
+
+NOW = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+USER = UserDTO(id=1, name="John Doe", email="johndoe@example.com", password="hash", created_at=NOW)
+SCOPE = {
+    "type": "http",
+    "method": "POST",
+    "path": "/api/users/",
+    "query_string": b"",
+    "path_params": {},
+    "headers": [
+        (b"host", b"testserver"),
+        (b"accept", b"application/json"),
+        (b"content-type", b"application/json"),
+        (b"user-agent", b"python-httpx/0.24.1"),
+        (b"authorization", b"Bearer token"),
+    ],
+}
+USERS = [
+    UserDTO(id=index, name=f"User {index}", email=f"user{index}@example.com", password="hash", created_at=NOW)
+    for index in range(1, 101)
+]
+
+
+def returning(data: object):
+    """
+    Build a use case method that answers every call with the same successful result.
+
+    Args:
+        data (object): The data of the result.
+
+    Returns:
+        (Callable[..., dict]): The use case method.
+    """
+    result = {"data": data, "success": True}
+    return lambda *args, **kwargs: result
+
+
+def awaiting(data: object):
+    """
+    Build an asynchronous use case method that answers every call with the same successful result.
+
+    Args:
+        data (object): The data of the result.
+
+    Returns:
+        (Callable[..., Awaitable[dict]]): The use case method.
+    """
+    result = {"data": data, "success": True}
+
+    async def method(*args, **kwargs) -> dict:
+        return result
+
+    return method
+
+
+def adapt_lazily(user_create: UserCreate) -> HttpRequest:
+    """
+    Hand a `POST /api/users` request to the create user controller the way the adapter does.
+
+    Args:
+        user_create (UserCreate): The body, validated by FastAPI.
+
+    Returns:
+        (HttpRequest): The request given to the controller.
+    """
+    request = Request(SCOPE)
+    http_request = HttpRequest(
+        header=Lazy(lambda: request.headers),
+        query=Lazy(lambda: request.query_params),
+        path=Lazy(lambda: request.path_params),
+        model=user_create,
+    )
+    CreateUserController.user_dto_from_request(http_request)
+    return http_request
+
+
+def adapt_eagerly(user_create: UserCreate) -> HttpRequest:
+    """
+    Hand a `POST /api/users` request to the create user controller the way the adapter did before, as a reference.
+
+    The headers, the query parameters and the path parameters were converted up front, and the
+    validated body was dumped to a dictionary whose keys the controller checked again.
+
+    Args:
+        user_create (UserCreate): The body, validated by FastAPI.
+
+    Returns:
+        (HttpRequest): The request given to the controller.
+    """
+    request = Request(SCOPE)
+    http_request = HttpRequest(
+        query=request.query_params, body=user_create.__dict__, header=request.headers, path=request.path_params
+    )
+    CreateUserController.user_dto_from_request(http_request)
+    return http_request
+
+
+def run(bench: Bench) -> None:
+    """
+    Benchmark the `route` of every controller, on use cases that answer right away.
+
+    Args:
+        bench (Bench): Times a function under a name.
+    """
+    user_create = UserCreate(name=USER.name, email=USER.email, password="password123")
+    bench("fast_api_adapter.request", lambda: adapt_lazily(user_create))
+    bench("fast_api_adapter.request.reference_eager", lambda: adapt_eagerly(user_create))
+    by_email = HttpRequest(query={"email": USER.email})
+    by_id = HttpRequest(path={"user_id": "1"})
+    create_controller = CreateUserController(SimpleNamespace(create_user=returning(USER)))
+    bench("CreateUserController.route", lambda: create_controller.route(HttpRequest(model=user_create)))
+    get_controller = GetUserController(SimpleNamespace(get_user_by_email=returning(USER)))
+    bench("GetUserController.route", lambda: get_controller.route(by_email))
+    delete_controller = DeleteUserController(SimpleNamespace(delete_user=returning("Deleted")))
+    bench("DeleteUserController.route", lambda: delete_controller.route(by_id))
+
+    rows = [
+        (index, {"name": user.name, "email": user.email, "password": "password123"})
+        for index, user in enumerate(USERS, 1)
+    ]
+    bulk_result = returning(
+        {"created": [{"row": row, "id": row, "email": record["email"]} for row, record in rows], "failed": []}
+    )
+
+    def create_users(rows):
+        for _ in rows:
+            pass
+        return bulk_result()
+
+    bulk_controller = BulkCreateUsersController(SimpleNamespace(create_users=create_users))
+    bench("BulkCreateUsersController.route[100]", lambda: bulk_controller.route(HttpRequest(body=iter(rows))))
+
+    export_controller = ExportUsersController(SimpleNamespace(export_users=returning(USERS)))
+    bench(
+        "ExportUsersController.route[100]",
+        lambda: "".join(export_controller.route(HttpRequest(query={"format": "ndjson"})).body["content"]),
+    )
+    list_controller = ListUsersController(
+        SimpleNamespace(list_users=returning({"users": USERS[:50], "next_after_id": 50, "total_estimate": None}))
+    )
+    bench("ListUsersController.route", lambda: list_controller.route(HttpRequest(query={"limit": "50"})))
+    search_controller = SearchUsersController(SimpleNamespace(search_users=returning(USERS[:20])))
+    bench("SearchUsersController.route", lambda: search_controller.route(HttpRequest(query={"q": "user"})))
+    lookup = UserBatchLookup(ids=[user.id for user in USERS[:10]], emails=[user.email for user in USERS[10:20]])
+    batch_result = {
+        "users_by_id": {user.id: user for user in USERS[:10]},
+        "users_by_email": {user.email: user for user in USERS[10:20]},
+        "missing_ids": [],
+        "missing_emails": [],
+    }
+    batch_controller = BatchGetUsersController(SimpleNamespace(get_users=returning(batch_result)))
+    bench("BatchGetUsersController.route", lambda: batch_controller.route(HttpRequest(model=lookup)))
+
+    token = AccessTokenDTO(access_token="token", token_type="bearer", expires_at=NOW)
+    login_controller = LoginController(SimpleNamespace(login=returning(token)))
+    credentials = LoginRequest(email=USER.email, password="password123")
+    bench("LoginController.route", lambda: login_controller.route(HttpRequest(model=credentials)))
+    claims = TokenClaimsDTO(subject=1, token_id="token-id", issued_at=NOW, expires_at=NOW)
+    logout_controller = LogoutController(SimpleNamespace(logout=returning(None)))
+    bench("LogoutController.route", lambda: logout_controller.route(HttpRequest(body={"claims": claims})))
+
+    loop = asyncio.new_event_loop()
+    try:
+        async_create = AsyncCreateUserController(SimpleNamespace(create_user=awaiting(USER)))
+        bench(
+            "AsyncCreateUserController.route",
+            lambda: loop.run_until_complete(async_create.route(HttpRequest(model=user_create))),
+        )
+        async_get = AsyncGetUserController(SimpleNamespace(get_user_by_email=awaiting(USER)))
+        bench("AsyncGetUserController.route", lambda: loop.run_until_complete(async_get.route(by_email)))
+        async_delete = AsyncDeleteUserController(SimpleNamespace(delete_user=awaiting("Deleted")))
+        bench("AsyncDeleteUserController.route", lambda: loop.run_until_complete(async_delete.route(by_id)))
+    finally:
+        loop.close()
@@ -0,0 +1,120 @@
+from itertools import count
+from typing import List
+
+from fastapi.testclient import TestClient
+from httpx import Response
+
+from src.infra.db.settings import Base, DBConnectionHandler
+from src.main.fast_api.configs.server import app
+
+from benchmarks.suites import Bench
+
+SEED_USERS = 1000
+PASSWORD = "password123"
+
+
+def expect(response: Response, status_code: int) -> Response:
+    """
+    Check the status of a response, so a failing endpoint is not timed as a fast one.
+
+    Args:
+        response (Response): The response of the endpoint.
+        status_code (int): The expected status code.
+
+    Returns:
+        (Response): The response.
+
+    Raises:
+        RuntimeError: If the response has another status code.
+    """
+    if response.status_code != status_code:
+        raise RuntimeError(
+            f"{response.request.method} {response.request.url} answered {response.status_code}: {response.text}"
+        )
+    return response
+
+
+def new_user(index: int) -> dict:
+    """
+    Build the body of a user that is not in the database yet.
+
+    Args:
+        index (int): A number no other user of the run was built with.
+
+    Returns:
+        (dict): The user to create.
+    """
+    return {"name": f"User {index}", "email": f"user{index}@example.com", "password": PASSWORD}
+
+
+def run(bench: Bench) -> None:
+    """
+    Benchmark every endpoint of the application through TestClient.
+
+    The application runs with its lifespan, so its dependency container is built as in production,
+    on the database configured by `benchmarks.environment`. The database is seeded with `SEED_USERS`
+    users through the bulk import.
+
+    Args:
+        bench (Bench): Times a function under a name.
+    """
+    connection = DBConnectionHandler()
+    Base.metadata.create_all(bind=connection.engine)
+    try:
+        with TestClient(app) as client:
+            run_endpoints(bench, client)
+    finally:
+        Base.metadata.drop_all(bind=connection.engine)
+
+
+def run_endpoints(bench: Bench, client: TestClient) -> None:
+    """
+    Benchmark every endpoint on a started application.
+
+    Args:
+        bench (Bench): Times a function under a name.
+        client (TestClient): The client of the started application.
+    """
+    indexes = count()
+    expect(client.post("/api/users/bulk", json=[new_user(next(indexes)) for _ in range(SEED_USERS)]), 200)
+    users = expect(client.get("/api/users/list", params={"limit": 100}), 200).json()["users"]
+    user = users[50]
+    lookup = {"ids": [user["id"] for user in users[:10]], "emails": [user["email"] for user in users[10:20]]}
+    credentials = {"email": user["email"], "password": PASSWORD}
+
+    bench("GET /api/users/", lambda: expect(client.get("/api/users/", params={"email": user["email"]}), 200))
+    bench("GET /api/users/list", lambda: expect(client.get("/api/users/list", params={"limit": 50}), 200))
+    bench("GET /api/users/search", lambda: expect(client.get("/api/users/search", params={"q": "user12"}), 200))
+    bench("POST /api/users/batch", lambda: expect(client.post("/api/users/batch", json=lookup), 200))
+    bench("GET /api/users/export", lambda: expect(client.get("/api/users/export"), 200))
+    bench("POST /api/auth/login", lambda: expect(client.post("/api/auth/login", json=credentials), 200))
+
+    tokens: List[str] = []
+
+    def login(calls: int) -> None:
+        tokens.extend(
+            expect(client.post("/api/auth/login", json=credentials), 200).json()["access_token"] for _ in range(calls)
+        )
+
+    bench(
+        "POST /api/auth/logout",
+        lambda: expect(client.post("/api/auth/logout", headers={"Authorization": f"Bearer {tokens.pop()}"}), 204),
+        setup=login,
+    )
+
+    bench("POST /api/users/", lambda: expect(client.post("/api/users/", json=new_user(next(indexes))), 201))
+    bench(
+        "POST /api/users/bulk[100]",
+        lambda: expect(client.post("/api/users/bulk", json=[new_user(next(indexes)) for _ in range(100)]), 200),
+    )
+    deletable: List[int] = []
+
+    def create_deletable(calls: int) -> None:
+        report = expect(client.post("/api/users/bulk", json=[new_user(next(indexes)) for _ in range(calls)]), 200)
+        deletable.extend(created["id"] for created in report.json()["created"])
+
+    bench(
+        "DELETE /api/users/{user_id}",
+        lambda: expect(client.delete(f"/api/users/{deletable.pop()}"), 200),
+        setup=create_deletable,
+    )
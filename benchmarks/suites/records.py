@@ -0,0 +1,78 @@
+import json
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from src.applications.dtos import UserDTO
+from src.main.fast_api.responses import ORJSONResponse, encode_default_response
+from src.main.fast_api.schemas import DefaultResponse, UserOut
+
+from benchmarks.suites import Bench
+
+ROW = (1, "John Doe", "johndoe@example.com", "pbkdf2_sha256$1000$salt$hash", datetime(2024, 1, 2, 3, 4, 5))
+RESPONSE_MODEL = TypeAdapter(DefaultResponse)
+
+
+@dataclass
+class MutableUserRecord:
+    """The user record as it was before it became frozen and slotted, with one `__dict__` per instance."""
+
+    id: Optional[int]
+    name: str
+    email: str
+    password: str
+    created_at: Optional[datetime]
+
+
+def copy_chain() -> Tuple[MutableUserRecord, ...]:
+    """
+    Carry a user through a use case the way it was done before the records were passed along, as a reference.
+
+    The row was copied to a DTO, the DTO to an entity and the entity back to a DTO.
+
+    Returns:
+        (Tuple[MutableUserRecord, ...]): Every record allocated on the way, the returned DTO last.
+    """
+    dto = MutableUserRecord(*ROW)
+    entity = MutableUserRecord(dto.id, dto.name, dto.email, dto.password, dto.created_at)
+    return dto, entity, MutableUserRecord(entity.id, entity.name, entity.email, entity.password, entity.created_at)
+
+
+def serialize_with_models(user: UserDTO) -> bytes:
+    """
+    Serialize a user the way the routes did before `encode_default_response`, as a reference.
+
+    The route built `UserOut` and `DefaultResponse`, then FastAPI validated the result against
+    `response_model`, dumped it, ran it through `jsonable_encoder` and rendered it with `json.dumps`.
+
+    Args:
+        user (UserDTO): The user.
+
+    Returns:
+        (bytes): The body of the response.
+    """
+    user_out = UserOut(id=user.id, email=user.email, name=user.name, created_at=user.created_at)
+    validated = RESPONSE_MODEL.validate_python(DefaultResponse(type="Users", attributes=user_out))
+    content = jsonable_encoder(validated.model_dump(mode="json"))
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def run(bench: Bench) -> None:
+    """
+    Benchmark the user records and their conversions.
+
+    Args:
+        bench (Bench): Times a function under a name.
+    """
+    user = UserDTO(*ROW)
+    entity = user.to_domain()
+    bench("UserDTO", lambda: UserDTO(*ROW), allocations=True)
+    bench("UserDTO.reference_copy_chain", copy_chain, allocations=True)
+    bench("UserDTO.to_domain", user.to_domain)
+    bench("UserDTO.to_dto", lambda: user.to_dto(entity))
+    bench("dataclasses.replace", lambda: replace(user, password="hash"))
+    bench("encode_default_response", lambda: ORJSONResponse(encode_default_response(user)).body)
+    bench("encode_default_response.reference_response_model", lambda: serialize_with_models(user))
@@ -0,0 +1,70 @@
+from itertools import count
+from typing import List
+
+from src.applications.dtos import UserDTO
+from src.infra.db.settings import Base, DBConnectionHandler, engine_registry
+from src.infra.repositories.user import UserRepository
+
+from benchmarks.suites import Bench
+
+DATABASE_URL = "sqlite://"
+SEED_USERS = 1000
+
+
+def new_user(index: int) -> UserDTO:
+    """
+    Build a user that is not in the database yet.
+
+    Args:
+        index (int): A number no other user of the run was built with.
+
+    Returns:
+        (UserDTO): The user to create.
+    """
+    return UserDTO(id=None, name=f"User {index}", email=f"user{index}@example.com", password="hash", created_at=None)
+
+
+def run(bench: Bench) -> None:
+    """
+    Benchmark every method of UserRepository against an in-memory SQLite database.
+
+    The database is seeded with `SEED_USERS` users, and the reads run before the writes so that they
+    all see the same table.
+
+    Args:
+        bench (Bench): Times a function under a name.
+    """
+    connection = DBConnectionHandler(connection_string=DATABASE_URL)
+    Base.metadata.create_all(bind=connection.engine)
+    try:
+        repository = UserRepository(db_connection=connection)
+        indexes = count()
+        users = repository.create_users([new_user(next(indexes)) for _ in range(SEED_USERS)])
+        user = users[SEED_USERS // 2]
+        ids = [user.id for user in users[:50]]
+        emails = [user.email for user in users[50:100]]
+
+        bench("get_user_by_email", lambda: repository.get_user_by_email(user.email))
+        bench("get_user_by_id", lambda: repository.get_user_by_id(user.id))
+        bench("get_users_by_ids[50]", lambda: repository.get_users_by_ids(ids))
+        bench("get_users_by_emails[50]", lambda: repository.get_users_by_emails(emails))
+        bench("list_users[50]", lambda: repository.list_users(after_id=user.id, limit=50))
+        bench("search_users", lambda: repository.search_users("user12", limit=20))
+        bench("estimate_user_count", repository.estimate_user_count)
+        bench(f"iter_users[{SEED_USERS}]", lambda: sum(1 for _ in repository.iter_users(batch_size=500)))
+        bench(f"iter_emails[{SEED_USERS}]", lambda: sum(1 for _ in repository.iter_emails(batch_size=500)))
+        bench("update_password", lambda: repository.update_password(user.id, "new-hash"))
+
+        bench("create_user", lambda: repository.create_user(new_user(next(indexes))))
+        bench("create_users[100]", lambda: repository.create_users([new_user(next(indexes)) for _ in range(100)]))
+        deletable: List[int] = []
+
+        def create_deletable(calls: int) -> None:
+            deletable.extend(
+                created.id for created in repository.create_users([new_user(next(indexes)) for _ in range(calls)])
+            )
+
+        bench("delete_user", lambda: repository.delete_user(deletable.pop()), setup=create_deletable)
+    finally:
+        Base.metadata.drop_all(bind=connection.engine)
+        engine_registry.dispose(DATABASE_URL)
@@ -0,0 +1,155 @@
+import gc
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, List, Optional
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """
+    Timings of a benchmark, in seconds per call, and optionally the memory its calls allocate.
+
+    Attributes:
+        name (str): The name of the benchmark, `<suite>.<subject>`.
+        rounds (int): The number of timed rounds.
+        iterations (int): The number of calls per round.
+        min (float): The time of a call in the fastest round.
+        median (float): The time of a call in the median round.
+        mean (float): The mean time of a call over the rounds.
+        stdev (float): The standard deviation of the time of a call over the rounds.
+        allocated (float | None): The bytes still allocated per call while the results are kept, when measured.
+    """
+
+    name: str
+    rounds: int
+    iterations: int
+    min: float
+    median: float
+    mean: float
+    stdev: float
+    allocated: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        """
+        Convert the result to a JSON-compatible dictionary.
+
+        Returns:
+            (dict): The fields of the result.
+        """
+        return asdict(self)
+
+
+def calibrate(function: Callable[[], object], round_time: float, setup: Optional[Callable[[int], None]]) -> int:
+    """
+    Find the number of calls that makes a round last about `round_time` seconds.
+
+    Args:
+        function (Callable[[], object]): The function to time.
+        round_time (float): The targeted duration of a round, in seconds.
+        setup (Callable[[int], None], optional): Prepares the given number of calls, untimed.
+
+    Returns:
+        (int): The number of calls per round.
+    """
+    iterations = 1
+    while True:
+        elapsed = time_round(function, iterations, setup)
+        if elapsed >= round_time or iterations >= 1_000_000:
+            return iterations
+        iterations = min(iterations * 10, max(iterations * 2, int(iterations * round_time / max(elapsed, 1e-9))))
+
+
+def time_round(function: Callable[[], object], iterations: int, setup: Optional[Callable[[int], None]]) -> float:
+    """
+    Time one round of calls, with the garbage collector disabled as `timeit` does.
+
+    Args:
+        function (Callable[[], object]): The function to time.
+        iterations (int): The number of calls of the round.
+        setup (Callable[[int], None], optional): Prepares the given number of calls, untimed.
+
+    Returns:
+        (float): The duration of the round, in seconds.
+    """
+    if setup is not None:
+        setup(iterations)
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            function()
+        return time.perf_counter() - started
+    finally:
+        if collecting:
+            gc.enable()
+
+
+def measure_allocations(function: Callable[[], object], calls: int = 10_000) -> float:
+    """
+    Measure with `tracemalloc` the memory held by the results of a function.
+
+    The results of the calls are kept until the measure is taken, so the objects a call returns count
+    while its temporaries do not.
+
+    Args:
+        function (Callable[[], object]): The function to measure.
+        calls (int): The number of calls measured.
+
+    Returns:
+        (float): The bytes still allocated per call.
+    """
+    results: List[object] = [None] * calls
+    function()
+    tracemalloc.start()
+    try:
+        started, _ = tracemalloc.get_traced_memory()
+        for index in range(calls):
+            results[index] = function()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (allocated - started) / calls
+
+
+def measure(
+    name: str,
+    function: Callable[[], object],
+    rounds: int = 5,
+    round_time: float = 0.05,
+    setup: Optional[Callable[[int], None]] = None,
+    allocations: bool = False,
+) -> BenchmarkResult:
+    """
+    Time a function over several rounds of calls.
+
+    The number of calls per round is calibrated so that a round lasts about `round_time`, and the
+    calibration doubles as the warm-up. A `setup` hook runs before each round, outside of the timing,
+    for functions that consume prepared state, such as the users a delete benchmark removes. With
+    `allocations`, the memory held by the results of the calls is measured too, untimed.
+
+    Args:
+        name (str): The name of the benchmark.
+        function (Callable[[], object]): The function to time.
+        rounds (int): The number of timed rounds.
+        round_time (float): The targeted duration of a round, in seconds.
+        setup (Callable[[int], None], optional): Prepares the given number of calls, untimed.
+        allocations (bool): Whether to measure the memory held by the results, for functions without setup.
+
+    Returns:
+        (BenchmarkResult): The timings of a call, and the bytes it allocates when measured.
+    """
+    iterations = calibrate(function, round_time, setup)
+    timings: List[float] = [time_round(function, iterations, setup) / iterations for _ in range(rounds)]
+    return BenchmarkResult(
+        name=name,
+        rounds=rounds,
+        iterations=iterations,
+        min=min(timings),
+        median=statistics.median(timings),
+        mean=statistics.fmean(timings),
+        stdev=statistics.stdev(timings) if rounds > 1 else 0.0,
+        allocated=measure_allocations(function) if allocations else None,
+    )
@@ -1 +1,3 @@
+from src.applications.dtos.access_token import AccessTokenDTO
+from src.applications.dtos.token_claims import TokenClaimsDTO
 from src.applications.dtos.user import UserDTO
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class AccessTokenDTO:
+    """DTO (Data Transfer Object) for representing an issued access token.
+
+    Attributes:
+        access_token (str): The signed token.
+        token_type (str): The scheme the token is presented with, `bearer`.
+        expires_at (datetime): When the token expires.
+    """
+
+    access_token: str
+    token_type: str
+    expires_at: datetime
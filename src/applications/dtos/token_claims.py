@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class TokenClaimsDTO:
+    """DTO (Data Transfer Object) for representing the verified claims of an access token.
+
+    Attributes:
+        subject (int): The ID of the user the token was issued to.
+        token_id (str): The unique ID of the token, the key it is revoked by.
+        issued_at (datetime): When the token was issued.
+        expires_at (datetime): When the token expires.
+    """
+
+    subject: int
+    token_id: str
+    issued_at: datetime
+    expires_at: datetime
@@ -5,10 +5,14 @@ from dataclasses import dataclass
 from src.domain.entities.user import UserEntity
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UserDTO:
     """DTO (Data Transfer Object) for representing a user entity.
 
+    The DTO is an immutable, slotted record: the repositories, the caches, the use cases and the
+    response encoders pass the same instance along instead of copying it, and a change is made with
+    `dataclasses.replace`.
+
     Attributes:
         id (Optional[int]): The user's ID.
         name (str): The user's name.
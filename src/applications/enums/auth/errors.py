@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class AuthErrorsEnum(Enum):
+    """
+    Enum class representing errors related to authentication.
+
+    Attributes:
+        INVALID_CREDENTIALS (str): An error that occurs when the email or the password of a login is wrong.
+    """
+
+    INVALID_CREDENTIALS = "Invalid email or password."
@@ -0,0 +1 @@
+from src.applications.services.password_hasher import PasswordHasher, PasswordHashingSettings
@@ -0,0 +1,395 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, List, Optional, Tuple
+
+from src.domain.password_hasher import PasswordHasherInterface
+
+try:
+    import argon2
+except ImportError:  # pragma: no cover - depends on the installed extras
+    argon2 = None
+
+try:
+    import bcrypt
+except ImportError:  # pragma: no cover - depends on the installed extras
+    bcrypt = None
+
+ARGON2ID = "argon2id"
+BCRYPT = "bcrypt"
+PBKDF2_SHA256 = "pbkdf2_sha256"
+ALGORITHMS = (ARGON2ID, BCRYPT, PBKDF2_SHA256)
+DEFAULT_ALGORITHM = ARGON2ID if argon2 is not None else BCRYPT if bcrypt is not None else PBKDF2_SHA256
+WORKER_NICENESS = 10
+
+
+def default_workers() -> int:
+    """
+    Get the default number of hashing processes: half of the CPUs, so hashing never takes them all.
+
+    Returns:
+        int: The number of hashing processes.
+    """
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+@dataclass(frozen=True)
+class PasswordHashingSettings:
+    """Settings of the password hashing.
+
+    Attributes:
+        algorithm (str): The algorithm new hashes are made with: `argon2id`, `bcrypt` or `pbkdf2_sha256`.
+            Defaults to the best one installed, `pbkdf2_sha256` needing only the standard library.
+        workers (int): The number of processes the hashing runs in, 0 to hash in the calling thread.
+        pbkdf2_iterations (int): The number of PBKDF2 iterations.
+        bcrypt_rounds (int): The bcrypt cost factor, the base-2 logarithm of the number of rounds.
+        argon2_time_cost (int): The number of argon2 passes over the memory.
+        argon2_memory_cost (int): The argon2 memory size in KiB.
+        argon2_parallelism (int): The number of argon2 lanes.
+    """
+
+    algorithm: str = DEFAULT_ALGORITHM
+    workers: int = field(default_factory=default_workers)
+    pbkdf2_iterations: int = 600_000
+    bcrypt_rounds: int = 12
+    argon2_time_cost: int = 3
+    argon2_memory_cost: int = 65536
+    argon2_parallelism: int = 1
+
+    def __post_init__(self) -> None:
+        """Check that the algorithm is known and installed.
+
+        Raises:
+            ValueError: If the algorithm is unknown or its package is not installed.
+        """
+        if self.algorithm not in ALGORITHMS:
+            raise ValueError(
+                f"Unsupported password hashing algorithm '{self.algorithm}', expected one of {ALGORITHMS}."
+            )
+        if self.algorithm == ARGON2ID and argon2 is None:
+            raise ValueError("The argon2id password hashing algorithm requires the argon2-cffi package.")
+        if self.algorithm == BCRYPT and bcrypt is None:
+            raise ValueError("The bcrypt password hashing algorithm requires the bcrypt package.")
+
+    @classmethod
+    def from_env(cls) -> "PasswordHashingSettings":
+        """Build the password hashing settings from environment variables.
+
+        The variables `PASSWORD_HASH_ALGORITHM`, `PASSWORD_HASH_WORKERS`, `PASSWORD_HASH_PBKDF2_ITERATIONS`,
+        `PASSWORD_HASH_BCRYPT_ROUNDS`, `PASSWORD_HASH_ARGON2_TIME_COST`, `PASSWORD_HASH_ARGON2_MEMORY_COST`
+        and `PASSWORD_HASH_ARGON2_PARALLELISM` override the defaults when they are set.
+
+        Returns:
+            (PasswordHashingSettings): The password hashing settings read from the environment.
+        """
+        return cls(
+            algorithm=os.getenv("PASSWORD_HASH_ALGORITHM", cls.algorithm),
+            workers=int(os.getenv("PASSWORD_HASH_WORKERS", default_workers())),
+            pbkdf2_iterations=int(os.getenv("PASSWORD_HASH_PBKDF2_ITERATIONS", cls.pbkdf2_iterations)),
+            bcrypt_rounds=int(os.getenv("PASSWORD_HASH_BCRYPT_ROUNDS", cls.bcrypt_rounds)),
+            argon2_time_cost=int(os.getenv("PASSWORD_HASH_ARGON2_TIME_COST", cls.argon2_time_cost)),
+            argon2_memory_cost=int(os.getenv("PASSWORD_HASH_ARGON2_MEMORY_COST", cls.argon2_memory_cost)),
+            argon2_parallelism=int(os.getenv("PASSWORD_HASH_ARGON2_PARALLELISM", cls.argon2_parallelism)),
+        )
+
+
+def identify_algorithm(password_hash: str) -> Optional[str]:
+    """
+    Identify the algorithm an encoded hash was made with.
+
+    Args:
+        password_hash (str): The encoded hash.
+
+    Returns:
+        str | None: The algorithm, or None when the value is not a hash of a supported algorithm.
+    """
+    if password_hash.startswith("$argon2id$"):
+        return ARGON2ID
+    if password_hash.startswith(("$2a$", "$2b$", "$2y$")):
+        return BCRYPT
+    if password_hash.startswith(PBKDF2_SHA256 + "$"):
+        return PBKDF2_SHA256
+    return None
+
+
+def hash_password(password: str, settings: PasswordHashingSettings) -> str:
+    """
+    Hash a password with the configured algorithm and cost parameters.
+
+    Args:
+        password (str): The password to hash.
+        settings (PasswordHashingSettings): The password hashing settings.
+
+    Returns:
+        str: The encoded hash, with its algorithm, cost parameters and salt.
+    """
+    if settings.algorithm == ARGON2ID:
+        return _argon2_hasher(settings).hash(password)
+    if settings.algorithm == BCRYPT:
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(settings.bcrypt_rounds)).decode()
+    salt = base64.b64encode(os.urandom(16)).decode().rstrip("=")
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt.encode(), settings.pbkdf2_iterations)
+    return f"{PBKDF2_SHA256}${settings.pbkdf2_iterations}${salt}${base64.b64encode(digest).decode().rstrip('=')}"
+
+
+def hash_passwords(passwords: List[str], settings: PasswordHashingSettings) -> List[str]:
+    """
+    Hash several passwords with the configured algorithm and cost parameters.
+
+    Args:
+        passwords (List[str]): The passwords to hash.
+        settings (PasswordHashingSettings): The password hashing settings.
+
+    Returns:
+        List[str]: The encoded hashes, in the order of the passwords.
+    """
+    return [hash_password(password, settings) for password in passwords]
+
+
+def password_needs_rehash(password_hash: str, settings: PasswordHashingSettings) -> bool:
+    """
+    Tell whether a hash was made with another algorithm or other cost parameters than the configured ones.
+
+    Args:
+        password_hash (str): The encoded hash.
+        settings (PasswordHashingSettings): The password hashing settings.
+
+    Returns:
+        bool: True when the hash must be replaced by a hash made with the configured parameters.
+    """
+    if identify_algorithm(password_hash) != settings.algorithm:
+        return True
+    if settings.algorithm == ARGON2ID:
+        return _argon2_hasher(settings).check_needs_rehash(password_hash)
+    if settings.algorithm == BCRYPT:
+        return int(password_hash.split("$")[2]) != settings.bcrypt_rounds
+    return int(password_hash.split("$")[1]) != settings.pbkdf2_iterations
+
+
+def verify_password(password: str, password_hash: str, settings: PasswordHashingSettings) -> Tuple[bool, Optional[str]]:
+    """
+    Check a password against a hash, rehashing it when the hash parameters are outdated.
+
+    Args:
+        password (str): The password to check.
+        password_hash (str): The encoded hash to check the password against.
+        settings (PasswordHashingSettings): The password hashing settings.
+
+    Returns:
+        Tuple[bool, Optional[str]]: Whether the password matches, and the new hash to store when it
+            matches a hash made with outdated parameters, or None.
+
+    Raises:
+        ValueError: If the hash was made with an algorithm whose package is not installed.
+    """
+    algorithm = identify_algorithm(password_hash)
+    if algorithm == ARGON2ID:
+        if argon2 is None:
+            raise ValueError("Verifying an argon2id hash requires the argon2-cffi package.")
+        try:
+            valid = argon2.PasswordHasher().verify(password_hash, password)
+        except argon2.exceptions.VerificationError:
+            valid = False
+    elif algorithm == BCRYPT:
+        if bcrypt is None:
+            raise ValueError("Verifying a bcrypt hash requires the bcrypt package.")
+        valid = bcrypt.checkpw(password.encode(), password_hash.encode())
+    elif algorithm == PBKDF2_SHA256:
+        _, iterations, salt, expected = password_hash.split("$")
+        digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt.encode(), int(iterations))
+        valid = hmac.compare_digest(base64.b64encode(digest).decode().rstrip("="), expected)
+    else:
+        valid = False
+    if valid and password_needs_rehash(password_hash, settings):
+        return True, hash_password(password, settings)
+    return valid, None
+
+
+def _argon2_hasher(settings: PasswordHashingSettings) -> "argon2.PasswordHasher":
+    """
+    Build the argon2id hasher of the configured cost parameters.
+
+    Args:
+        settings (PasswordHashingSettings): The password hashing settings.
+
+    Returns:
+        argon2.PasswordHasher: The argon2id hasher.
+    """
+    return argon2.PasswordHasher(
+        time_cost=settings.argon2_time_cost,
+        memory_cost=settings.argon2_memory_cost,
+        parallelism=settings.argon2_parallelism,
+        type=argon2.Type.ID,
+    )
+
+
+def _lower_priority() -> None:
+    """Lower the scheduling priority of a hashing process, so the request workers keep the CPU first."""
+    if hasattr(os, "nice"):
+        os.nice(WORKER_NICENESS)
+
+
+class PasswordHasher(PasswordHasherInterface):
+    """
+    Password hasher running the hashing on a bounded pool of processes.
+
+    Hashing is CPU work deliberately slow: run on a request thread it would hold the GIL for every
+    request of the worker, and awaited on the event loop it would stall it. The hashes are computed in
+    at most `settings.workers` processes of lowered priority instead, so a burst of signups is queued
+    behind them and never takes more CPUs than that. The synchronous methods block the calling thread
+    on the result and the asynchronous ones await it. The pool is started on the first hash.
+
+    Attributes:
+        settings (PasswordHashingSettings): The password hashing settings.
+    """
+
+    def __init__(self, settings: Optional[PasswordHashingSettings] = None) -> None:
+        """
+        Initialize a new instance of PasswordHasher.
+
+        Args:
+            settings (PasswordHashingSettings, optional): The password hashing settings. Read from the
+                environment when omitted.
+        """
+        self.settings = settings or PasswordHashingSettings.from_env()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def hash(self, password: str) -> str:
+        """
+        Hash a password in the process pool, blocking the calling thread until it is done.
+
+        Args:
+            password (str): The password to hash.
+
+        Returns:
+            str: The encoded hash, with its algorithm, cost parameters and salt.
+        """
+        return self._run(hash_password, password, self.settings)
+
+    def hash_many(self, passwords: List[str]) -> List[str]:
+        """
+        Hash several passwords, spread over the processes of the pool.
+
+        Args:
+            passwords (List[str]): The passwords to hash.
+
+        Returns:
+            List[str]: The encoded hashes, in the order of the passwords.
+        """
+        executor = self._get_executor()
+        if executor is None or len(passwords) < 2:
+            return hash_passwords(passwords, self.settings)
+        chunk_size = -(-len(passwords) // self.settings.workers)
+        chunks = [passwords[start : start + chunk_size] for start in range(0, len(passwords), chunk_size)]
+        hashes = executor.map(partial(hash_passwords, settings=self.settings), chunks)
+        return [password_hash for chunk in hashes for password_hash in chunk]
+
+    def verify(self, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+        """
+        Check a password against a hash in the process pool, rehashing it when its parameters are outdated.
+
+        Args:
+            password (str): The password to check.
+            password_hash (str): The encoded hash to check the password against.
+
+        Returns:
+            Tuple[bool, Optional[str]]: Whether the password matches, and the new hash to store when it
+                matches a hash made with outdated parameters, or None.
+        """
+        return self._run(verify_password, password, password_hash, self.settings)
+
+    async def hash_async(self, password: str) -> str:
+        """
+        Hash a password in the process pool without blocking the event loop.
+
+        Args:
+            password (str): The password to hash.
+
+        Returns:
+            str: The encoded hash, with its algorithm, cost parameters and salt.
+        """
+        return await self._run_async(hash_password, password, self.settings)
+
+    async def verify_async(self, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+        """
+        Check a password against a hash in the process pool without blocking the event loop.
+
+        Args:
+            password (str): The password to check.
+            password_hash (str): The encoded hash to check the password against.
+
+        Returns:
+            Tuple[bool, Optional[str]]: Whether the password matches, and the new hash to store when it
+                matches a hash made with outdated parameters, or None.
+        """
+        return await self._run_async(verify_password, password, password_hash, self.settings)
+
+    def close(self) -> None:
+        """Stop the hashing processes, waiting for the running hashes to finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _run(self, function: Callable, *args):
+        """
+        Call a hashing function in the process pool and wait for its result.
+
+        Args:
+            function (Callable): The module-level hashing function.
+            *args: The arguments of the function.
+
+        Returns:
+            Any: The result of the function.
+        """
+        executor = self._get_executor()
+        if executor is None:
+            return function(*args)
+        return executor.submit(function, *args).result()
+
+    async def _run_async(self, function: Callable, *args):
+        """
+        Call a hashing function in the process pool and await its result.
+
+        Without a pool the function runs in a worker thread, so the event loop is not blocked either.
+
+        Args:
+            function (Callable): The module-level hashing function.
+            *args: The arguments of the function.
+
+        Returns:
+            Any: The result of the function.
+        """
+        executor = self._get_executor()
+        if executor is None:
+            return await asyncio.to_thread(function, *args)
+        return await asyncio.wrap_future(executor.submit(function, *args))
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Get the process pool, starting it on the first call.
+
+        The processes are spawned rather than forked, so they do not inherit the threads, locks and
+        database connections of the application process.
+
+        Returns:
+            ProcessPoolExecutor | None: The process pool, or None when the hashing runs in the calling thread.
+        """
+        if self.settings.workers <= 0:
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.settings.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_lower_priority,
+                )
+            return self._executor
@@ -0,0 +1,76 @@
+import logging
+import secrets
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.applications.enums.auth.errors import AuthErrorsEnum
+from src.domain.password_hasher import PasswordHasherInterface
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.token_service import TokenServiceInterface
+from src.domain.use_cases.auth.login import LoginUseCaseInterface
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LoginUseCase(LoginUseCaseInterface):
+    """
+    Login use case.
+
+    This class implements the LoginUseCaseInterface. The password is checked by the password hasher,
+    off the request thread, and a hash made with outdated parameters is replaced by the one the
+    check returns. An unknown email is checked against a decoy hash, so it takes as long to reject
+    as a wrong password and the response time does not reveal which emails have an account.
+
+    Attributes:
+        user_repository (UserRepositoryInterface): The user repository interface.
+        password_hasher (PasswordHasherInterface): The hasher the passwords are checked with.
+        token_service (TokenServiceInterface): The service the access tokens are issued by.
+
+    Methods:
+        login(email: str, password: str) -> dict:
+            Check the credentials of a user and issue an access token.
+
+    """
+
+    user_repository: UserRepositoryInterface
+    password_hasher: PasswordHasherInterface
+    token_service: TokenServiceInterface
+    auth_errors_enum = AuthErrorsEnum
+    _decoy_hash: Optional[str] = field(default=None, init=False, repr=False)
+
+    def login(self, email: str, password: str) -> dict:
+        """
+        Check the credentials of a user and issue an access token.
+
+        Args:
+            email (str): The email of the user.
+            password (str): The password of the user.
+
+        Returns:
+            dict: A dictionary with the AccessTokenDTO, or the error when the credentials are wrong.
+        """
+        user = self.user_repository.get_user_by_email(email)
+        if user is None:
+            self.password_hasher.verify(password, self._get_decoy_hash())
+            return {"data": self.auth_errors_enum.INVALID_CREDENTIALS.value, "success": False}
+        valid, new_hash = self.password_hasher.verify(password, user.password)
+        if not valid:
+            return {"data": self.auth_errors_enum.INVALID_CREDENTIALS.value, "success": False}
+        if new_hash is not None:
+            try:
+                self.user_repository.update_password(user.id, new_hash)
+            except Exception:
+                logger.exception("Rehashing the password of the user %s failed.", user.id)
+        return {"data": self.token_service.issue(user.id), "success": True}
+
+    def _get_decoy_hash(self) -> str:
+        """
+        Get the hash unknown emails are checked against, made with the current parameters on first use.
+
+        Returns:
+            str: The decoy hash.
+        """
+        if self._decoy_hash is None:
+            self._decoy_hash = self.password_hasher.hash(secrets.token_urlsafe(16))
+        return self._decoy_hash
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+from src.applications.dtos import TokenClaimsDTO
+from src.domain.token_service import TokenServiceInterface
+from src.domain.use_cases.auth.logout import LogoutUseCaseInterface
+
+
+@dataclass
+class LogoutUseCase(LogoutUseCaseInterface):
+    """
+    Logout use case.
+
+    This class implements the LogoutUseCaseInterface by revoking the access token the request was
+    authenticated with.
+
+    Attributes:
+        token_service (TokenServiceInterface): The service the access tokens are revoked with.
+
+    Methods:
+        logout(claims: TokenClaimsDTO) -> dict:
+            Revoke the access token a request was authenticated with.
+
+    """
+
+    token_service: TokenServiceInterface
+
+    def logout(self, claims: TokenClaimsDTO) -> dict:
+        """
+        Revoke the access token a request was authenticated with.
+
+        Args:
+            claims (TokenClaimsDTO): The claims of the token.
+
+        Returns:
+            dict: A dictionary indicating the success of the logout.
+        """
+        self.token_service.revoke(claims)
+        return {"data": None, "success": True}
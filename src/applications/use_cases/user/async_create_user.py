@@ -0,0 +1,54 @@
+from dataclasses import dataclass, replace
+
+from src.applications.dtos.user import UserDTO
+from src.applications.enums.user.errors import UserErrorsEnum
+from src.domain.exceptions import EmailAlreadyExistsError
+from src.domain.password_hasher import PasswordHasherInterface
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+from src.domain.unit_of_work import AsyncUnitOfWorkInterface
+from src.domain.use_cases.user.async_create_user import AsyncCreateUserUseCaseInterface
+from src.domain.entities.user import UserEntity
+
+
+@dataclass
+class AsyncCreateUserUseCase(AsyncCreateUserUseCaseInterface):
+    """
+    Asynchronous create user use case.
+
+    This class implements the AsyncCreateUserUseCaseInterface on top of an asynchronous repository. The
+    password hash is awaited before the unit of work begins, so the event loop keeps serving meanwhile.
+
+    Attributes:
+        user_repository (AsyncUserRepositoryInterface): The asynchronous user repository interface.
+        unit_of_work (AsyncUnitOfWorkInterface): The unit of work the repository calls run in.
+        password_hasher (PasswordHasherInterface): The hasher the password is stored hashed with.
+        user_entity (UserEntity): The user entity class.
+        user_dto (UserDTO): The user DTO class.
+
+    """
+
+    user_repository: AsyncUserRepositoryInterface
+    unit_of_work: AsyncUnitOfWorkInterface
+    password_hasher: PasswordHasherInterface
+    user_dto = UserDTO
+    user_entity = UserEntity
+    user_errors_enum = UserErrorsEnum
+
+    async def create_user(self, user_dto: UserDTO) -> dict:
+        """
+        Create a new user with the provided user DTO.
+
+        Args:
+            user_dto (UserDTO): The user DTO containing the user data.
+
+        Returns:
+            dict: A dictionary with the created user DTO, or the error when the email already exists.
+        """
+        dto = replace(user_dto, password=await self.password_hasher.hash_async(user_dto.password))
+        async with self.unit_of_work:
+            try:
+                user_created = await self.user_repository.create_user(dto)
+            except EmailAlreadyExistsError:
+                return {"data": self.user_errors_enum.EMAIL_ALREADY_EXISTS.value, "success": False}
+            await self.unit_of_work.commit()
+        return {"data": user_created, "success": True}
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+
+from src.applications.dtos.user import UserDTO
+from src.applications.enums.user.errors import UserErrorsEnum
+from src.applications.enums.user.success import UserSuccessEnum
+from src.domain.exceptions import UserNotFoundError
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+from src.domain.unit_of_work import AsyncUnitOfWorkInterface
+from src.domain.use_cases.user.async_delete_user import AsyncDeleteUserUseCaseInterface
+from src.domain.entities.user import UserEntity
+
+
+@dataclass
+class AsyncDeleteUserUseCase(AsyncDeleteUserUseCaseInterface):
+    """
+    Asynchronous delete user use case.
+
+    This class implements the AsyncDeleteUserUseCaseInterface on top of an asynchronous repository.
+
+    Attributes:
+        user_repository (AsyncUserRepositoryInterface): The asynchronous user repository interface.
+        unit_of_work (AsyncUnitOfWorkInterface): The unit of work the repository calls run in.
+        user_entity (UserEntity): The user entity class.
+        user_dto (UserDTO): The user DTO class.
+
+    """
+
+    user_repository: AsyncUserRepositoryInterface
+    unit_of_work: AsyncUnitOfWorkInterface
+    user_dto = UserDTO
+    user_entity = UserEntity
+    user_errors_enum = UserErrorsEnum
+    user_success_enum = UserSuccessEnum
+
+    async def delete_user(self, user_id: int) -> dict:
+        """
+        Delete a user by their ID.
+
+        Args:
+            user_id (int): The ID of the user to delete.
+
+        Returns:
+            dict: A dictionary indicating the success or failure of the deletion operation.
+        """
+        async with self.unit_of_work:
+            try:
+                await self.user_repository.delete_user(user_id=user_id)
+            except UserNotFoundError:
+                return {"data": self.user_errors_enum.READ_NOT_FOUND.value, "success": False}
+            await self.unit_of_work.commit()
+        return {"data": self.user_success_enum.DELETE_SUCCESS.value, "success": True}
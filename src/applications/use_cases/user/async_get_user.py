@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+
+from src.applications.dtos.user import UserDTO
+from src.applications.enums.user.errors import UserErrorsEnum
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+from src.domain.use_cases.user.async_get_user import AsyncGetUserUseCaseInterface
+
+
+@dataclass
+class AsyncGetUserUseCase(AsyncGetUserUseCaseInterface):
+    """
+    Concrete implementation of the AsyncGetUserUseCaseInterface.
+
+    This use case retrieves a user from the data source using their email, without blocking the event loop.
+
+    Attributes:
+        user_repository (AsyncUserRepositoryInterface): The asynchronous repository that provides
+            access to the user data.
+        user_dto (UserDTO): The user DTO class used to transfer user data between
+            layers of the application.
+        user_errors_enum (UserErrorsEnum): Enum class representing common errors related
+            to user operations (CRUD).
+
+    """
+
+    user_repository: AsyncUserRepositoryInterface
+    user_dto: UserDTO = UserDTO
+    user_errors_enum = UserErrorsEnum
+
+    async def get_user_by_email(self, email: str) -> dict:
+        """
+        Retrieves a user by their email from the data source.
+
+        Args:
+            email (str): The email of the user to retrieve.
+
+        Returns:
+            dict: A dictionary containing the user details if found. If the user is not found,
+                it returns a dictionary with error details using the user_errors_enum.
+        """
+        user_dto = await self.user_repository.get_user_by_email(email=email)
+        if user_dto is None:
+            return {"data": self.user_errors_enum.READ_NOT_FOUND.value, "success": False}
+        return {"data": user_dto, "success": True}
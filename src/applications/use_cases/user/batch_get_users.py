@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+from typing import List
+
+from src.applications.dtos.user import UserDTO
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.use_cases.user.batch_get_users import BatchGetUsersUseCaseInterface
+
+
+@dataclass
+class BatchGetUsersUseCase(BatchGetUsersUseCaseInterface):
+    """
+    Batch get users use case.
+
+    This class implements the BatchGetUsersUseCaseInterface: the IDs and the emails are each resolved
+    with a single repository call instead of one lookup per user.
+
+    Attributes:
+        user_repository (UserRepositoryInterface): The user repository interface.
+        user_dto (UserDTO): The user DTO class.
+
+    Methods:
+        get_users(user_ids: List[int], emails: List[str]) -> dict:
+            Resolve users by their IDs and their emails.
+
+    """
+
+    user_repository: UserRepositoryInterface
+    user_dto = UserDTO
+
+    def get_users(self, user_ids: List[int], emails: List[str]) -> dict:
+        """
+        Resolve users by their IDs and their emails.
+
+        Args:
+            user_ids (List[int]): The IDs of the users to resolve.
+            emails (List[str]): The emails of the users to resolve.
+
+        Returns:
+            dict: A dictionary whose 'data' holds the users keyed by requested ID ('users_by_id') and by
+                requested email ('users_by_email'), and the requested IDs and emails no user has
+                ('missing_ids' and 'missing_emails'), in request order.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        emails = list(dict.fromkeys(emails))
+        found_by_id = {user.id: user for user in self.user_repository.get_users_by_ids(user_ids)} if user_ids else {}
+        found_by_email = (
+            {user.email: user for user in self.user_repository.get_users_by_emails(emails)} if emails else {}
+        )
+        return {
+            "data": {
+                "users_by_id": {user_id: found_by_id[user_id] for user_id in user_ids if user_id in found_by_id},
+                "users_by_email": {email: found_by_email[email] for email in emails if email in found_by_email},
+                "missing_ids": [user_id for user_id in user_ids if user_id not in found_by_id],
+                "missing_emails": [email for email in emails if email not in found_by_email],
+            },
+            "success": True,
+        }
@@ -0,0 +1,112 @@
+from dataclasses import dataclass, replace
+from itertools import islice
+from typing import Iterable, List, Tuple
+
+from src.applications.dtos.user import UserDTO
+from src.applications.enums.user.errors import UserErrorsEnum
+from src.domain.password_hasher import PasswordHasherInterface
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.unit_of_work import UnitOfWorkInterface
+from src.domain.use_cases.user.bulk_create_users import BulkCreateUsersUseCaseInterface
+from src.domain.entities.user import UserEntity
+
+
+@dataclass
+class BulkCreateUsersUseCase(BulkCreateUsersUseCaseInterface):
+    """
+    Bulk create users use case.
+
+    This class implements the BulkCreateUsersUseCaseInterface and provides the functionality to import
+    many users at once. The rows are consumed lazily and inserted `batch_size` at a time, each batch in
+    its own unit of work, so a large import never holds more than one batch in memory and a failing
+    batch does not undo the batches committed before it. The passwords of a batch are hashed across
+    the processes of the password hasher before its unit of work begins.
+
+    Attributes:
+        user_repository (UserRepositoryInterface): The user repository interface.
+        unit_of_work (UnitOfWorkInterface): The unit of work each batch of users is created in.
+        password_hasher (PasswordHasherInterface): The hasher the passwords are stored hashed with.
+        batch_size (int): The number of users inserted per statement.
+        user_entity (UserEntity): The user entity class.
+        user_dto (UserDTO): The user DTO class.
+
+    Methods:
+        create_users(rows: Iterable[Tuple[int, UserDTO]]) -> dict:
+            Create the users of an import and report the created users and the failed rows.
+
+    """
+
+    user_repository: UserRepositoryInterface
+    unit_of_work: UnitOfWorkInterface
+    password_hasher: PasswordHasherInterface
+    batch_size: int = 1000
+    user_dto = UserDTO
+    user_entity = UserEntity
+    user_errors_enum = UserErrorsEnum
+
+    def create_users(self, rows: Iterable[Tuple[int, UserDTO]]) -> dict:
+        """
+        Create the users of an import and report the created users and the failed rows.
+
+        A row fails when its email is already taken, either by an existing user or by an earlier row
+        of the same import.
+
+        Args:
+            rows (Iterable[Tuple[int, UserDTO]]): The users to create, with the number of their row in the import.
+
+        Returns:
+            dict: The report, with the 'created' entries ('row', 'id', 'email') and the 'failed'
+                entries ('row', 'email', 'error') under 'data'.
+        """
+        created: List[dict] = []
+        failed: List[dict] = []
+        seen_emails = set()
+        rows = iter(rows)
+        while True:
+            batch = []
+            for row, user_dto in islice(rows, self.batch_size):
+                if user_dto.email in seen_emails:
+                    failed.append(self._failure(row, user_dto.email))
+                    continue
+                seen_emails.add(user_dto.email)
+                batch.append((row, user_dto))
+            if not batch:
+                break
+            self._create_batch(batch, created, failed)
+        return {"data": {"created": created, "failed": failed}, "success": True}
+
+    def _create_batch(self, batch: List[Tuple[int, UserDTO]], created: List[dict], failed: List[dict]) -> None:
+        """
+        Create a batch of users with a single statement and record the outcome of each row.
+
+        Args:
+            batch (List[Tuple[int, UserDTO]]): The users of the batch, with the number of their row.
+            created (List[dict]): The created entries of the report, extended in place.
+            failed (List[dict]): The failed entries of the report, extended in place.
+        """
+        password_hashes = self.password_hasher.hash_many([user_dto.password for _, user_dto in batch])
+        users = [
+            replace(user_dto, password=password_hash) for (_, user_dto), password_hash in zip(batch, password_hashes)
+        ]
+        with self.unit_of_work:
+            created_users = self.user_repository.create_users(users)
+            self.unit_of_work.commit()
+        ids_by_email = {user.email: user.id for user in created_users}
+        for row, user_dto in batch:
+            if user_dto.email in ids_by_email:
+                created.append({"row": row, "id": ids_by_email[user_dto.email], "email": user_dto.email})
+            else:
+                failed.append(self._failure(row, user_dto.email))
+
+    def _failure(self, row: int, email: str) -> dict:
+        """
+        Build the failed entry of a row whose email is already taken.
+
+        Args:
+            row (int): The number of the row in the import.
+            email (str): The email of the row.
+
+        Returns:
+            dict: The failed entry of the report.
+        """
+        return {"row": row, "email": email, "error": self.user_errors_enum.EMAIL_ALREADY_EXISTS.value}
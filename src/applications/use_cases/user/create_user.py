@@ -1,8 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from src.applications.dtos.user import UserDTO
 from src.applications.enums.user.errors import UserErrorsEnum
+from src.domain.exceptions import EmailAlreadyExistsError
+from src.domain.password_hasher import PasswordHasherInterface
 from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.unit_of_work import UnitOfWorkInterface
 from src.domain.use_cases.user.create_user import CreateUserUseCaseInterface
 from src.domain.entities.user import UserEntity
 
@@ -13,9 +16,12 @@ class CreateUserUseCase(CreateUserUseCaseInterface):
     Create user use case.
 
     This class implements the CreateUserUseCaseInterface and provides the functionality to create a new user.
+    The password is hashed before the unit of work begins, so no connection is held during the hashing.
 
     Attributes:
         user_repository (UserRepositoryInterface): The user repository interface.
+        unit_of_work (UnitOfWorkInterface): The unit of work the repository calls run in.
+        password_hasher (PasswordHasherInterface): The hasher the password is stored hashed with.
         user_entity (UserEntity): The user entity class.
         user_dto (UserDTO): The user DTO class.
 
@@ -26,6 +32,8 @@ class CreateUserUseCase(CreateUserUseCaseInterface):
     """
 
     user_repository: UserRepositoryInterface
+    unit_of_work: UnitOfWorkInterface
+    password_hasher: PasswordHasherInterface
     user_dto = UserDTO
     user_entity = UserEntity
     user_errors_enum = UserErrorsEnum
@@ -40,10 +48,11 @@ class CreateUserUseCase(CreateUserUseCaseInterface):
         Returns:
             user_dto (UserDTO): The created user DTO.
         """
-        user_entity = user_dto.to_domain()
-        dto = user_dto.to_dto(user_entity)
-        user = self.user_repository.get_user_by_email(email=dto.email)
-        if user:
-            return {"data": self.user_errors_enum.EMAIL_ALREADY_EXISTS.value, "success": False}
-        user_created = self.user_repository.create_user(dto)
+        dto = replace(user_dto, password=self.password_hasher.hash(user_dto.password))
+        with self.unit_of_work:
+            try:
+                user_created = self.user_repository.create_user(dto)
+            except EmailAlreadyExistsError:
+                return {"data": self.user_errors_enum.EMAIL_ALREADY_EXISTS.value, "success": False}
+            self.unit_of_work.commit()
         return {"data": user_created, "success": True}
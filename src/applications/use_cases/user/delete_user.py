@@ -3,7 +3,9 @@ from dataclasses import dataclass
 from src.applications.dtos.user import UserDTO
 from src.applications.enums.user.errors import UserErrorsEnum
 from src.applications.enums.user.success import UserSuccessEnum
+from src.domain.exceptions import UserNotFoundError
 from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.unit_of_work import UnitOfWorkInterface
 from src.domain.use_cases.user.delete_user import DeleteUserUseCaseInterface
 from src.domain.entities.user import UserEntity
 
@@ -17,6 +19,7 @@ class DeleteUserUseCase(DeleteUserUseCaseInterface):
 
     Attributes:
         user_repository (UserRepositoryInterface): The user repository interface.
+        unit_of_work (UnitOfWorkInterface): The unit of work the repository calls run in.
         user_entity (UserEntity): The user entity class.
         user_dto (UserDTO): The user DTO class.
 
@@ -27,6 +30,7 @@ class DeleteUserUseCase(DeleteUserUseCaseInterface):
     """
 
     user_repository: UserRepositoryInterface
+    unit_of_work: UnitOfWorkInterface
     user_dto = UserDTO
     user_entity = UserEntity
     user_errors_enum = UserErrorsEnum
@@ -42,8 +46,10 @@ class DeleteUserUseCase(DeleteUserUseCaseInterface):
         Returns:
             dict: A dictionary indicating the success or failure of the deletion operation.
         """
-        user = self.user_repository.get_user_by_id(user_id=user_id)
-        if user is None:
-            return {"data": self.user_errors_enum.READ_NOT_FOUND.value, "success": False}
-        self.user_repository.delete_user(user_id=user.id)
+        with self.unit_of_work:
+            try:
+                self.user_repository.delete_user(user_id=user_id)
+            except UserNotFoundError:
+                return {"data": self.user_errors_enum.READ_NOT_FOUND.value, "success": False}
+            self.unit_of_work.commit()
         return {"data": self.user_success_enum.DELETE_SUCCESS.value, "success": True}
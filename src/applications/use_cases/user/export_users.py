@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+from src.applications.dtos.user import UserDTO
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.use_cases.user.export_users import ExportUsersUseCaseInterface
+
+
+@dataclass
+class ExportUsersUseCase(ExportUsersUseCaseInterface):
+    """
+    Export users use case.
+
+    This class implements the ExportUsersUseCaseInterface. The users are not loaded up front: the
+    returned iterator reads them from the repository in batches as it is consumed.
+
+    Attributes:
+        user_repository (UserRepositoryInterface): The user repository interface.
+        batch_size (int): The number of users fetched from the database per round-trip.
+        user_dto (UserDTO): The user DTO class.
+
+    Methods:
+        export_users() -> dict:
+            Stream every user in ID order.
+
+    """
+
+    user_repository: UserRepositoryInterface
+    batch_size: int = 1000
+    user_dto = UserDTO
+
+    def export_users(self) -> dict:
+        """
+        Stream every user in ID order.
+
+        Returns:
+            dict: A dictionary with the lazy iterator of the user DTOs under 'data'.
+        """
+        return {"data": self.user_repository.iter_users(batch_size=self.batch_size), "success": True}
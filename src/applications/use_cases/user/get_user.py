@@ -45,6 +45,4 @@ class GetUserUseCase(GetUserUseCaseInterface):
         user_dto = self.user_repository.get_user_by_email(email=email)
         if user_dto is None:
             return {"data": self.user_errors_enum.READ_NOT_FOUND.value, "success": False}
-        user_entity = user_dto.to_domain()
-        dto = user_dto.to_dto(user_entity)
-        return {"data": dto, "success": True}
+        return {"data": user_dto, "success": True}
@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from src.applications.dtos.user import UserDTO
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.use_cases.user.list_users import ListUsersUseCaseInterface
+
+
+@dataclass
+class ListUsersUseCase(ListUsersUseCaseInterface):
+    """
+    List users use case.
+
+    This class implements the ListUsersUseCaseInterface with keyset pagination: a page is identified
+    by the ID of the last user of the previous page rather than by an offset. One extra user is
+    fetched to tell whether a next page exists without a second query.
+
+    Attributes:
+        user_repository (UserRepositoryInterface): The user repository interface.
+        user_dto (UserDTO): The user DTO class.
+
+    Methods:
+        list_users(after_id: Optional[int], limit: int, include_total: bool) -> dict:
+            Retrieve a page of users in ID order.
+
+    """
+
+    user_repository: UserRepositoryInterface
+    user_dto = UserDTO
+
+    def list_users(self, after_id: Optional[int] = None, limit: int = 50, include_total: bool = False) -> dict:
+        """
+        Retrieve a page of users in ID order.
+
+        Args:
+            after_id (int, optional): The ID of the last user of the previous page, None for the first page.
+            limit (int): The maximum number of users of the page.
+            include_total (bool): Whether to estimate the total number of users.
+
+        Returns:
+            dict: A dictionary whose 'data' holds the 'users' of the page, the 'next_after_id' to pass to
+                get the next page (None on the last page) and the 'total_estimate' (None unless requested).
+        """
+        users = self.user_repository.list_users(after_id=after_id, limit=limit + 1)
+        has_next_page = len(users) > limit
+        users = users[:limit]
+        return {
+            "data": {
+                "users": users,
+                "next_after_id": users[-1].id if has_next_page else None,
+                "total_estimate": self.user_repository.estimate_user_count() if include_total else None,
+            },
+            "success": True,
+        }
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+
+from src.applications.dtos.user import UserDTO
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.use_cases.user.search_users import SearchUsersUseCaseInterface
+
+
+@dataclass
+class SearchUsersUseCase(SearchUsersUseCaseInterface):
+    """
+    Search users use case.
+
+    This class implements the SearchUsersUseCaseInterface for the type-ahead lookups of the staff.
+
+    Attributes:
+        user_repository (UserRepositoryInterface): The user repository interface.
+        user_dto (UserDTO): The user DTO class.
+
+    Methods:
+        search_users(query: str, limit: int) -> dict:
+            Find the users whose name or email contains a text, best matches first.
+
+    """
+
+    user_repository: UserRepositoryInterface
+    user_dto = UserDTO
+
+    def search_users(self, query: str, limit: int = 20) -> dict:
+        """
+        Find the users whose name or email contains a text, best matches first.
+
+        Args:
+            query (str): The text to look for. Surrounding whitespace is ignored.
+            limit (int): The maximum number of users to return.
+
+        Returns:
+            dict: A dictionary with the list of the matching user DTOs under 'data'.
+        """
+        return {"data": self.user_repository.search_users(query.strip(), limit=limit), "success": True}
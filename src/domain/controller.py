@@ -15,3 +15,18 @@ class ControllerInterface(ABC):
         Returns:
             HttpResponse: The generated HTTP response.
         """
+
+
+class AsyncControllerInterface(ABC):
+    """Interface for defining a route handled by a coroutine."""
+
+    @abstractmethod
+    async def route(self, http_request: HttpRequest) -> HttpResponse:
+        """Route the HTTP request and return the corresponding HTTP response without blocking the event loop.
+
+        Args:
+            http_request (HttpRequest): The incoming HTTP request.
+
+        Returns:
+            HttpResponse: The generated HTTP response.
+        """
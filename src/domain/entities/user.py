@@ -3,9 +3,9 @@ from typing import Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UserEntity:
-    """Class representing a user.
+    """Class representing a user, as an immutable, slotted record.
 
     Attributes:
         id (Optional[int]): The user's ID.
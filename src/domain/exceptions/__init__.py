@@ -0,0 +1,2 @@
+from .auth import InvalidTokenError
+from .user import EmailAlreadyExistsError, UserNotFoundError
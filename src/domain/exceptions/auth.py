@@ -0,0 +1,17 @@
+class InvalidTokenError(Exception):
+    """
+    Raised by a token service when an access token is malformed, forged, expired or revoked.
+
+    Attributes:
+        reason (str): Why the token was rejected.
+    """
+
+    def __init__(self, reason: str) -> None:
+        """
+        Initialize a new instance of InvalidTokenError.
+
+        Args:
+            reason (str): Why the token was rejected.
+        """
+        super().__init__(f"Invalid access token: {reason}.")
+        self.reason = reason
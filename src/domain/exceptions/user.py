@@ -0,0 +1,36 @@
+class EmailAlreadyExistsError(Exception):
+    """
+    Raised by a user repository when a user is created with an email that is already taken.
+
+    Attributes:
+        email (str): The email that is already taken.
+    """
+
+    def __init__(self, email: str) -> None:
+        """
+        Initialize a new instance of EmailAlreadyExistsError.
+
+        Args:
+            email (str): The email that is already taken.
+        """
+        super().__init__(f"A user with the email '{email}' already exists.")
+        self.email = email
+
+
+class UserNotFoundError(Exception):
+    """
+    Raised by a user repository when the user targeted by an operation does not exist.
+
+    Attributes:
+        user_id (int): The ID of the missing user.
+    """
+
+    def __init__(self, user_id: int) -> None:
+        """
+        Initialize a new instance of UserNotFoundError.
+
+        Args:
+            user_id (int): The ID of the missing user.
+        """
+        super().__init__(f"User with the ID '{user_id}' not found.")
+        self.user_id = user_id
@@ -0,0 +1,91 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+
+class PasswordHasherInterface(ABC):
+    """
+    Interface for a password hasher.
+
+    A password hasher turns passwords into salted, slow hashes and checks passwords against them. The
+    hashes carry their algorithm and cost parameters, so a hash made with parameters that are no
+    longer the configured ones is recognized and replaced on the next successful verification.
+    """
+
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        """
+        Hash a password.
+
+        Args:
+            password (str): The password to hash.
+
+        Returns:
+            str: The encoded hash, with its algorithm, cost parameters and salt.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
+
+    @abstractmethod
+    def hash_many(self, passwords: List[str]) -> List[str]:
+        """
+        Hash several passwords.
+
+        Args:
+            passwords (List[str]): The passwords to hash.
+
+        Returns:
+            List[str]: The encoded hashes, in the order of the passwords.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
+
+    @abstractmethod
+    def verify(self, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+        """
+        Check a password against a hash, rehashing it when the hash parameters are outdated.
+
+        Args:
+            password (str): The password to check.
+            password_hash (str): The encoded hash to check the password against.
+
+        Returns:
+            Tuple[bool, Optional[str]]: Whether the password matches, and the new hash to store when it
+                matches a hash made with outdated parameters, or None.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
+
+    @abstractmethod
+    async def hash_async(self, password: str) -> str:
+        """
+        Hash a password without blocking the event loop.
+
+        Args:
+            password (str): The password to hash.
+
+        Returns:
+            str: The encoded hash, with its algorithm, cost parameters and salt.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
+
+    @abstractmethod
+    async def verify_async(self, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+        """
+        Check a password against a hash without blocking the event loop, rehashing outdated hashes.
+
+        Args:
+            password (str): The password to check.
+            password_hash (str): The encoded hash to check the password against.
+
+        Returns:
+            Tuple[bool, Optional[str]]: Whether the password matches, and the new hash to store when it
+                matches a hash made with outdated parameters, or None.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
@@ -0,0 +1,78 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from src.applications.dtos import UserDTO
+
+
+class AsyncUserRepositoryInterface(ABC):
+    """
+    Interface for asynchronous user repository.
+
+    This interface mirrors UserRepositoryInterface with coroutine methods, so the data can be
+    accessed without blocking the event loop.
+
+    """
+
+    @abstractmethod
+    async def create_user(self, user: UserDTO) -> UserDTO:
+        """
+        Create a new user.
+
+        Implementations must rely on the unique email constraint to detect duplicates atomically.
+
+        Args:
+            user (UserDTO): The user DTO containing the user data.
+
+        Returns:
+            UserDTO: The created user DTO.
+
+        Raises:
+            EmailAlreadyExistsError: If a user with the same email already exists.
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+            Exception: If an error occurs during user creation.
+        """
+
+    @abstractmethod
+    async def get_user_by_email(self, email: str) -> Optional[UserDTO]:
+        """
+        Get a user by their email.
+
+        Args:
+            email (str): The email of the user to retrieve.
+
+        Returns:
+            UserDTO | None: The user DTO representing the user's information if found, or None if not found.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+            Exception: If an error occurs while retrieving the user.
+        """
+
+    @abstractmethod
+    async def get_user_by_id(self, user_id: int) -> Optional[UserDTO]:
+        """
+        Get a user by their ID.
+
+        Args:
+            user_id (int): The ID of the user to retrieve.
+
+        Returns:
+            UserDTO | None: The user DTO representing the user's information if found, or None if not found.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+            Exception: If an error occurs while retrieving the user.
+        """
+
+    @abstractmethod
+    async def delete_user(self, user_id: int) -> None:
+        """
+        Delete a user by their ID.
+
+        Args:
+            user_id (int): The ID of the user to delete.
+
+        Raises:
+            UserNotFoundError: If no user has the given ID.
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+            Exception: If an error occurs while deleting the user.
+        """
@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+
+
+class RevokedTokenRepositoryInterface(ABC):
+    """
+    Interface for the repository of the access tokens revoked before their expiry.
+
+    A revoked token only needs to be remembered until it expires, after which it is rejected anyway.
+    """
+
+    @abstractmethod
+    def revoke_token(self, token_id: str, expires_at: datetime) -> None:
+        """
+        Record the revocation of a token. Revoking a token twice is not an error.
+
+        Args:
+            token_id (str): The unique ID of the token.
+            expires_at (datetime): When the token expires.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+            Exception: If an error occurs while recording the revocation.
+        """
+
+    @abstractmethod
+    def get_revoked_token_ids(self, now: datetime) -> List[str]:
+        """
+        Retrieve the IDs of the revoked tokens that have not expired yet.
+
+        Args:
+            now (datetime): The current time, the tokens expired before it are left out.
+
+        Returns:
+            List[str]: The IDs of the revoked tokens.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+            Exception: If an error occurs while retrieving the tokens.
+        """
+
+    @abstractmethod
+    def delete_expired_tokens(self, now: datetime) -> int:
+        """
+        Forget the revoked tokens that have expired.
+
+        Args:
+            now (datetime): The current time.
+
+        Returns:
+            int: The number of forgotten tokens.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+            Exception: If an error occurs while deleting the tokens.
+        """
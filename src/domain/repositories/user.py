@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterator, List, Optional
 from src.applications.dtos import UserDTO
 
 
@@ -16,12 +16,31 @@ class UserRepositoryInterface(ABC):
         """
         Create a new user.
 
+        Implementations must rely on the unique email constraint to detect duplicates atomically.
+
         Args:
             user (UserDTO): The user DTO containing the user data.
 
         Returns:
             UserDTO: The created user DTO.
 
+        Raises:
+            EmailAlreadyExistsError: If a user with the same email already exists.
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+            Exception: If an error occurs during user creation.
+        """
+
+    @abstractmethod
+    def create_users(self, users: List[UserDTO]) -> List[UserDTO]:
+        """
+        Create several users at once, skipping those whose email is already taken.
+
+        Args:
+            users (List[UserDTO]): The user DTOs containing the user data.
+
+        Returns:
+            List[UserDTO]: The created users. Users whose email is already taken are left out.
+
         Raises:
             NotImplementedError: If the method is not implemented by a concrete subclass.
             Exception: If an error occurs during user creation.
@@ -65,6 +84,100 @@ class UserRepositoryInterface(ABC):
             Exception: If an error occurs while retrieving the user.
         """
 
+    @abstractmethod
+    def get_users_by_ids(self, user_ids: List[int]) -> List[UserDTO]:
+        """
+        Retrieve several users by their IDs at once.
+
+        Args:
+            user_ids (List[int]): The IDs of the users to retrieve.
+
+        Returns:
+            List[UserDTO]: The users found, in no particular order. Unknown IDs are left out.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+            Exception: If an error occurs while retrieving the users.
+        """
+
+    @abstractmethod
+    def get_users_by_emails(self, emails: List[str]) -> List[UserDTO]:
+        """
+        Retrieve several users by their emails at once.
+
+        Args:
+            emails (List[str]): The emails of the users to retrieve.
+
+        Returns:
+            List[UserDTO]: The users found, in no particular order. Unknown emails are left out.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+            Exception: If an error occurs while retrieving the users.
+        """
+
+    @abstractmethod
+    def list_users(self, after_id: Optional[int] = None, limit: int = 50) -> List[UserDTO]:
+        """
+        Retrieve a page of users in ID order, starting after a given ID.
+
+        Args:
+            after_id (int, optional): The ID of the last user of the previous page, None for the first page.
+            limit (int): The maximum number of users of the page.
+
+        Returns:
+            List[UserDTO]: The users of the page.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+            Exception: If an error occurs while retrieving the users.
+        """
+
+    @abstractmethod
+    def search_users(self, query: str, limit: int = 20) -> List[UserDTO]:
+        """
+        Find the users whose name or email contains a text, best matches first.
+
+        Args:
+            query (str): The text to look for, case-insensitively.
+            limit (int): The maximum number of users to return.
+
+        Returns:
+            List[UserDTO]: The matching users.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+            Exception: If an error occurs while searching the users.
+        """
+
+    @abstractmethod
+    def estimate_user_count(self) -> int:
+        """
+        Estimate the number of users cheaply, trading exactness for speed where the database allows it.
+
+        Returns:
+            int: The estimated number of users.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+            Exception: If an error occurs while counting the users.
+        """
+
+    @abstractmethod
+    def update_password(self, user_id: int, password_hash: str) -> None:
+        """
+        Replace the password hash of a user.
+
+        Args:
+            user_id (int): The ID of the user.
+            password_hash (str): The new password hash.
+
+        Raises:
+            UserNotFoundError: If no user has the given ID.
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+            Exception: If an error occurs while updating the user.
+        """
+
     @abstractmethod
     def delete_user(self, user_id: int) -> None:
         """
@@ -74,6 +187,23 @@ class UserRepositoryInterface(ABC):
             user_id (int): The ID of the user to delete.
 
         Raises:
+            UserNotFoundError: If no user has the given ID.
             NotImplementedError: If the method is not implemented by a concrete subclass.
             Exception: If an error occurs while deleting the user.
         """
+
+    @abstractmethod
+    def iter_users(self, batch_size: int = 1000) -> Iterator[UserDTO]:
+        """
+        Stream every user in ID order without loading the whole table in memory.
+
+        Args:
+            batch_size (int): The number of rows fetched per round-trip.
+
+        Yields:
+            user_dto (UserDTO): A user.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+            Exception: If an error occurs while reading the users.
+        """
@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+
+from src.applications.dtos import AccessTokenDTO, TokenClaimsDTO
+
+
+class TokenServiceInterface(ABC):
+    """
+    Interface for an access token service.
+
+    A token service issues signed, expiring access tokens and verifies the tokens presented with the
+    requests. Verifying a token is done in memory, without a database round-trip, so it can guard
+    every request.
+    """
+
+    @abstractmethod
+    def issue(self, user_id: int) -> AccessTokenDTO:
+        """
+        Issue an access token to a user.
+
+        Args:
+            user_id (int): The ID of the user the token is issued to.
+
+        Returns:
+            AccessTokenDTO: The signed token and its expiry.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
+
+    @abstractmethod
+    def verify(self, token: str) -> TokenClaimsDTO:
+        """
+        Verify an access token and get its claims.
+
+        Args:
+            token (str): The token presented with a request.
+
+        Returns:
+            TokenClaimsDTO: The claims of the token.
+
+        Raises:
+            InvalidTokenError: If the token is malformed, forged, expired or revoked.
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
+
+    @abstractmethod
+    def revoke(self, claims: TokenClaimsDTO) -> None:
+        """
+        Revoke an access token before it expires.
+
+        Args:
+            claims (TokenClaimsDTO): The claims of the token to revoke.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
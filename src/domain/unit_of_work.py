@@ -0,0 +1,139 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+
+class UnitOfWorkInterface(ABC):
+    """
+    Interface for a unit of work.
+
+    A unit of work groups the repository calls made inside its `with` block in a single session and
+    a single transaction. The work is persisted by `commit`, and discarded when the block is left
+    without committing or with an exception. Nested blocks join the outermost one, which alone
+    commits or rolls back the transaction.
+    """
+
+    @abstractmethod
+    def __enter__(self) -> "UnitOfWorkInterface":
+        """
+        Begin the unit of work.
+
+        Returns:
+            UnitOfWorkInterface: This unit of work.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
+
+    @abstractmethod
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """
+        End the unit of work, discarding the work that was not committed.
+
+        Args:
+            exc_type (Any): The exception type, if any.
+            exc_val (Any): The exception value, if any.
+            exc_tb (Any): The exception traceback, if any.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
+
+    @abstractmethod
+    def commit(self) -> None:
+        """
+        Persist the work done in the unit of work.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """
+        Discard the work done in the unit of work.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
+
+    @abstractmethod
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Run a callback once the work done so far is committed.
+
+        The callback runs after the next commit of the outermost block, and is dropped when the work is
+        discarded. Outside of a unit of work, the work is already committed and the callback runs right away.
+
+        Args:
+            callback (Callable[[], None]): The function to run.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
+
+
+class AsyncUnitOfWorkInterface(ABC):
+    """
+    Interface for a unit of work used with `async with`.
+
+    This interface mirrors UnitOfWorkInterface with coroutine methods for the asynchronous repositories.
+    """
+
+    @abstractmethod
+    async def __aenter__(self) -> "AsyncUnitOfWorkInterface":
+        """
+        Begin the unit of work.
+
+        Returns:
+            AsyncUnitOfWorkInterface: This unit of work.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
+
+    @abstractmethod
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """
+        End the unit of work, discarding the work that was not committed.
+
+        Args:
+            exc_type (Any): The exception type, if any.
+            exc_val (Any): The exception value, if any.
+            exc_tb (Any): The exception traceback, if any.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """
+        Persist the work done in the unit of work.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """
+        Discard the work done in the unit of work.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
+
+    @abstractmethod
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Run a callback once the work done so far is committed.
+
+        The callback runs after the next commit of the outermost block, and is dropped when the work is
+        discarded. Outside of a unit of work, the work is already committed and the callback runs right away.
+
+        Args:
+            callback (Callable[[], None]): The function to run.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from src.applications.enums.auth.errors import AuthErrorsEnum
+from src.domain.password_hasher import PasswordHasherInterface
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.token_service import TokenServiceInterface
+
+
+@dataclass
+class LoginUseCaseInterface(ABC):
+    """
+    Interface for the Login use case.
+
+    This interface defines the contract for the Login use case and enforces the implementation of
+    the login method.
+
+    Attributes:
+        user_repository (UserRepositoryInterface): The user repository interface.
+        password_hasher (PasswordHasherInterface): The hasher the passwords are checked with.
+        token_service (TokenServiceInterface): The service the access tokens are issued by.
+    """
+
+    user_repository: UserRepositoryInterface
+    password_hasher: PasswordHasherInterface
+    token_service: TokenServiceInterface
+    auth_errors_enum = AuthErrorsEnum
+
+    @abstractmethod
+    def login(self, email: str, password: str) -> dict:
+        """
+        Check the credentials of a user and issue an access token.
+
+        Args:
+            email (str): The email of the user.
+            password (str): The password of the user.
+
+        Returns:
+            dict: A dictionary with the access token, or the error when the credentials are wrong.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from src.applications.dtos import TokenClaimsDTO
+from src.domain.token_service import TokenServiceInterface
+
+
+@dataclass
+class LogoutUseCaseInterface(ABC):
+    """
+    Interface for the Logout use case.
+
+    This interface defines the contract for the Logout use case and enforces the implementation of
+    the logout method.
+
+    Attributes:
+        token_service (TokenServiceInterface): The service the access tokens are revoked with.
+    """
+
+    token_service: TokenServiceInterface
+
+    @abstractmethod
+    def logout(self, claims: TokenClaimsDTO) -> dict:
+        """
+        Revoke the access token a request was authenticated with.
+
+        Args:
+            claims (TokenClaimsDTO): The claims of the token.
+
+        Returns:
+            dict: A dictionary indicating the success of the logout.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a concrete subclass.
+        """
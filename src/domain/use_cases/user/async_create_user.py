@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from src.applications.dtos.user import UserDTO
+from src.applications.enums.user.errors import UserErrorsEnum
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+from src.domain.password_hasher import PasswordHasherInterface
+from src.domain.unit_of_work import AsyncUnitOfWorkInterface
+from src.domain.entities.user import UserEntity
+
+
+@dataclass
+class AsyncCreateUserUseCaseInterface(ABC):
+    """
+    Interface for the asynchronous CreateUser use case.
+
+    This interface defines the contract for the CreateUser use case on top of an asynchronous
+    repository and enforces the implementation of the create_user coroutine.
+
+    Attributes:
+        user_repository (AsyncUserRepositoryInterface): The asynchronous user repository interface.
+        unit_of_work (AsyncUnitOfWorkInterface): The unit of work the repository calls run in.
+        password_hasher (PasswordHasherInterface): The hasher the password is stored hashed with.
+        user_entity (UserEntity): The user entity class.
+        user_dto (UserDTO): The user DTO class.
+    """
+
+    user_repository: AsyncUserRepositoryInterface
+    unit_of_work: AsyncUnitOfWorkInterface
+    password_hasher: PasswordHasherInterface
+    user_entity: UserEntity = UserEntity
+    user_dto: UserDTO = UserDTO
+    user_errors_enum = UserErrorsEnum
+
+    @abstractmethod
+    async def create_user(self, user_dto: UserDTO) -> dict:
+        """
+        Create a new user.
+
+        Args:
+            user_dto (UserDTO): The user DTO containing the user data.
+
+        Returns:
+            dict: A dictionary with the created user DTO, or the error when the user could not be created.
+        """
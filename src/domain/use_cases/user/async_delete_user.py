@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from src.applications.dtos.user import UserDTO
+from src.applications.enums.user.errors import UserErrorsEnum
+from src.applications.enums.user.success import UserSuccessEnum
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+from src.domain.unit_of_work import AsyncUnitOfWorkInterface
+from src.domain.entities.user import UserEntity
+
+
+@dataclass
+class AsyncDeleteUserUseCaseInterface(ABC):
+    """
+    Interface for the asynchronous DeleteUser use case.
+
+    Attributes:
+        user_repository (AsyncUserRepositoryInterface): The asynchronous user repository interface.
+        unit_of_work (AsyncUnitOfWorkInterface): The unit of work the repository calls run in.
+        user_entity (UserEntity): The user entity class.
+        user_dto (UserDTO): The user DTO class.
+    """
+
+    user_repository: AsyncUserRepositoryInterface
+    unit_of_work: AsyncUnitOfWorkInterface
+    user_entity: UserEntity = UserEntity
+    user_dto: UserDTO = UserDTO
+    user_errors_enum = UserErrorsEnum
+    user_success_enum = UserSuccessEnum
+
+    @abstractmethod
+    async def delete_user(self, user_id: int) -> dict:
+        """
+        Delete a user by their ID.
+
+        Args:
+            user_id (int): The ID of the user to delete.
+
+        Returns:
+            dict: A dictionary indicating the success or failure of the deletion operation.
+        """
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from src.applications.dtos.user import UserDTO
+from src.applications.enums.user.errors import UserErrorsEnum
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+
+
+@dataclass
+class AsyncGetUserUseCaseInterface(ABC):
+    """
+    Abstract class representing the asynchronous use case for getting a user by email.
+
+    Attributes:
+        user_repository (AsyncUserRepositoryInterface): The asynchronous repository that provides
+            access to the user data.
+        user_dto (UserDTO): The user DTO class used to transfer user data between
+            layers of the application.
+        user_errors_enum (UserErrorsEnum): Enum class representing common errors related
+            to user operations (CRUD).
+
+    """
+
+    user_repository: AsyncUserRepositoryInterface
+    user_dto: UserDTO = UserDTO
+    user_errors_enum = UserErrorsEnum
+
+    @abstractmethod
+    async def get_user_by_email(self, email: str) -> dict:
+        """
+        Abstract coroutine to retrieve a user by their email.
+
+        Args:
+            email (str): The email of the user to retrieve.
+
+        Returns:
+            details (dict): A dictionary containing the user DTO retrieved from the data source.
+                If the user is not found, it returns an error dictionary using the user_errors_enum.
+        """
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List
+
+from src.applications.dtos.user import UserDTO
+from src.domain.repositories.user import UserRepositoryInterface
+
+
+@dataclass
+class BatchGetUsersUseCaseInterface(ABC):
+    """
+    Interface for the BatchGetUsers use case.
+
+    This interface defines the contract for the use case that resolves many users by ID or email in
+    one call, and enforces the implementation of the get_users method.
+
+    Attributes:
+        user_repository (UserRepositoryInterface): The user repository interface.
+        user_dto (UserDTO): The user DTO class.
+    """
+
+    user_repository: UserRepositoryInterface
+    user_dto: UserDTO = UserDTO
+
+    @abstractmethod
+    def get_users(self, user_ids: List[int], emails: List[str]) -> dict:
+        """
+        Resolve users by their IDs and their emails.
+
+        Args:
+            user_ids (List[int]): The IDs of the users to resolve.
+            emails (List[str]): The emails of the users to resolve.
+
+        Returns:
+            dict: A dictionary with the users found and the identifiers missing under 'data'.
+        """
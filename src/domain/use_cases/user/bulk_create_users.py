@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable, Tuple
+
+from src.applications.dtos.user import UserDTO
+from src.applications.enums.user.errors import UserErrorsEnum
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.password_hasher import PasswordHasherInterface
+from src.domain.unit_of_work import UnitOfWorkInterface
+from src.domain.entities.user import UserEntity
+
+
+@dataclass
+class BulkCreateUsersUseCaseInterface(ABC):
+    """
+    Interface for the BulkCreateUsers use case.
+
+    This interface defines the contract for the BulkCreateUsers use case and enforces the implementation of
+    the create_users method.
+
+    Attributes:
+        user_repository (UserRepositoryInterface): The user repository interface.
+        unit_of_work (UnitOfWorkInterface): The unit of work each batch of users is created in.
+        password_hasher (PasswordHasherInterface): The hasher the passwords are stored hashed with.
+        batch_size (int): The number of users inserted per statement.
+        user_entity (UserEntity): The user entity class.
+        user_dto (UserDTO): The user DTO class.
+    """
+
+    user_repository: UserRepositoryInterface
+    unit_of_work: UnitOfWorkInterface
+    password_hasher: PasswordHasherInterface
+    batch_size: int = 1000
+    user_entity: UserEntity = UserEntity
+    user_dto: UserDTO = UserDTO
+    user_errors_enum = UserErrorsEnum
+
+    @abstractmethod
+    def create_users(self, rows: Iterable[Tuple[int, UserDTO]]) -> dict:
+        """
+        Create the users of an import.
+
+        Args:
+            rows (Iterable[Tuple[int, UserDTO]]): The users to create, with the number of their row in the import.
+
+        Returns:
+            dict: The report of the import, with the created users and the rows that failed.
+        """
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from src.applications.dtos.user import UserDTO
 from src.applications.enums.user.errors import UserErrorsEnum
 from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.password_hasher import PasswordHasherInterface
+from src.domain.unit_of_work import UnitOfWorkInterface
 from src.domain.entities.user import UserEntity
 
 
@@ -17,11 +19,15 @@ class CreateUserUseCaseInterface(ABC):
 
     Attributes:
         user_repository (UserRepositoryInterface): The user repository interface.
+        unit_of_work (UnitOfWorkInterface): The unit of work the repository calls run in.
+        password_hasher (PasswordHasherInterface): The hasher the password is stored hashed with.
         user_entity (UserEntity): The user entity class.
         user_dto (UserDTO): The user DTO class.
     """
 
     user_repository: UserRepositoryInterface
+    unit_of_work: UnitOfWorkInterface
+    password_hasher: PasswordHasherInterface
     user_entity: UserEntity = UserEntity
     user_dto: UserDTO = UserDTO
     user_errors_enum = UserErrorsEnum
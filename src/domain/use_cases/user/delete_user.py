@@ -5,6 +5,7 @@ from src.applications.dtos.user import UserDTO
 from src.applications.enums.user.errors import UserErrorsEnum
 from src.applications.enums.user.success import UserSuccessEnum
 from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.unit_of_work import UnitOfWorkInterface
 from src.domain.entities.user import UserEntity
 
 
@@ -18,11 +19,13 @@ class DeleteUserUseCaseInterface(ABC):
 
     Attributes:
         user_repository (UserRepositoryInterface): The user repository interface.
+        unit_of_work (UnitOfWorkInterface): The unit of work the repository calls run in.
         user_entity (UserEntity): The user entity class.
         user_dto (UserDTO): The user DTO class.
     """
 
     user_repository: UserRepositoryInterface
+    unit_of_work: UnitOfWorkInterface
     user_entity: UserEntity = UserEntity
     user_dto: UserDTO = UserDTO
     user_errors_enum = UserErrorsEnum
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from src.applications.dtos.user import UserDTO
+from src.domain.repositories.user import UserRepositoryInterface
+
+
+@dataclass
+class ExportUsersUseCaseInterface(ABC):
+    """
+    Interface for the ExportUsers use case.
+
+    This interface defines the contract for the use case that streams every user, and enforces the
+    implementation of the export_users method.
+
+    Attributes:
+        user_repository (UserRepositoryInterface): The user repository interface.
+        batch_size (int): The number of users fetched from the database per round-trip.
+        user_dto (UserDTO): The user DTO class.
+    """
+
+    user_repository: UserRepositoryInterface
+    batch_size: int = 1000
+    user_dto: UserDTO = UserDTO
+
+    @abstractmethod
+    def export_users(self) -> dict:
+        """
+        Stream every user.
+
+        Returns:
+            dict: A dictionary with the iterator of the users under 'data'.
+        """
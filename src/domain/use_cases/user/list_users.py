@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+from src.applications.dtos.user import UserDTO
+from src.domain.repositories.user import UserRepositoryInterface
+
+
+@dataclass
+class ListUsersUseCaseInterface(ABC):
+    """
+    Interface for the ListUsers use case.
+
+    This interface defines the contract for the use case that pages through the users, and enforces
+    the implementation of the list_users method.
+
+    Attributes:
+        user_repository (UserRepositoryInterface): The user repository interface.
+        user_dto (UserDTO): The user DTO class.
+    """
+
+    user_repository: UserRepositoryInterface
+    user_dto: UserDTO = UserDTO
+
+    @abstractmethod
+    def list_users(self, after_id: Optional[int] = None, limit: int = 50, include_total: bool = False) -> dict:
+        """
+        Retrieve a page of users.
+
+        Args:
+            after_id (int, optional): The ID of the last user of the previous page, None for the first page.
+            limit (int): The maximum number of users of the page.
+            include_total (bool): Whether to estimate the total number of users.
+
+        Returns:
+            dict: A dictionary with the page under 'data'.
+        """
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from src.applications.dtos.user import UserDTO
+from src.domain.repositories.user import UserRepositoryInterface
+
+
+@dataclass
+class SearchUsersUseCaseInterface(ABC):
+    """
+    Interface for the SearchUsers use case.
+
+    This interface defines the contract for the use case that finds users by name or email, and
+    enforces the implementation of the search_users method.
+
+    Attributes:
+        user_repository (UserRepositoryInterface): The user repository interface.
+        user_dto (UserDTO): The user DTO class.
+    """
+
+    user_repository: UserRepositoryInterface
+    user_dto: UserDTO = UserDTO
+
+    @abstractmethod
+    def search_users(self, query: str, limit: int = 20) -> dict:
+        """
+        Find the users whose name or email contains a text.
+
+        Args:
+            query (str): The text to look for.
+            limit (int): The maximum number of users to return.
+
+        Returns:
+            dict: A dictionary with the matching users under 'data'.
+        """
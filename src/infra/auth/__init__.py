@@ -0,0 +1 @@
+from .hmac_token_service import HmacTokenService, TokenSettings
@@ -0,0 +1,293 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Optional, Set
+
+from src.applications.dtos import AccessTokenDTO, TokenClaimsDTO
+from src.domain.exceptions import InvalidTokenError
+from src.domain.repositories.revoked_token import RevokedTokenRepositoryInterface
+from src.domain.token_service import TokenServiceInterface
+from src.infra.cache import CacheStats, TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TokenSettings:
+    """Settings of the access tokens.
+
+    Attributes:
+        secret (str): The key the tokens are signed with, shared by every worker. A random key is
+            generated per process when it is empty, so the tokens only hold on the worker that issued them.
+        ttl (float): The number of seconds a token is valid.
+        verified_cache_size (int): The maximum number of verified tokens whose signature check is skipped.
+        revocation_refresh_interval (float): The number of seconds between two reloads of the revocation
+            list, 0 to disable.
+    """
+
+    secret: str = ""
+    ttl: float = 900.0
+    verified_cache_size: int = 4096
+    revocation_refresh_interval: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> "TokenSettings":
+        """Build the token settings from environment variables.
+
+        The variables `AUTH_TOKEN_SECRET`, `AUTH_TOKEN_TTL`, `AUTH_VERIFIED_TOKEN_CACHE_SIZE` and
+        `AUTH_REVOCATION_REFRESH_INTERVAL` override the defaults when they are set.
+
+        Returns:
+            (TokenSettings): The token settings read from the environment.
+        """
+        return cls(
+            secret=os.getenv("AUTH_TOKEN_SECRET", cls.secret),
+            ttl=float(os.getenv("AUTH_TOKEN_TTL", cls.ttl)),
+            verified_cache_size=int(os.getenv("AUTH_VERIFIED_TOKEN_CACHE_SIZE", cls.verified_cache_size)),
+            revocation_refresh_interval=float(
+                os.getenv("AUTH_REVOCATION_REFRESH_INTERVAL", cls.revocation_refresh_interval)
+            ),
+        )
+
+
+def encode_segment(data: bytes) -> str:
+    """
+    Encode bytes as unpadded URL-safe base64.
+
+    Args:
+        data (bytes): The bytes to encode.
+
+    Returns:
+        str: The encoded segment.
+    """
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def decode_segment(segment: str) -> bytes:
+    """
+    Decode unpadded URL-safe base64.
+
+    Args:
+        segment (str): The encoded segment.
+
+    Returns:
+        bytes: The decoded bytes.
+
+    Raises:
+        binascii.Error: If the segment is not valid base64.
+    """
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+class HmacTokenService(TokenServiceInterface):
+    """Token service issuing HMAC-SHA256 signed access tokens, verified in memory.
+
+    A token is `<payload>.<signature>`: the payload is the URL-safe base64 of the JSON claims
+    (`sub`, `jti`, `iat`, `exp`) and the signature its HMAC-SHA256 under the secret. Verifying a
+    token never reads the database:
+
+    - the claims of the tokens whose signature was checked are kept in a bounded LRU cache, so a
+      token presented again skips the HMAC and the JSON decoding;
+    - the expiry is checked on every verification;
+    - the IDs of the revoked tokens are held in a set, reloaded from the database by `start` and
+      then every `revocation_refresh_interval` seconds. A token revoked by another worker is
+      accepted by this one until the next reload, so the interval bounds how long it stays usable.
+
+    Attributes:
+        revoked_token_repository (RevokedTokenRepositoryInterface): The repository of the revoked tokens.
+        settings (TokenSettings): The token settings.
+        clock (Callable[[], float]): The wall clock the tokens are issued and expired with.
+    """
+
+    def __init__(
+        self,
+        revoked_token_repository: RevokedTokenRepositoryInterface,
+        settings: Optional[TokenSettings] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize a new instance of HmacTokenService, without loading the revocation list.
+
+        Args:
+            revoked_token_repository (RevokedTokenRepositoryInterface): The repository of the revoked tokens.
+            settings (TokenSettings, optional): The token settings. Read from the environment when omitted.
+            clock (Callable[[], float]): The wall clock the tokens are issued and expired with.
+        """
+        self.revoked_token_repository = revoked_token_repository
+        self.settings = settings or TokenSettings.from_env()
+        self.clock = clock
+        if not self.settings.secret:
+            logger.warning("AUTH_TOKEN_SECRET is not set: the access tokens are signed with a per-process key.")
+        self._key = self.settings.secret.encode() or secrets.token_bytes(32)
+        self._verified = TTLCache(max_size=self.settings.verified_cache_size, ttl=self.settings.ttl)
+        self._revoked: Set[str] = set()
+        self._pending_revocations: Optional[list] = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    @property
+    def stats(self) -> CacheStats:
+        """Get the hit, miss and eviction counters of the verified token cache.
+
+        Returns:
+            (CacheStats): The counters of the cache.
+        """
+        return self._verified.stats
+
+    def start(self) -> None:
+        """Load the revocation list and start its periodic reloads."""
+        self.refresh_revocations()
+        if self.settings.revocation_refresh_interval > 0 and self._refresh_thread is None:
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_periodically, name="token-revocation-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+
+    def stop(self) -> None:
+        """Stop the periodic reloads of the revocation list."""
+        self._stopped.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join()
+            self._refresh_thread = None
+
+    def refresh_revocations(self) -> bool:
+        """Reload the IDs of the revoked tokens from the database and swap them in.
+
+        The tokens revoked by this worker while the list is loaded are kept, so none is missed.
+
+        Returns:
+            (bool): Whether the reload succeeded. A failed reload is logged and keeps the previous list.
+        """
+        with self._lock:
+            self._pending_revocations = []
+        try:
+            token_ids = self.revoked_token_repository.get_revoked_token_ids(self._now())
+        except Exception:
+            logger.exception("Reloading the revoked access tokens failed.")
+            with self._lock:
+                self._pending_revocations = None
+            return False
+        with self._lock:
+            self._revoked = set(token_ids).union(self._pending_revocations)
+            self._pending_revocations = None
+        return True
+
+    def issue(self, user_id: int) -> AccessTokenDTO:
+        """
+        Issue an access token to a user, valid for `settings.ttl` seconds.
+
+        Args:
+            user_id (int): The ID of the user the token is issued to.
+
+        Returns:
+            AccessTokenDTO: The signed token and its expiry.
+        """
+        issued_at = int(self.clock())
+        expires_at = issued_at + int(self.settings.ttl)
+        claims = {"sub": user_id, "jti": secrets.token_hex(16), "iat": issued_at, "exp": expires_at}
+        payload = encode_segment(json.dumps(claims, separators=(",", ":")).encode())
+        token = f"{payload}.{self._sign(payload)}"
+        return AccessTokenDTO(
+            access_token=token, token_type="bearer", expires_at=datetime.fromtimestamp(expires_at, timezone.utc)
+        )
+
+    def verify(self, token: str) -> TokenClaimsDTO:
+        """
+        Verify an access token in memory and get its claims.
+
+        Args:
+            token (str): The token presented with a request.
+
+        Returns:
+            TokenClaimsDTO: The claims of the token.
+
+        Raises:
+            InvalidTokenError: If the token is malformed, forged, expired or revoked.
+        """
+        claims = self._verified.get_or_load(token, lambda: self._decode(token))
+        if claims.expires_at <= self._now():
+            raise InvalidTokenError("expired")
+        if claims.token_id in self._revoked:
+            raise InvalidTokenError("revoked")
+        return claims
+
+    def revoke(self, claims: TokenClaimsDTO) -> None:
+        """
+        Revoke an access token, at once on this worker and on the others at their next reload.
+
+        The revocations of the tokens that have expired are forgotten at the same time.
+
+        Args:
+            claims (TokenClaimsDTO): The claims of the token to revoke.
+
+        Raises:
+            Exception: If an error occurs while recording the revocation.
+        """
+        self.revoked_token_repository.delete_expired_tokens(self._now())
+        self.revoked_token_repository.revoke_token(claims.token_id, claims.expires_at)
+        with self._lock:
+            self._revoked.add(claims.token_id)
+            if self._pending_revocations is not None:
+                self._pending_revocations.append(claims.token_id)
+
+    def _sign(self, payload: str) -> str:
+        """
+        Sign the payload of a token.
+
+        Args:
+            payload (str): The encoded claims.
+
+        Returns:
+            str: The encoded HMAC-SHA256 of the payload.
+        """
+        return encode_segment(hmac.new(self._key, payload.encode(), hashlib.sha256).digest())
+
+    def _decode(self, token: str) -> TokenClaimsDTO:
+        """
+        Check the signature of a token and decode its claims.
+
+        Args:
+            token (str): The token.
+
+        Returns:
+            TokenClaimsDTO: The claims of the token.
+
+        Raises:
+            InvalidTokenError: If the token is malformed or its signature does not match.
+        """
+        payload, _, signature = token.partition(".")
+        if not payload or not hmac.compare_digest(signature.encode(), self._sign(payload).encode()):
+            raise InvalidTokenError("bad signature")
+        try:
+            claims = json.loads(decode_segment(payload))
+            return TokenClaimsDTO(
+                subject=int(claims["sub"]),
+                token_id=str(claims["jti"]),
+                issued_at=datetime.fromtimestamp(claims["iat"], timezone.utc),
+                expires_at=datetime.fromtimestamp(claims["exp"], timezone.utc),
+            )
+        except (binascii.Error, ValueError, KeyError, TypeError) as exception:
+            raise InvalidTokenError("malformed claims") from exception
+
+    def _now(self) -> datetime:
+        """
+        Get the current time of the clock.
+
+        Returns:
+            datetime: The current time, in UTC.
+        """
+        return datetime.fromtimestamp(self.clock(), timezone.utc)
+
+    def _refresh_periodically(self) -> None:
+        """Reload the revocation list every `revocation_refresh_interval` seconds until stopped."""
+        while not self._stopped.wait(self.settings.revocation_refresh_interval):
+            self.refresh_revocations()
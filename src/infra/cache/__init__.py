@@ -0,0 +1,3 @@
+from .ttl_cache import CacheStats, TTLCache
+from .bloom_filter import BloomFilter
+from .single_flight import AsyncSingleFlight, SingleFlight, SingleFlightStats
@@ -0,0 +1,114 @@
+import hashlib
+import math
+import threading
+from typing import Iterable
+
+
+class BloomFilter:
+    """
+    Space-efficient probabilistic set of strings.
+
+    A Bloom filter answers "definitely absent" or "maybe present": it has no false negatives, and
+    its false-positive rate grows with the number of added items. The filter is sized from the
+    number of items it is expected to hold and the false-positive rate targeted at that size. Items
+    cannot be removed, so a filter is rebuilt from the source of truth to forget deleted items.
+
+    Attributes:
+        bit_size (int): The number of bits of the filter.
+        hash_count (int): The number of bits set per item.
+        count (int): The number of items added to the filter.
+    """
+
+    def __init__(self, expected_items: int, false_positive_rate: float = 0.01) -> None:
+        """
+        Initialize a new, empty BloomFilter.
+
+        Args:
+            expected_items (int): The number of items the filter is sized for.
+            false_positive_rate (float): The false-positive rate targeted when the filter holds `expected_items`.
+
+        Raises:
+            ValueError: If the false-positive rate is not strictly between 0 and 1.
+        """
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("The false-positive rate must be strictly between 0 and 1.")
+        expected_items = max(expected_items, 1)
+        self.bit_size = max(8, math.ceil(-expected_items * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.bit_size / expected_items * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.bit_size + 7) // 8)
+        self._lock = threading.Lock()
+
+    def __contains__(self, item: str) -> bool:
+        """
+        Tell whether an item may have been added to the filter.
+
+        Args:
+            item (str): The item to look up.
+
+        Returns:
+            (bool): False when the item was definitely never added, True when it may have been.
+        """
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __len__(self) -> int:
+        """Get the number of items added to the filter."""
+        return self.count
+
+    @property
+    def memory_bytes(self) -> int:
+        """
+        Get the size of the bit array.
+
+        Returns:
+            (int): The number of bytes used by the bits of the filter.
+        """
+        return len(self._bits)
+
+    def add(self, item: str) -> None:
+        """
+        Add an item to the filter.
+
+        Args:
+            item (str): The item to add.
+        """
+        positions = self._positions(item)
+        with self._lock:
+            for position in positions:
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def update(self, items: Iterable[str]) -> None:
+        """
+        Add several items to the filter.
+
+        Args:
+            items (Iterable[str]): The items to add.
+        """
+        for item in items:
+            self.add(item)
+
+    def estimated_false_positive_rate(self) -> float:
+        """
+        Estimate the current false-positive rate from the number of added items.
+
+        Returns:
+            (float): The probability that an item never added is reported as maybe present.
+        """
+        return (1 - math.exp(-self.hash_count * self.count / self.bit_size)) ** self.hash_count
+
+    def _positions(self, item: str) -> list:
+        """
+        Compute the bit positions of an item with double hashing.
+
+        Args:
+            item (str): The item to hash.
+
+        Returns:
+            (list): The `hash_count` bit positions of the item.
+        """
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + index * second) % self.bit_size for index in range(self.hash_count)]
@@ -0,0 +1,165 @@
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+@dataclass
+class SingleFlightStats:
+    """
+    Counters of a single-flight group.
+
+    Attributes:
+        calls (int): The calls that ran their function.
+        shared (int): The calls that joined a call in flight and received its outcome.
+    """
+
+    calls: int = 0
+    shared: int = 0
+
+
+class _Call:
+    """The outcome of a call in flight, published to the callers that joined it."""
+
+    def __init__(self) -> None:
+        """Initialize a new call in flight, with no outcome yet."""
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalescing of the concurrent calls for the same key, for threads.
+
+    While a call for a key is in flight, the other calls for the key wait for it and receive its
+    result, or its exception, instead of running their own function. A call that starts after the
+    previous one completed runs again: nothing is cached.
+
+    Methods:
+        do(key, function): Run the function, or join the call in flight for the key.
+        forget(key): Make the next calls for the key run again instead of joining the call in flight.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new SingleFlight with no call in flight."""
+        self.stats = SingleFlightStats()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """
+        Run the function, or wait for the call in flight for the key and share its outcome.
+
+        Args:
+            key (Hashable): The key the calls are coalesced on.
+            function (Callable[[], Any]): The function to run when no call for the key is in flight.
+
+        Returns:
+            (Any): The result of the call.
+
+        Raises:
+            Exception: The exception raised by the call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.stats.calls += 1
+            else:
+                self.stats.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = function()
+        except BaseException as exception:
+            call.error = exception
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def forget(self, key: Hashable) -> None:
+        """
+        Make the next calls for the key run again instead of joining the call in flight.
+
+        The callers already waiting for the call in flight still receive its outcome.
+
+        Args:
+            key (Hashable): The key of the call.
+        """
+        with self._lock:
+            self._calls.pop(key, None)
+
+
+class AsyncSingleFlight:
+    """
+    Coalescing of the concurrent calls for the same key, for coroutines of one event loop.
+
+    The asyncio counterpart of SingleFlight: while a call for a key is awaited, the other calls for
+    the key await its outcome instead of running their own coroutine.
+
+    Methods:
+        do(key, function): Await the coroutine function, or join the call in flight for the key.
+        forget(key): Make the next calls for the key run again instead of joining the call in flight.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new AsyncSingleFlight with no call in flight."""
+        self.stats = SingleFlightStats()
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await the coroutine function, or the call in flight for the key and share its outcome.
+
+        A caller cancelled while it waits for the call of another one does not cancel that call.
+
+        Args:
+            key (Hashable): The key the calls are coalesced on.
+            function (Callable[[], Awaitable[Any]]): The coroutine function to await when no call for the
+                key is in flight.
+
+        Returns:
+            (Any): The result of the call.
+
+        Raises:
+            Exception: The exception raised by the call.
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self.stats.shared += 1
+            return await asyncio.shield(future)
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self.stats.calls += 1
+        try:
+            result = await function()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exception:
+            future.set_exception(exception)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def forget(self, key: Hashable) -> None:
+        """
+        Make the next calls for the key run again instead of joining the call in flight.
+
+        Args:
+            key (Hashable): The key of the call.
+        """
+        self._calls.pop(key, None)
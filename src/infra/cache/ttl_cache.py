@@ -0,0 +1,241 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional, Set, Tuple
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters of a TTLCache.
+
+    Attributes:
+        hits (int): The lookups answered with a fresh entry.
+        misses (int): The lookups that had to call the loader.
+        evictions (int): The entries dropped to keep the cache within its size bound.
+        stale_hits (int): The lookups answered with a stale entry while it is refreshed in the background.
+        stale_on_error (int): The lookups answered with a stale entry because the loader failed.
+        refreshes (int): The background refreshes started by stale-while-revalidate.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    stale_hits: int = 0
+    stale_on_error: int = 0
+    refreshes: int = 0
+
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded LRU cache whose entries expire after a time to live.
+
+    Values are loaded through `get_or_load`, which calls the loader on a miss. Two optional modes
+    keep serving an expired entry for a grace period:
+
+    - stale-while-revalidate: the expired entry is returned right away and the loader is called in
+      a background thread to refresh it.
+    - serve-stale-on-error: the expired entry is returned when the loader raises an exception.
+
+    Methods:
+        get_or_load(key, loader): Get the value of a key, loading it on a miss.
+        set(key, value): Store the value of a key.
+        discard(key): Drop the entry of a key.
+        discard_where(predicate): Drop the entries whose value matches a predicate.
+        clear(): Drop every entry.
+        close(): Stop the background refreshes.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 60.0,
+        stale_while_revalidate: float = 0.0,
+        stale_if_error: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize a new, empty TTLCache.
+
+        Args:
+            max_size (int): The maximum number of entries, the least recently used one is evicted first.
+            ttl (float): The number of seconds an entry is fresh.
+            stale_while_revalidate (float): The number of seconds past the TTL an entry is served while
+                it is refreshed in the background, 0 to disable.
+            stale_if_error (float): The number of seconds past the TTL an entry is served when the loader
+                fails, 0 to disable.
+            clock (Callable[[], float]): The monotonic clock the entry ages are measured with.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._refreshing: Set[Hashable] = set()
+        self._generation = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of entries, expired ones included."""
+        return len(self._entries)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Get the value of a key, calling the loader and caching its result on a miss.
+
+        A None result is not cached, so a missing record is looked up again on the next call. A result
+        loaded while entries were being discarded is not cached either, so an invalidation racing with
+        the load cannot be undone by it.
+
+        Args:
+            key (Hashable): The key of the value.
+            loader (Callable[[], Any]): Loads the value from the source of truth.
+
+        Returns:
+            (Any): The cached or loaded value.
+
+        Raises:
+            Exception: If the loader fails and there is no entry to serve in its place.
+        """
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            age = None if entry is None else now - entry[1]
+            if age is not None and age < self.ttl:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry[0]
+            if age is not None and age < self.ttl + self.stale_while_revalidate:
+                self._entries.move_to_end(key)
+                self.stats.stale_hits += 1
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    self.stats.refreshes += 1
+                    self._refresh_in_background(key, loader, self._generation)
+                return entry[0]
+            self.stats.misses += 1
+            generation = self._generation
+        try:
+            value = loader()
+        except Exception:
+            if age is not None and age < self.ttl + self.stale_if_error:
+                with self._lock:
+                    self.stats.stale_on_error += 1
+                return entry[0]
+            raise
+        self._store(key, value, generation)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store the value of a key, evicting the least recently used entries above the size bound.
+
+        Args:
+            key (Hashable): The key of the value.
+            value (Any): The value to store.
+        """
+        with self._lock:
+            self._insert(key, value)
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Drop the entry of a key, if any.
+
+        Args:
+            key (Hashable): The key of the entry.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generation += 1
+
+    def discard_where(self, predicate: Callable[[Any], bool]) -> None:
+        """
+        Drop the entries whose value matches a predicate.
+
+        Args:
+            predicate (Callable[[Any], bool]): Tells whether a value must be dropped.
+        """
+        with self._lock:
+            for key in [key for key, (value, _) in self._entries.items() if predicate(value)]:
+                del self._entries[key]
+            self._generation += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def close(self) -> None:
+        """Stop the background refreshes, waiting for the running ones to finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _insert(self, key: Hashable, value: Any) -> None:
+        """
+        Store the value of a key and enforce the size bound. Must be called with the lock held.
+
+        Args:
+            key (Hashable): The key of the value.
+            value (Any): The value to store.
+        """
+        self._entries[key] = (value, self.clock())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _store(self, key: Hashable, value: Any, generation: int) -> None:
+        """
+        Store a loaded value, unless it is None or entries were discarded since the load started.
+
+        Args:
+            key (Hashable): The key of the value.
+            value (Any): The loaded value.
+            generation (int): The invalidation generation read before the load started.
+        """
+        with self._lock:
+            if generation != self._generation:
+                return
+            if value is None:
+                self._entries.pop(key, None)
+            else:
+                self._insert(key, value)
+
+    def _refresh_in_background(self, key: Hashable, loader: Callable[[], Any], generation: int) -> None:
+        """
+        Reload the value of a key in a background thread. Must be called with the lock held.
+
+        Args:
+            key (Hashable): The key of the value.
+            loader (Callable[[], Any]): Loads the value from the source of truth.
+            generation (int): The invalidation generation read before the refresh started.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ttl-cache-refresh")
+        self._executor.submit(self._refresh, key, loader, generation)
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any], generation: int) -> None:
+        """
+        Reload the value of a key, keeping the stale entry when the loader fails.
+
+        Args:
+            key (Hashable): The key of the value.
+            loader (Callable[[], Any]): Loads the value from the source of truth.
+            generation (int): The invalidation generation read before the refresh started.
+        """
+        try:
+            value = loader()
+        except Exception:
+            return
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+        self._store(key, value, generation)
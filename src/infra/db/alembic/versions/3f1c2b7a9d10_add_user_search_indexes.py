@@ -0,0 +1,68 @@
+"""add user search indexes
+
+Revision ID: 3f1c2b7a9d10
+Revises: 77b0e9115dfc
+Create Date: 2026-10-18 10:12:41.502317
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "3f1c2b7a9d10"
+down_revision = "77b0e9115dfc"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    dialect_name = op.get_context().dialect.name
+    if dialect_name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            "ix_users_name_trgm",
+            "users",
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        )
+        op.create_index(
+            "ix_users_email_trgm",
+            "users",
+            ["email"],
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        )
+    elif dialect_name == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE users_search USING fts5("
+            "name, email, content='users', content_rowid='id', tokenize='trigram')"
+        )
+        op.execute(
+            "CREATE TRIGGER users_search_ai AFTER INSERT ON users BEGIN "
+            "INSERT INTO users_search(rowid, name, email) VALUES (new.id, new.name, new.email); END"
+        )
+        op.execute(
+            "CREATE TRIGGER users_search_ad AFTER DELETE ON users BEGIN "
+            "INSERT INTO users_search(users_search, rowid, name, email) "
+            "VALUES ('delete', old.id, old.name, old.email); END"
+        )
+        op.execute(
+            "CREATE TRIGGER users_search_au AFTER UPDATE ON users BEGIN "
+            "INSERT INTO users_search(users_search, rowid, name, email) "
+            "VALUES ('delete', old.id, old.name, old.email); "
+            "INSERT INTO users_search(rowid, name, email) VALUES (new.id, new.name, new.email); END"
+        )
+        op.execute("INSERT INTO users_search(users_search) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect_name = op.get_context().dialect.name
+    if dialect_name == "postgresql":
+        op.drop_index("ix_users_email_trgm", table_name="users")
+        op.drop_index("ix_users_name_trgm", table_name="users")
+    elif dialect_name == "sqlite":
+        op.execute("DROP TRIGGER IF EXISTS users_search_au")
+        op.execute("DROP TRIGGER IF EXISTS users_search_ad")
+        op.execute("DROP TRIGGER IF EXISTS users_search_ai")
+        op.execute("DROP TABLE IF EXISTS users_search")
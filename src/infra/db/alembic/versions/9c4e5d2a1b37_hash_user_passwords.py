@@ -0,0 +1,56 @@
+"""hash user passwords
+
+Revision ID: 9c4e5d2a1b37
+Revises: 3f1c2b7a9d10
+Create Date: 2026-10-18 14:03:27.118902
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from src.applications.services.password_hasher import PasswordHashingSettings, hash_password, identify_algorithm
+
+
+# revision identifiers, used by Alembic.
+revision = "9c4e5d2a1b37"
+down_revision = "3f1c2b7a9d10"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    op.alter_column("users", "password", new_column_name="password_hash")
+    if op.get_context().as_sql:
+        return
+    # The passwords stored before this revision are plain text: hash them with the configured settings.
+    settings = PasswordHashingSettings.from_env()
+    users = sa.table("users", sa.column("id", sa.Integer), sa.column("password_hash", sa.String))
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(users.c.id, users.c.password_hash)
+            .where(users.c.id > last_id)
+            .order_by(users.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        updates = [
+            {"user_id": row.id, "password_hash": hash_password(row.password_hash, settings)}
+            for row in rows
+            if identify_algorithm(row.password_hash) is None
+        ]
+        if updates:
+            connection.execute(
+                users.update().where(users.c.id == sa.bindparam("user_id")),
+                updates,
+            )
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    # The hashes cannot be turned back into passwords: the column keeps them under its former name.
+    op.alter_column("users", "password_hash", new_column_name="password")
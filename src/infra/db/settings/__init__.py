@@ -1,2 +1,7 @@
 from .connection import DBConnectionHandler
+from .async_connection import AsyncDBConnectionHandler
 from .declarative_base import Base
+from .engine_registry import EngineRegistry, PoolSettings, engine_registry, to_async_connection_string
+from .query_counter import QueryStats, current_query_stats, instrument_engine, track_queries
+from .unit_of_work import SqlAlchemyUnitOfWork
+from .async_unit_of_work import SqlAlchemyAsyncUnitOfWork
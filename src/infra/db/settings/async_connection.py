@@ -0,0 +1,112 @@
+import os
+from contextvars import ContextVar
+from typing import Optional
+
+from dotenv import load_dotenv
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.infra.db.settings.engine_registry import engine_registry, to_async_connection_string
+
+load_dotenv()
+
+async_unit_of_work_session: ContextVar[Optional[AsyncSession]] = ContextVar("async_unit_of_work_session", default=None)
+
+
+class AsyncDBConnectionHandler:
+    """Database connection handler for managing SQLAlchemy asyncio sessions.
+
+    This class provides an asynchronous context manager for managing database sessions using the
+    SQLAlchemy asyncio extension. The asyncio engine is taken from the process-wide engine registry.
+    When no connection string is given, `SQLALCHEMY_ASYNC_DATABASE_URL` is used, falling back to
+    `SQLALCHEMY_DATABASE_URL` converted to its asyncio driver (asyncpg or aiosqlite).
+    The current session is kept per asyncio task, so a single handler can be shared by
+    repositories that serve concurrent requests.
+
+    Inside a unit of work on the same engine, the handler joins the session of the unit of work
+    instead of opening its own: `commit` only flushes, `rollback` and the exit of the context
+    manager leave the transaction to the unit of work.
+
+    Attributes:
+        session: The current database session of the calling task.
+
+    Methods:
+        get_engine(): Get the underlying SQLAlchemy asyncio engine.
+        commit(): Commit the current session, or flush it inside a unit of work.
+        rollback(): Roll back the current session, unless it belongs to a unit of work.
+    """
+
+    def __init__(self, connection_string: Optional[str] = None) -> None:
+        """Initialize a new instance of AsyncDBConnectionHandler.
+
+        Args:
+            connection_string (str, optional): The database connection string.
+        """
+        if connection_string is None:
+            connection_string = os.getenv("SQLALCHEMY_ASYNC_DATABASE_URL") or os.getenv("SQLALCHEMY_DATABASE_URL")
+        self.connection_string = to_async_connection_string(connection_string)
+        self.engine = engine_registry.get_async_engine(self.connection_string)
+        self.session_maker = async_sessionmaker(bind=self.engine, expire_on_commit=False)
+        self._session: ContextVar[Optional[AsyncSession]] = ContextVar(f"async_session_{id(self)}", default=None)
+
+    @property
+    def session(self) -> Optional[AsyncSession]:
+        """Get the database session opened by the calling task.
+
+        Returns:
+            (AsyncSession | None): The current session, or None outside of the context manager.
+        """
+        return self._session.get()
+
+    @property
+    def unit_of_work_session(self) -> Optional[AsyncSession]:
+        """Get the session of the unit of work the calling task runs in, if it uses this engine.
+
+        Returns:
+            (AsyncSession | None): The unit of work session, or None outside of a unit of work.
+        """
+        session = async_unit_of_work_session.get()
+        if session is not None and session.bind is self.engine:
+            return session
+        return None
+
+    async def commit(self) -> None:
+        """Commit the current session, or only flush it when it belongs to a unit of work."""
+        if self.session is self.unit_of_work_session:
+            await self.session.flush()
+        else:
+            await self.session.commit()
+
+    async def rollback(self) -> None:
+        """Roll back the current session, unless it belongs to a unit of work."""
+        if self.session is not self.unit_of_work_session:
+            await self.session.rollback()
+
+    def get_engine(self) -> AsyncEngine:
+        """Get the underlying SQLAlchemy asyncio engine.
+
+        Returns:
+            (AsyncEngine): The SQLAlchemy asyncio engine.
+        """
+        return self.engine
+
+    async def __aenter__(self):
+        """Enter method for asynchronous context management.
+
+        Returns:
+            (AsyncDBConnectionHandler): This instance.
+        """
+        self._session.set(self.unit_of_work_session or self.session_maker())
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit method for asynchronous context management.
+
+        Args:
+            exc_type (Any): The exception type, if any.
+            exc_val (Any): The exception value, if any.
+            exc_tb (Any): The exception traceback, if any.
+        """
+        session = self._session.get()
+        self._session.set(None)
+        if session is not self.unit_of_work_session:
+            await session.close()
@@ -0,0 +1,108 @@
+from contextvars import ContextVar, Token
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.unit_of_work import AsyncUnitOfWorkInterface
+from src.infra.db.settings.async_connection import AsyncDBConnectionHandler, async_unit_of_work_session
+from src.infra.db.settings.unit_of_work import AFTER_COMMIT
+
+
+class SqlAlchemyAsyncUnitOfWork(AsyncUnitOfWorkInterface):
+    """SQLAlchemy asyncio implementation of the unit of work.
+
+    This class mirrors SqlAlchemyUnitOfWork for the asynchronous repositories: every
+    AsyncDBConnectionHandler on the same engine joins the session opened by the unit of work.
+
+    Attributes:
+        db_connection (AsyncDBConnectionHandler): The connection handler the session is opened from.
+        session: The session of the unit of work in the calling task.
+    """
+
+    def __init__(self, db_connection: AsyncDBConnectionHandler) -> None:
+        """Initialize a new instance of SqlAlchemyAsyncUnitOfWork.
+
+        Args:
+            db_connection (AsyncDBConnectionHandler): The connection handler the session is opened from.
+        """
+        self.db_connection = db_connection
+        self._tokens: ContextVar[Tuple[Optional[Token], ...]] = ContextVar(f"async_unit_of_work_{id(self)}", default=())
+
+    @property
+    def session(self) -> Optional[AsyncSession]:
+        """Get the session of the unit of work in the calling task.
+
+        Returns:
+            (AsyncSession | None): The current session, or None outside of the unit of work.
+        """
+        return self.db_connection.unit_of_work_session
+
+    async def __aenter__(self) -> "SqlAlchemyAsyncUnitOfWork":
+        """Open the session of the unit of work, or join the one already open in the calling task.
+
+        Returns:
+            (SqlAlchemyAsyncUnitOfWork): This instance.
+        """
+        token = None
+        if self.session is None:
+            token = async_unit_of_work_session.set(self.db_connection.session_maker())
+        self._tokens.set(self._tokens.get() + (token,))
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the session when leaving the outermost block, discarding the work that was not committed.
+
+        Args:
+            exc_type (Any): The exception type, if any.
+            exc_val (Any): The exception value, if any.
+            exc_tb (Any): The exception traceback, if any.
+        """
+        tokens = self._tokens.get()
+        self._tokens.set(tokens[:-1])
+        token = tokens[-1]
+        if token is None:
+            return
+        session = self.session
+        session.info.pop(AFTER_COMMIT, None)
+        async_unit_of_work_session.reset(token)
+        await session.close()
+
+    async def commit(self) -> None:
+        """Commit the transaction and run the after-commit callbacks, or only flush it inside a nested block."""
+        if not self._is_outermost():
+            await self.session.flush()
+            return
+        await self.session.commit()
+        for callback in self.session.info.pop(AFTER_COMMIT, ()):
+            callback()
+
+    async def rollback(self) -> None:
+        """Roll back the transaction and drop the after-commit callbacks, leaving both to the outermost block."""
+        if self._is_outermost():
+            await self.session.rollback()
+            self.session.info.pop(AFTER_COMMIT, None)
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Run a callback after the next commit of the outermost block, or right away outside of the unit of work.
+
+        The callbacks are kept on the session, so they run whichever instance opened it, and are dropped
+        with the session when the work is discarded.
+
+        Args:
+            callback (Callable[[], None]): The function to run.
+        """
+        session = self.session
+        if session is None:
+            callback()
+            return
+        callbacks: List[Callable[[], None]] = session.info.setdefault(AFTER_COMMIT, [])
+        callbacks.append(callback)
+
+    def _is_outermost(self) -> bool:
+        """Tell whether the calling task is in the block that opened the session.
+
+        Returns:
+            (bool): True in the outermost block of the unit of work.
+        """
+        tokens = self._tokens.get()
+        return bool(tokens) and tokens[-1] is not None
@@ -1,39 +1,99 @@
 import os
+import threading
+from contextvars import ContextVar
+from typing import Optional
+
 from dotenv import load_dotenv
-from sqlalchemy import Engine, create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.infra.db.settings.engine_registry import engine_registry
 
 load_dotenv()
 
+unit_of_work_session: ContextVar[Optional[Session]] = ContextVar("unit_of_work_session", default=None)
+
 
 class DBConnectionHandler:
     """Database connection handler for managing SQLAlchemy sessions.
 
     This class provides a context manager for managing database sessions using SQLAlchemy.
-    It initializes a database engine based on the provided connection string from environment variables.
+    The database engine is taken from the process-wide engine registry, so every handler that
+    points at the same connection string shares one engine and its connection pool.
+    The current session is kept per thread, so a single handler can be shared by
+    repositories that serve concurrent requests.
+
+    Inside a unit of work on the same engine, the handler joins the session of the unit of work
+    instead of opening its own: `commit` only flushes, `rollback` and the exit of the context
+    manager leave the transaction to the unit of work.
 
     Attributes:
-        session: The current database session.
+        session: The current database session of the calling thread.
 
     Methods:
         get_engine(): Get the underlying SQLAlchemy database engine.
+        commit(): Commit the current session, or flush it inside a unit of work.
+        rollback(): Roll back the current session, unless it belongs to a unit of work.
     """
 
     def __init__(self, connection_string: str = os.getenv("SQLALCHEMY_DATABASE_URL")) -> None:
         """Initialize a new instance of DBConnectionHandler."""
         self.connection_string = connection_string
         self.engine = self.__create_database_engine()
-        self.session = None
+        self.session_maker = sessionmaker(bind=self.engine)
+        self._local = threading.local()
 
     def __create_database_engine(self) -> Engine:
-        """Create a new SQLAlchemy database engine.
+        """Get the shared SQLAlchemy database engine for the connection string.
 
         Returns:
-            (Engine): The created SQLAlchemy engine.
+            (Engine): The SQLAlchemy engine registered for the connection string.
         """
-        engine = create_engine(self.connection_string)
+        engine = engine_registry.get_engine(self.connection_string)
         return engine
 
+    @property
+    def session(self):
+        """Get the database session opened by the calling thread.
+
+        Returns:
+            (Session | None): The current session, or None outside of the context manager.
+        """
+        return getattr(self._local, "session", None)
+
+    @session.setter
+    def session(self, session):
+        """Set the database session of the calling thread.
+
+        Args:
+            session (Session | None): The session to set.
+        """
+        self._local.session = session
+
+    @property
+    def unit_of_work_session(self) -> Optional[Session]:
+        """Get the session of the unit of work the calling context runs in, if it uses this engine.
+
+        Returns:
+            (Session | None): The unit of work session, or None outside of a unit of work.
+        """
+        session = unit_of_work_session.get()
+        if session is not None and session.get_bind() is self.engine:
+            return session
+        return None
+
+    def commit(self) -> None:
+        """Commit the current session, or only flush it when it belongs to a unit of work."""
+        if self.session is self.unit_of_work_session:
+            self.session.flush()
+        else:
+            self.session.commit()
+
+    def rollback(self) -> None:
+        """Roll back the current session, unless it belongs to a unit of work."""
+        if self.session is not self.unit_of_work_session:
+            self.session.rollback()
+
     def get_engine(self):
         """Get the underlying SQLAlchemy database engine.
 
@@ -48,8 +108,7 @@ class DBConnectionHandler:
         Returns:
             (DBConnectionHandler): This instance.
         """
-        session_make = sessionmaker(bind=self.engine)
-        self.session = session_make()
+        self.session = self.unit_of_work_session or self.session_maker()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -60,4 +119,5 @@ class DBConnectionHandler:
             exc_val (Any): The exception value, if any.
             exc_tb (Any): The exception traceback, if any.
         """
-        self.session.close()
+        if self.session is not self.unit_of_work_session:
+            self.session.close()
@@ -0,0 +1,225 @@
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.infra.metrics import instrument_pool
+from src.infra.tracing import trace_engine
+
+from .query_counter import instrument_engine
+
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def to_async_connection_string(connection_string: str) -> str:
+    """Convert a connection string to the asyncio driver of its database.
+
+    PostgreSQL connection strings are served by asyncpg and SQLite ones by aiosqlite.
+    Connection strings that already name an asyncio driver are returned unchanged.
+
+    Args:
+        connection_string (str): The database connection string.
+
+    Returns:
+        (str): The connection string using the asyncio driver.
+    """
+    url = make_url(connection_string)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None or url.get_driver_name() == driver:
+        return connection_string
+    return url.set(drivername=f"{url.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Connection pool settings shared by every engine of the registry.
+
+    Attributes:
+        pool_size (int): The number of connections kept open in the pool.
+        max_overflow (int): The number of connections allowed above `pool_size` under load.
+        pool_pre_ping (bool): Whether connections are tested for liveness on checkout.
+        pool_recycle (int): The number of seconds after which a connection is recycled, -1 to disable.
+        pool_timeout (float): The number of seconds to wait for a connection before giving up.
+    """
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_pre_ping: bool = True
+    pool_recycle: int = 1800
+    pool_timeout: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> "PoolSettings":
+        """Build the pool settings from environment variables.
+
+        The variables `DB_POOL_SIZE`, `DB_MAX_OVERFLOW`, `DB_POOL_PRE_PING`, `DB_POOL_RECYCLE` and
+        `DB_POOL_TIMEOUT` override the defaults when they are set.
+
+        Returns:
+            (PoolSettings): The pool settings read from the environment.
+        """
+        return cls(
+            pool_size=int(os.getenv("DB_POOL_SIZE", cls.pool_size)),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", cls.max_overflow)),
+            pool_pre_ping=os.getenv("DB_POOL_PRE_PING", str(cls.pool_pre_ping)).lower() in ("1", "true", "yes"),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", cls.pool_recycle)),
+            pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", cls.pool_timeout)),
+        )
+
+    def engine_options(self, connection_string: str) -> dict:
+        """Return the `create_engine` keyword arguments for the given connection string.
+
+        In-memory SQLite databases use a single connection per thread, so the sizing options
+        are only applied to databases served by a queue pool.
+
+        Args:
+            connection_string (str): The database connection string.
+
+        Returns:
+            (dict): The keyword arguments to pass to `create_engine`.
+        """
+        options = {"pool_pre_ping": self.pool_pre_ping, "pool_recycle": self.pool_recycle}
+        url = make_url(connection_string)
+        if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+            return options
+        options.update(pool_size=self.pool_size, max_overflow=self.max_overflow, pool_timeout=self.pool_timeout)
+        return options
+
+
+class EngineRegistry:
+    """Process-wide registry of SQLAlchemy engines keyed by connection string.
+
+    Creating an engine builds a new connection pool, so every handler pointing at the same
+    database shares the engine kept here instead of creating its own. The engines are instrumented
+    to record their statements in the query tracker and the trace of the current request, and the
+    time their connections wait to be checked out of the pool.
+
+    Methods:
+        get_engine(connection_string): Get the engine for a connection string, creating it on first use.
+        get_async_engine(connection_string): Get the asyncio engine for a connection string.
+        engines(): List the registered engines, the synchronous core of the asyncio ones included.
+        dispose(connection_string): Dispose and forget the engine of a connection string.
+        dispose_async(connection_string): Dispose and forget the asyncio engine of a connection string.
+        dispose_all(): Dispose and forget every registered engine.
+        dispose_all_async(): Dispose and forget every registered engine, awaiting the asyncio ones.
+    """
+
+    def __init__(self, pool_settings: Optional[PoolSettings] = None) -> None:
+        """Initialize a new, empty EngineRegistry.
+
+        Args:
+            pool_settings (PoolSettings, optional): The pool settings. Read from the environment when omitted.
+        """
+        self.pool_settings = pool_settings
+        self._engines: Dict[str, Engine] = {}
+        self._async_engines: Dict[str, AsyncEngine] = {}
+        self._lock = threading.Lock()
+
+    def get_engine(self, connection_string: str) -> Engine:
+        """Get the engine for a connection string, creating it on first use.
+
+        Args:
+            connection_string (str): The database connection string.
+
+        Returns:
+            (Engine): The shared SQLAlchemy engine.
+        """
+        engine = self._engines.get(connection_string)
+        if engine is not None:
+            return engine
+        with self._lock:
+            engine = self._engines.get(connection_string)
+            if engine is None:
+                pool_settings = self.pool_settings or PoolSettings.from_env()
+                engine = create_engine(connection_string, **pool_settings.engine_options(connection_string))
+                instrument_engine(engine)
+                instrument_pool(engine)
+                trace_engine(engine)
+                self._engines[connection_string] = engine
+        return engine
+
+    def get_async_engine(self, connection_string: str) -> AsyncEngine:
+        """Get the asyncio engine for a connection string, creating it on first use.
+
+        Args:
+            connection_string (str): The database connection string, using an asyncio driver.
+
+        Returns:
+            (AsyncEngine): The shared SQLAlchemy asyncio engine.
+        """
+        engine = self._async_engines.get(connection_string)
+        if engine is not None:
+            return engine
+        with self._lock:
+            engine = self._async_engines.get(connection_string)
+            if engine is None:
+                pool_settings = self.pool_settings or PoolSettings.from_env()
+                engine = create_async_engine(connection_string, **pool_settings.engine_options(connection_string))
+                instrument_engine(engine.sync_engine)
+                instrument_pool(engine.sync_engine)
+                trace_engine(engine.sync_engine)
+                self._async_engines[connection_string] = engine
+        return engine
+
+    def engines(self) -> List[Engine]:
+        """List the registered engines.
+
+        Returns:
+            (List[Engine]): The synchronous engines, then the `sync_engine` of the asyncio engines.
+        """
+        with self._lock:
+            return [*self._engines.values(), *(engine.sync_engine for engine in self._async_engines.values())]
+
+    def dispose(self, connection_string: str) -> None:
+        """Dispose and forget the engine of a connection string.
+
+        Args:
+            connection_string (str): The database connection string.
+        """
+        with self._lock:
+            engine = self._engines.pop(connection_string, None)
+        if engine is not None:
+            engine.dispose()
+
+    async def dispose_async(self, connection_string: str) -> None:
+        """Dispose and forget the asyncio engine of a connection string.
+
+        Args:
+            connection_string (str): The database connection string, using an asyncio driver.
+        """
+        with self._lock:
+            engine = self._async_engines.pop(connection_string, None)
+        if engine is not None:
+            await engine.dispose()
+
+    def dispose_all(self) -> None:
+        """Dispose and forget every registered engine, closing their pooled connections.
+
+        The connections of the asyncio engines are dropped without being awaited, use
+        `dispose_all_async` from a running event loop to close them gracefully.
+        """
+        with self._lock:
+            engines = list(self._engines.values())
+            async_engines = list(self._async_engines.values())
+            self._engines.clear()
+            self._async_engines.clear()
+        for engine in engines:
+            engine.dispose()
+        for async_engine in async_engines:
+            async_engine.sync_engine.dispose(close=False)
+
+    async def dispose_all_async(self) -> None:
+        """Dispose and forget every registered engine, awaiting the close of the asyncio connections."""
+        with self._lock:
+            async_engines = list(self._async_engines.values())
+            self._async_engines.clear()
+        for async_engine in async_engines:
+            await async_engine.dispose()
+        self.dispose_all()
+
+
+engine_registry = EngineRegistry()
@@ -0,0 +1,131 @@
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Engine, event
+
+
+class QueryStats:
+    """
+    The SQL statements executed while it is tracked, usually during one request.
+
+    The statements are counted by text, so a statement executed once per item of a list, the
+    pattern of an N+1 query, shows up as one text with a high count. Trackers can be nested: a
+    statement is recorded by the current tracker and every tracker it was opened in.
+
+    Attributes:
+        count (int): The number of statements executed.
+        duration (float): The total time the database took to execute them, in seconds.
+        statements (Counter): The number of executions of each statement text.
+        parent (QueryStats, optional): The tracker this one was opened in.
+    """
+
+    __slots__ = ("count", "duration", "statements", "parent")
+
+    def __init__(self, parent: Optional["QueryStats"] = None) -> None:
+        """
+        Initialize a new, empty QueryStats.
+
+        Args:
+            parent (QueryStats, optional): The tracker this one is opened in.
+        """
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+        self.parent = parent
+
+    def record(self, statement: str, duration: float) -> None:
+        """
+        Record a statement in this tracker and the trackers it was opened in.
+
+        Args:
+            statement (str): The SQL text of the statement.
+            duration (float): The time the database took to execute it, in seconds.
+        """
+        stats = self
+        while stats is not None:
+            stats.count += 1
+            stats.duration += duration
+            stats.statements[statement] += 1
+            stats = stats.parent
+
+    def repeated_statements(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        Get the statements executed at least `threshold` times, the likely N+1 queries.
+
+        Args:
+            threshold (int): The number of executions from which a statement is reported.
+
+        Returns:
+            (List[Tuple[str, int]]): The text and the number of executions of each repeated statement, most
+                repeated first.
+        """
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """
+    Get the tracker of the statements executed in the current context.
+
+    Returns:
+        (QueryStats | None): The innermost open tracker, or None when the statements are not tracked.
+    """
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Track the statements executed by the instrumented engines until the block exits.
+
+    The tracker is held in a context variable, so it follows the request into the threadpool and
+    the tasks it starts, and concurrent requests do not see each other's statements.
+
+    Yields:
+        (QueryStats): The tracker, filled as the statements are executed.
+    """
+    stats = QueryStats(parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Record the statements executed by an engine in the tracker of the current context.
+
+    The hooks only read a context variable when no tracker is open. Instrumenting an engine
+    twice has no effect.
+
+    Args:
+        engine (Engine): The engine to instrument, the `sync_engine` of an asyncio engine.
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(
+    connection: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    """Note when a statement is sent to the database, if it is tracked."""
+    if context is not None and _current_stats.get() is not None:
+        context._query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(
+    connection: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    """Record a statement once the database executed it, if it is tracked."""
+    stats = _current_stats.get()
+    started_at = getattr(context, "_query_started_at", None)
+    if stats is not None and started_at is not None:
+        stats.record(statement, time.perf_counter() - started_at)
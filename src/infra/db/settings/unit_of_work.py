@@ -0,0 +1,113 @@
+from contextvars import ContextVar, Token
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from src.domain.unit_of_work import UnitOfWorkInterface
+from src.infra.db.settings.connection import DBConnectionHandler, unit_of_work_session
+
+# The key of the after-commit callbacks in the `info` of the unit of work session.
+AFTER_COMMIT = "after_commit"
+
+
+class SqlAlchemyUnitOfWork(UnitOfWorkInterface):
+    """SQLAlchemy implementation of the unit of work.
+
+    Entering the unit of work opens one session, which every DBConnectionHandler on the same engine
+    joins until the unit of work ends, so the repositories called inside it share a single
+    connection checkout and a single transaction. The state is kept per context, so a single
+    instance can be shared by use cases that serve concurrent requests. The callbacks registered
+    with `after_commit`, such as cache invalidations, run once the outermost block commits.
+
+    Attributes:
+        db_connection (DBConnectionHandler): The connection handler the session is opened from.
+        session: The session of the unit of work in the calling context.
+    """
+
+    def __init__(self, db_connection: DBConnectionHandler) -> None:
+        """Initialize a new instance of SqlAlchemyUnitOfWork.
+
+        Args:
+            db_connection (DBConnectionHandler): The connection handler the session is opened from.
+        """
+        self.db_connection = db_connection
+        self._tokens: ContextVar[Tuple[Optional[Token], ...]] = ContextVar(f"unit_of_work_{id(self)}", default=())
+
+    @property
+    def session(self) -> Optional[Session]:
+        """Get the session of the unit of work in the calling context.
+
+        Returns:
+            (Session | None): The current session, or None outside of the unit of work.
+        """
+        return self.db_connection.unit_of_work_session
+
+    def __enter__(self) -> "SqlAlchemyUnitOfWork":
+        """Open the session of the unit of work, or join the one already open in the calling context.
+
+        Returns:
+            (SqlAlchemyUnitOfWork): This instance.
+        """
+        token = None
+        if self.session is None:
+            token = unit_of_work_session.set(self.db_connection.session_maker())
+        self._tokens.set(self._tokens.get() + (token,))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the session when leaving the outermost block, discarding the work that was not committed.
+
+        Args:
+            exc_type (Any): The exception type, if any.
+            exc_val (Any): The exception value, if any.
+            exc_tb (Any): The exception traceback, if any.
+        """
+        tokens = self._tokens.get()
+        self._tokens.set(tokens[:-1])
+        token = tokens[-1]
+        if token is None:
+            return
+        session = self.session
+        session.info.pop(AFTER_COMMIT, None)
+        unit_of_work_session.reset(token)
+        session.close()
+
+    def commit(self) -> None:
+        """Commit the transaction and run the after-commit callbacks, or only flush it inside a nested block."""
+        if not self._is_outermost():
+            self.session.flush()
+            return
+        self.session.commit()
+        for callback in self.session.info.pop(AFTER_COMMIT, ()):
+            callback()
+
+    def rollback(self) -> None:
+        """Roll back the transaction and drop the after-commit callbacks, leaving both to the outermost block."""
+        if self._is_outermost():
+            self.session.rollback()
+            self.session.info.pop(AFTER_COMMIT, None)
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Run a callback after the next commit of the outermost block, or right away outside of the unit of work.
+
+        The callbacks are kept on the session, so they run whichever instance opened it, and are dropped
+        with the session when the work is discarded.
+
+        Args:
+            callback (Callable[[], None]): The function to run.
+        """
+        session = self.session
+        if session is None:
+            callback()
+            return
+        callbacks: List[Callable[[], None]] = session.info.setdefault(AFTER_COMMIT, [])
+        callbacks.append(callback)
+
+    def _is_outermost(self) -> bool:
+        """Tell whether the calling context is in the block that opened the session.
+
+        Returns:
+            (bool): True in the outermost block of the unit of work.
+        """
+        tokens = self._tokens.get()
+        return bool(tokens) and tokens[-1] is not None
@@ -0,0 +1,4 @@
+from .metrics import Counter, Gauge, Histogram, MetricFamily
+from .caches import CacheCollector, EmailFilterCollector
+from .pool import PoolCollector, instrument_pool
+from .registry import CONTENT_TYPE, MetricsRegistry, metrics_registry
@@ -0,0 +1,123 @@
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from src.infra.cache import TTLCache
+
+from .metrics import MetricFamily
+
+if TYPE_CHECKING:
+    from src.infra.repositories.bloom_filtered_user import EmailFilter
+
+
+class CacheCollector:
+    """
+    Collects the counters and the size of TTL caches when the metrics are scraped.
+
+    Attributes:
+        caches (Callable[[], Dict[str, TTLCache]]): Gets the caches, keyed by the name reported in the `cache` label.
+    """
+
+    def __init__(self, caches: Callable[[], Dict[str, TTLCache]]) -> None:
+        """
+        Initialize a new instance of CacheCollector.
+
+        Args:
+            caches (Callable[[], Dict[str, TTLCache]]): Gets the caches, keyed by the name reported in the `cache`
+                label.
+        """
+        self.caches = caches
+
+    def __call__(self) -> List[MetricFamily]:
+        """
+        Collect the counters and the size of every cache.
+
+        Returns:
+            (List[MetricFamily]): The hit, miss, eviction, stale hit, stale on error and refresh counters, and the
+                entries gauge of the caches.
+        """
+        families = {
+            "hits": MetricFamily("cache_hits_total", "counter", "Lookups answered with a fresh entry."),
+            "misses": MetricFamily("cache_misses_total", "counter", "Lookups that loaded the value."),
+            "evictions": MetricFamily("cache_evictions_total", "counter", "Entries dropped to respect the size bound."),
+            "stale_hits": MetricFamily(
+                "cache_stale_hits_total", "counter", "Lookups answered with a stale entry while it is refreshed."
+            ),
+            "stale_on_error": MetricFamily(
+                "cache_stale_on_error_total", "counter", "Lookups answered with a stale entry because the load failed."
+            ),
+            "refreshes": MetricFamily("cache_refreshes_total", "counter", "Background refreshes of stale entries."),
+        }
+        entries = MetricFamily("cache_entries", "gauge", "Entries held, expired ones included.")
+        for name, cache in self.caches().items():
+            labels = {"cache": name}
+            for attribute, family in families.items():
+                family.samples.append(("", labels, float(getattr(cache.stats, attribute))))
+            entries.samples.append(("", labels, float(len(cache))))
+        return [*families.values(), entries]
+
+
+class EmailFilterCollector:
+    """
+    Collects the size and the effectiveness of the email filter when the metrics are scraped.
+
+    Attributes:
+        email_filter (Callable[[], EmailFilter | None]): Gets the email filter, None when it is disabled.
+    """
+
+    def __init__(self, email_filter: Callable[[], Optional["EmailFilter"]]) -> None:
+        """
+        Initialize a new instance of EmailFilterCollector.
+
+        Args:
+            email_filter (Callable[[], EmailFilter | None]): Gets the email filter, None when it is disabled.
+        """
+        self.email_filter = email_filter
+
+    def __call__(self) -> List[MetricFamily]:
+        """
+        Collect the metrics of the email filter.
+
+        Returns:
+            (List[MetricFamily]): The readiness, items, memory and false-positive rate gauges and the lookup and
+                rebuild counters of the filter, none when it is disabled.
+        """
+        email_filter = self.email_filter()
+        if email_filter is None:
+            return []
+        stats = email_filter.stats
+        return [
+            MetricFamily("email_filter_ready", "gauge", "Whether the filter is built.", [("", {}, float(stats.ready))]),
+            MetricFamily("email_filter_items", "gauge", "Emails added to the filter.", [("", {}, float(stats.items))]),
+            MetricFamily(
+                "email_filter_memory_bytes", "gauge", "Size of the bit array.", [("", {}, float(stats.memory_bytes))]
+            ),
+            MetricFamily(
+                "email_filter_estimated_false_positive_rate",
+                "gauge",
+                "False-positive rate expected from the filter fill.",
+                [("", {}, stats.estimated_false_positive_rate)],
+            ),
+            MetricFamily(
+                "email_filter_observed_false_positive_rate",
+                "gauge",
+                "Share of the lookups of unknown emails the filter let through.",
+                [("", {}, stats.observed_false_positive_rate)],
+            ),
+            MetricFamily(
+                "email_filter_definite_misses_total",
+                "counter",
+                "Lookups answered without querying the database.",
+                [("", {}, float(stats.definite_misses))],
+            ),
+            MetricFamily(
+                "email_filter_false_positives_total",
+                "counter",
+                "Lookups the filter let through that found no user.",
+                [("", {}, float(stats.false_positives))],
+            ),
+            MetricFamily(
+                "email_filter_rebuilds_total",
+                "counter",
+                "Successful builds of the filter.",
+                [("", {}, float(stats.rebuilds))],
+            ),
+        ]
@@ -0,0 +1,347 @@
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Dict, Generic, List, Sequence, Tuple, TypeVar
+
+Child = TypeVar("Child")
+
+# Upper bounds of the request duration buckets, in seconds.
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class MetricFamily:
+    """
+    The samples of a metric at collection time.
+
+    Attributes:
+        name (str): The name of the metric.
+        type (str): The Prometheus type of the metric: `counter`, `gauge` or `histogram`.
+        documentation (str): The help text of the metric.
+        samples (List[Tuple[str, Dict[str, str], float]]): The name suffix, the labels and the value of each sample.
+    """
+
+    name: str
+    type: str
+    documentation: str
+    samples: List[Tuple[str, Dict[str, str], float]] = field(default_factory=list)
+
+
+class ThreadCells:
+    """
+    Values updated without locks, kept in one cell per thread and summed at collection time.
+
+    A thread only ever writes to its own cell, so updates do not race and need no lock: the
+    lock is taken when a thread first updates the values, and when they are collected.
+
+    Attributes:
+        size (int): The number of values of a cell.
+    """
+
+    __slots__ = ("size", "_local", "_cells", "_lock")
+
+    def __init__(self, size: int) -> None:
+        """
+        Initialize a new instance of ThreadCells, with every value at 0.
+
+        Args:
+            size (int): The number of values of a cell.
+        """
+        self.size = size
+        self._local = threading.local()
+        self._cells: List[List[float]] = []
+        self._lock = threading.Lock()
+
+    def cell(self) -> List[float]:
+        """
+        Get the cell of the current thread, creating it on first use.
+
+        Returns:
+            (List[float]): The values written by the current thread.
+        """
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = self._local.cell = [0.0] * self.size
+            with self._lock:
+                self._cells.append(cell)
+            return cell
+
+    def totals(self) -> List[float]:
+        """
+        Sum the cells of every thread.
+
+        Returns:
+            (List[float]): The total of each value.
+        """
+        with self._lock:
+            cells = list(self._cells)
+        return [sum(values) for values in zip(*cells)] if cells else [0.0] * self.size
+
+
+class Metric(Generic[Child]):
+    """
+    Base class of the metrics: a family of children, one per combination of label values.
+
+    Attributes:
+        name (str): The name of the metric.
+        documentation (str): The help text of the metric.
+        label_names (Tuple[str, ...]): The names of the labels of the metric.
+    """
+
+    type = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> None:
+        """
+        Initialize a new metric without children.
+
+        Args:
+            name (str): The name of the metric.
+            documentation (str): The help text of the metric.
+            label_names (Sequence[str]): The names of the labels of the metric.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._children: Dict[Tuple[str, ...], Child] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str) -> Child:
+        """
+        Get the child of a combination of label values, creating it on first use.
+
+        Args:
+            *values (str): The value of each label, in the order of `label_names`.
+
+        Returns:
+            (Child): The child holding the values of the combination.
+
+        Raises:
+            ValueError: If the number of values does not match the number of labels.
+        """
+        child = self._children.get(values)
+        if child is not None:
+            return child
+        if len(values) != len(self.label_names):
+            raise ValueError(f"{self.name} expects the labels {self.label_names}, got {values}.")
+        with self._lock:
+            child = self._children.get(values)
+            if child is None:
+                child = self._children[values] = self._new_child()
+        return child
+
+    def collect(self) -> MetricFamily:
+        """
+        Collect the samples of every child.
+
+        Returns:
+            (MetricFamily): The samples of the metric.
+        """
+        family = MetricFamily(self.name, self.type, self.documentation)
+        for values, child in list(self._children.items()):
+            self._collect_child(family, dict(zip(self.label_names, values)), child)
+        return family
+
+    def _new_child(self) -> Child:
+        """Build the child of a new combination of label values."""
+        raise NotImplementedError
+
+    def _collect_child(self, family: MetricFamily, labels: Dict[str, str], child: Child) -> None:
+        """Add the samples of a child to the family."""
+        raise NotImplementedError
+
+
+class CounterChild:
+    """A value that only goes up."""
+
+    __slots__ = ("_cells",)
+
+    def __init__(self) -> None:
+        """Initialize a new counter at 0."""
+        self._cells = ThreadCells(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the counter.
+
+        Args:
+            amount (float): The amount to add, not negative.
+        """
+        self._cells.cell()[0] += amount
+
+    @property
+    def value(self) -> float:
+        """Get the current value of the counter."""
+        return self._cells.totals()[0]
+
+
+class Counter(Metric[CounterChild]):
+    """A metric counting events, such as requests or outcomes."""
+
+    type = "counter"
+
+    def _new_child(self) -> CounterChild:
+        """Build a counter at 0."""
+        return CounterChild()
+
+    def _collect_child(self, family: MetricFamily, labels: Dict[str, str], child: CounterChild) -> None:
+        """Add the value of the counter to the family."""
+        family.samples.append(("", labels, child.value))
+
+
+class GaugeChild:
+    """A value that goes up and down."""
+
+    __slots__ = ("_cells",)
+
+    def __init__(self) -> None:
+        """Initialize a new gauge at 0."""
+        self._cells = ThreadCells(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the gauge.
+
+        Args:
+            amount (float): The amount to add.
+        """
+        self._cells.cell()[0] += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """
+        Decrease the gauge.
+
+        Args:
+            amount (float): The amount to subtract.
+        """
+        self._cells.cell()[0] -= amount
+
+    @property
+    def value(self) -> float:
+        """Get the current value of the gauge."""
+        return self._cells.totals()[0]
+
+
+class Gauge(Metric[GaugeChild]):
+    """A metric measuring a level, such as the requests in flight."""
+
+    type = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        """Build a gauge at 0."""
+        return GaugeChild()
+
+    def _collect_child(self, family: MetricFamily, labels: Dict[str, str], child: GaugeChild) -> None:
+        """Add the value of the gauge to the family."""
+        family.samples.append(("", labels, child.value))
+
+
+class HistogramChild:
+    """
+    The distribution of observed values in buckets.
+
+    The cell of a thread holds the number of observations of each bucket, not cumulated, then
+    the sum of the observations, so an observation updates two values.
+
+    Attributes:
+        upper_bounds (Tuple[float, ...]): The inclusive upper bound of each bucket, the last one infinite.
+    """
+
+    __slots__ = ("upper_bounds", "_cells")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]) -> None:
+        """
+        Initialize a new, empty histogram.
+
+        Args:
+            upper_bounds (Tuple[float, ...]): The inclusive upper bound of each bucket, the last one infinite.
+        """
+        self.upper_bounds = upper_bounds
+        self._cells = ThreadCells(len(upper_bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value (float): The observed value.
+        """
+        cell = self._cells.cell()
+        cell[bisect_left(self.upper_bounds, value)] += 1
+        cell[-1] += value
+
+    def snapshot(self) -> Tuple[List[float], float]:
+        """
+        Get the cumulated bucket counts and the sum of the observations.
+
+        Returns:
+            (Tuple[List[float], float]): The number of observations lower than or equal to each upper bound,
+                and the sum of the observations.
+        """
+        totals = self._cells.totals()
+        counts, running = [], 0.0
+        for count in totals[:-1]:
+            running += count
+            counts.append(running)
+        return counts, totals[-1]
+
+
+class Histogram(Metric[HistogramChild]):
+    """
+    A metric of the distribution of values, such as request durations.
+
+    Attributes:
+        upper_bounds (Tuple[float, ...]): The inclusive upper bound of each bucket, the last one infinite.
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """
+        Initialize a new histogram without children.
+
+        Args:
+            name (str): The name of the metric.
+            documentation (str): The help text of the metric.
+            label_names (Sequence[str]): The names of the labels of the metric.
+            buckets (Sequence[float]): The upper bounds of the buckets. An infinite bucket is added last.
+        """
+        super().__init__(name, documentation, label_names)
+        self.upper_bounds = tuple(sorted(set(buckets) | {float("inf")}))
+
+    def _new_child(self) -> HistogramChild:
+        """Build an empty histogram."""
+        return HistogramChild(self.upper_bounds)
+
+    def _collect_child(self, family: MetricFamily, labels: Dict[str, str], child: HistogramChild) -> None:
+        """Add the buckets, the sum and the count of the histogram to the family."""
+        counts, total = child.snapshot()
+        for upper_bound, count in zip(self.upper_bounds, counts):
+            family.samples.append(("_bucket", {**labels, "le": format_value(upper_bound)}, count))
+        family.samples.append(("_sum", labels, total))
+        family.samples.append(("_count", labels, counts[-1]))
+
+
+def format_value(value: float) -> str:
+    """
+    Format a sample value in the Prometheus text format.
+
+    Args:
+        value (float): The value.
+
+    Returns:
+        (str): The value, without decimals when it is whole.
+    """
+    if value == float("inf"):
+        return "+Inf"
+    if value == float("-inf"):
+        return "-Inf"
+    if value.is_integer():
+        return str(int(value))
+    return repr(value)
@@ -0,0 +1,107 @@
+import time
+from typing import Callable, Iterable, List
+
+from sqlalchemy import Engine
+from sqlalchemy.pool import Pool
+
+from .metrics import MetricFamily
+from .registry import metrics_registry
+
+# Upper bounds of the checkout wait buckets, in seconds: a healthy pool answers in microseconds.
+CHECKOUT_WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+POOL_CHECKOUT_WAIT = metrics_registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time taken to get a connection from the pool, including opening a new one.",
+    ("database",),
+    CHECKOUT_WAIT_BUCKETS,
+)
+
+
+def database_label(engine: Engine) -> str:
+    """
+    Name the database of an engine in the metric labels.
+
+    Args:
+        engine (Engine): The engine.
+
+    Returns:
+        (str): The URL of the engine, without its password.
+    """
+    return engine.url.render_as_string(hide_password=True)
+
+
+def instrument_pool(engine: Engine) -> None:
+    """
+    Record the time the connections of an engine take to be checked out of its pool.
+
+    The pool is switched to a subclass of its own class, built for the engine, that times
+    `_do_get`, where a checkout waits for a free connection or opens a new one. The subclass, and
+    the database label it carries, are kept when the engine is disposed, since a pool is recreated
+    from its class. Instrumenting a pool twice has no effect.
+
+    Args:
+        engine (Engine): The engine to instrument, the `sync_engine` of an asyncio engine.
+    """
+    pool = engine.pool
+    if getattr(pool, "metrics_timed", False):
+        return
+    base = type(pool)
+    pool.__class__ = type(
+        f"Timed{base.__name__}",
+        (base,),
+        {"_do_get": _timed_do_get, "metrics_timed": True, "metrics_database": database_label(engine)},
+    )
+
+
+def _timed_do_get(self: Pool):
+    """Check a connection out of the pool and record how long it took."""
+    started_at = time.perf_counter()
+    try:
+        return super(type(self), self)._do_get()
+    finally:
+        POOL_CHECKOUT_WAIT.labels(self.metrics_database).observe(time.perf_counter() - started_at)
+
+
+class PoolCollector:
+    """
+    Collects the state of the connection pools of engines when the metrics are scraped.
+
+    Only queue pools report their size and overflow; the pools of in-memory SQLite databases
+    are skipped.
+
+    Attributes:
+        engines (Callable[[], Iterable[Engine]]): Lists the engines, the `sync_engine` of the asyncio ones.
+    """
+
+    def __init__(self, engines: Callable[[], Iterable[Engine]]) -> None:
+        """
+        Initialize a new instance of PoolCollector.
+
+        Args:
+            engines (Callable[[], Iterable[Engine]]): Lists the engines, the `sync_engine` of the asyncio ones.
+        """
+        self.engines = engines
+
+    def __call__(self) -> List[MetricFamily]:
+        """
+        Collect the state of every pool.
+
+        Returns:
+            (List[MetricFamily]): The checked out, checked in, overflow and size gauges of the pools. The overflow
+                is reported from 0, where SQLAlchemy counts it from minus the pool size.
+        """
+        families = {
+            "checkedout": MetricFamily("db_pool_checked_out", "gauge", "Connections in use."),
+            "checkedin": MetricFamily("db_pool_checked_in", "gauge", "Idle connections kept open in the pool."),
+            "overflow": MetricFamily("db_pool_overflow", "gauge", "Connections opened above the pool size."),
+            "size": MetricFamily("db_pool_size", "gauge", "Connections the pool keeps open."),
+        }
+        for engine in self.engines():
+            pool = engine.pool
+            if not hasattr(pool, "overflow"):
+                continue
+            labels = {"database": database_label(engine)}
+            for method, family in families.items():
+                family.samples.append(("", labels, float(max(getattr(pool, method)(), 0))))
+        return list(families.values())
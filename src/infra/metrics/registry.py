@@ -0,0 +1,188 @@
+import threading
+from typing import Callable, Dict, Iterable, List, Sequence, Type, TypeVar
+
+from .metrics import DEFAULT_BUCKETS, Counter, Gauge, Histogram, Metric, MetricFamily, format_value
+
+MetricType = TypeVar("MetricType", bound=Metric)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsRegistry:
+    """
+    Process-wide registry of the metrics, rendered in the Prometheus text format.
+
+    The metrics are updated as events happen, while the collectors compute their samples when the
+    metrics are scraped, so a value that is cheap to read on demand, such as the state of a
+    connection pool, costs nothing between scrapes.
+
+    Methods:
+        counter(name, documentation, label_names): Get the counter of a name, creating it on first use.
+        gauge(name, documentation, label_names): Get the gauge of a name, creating it on first use.
+        histogram(name, documentation, label_names, buckets): Get the histogram of a name, creating it on first use.
+        register_collector(collector): Add a function computing metric families at scrape time.
+        unregister_collector(collector): Remove a function added by register_collector.
+        collect(): Collect the families of every metric and collector.
+        render(): Render every metric in the Prometheus text format.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new, empty MetricsRegistry."""
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], Iterable[MetricFamily]]] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        """
+        Get the counter of a name, creating it on first use.
+
+        Args:
+            name (str): The name of the counter, ending with `_total`.
+            documentation (str): The help text of the counter.
+            label_names (Sequence[str]): The names of the labels of the counter.
+
+        Returns:
+            (Counter): The counter.
+
+        Raises:
+            ValueError: If a metric of another type has the same name.
+        """
+        return self._get_or_create(Counter, name, lambda: Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Gauge:
+        """
+        Get the gauge of a name, creating it on first use.
+
+        Args:
+            name (str): The name of the gauge.
+            documentation (str): The help text of the gauge.
+            label_names (Sequence[str]): The names of the labels of the gauge.
+
+        Returns:
+            (Gauge): The gauge.
+
+        Raises:
+            ValueError: If a metric of another type has the same name.
+        """
+        return self._get_or_create(Gauge, name, lambda: Gauge(name, documentation, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """
+        Get the histogram of a name, creating it on first use.
+
+        Args:
+            name (str): The name of the histogram.
+            documentation (str): The help text of the histogram.
+            label_names (Sequence[str]): The names of the labels of the histogram.
+            buckets (Sequence[float]): The upper bounds of the buckets.
+
+        Returns:
+            (Histogram): The histogram.
+
+        Raises:
+            ValueError: If a metric of another type has the same name.
+        """
+        return self._get_or_create(Histogram, name, lambda: Histogram(name, documentation, label_names, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[MetricFamily]]) -> None:
+        """
+        Add a function computing metric families when the metrics are scraped.
+
+        Args:
+            collector (Callable[[], Iterable[MetricFamily]]): The function.
+        """
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def unregister_collector(self, collector: Callable[[], Iterable[MetricFamily]]) -> None:
+        """
+        Remove a function added by `register_collector`, if it is registered.
+
+        Args:
+            collector (Callable[[], Iterable[MetricFamily]]): The function.
+        """
+        with self._lock:
+            if collector in self._collectors:
+                self._collectors.remove(collector)
+
+    def collect(self) -> List[MetricFamily]:
+        """
+        Collect the families of every metric and collector.
+
+        Returns:
+            (List[MetricFamily]): The families, the metrics in registration order and then those of the collectors.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        families = [metric.collect() for metric in metrics]
+        for collector in collectors:
+            families.extend(collector())
+        return families
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text format.
+
+        Returns:
+            (str): The exposition, served with the `CONTENT_TYPE` content type.
+        """
+        lines = []
+        for family in self.collect():
+            lines.append(f"# HELP {family.name} {escape(family.documentation, quote=False)}")
+            lines.append(f"# TYPE {family.name} {family.type}")
+            for suffix, labels, value in family.samples:
+                rendered_labels = ",".join(f'{name}="{escape(str(label))}"' for name, label in labels.items())
+                name = f"{family.name}{suffix}"
+                lines.append(
+                    f"{name}{{{rendered_labels}}} {format_value(value)}" if labels else f"{name} {format_value(value)}"
+                )
+        return "\n".join(lines) + "\n"
+
+    def _get_or_create(self, metric_type: Type[MetricType], name: str, build: Callable[[], MetricType]) -> MetricType:
+        """
+        Get the metric of a name, building it on first use.
+
+        Args:
+            metric_type (Type[Metric]): The expected type of the metric.
+            name (str): The name of the metric.
+            build (Callable[[], Metric]): Builds the metric.
+
+        Returns:
+            (Metric): The metric.
+
+        Raises:
+            ValueError: If a metric of another type has the same name.
+        """
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = build()
+        if not isinstance(metric, metric_type):
+            raise ValueError(f"The metric {name} is already registered as a {metric.type}.")
+        return metric
+
+
+def escape(text: str, quote: bool = True) -> str:
+    """
+    Escape a label value or a help text for the Prometheus text format.
+
+    Args:
+        text (str): The text.
+        quote (bool): Whether double quotes are escaped too, as in label values.
+
+    Returns:
+        (str): The escaped text.
+    """
+    text = text.replace("\\", "\\\\").replace("\n", "\\n")
+    return text.replace('"', '\\"') if quote else text
+
+
+metrics_registry = MetricsRegistry()
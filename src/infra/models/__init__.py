@@ -1 +1,3 @@
+from .revoked_token import RevokedTokenModel
 from .user import UserModel
+from .user_search import USER_SEARCH_TABLE
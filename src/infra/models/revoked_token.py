@@ -0,0 +1,23 @@
+from sqlalchemy import Column, DateTime, String
+from src.infra.db.settings import Base
+
+
+class RevokedTokenModel(Base):
+    """
+    Represents an access token revoked before its expiry.
+
+    The rows are read in full by every worker to refresh its in-memory revocation list, and are only
+    needed until the token expires, so expired rows are deleted.
+
+    Attributes:
+        token_id (str): The unique ID of the token, the primary key.
+        expires_at (datetime): When the token expires. Indexed to select the tokens not expired yet.
+
+    Table name:
+        revoked_tokens: The name of the table in the database that this SQLAlchemy model maps to.
+    """
+
+    __tablename__ = "revoked_tokens"
+
+    token_id = Column(String(32), primary_key=True)
+    expires_at = Column(DateTime(timezone=True), index=True, nullable=False)
@@ -14,7 +14,7 @@ class UserModel(Base):
         id (int): The primary key of the user table.
         name (str): The name of the user, with a maximum length of 50 characters.
         email (str): The email address of the user, with a maximum length of 255 characters. Must be unique.
-        password (str): The user's password.
+        password (str): The hash of the user's password, stored in the `password_hash` column.
         created_at (datetime): The timestamp for when the user was created.
 
     Constraints:
@@ -27,7 +27,7 @@ class UserModel(Base):
         id: The primary key column for the user table.
         name: The name column for the user table.
         email: The email column for the user table.
-        password: The password column for the user table.
+        password_hash: The password hash column for the user table, mapped to the `password` attribute.
         created_at: The timestamp column for when the user was created.
         updated_at: The timestamp column for when the user was last updated.
 
@@ -42,7 +42,7 @@ class UserModel(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(50), index=True, nullable=False, info={"max_length": 50})
     email = Column(String(255), unique=True, index=True, nullable=False, info={"max_length": 255})
-    password = Column(String, nullable=False)
+    password = Column("password_hash", String, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     __table_args__ = (UniqueConstraint("email", name="uq_users_email"),)
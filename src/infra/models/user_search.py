@@ -0,0 +1,36 @@
+from sqlalchemy import DDL, event
+
+from src.infra.models.user import UserModel
+
+USER_SEARCH_TABLE = "users_search"
+
+SQLITE_USER_SEARCH_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {USER_SEARCH_TABLE} USING fts5("
+    "name, email, content='users', content_rowid='id', tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS {USER_SEARCH_TABLE}_ai AFTER INSERT ON users BEGIN "
+    f"INSERT INTO {USER_SEARCH_TABLE}(rowid, name, email) VALUES (new.id, new.name, new.email); END",
+    f"CREATE TRIGGER IF NOT EXISTS {USER_SEARCH_TABLE}_ad AFTER DELETE ON users BEGIN "
+    f"INSERT INTO {USER_SEARCH_TABLE}({USER_SEARCH_TABLE}, rowid, name, email) "
+    "VALUES ('delete', old.id, old.name, old.email); END",
+    f"CREATE TRIGGER IF NOT EXISTS {USER_SEARCH_TABLE}_au AFTER UPDATE ON users BEGIN "
+    f"INSERT INTO {USER_SEARCH_TABLE}({USER_SEARCH_TABLE}, rowid, name, email) "
+    "VALUES ('delete', old.id, old.name, old.email); "
+    f"INSERT INTO {USER_SEARCH_TABLE}(rowid, name, email) VALUES (new.id, new.name, new.email); END",
+    f"INSERT INTO {USER_SEARCH_TABLE}({USER_SEARCH_TABLE}) VALUES ('rebuild')",
+)
+SQLITE_USER_SEARCH_DROP_DDL = (f"DROP TABLE IF EXISTS {USER_SEARCH_TABLE}",)
+
+POSTGRESQL_USER_SEARCH_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_users_name_trgm ON users USING gin (name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_users_email_trgm ON users USING gin (email gin_trgm_ops)",
+)
+
+# Tables created with `Base.metadata.create_all` get the same search structures as the Alembic migration:
+# an FTS5 trigram table kept in sync by triggers on SQLite, and trigram GIN indexes on PostgreSQL.
+for statement in SQLITE_USER_SEARCH_DDL:
+    event.listen(UserModel.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+for statement in SQLITE_USER_SEARCH_DROP_DDL:
+    event.listen(UserModel.__table__, "before_drop", DDL(statement).execute_if(dialect="sqlite"))
+for statement in POSTGRESQL_USER_SEARCH_DDL:
+    event.listen(UserModel.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
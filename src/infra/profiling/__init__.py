@@ -0,0 +1,3 @@
+from .formats import function_name, to_collapsed, to_speedscope
+from .sampler import AWAIT, Profile, Sampler, current_profile, sampler
+from .tokens import sign_profile_token, verify_profile_token
@@ -0,0 +1,93 @@
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+from .sampler import Profile
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+def function_name(function: Any) -> str:
+    """
+    Name a function of a sampled stack.
+
+    Args:
+        function (CodeType | str): The code of the function, or the name of a synthetic function such as `[await]`.
+
+    Returns:
+        (str): The qualified name of the function, such as `UserRepository.get_user_by_email`. Python 3.10 does not
+            keep it on the code, so its bare name is used there.
+    """
+    if isinstance(function, str):
+        return function
+    return getattr(function, "co_qualname", function.co_name)
+
+
+def frame_of(function: Any) -> Dict[str, Any]:
+    """
+    Describe a function of a sampled stack.
+
+    Args:
+        function (CodeType | str): The code of the function, or the name of a synthetic function such as `[await]`.
+
+    Returns:
+        (Dict[str, Any]): The name, the file and the first line of the function.
+    """
+    if isinstance(function, str):
+        return {"name": function}
+    return {"name": function_name(function), "file": function.co_filename, "line": function.co_firstlineno}
+
+
+def to_speedscope(profile: Profile) -> Dict[str, Any]:
+    """
+    Convert a profile to the speedscope file format, as a sampled profile weighted in seconds.
+
+    Args:
+        profile (Profile): The profile.
+
+    Returns:
+        (Dict[str, Any]): The speedscope document, to be serialized to JSON and opened at https://www.speedscope.app.
+    """
+    indexes: Dict[Any, int] = {}
+    samples: List[List[int]] = []
+    weights: List[float] = []
+    for stack, weight in profile.samples:
+        samples.append([indexes.setdefault(function, len(indexes)) for function in stack])
+        weights.append(weight)
+    return {
+        "$schema": SPEEDSCOPE_SCHEMA,
+        "name": profile.name,
+        "activeProfileIndex": 0,
+        "exporter": "school-platform-api",
+        "shared": {"frames": [frame_of(function) for function in indexes]},
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": profile.name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": profile.duration,
+                "samples": samples,
+                "weights": weights,
+            }
+        ],
+    }
+
+
+def to_collapsed(profile: Profile) -> str:
+    """
+    Convert a profile to the folded stacks read by `flamegraph.pl` and most flame graph tools.
+
+    Args:
+        profile (Profile): The profile.
+
+    Returns:
+        (str): One line per distinct stack, the functions joined by `;`, followed by its weight in microseconds.
+    """
+    weights: Counter = Counter()
+    for stack, weight in profile.samples:
+        weights[stack] += weight
+    lines: List[Tuple[str, int]] = [
+        (";".join(function_name(function) for function in stack), round(weight * 1e6))
+        for stack, weight in weights.items()
+    ]
+    return "".join(f"{stack} {weight}\n" for stack, weight in lines)
@@ -0,0 +1,232 @@
+import asyncio
+import itertools
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from types import CodeType, FrameType
+from typing import Any, Callable, List, Optional, Tuple
+
+# The function of a sample that was taken while the request awaited, off the CPU.
+AWAIT = "[await]"
+
+_current_profile: ContextVar[Optional["Profile"]] = ContextVar("current_profile", default=None)
+_profile_ids = itertools.count(1)
+
+Stack = Tuple[Any, ...]
+
+
+def current_profile() -> Optional["Profile"]:
+    """
+    Get the profile of the running request.
+
+    Returns:
+        (Profile | None): The profile, or None when the request is not profiled.
+    """
+    return _current_profile.get()
+
+
+def coroutine_stack(coroutine: Any, root: Optional[FrameType]) -> List[CodeType]:
+    """
+    Read the stack of a suspended coroutine, from the chain of the awaitables it awaits.
+
+    Args:
+        coroutine (Any): The outermost coroutine of the task.
+        root (FrameType, optional): The frame the stack starts from, the frames of the callers being left out.
+
+    Returns:
+        (List[CodeType]): The code of the awaiting functions, the outermost first.
+    """
+    stack = []
+    while coroutine is not None:
+        frame = getattr(coroutine, "cr_frame", None) or getattr(coroutine, "gi_frame", None)
+        if frame is None:
+            break
+        if frame is root:
+            stack.clear()
+        stack.append(frame.f_code)
+        coroutine = getattr(coroutine, "cr_await", None) or getattr(coroutine, "gi_yieldfrom", None)
+    return stack
+
+
+def frame_stack(frame: Optional[FrameType], root: FrameType) -> Optional[List[CodeType]]:
+    """
+    Read the stack of a running thread, up to a root frame.
+
+    Args:
+        frame (FrameType, optional): The innermost frame of the thread.
+        root (FrameType): The frame the stack starts from.
+
+    Returns:
+        (List[CodeType] | None): The code of the running functions, the outermost first, or None when the root
+            frame is not on the stack.
+    """
+    stack = []
+    while frame is not None:
+        stack.append(frame.f_code)
+        if frame is root:
+            stack.reverse()
+            return stack
+        frame = frame.f_back
+    return None
+
+
+class Profile:
+    """
+    The samples of the stack of one request.
+
+    A request runs on the event loop, and its synchronous controller runs in a worker thread. At
+    each sample the profile is read from the worker thread while it runs the request, from the
+    event loop thread while it runs the task of the request, and from the chain of awaited
+    coroutines of the task otherwise, the request then waiting off the CPU.
+
+    Attributes:
+        id (int): The number of the profile in the process.
+        name (str): What is profiled, such as `GET /api/users/`.
+        interval (float): The number of seconds between two samples.
+        samples (List[Tuple[Stack, float]]): The stacks sampled, the outermost function first, with the
+            number of seconds each stands for.
+        started_at (float): When the profile started, as a `time.perf_counter` value.
+        duration (float): The number of seconds the profile ran, 0 while it runs.
+    """
+
+    def __init__(self, name: str, interval: float = 0.001) -> None:
+        """
+        Initialize a new instance of Profile.
+
+        Args:
+            name (str): What is profiled.
+            interval (float): The number of seconds between two samples.
+        """
+        self.id = next(_profile_ids)
+        self.name = name
+        self.interval = interval
+        self.samples: List[Tuple[Stack, float]] = []
+        self.started_at = 0.0
+        self.duration = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._root: Optional[FrameType] = None
+        self._loop_thread = 0
+        self._worker: Optional[Tuple[int, FrameType]] = None
+
+    def sample(self, frames: dict, weight: float) -> None:
+        """
+        Record the current stack of the request. Called by the sampler thread.
+
+        Args:
+            frames (dict): The innermost frame of each thread, keyed by thread ID.
+            weight (float): The number of seconds the sample stands for.
+        """
+        root, task = self._root, self._task
+        if root is None or task is None:
+            return
+        worker = self._worker
+        if worker is not None:
+            thread_stack = frame_stack(frames.get(worker[0]), worker[1])
+            if thread_stack is not None:
+                stack = coroutine_stack(task.get_coro(), root) + thread_stack[1:]
+                self.samples.append((tuple(stack), weight))
+                return
+        loop_stack = frame_stack(frames.get(self._loop_thread), root)
+        if loop_stack is not None:
+            self.samples.append((tuple(loop_stack), weight))
+        else:
+            self.samples.append((tuple(coroutine_stack(task.get_coro(), root)) + (AWAIT,), weight))
+
+    def run(self, function: Callable, *args, **kwargs) -> Any:
+        """
+        Call a function in a worker thread, sampling the thread as part of the request.
+
+        Args:
+            function (Callable): The function.
+            *args: The positional arguments of the function.
+            **kwargs: The keyword arguments of the function.
+
+        Returns:
+            (Any): What the function returns.
+        """
+        self._worker = (threading.get_ident(), sys._getframe())
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self._worker = None
+
+    def __enter__(self) -> "Profile":
+        """
+        Start profiling the request running in the current task, from the frame of the caller.
+
+        Returns:
+            (Profile): The profile.
+        """
+        self._task = asyncio.current_task()
+        self._root = sys._getframe(1)
+        self._loop_thread = threading.get_ident()
+        self._token = _current_profile.set(self)
+        self.started_at = time.perf_counter()
+        sampler.start(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stop profiling the request."""
+        sampler.stop(self)
+        self.duration = time.perf_counter() - self.started_at
+        _current_profile.reset(self._token)
+        self._task = self._root = None
+
+
+class Sampler:
+    """
+    A thread sampling the stacks of the profiled requests at a fixed interval.
+
+    The thread only runs while a request is profiled. Sampling reads the frames of the threads
+    under the GIL, so the requests are not interrupted, but they are slowed down by the time the
+    sampler holds the GIL, more so with a short interval.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new, idle instance of Sampler."""
+        self._profiles: List[Profile] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, profile: Profile) -> None:
+        """
+        Sample a profile until it is stopped, starting the thread if it is idle.
+
+        Args:
+            profile (Profile): The profile.
+        """
+        with self._lock:
+            self._profiles = self._profiles + [profile]
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._sample, name="profiling-sampler", daemon=True)
+                self._thread.start()
+
+    def stop(self, profile: Profile) -> None:
+        """
+        Stop sampling a profile. The thread stops once no profile is left.
+
+        Args:
+            profile (Profile): The profile.
+        """
+        with self._lock:
+            self._profiles = [other for other in self._profiles if other is not profile]
+
+    def _sample(self) -> None:
+        """Sample the running profiles until none is left."""
+        last = time.perf_counter()
+        while True:
+            with self._lock:
+                profiles = self._profiles
+                if not profiles:
+                    self._thread = None
+                    return
+            time.sleep(min(profile.interval for profile in profiles))
+            now = time.perf_counter()
+            frames = sys._current_frames()
+            for profile in profiles:
+                profile.sample(frames, now - max(last, profile.started_at))
+            last = now
+
+
+sampler = Sampler()
@@ -0,0 +1,54 @@
+import hashlib
+import hmac
+import time
+from typing import Optional
+
+
+def sign_profile_token(secret: str, ttl: float = 300, now: Optional[float] = None) -> str:
+    """
+    Sign a token allowing to profile requests until it expires.
+
+    Args:
+        secret (str): The profiling secret shared with the application.
+        ttl (float): The number of seconds the token is valid.
+        now (float, optional): The current UNIX time. The clock is read when omitted.
+
+    Returns:
+        (str): The token, `<expiry>.<signature>`.
+    """
+    expires_at = int((time.time() if now is None else now) + ttl)
+    return f"{expires_at}.{_signature(secret, str(expires_at))}"
+
+
+def verify_profile_token(secret: str, token: str, now: Optional[float] = None) -> bool:
+    """
+    Check a profiling token.
+
+    Args:
+        secret (str): The profiling secret. Every token is refused when it is empty.
+        token (str): The token, from the request.
+        now (float, optional): The current UNIX time. The clock is read when omitted.
+
+    Returns:
+        (bool): True when the token was signed with the secret and has not expired.
+    """
+    expires_at, _, signature = token.partition(".")
+    if not secret or not expires_at.isdigit():
+        return False
+    if not hmac.compare_digest(signature.encode(), _signature(secret, expires_at).encode()):
+        return False
+    return int(expires_at) > (time.time() if now is None else now)
+
+
+def _signature(secret: str, payload: str) -> str:
+    """
+    Sign a payload with HMAC-SHA256.
+
+    Args:
+        secret (str): The profiling secret.
+        payload (str): The signed payload.
+
+    Returns:
+        (str): The signature, in hexadecimal.
+    """
+    return hmac.new(secret.encode(), payload.encode(), hashlib.sha256).hexdigest()
@@ -0,0 +1,123 @@
+from typing import List, Optional
+
+from src.applications.dtos import UserDTO
+from src.domain.exceptions import EmailAlreadyExistsError
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+from src.domain.unit_of_work import AsyncUnitOfWorkInterface
+from src.infra.repositories.bloom_filtered_user import EmailFilter, EmailFilterStats
+
+
+class AsyncBloomFilteredUserRepository(AsyncUserRepositoryInterface):
+    """Decorator of an asynchronous user repository that answers lookups of unknown emails without the database.
+
+    The asyncio counterpart of BloomFilteredUserRepository, sharing its email filter: the users created
+    on the asynchronous path are known to the lookups of the synchronous one, such as the login.
+
+    Attributes:
+        repository (AsyncUserRepositoryInterface): The decorated repository.
+        email_filter (EmailFilter): The filter of the user emails.
+        unit_of_work (AsyncUnitOfWorkInterface | None): The unit of work the creates run in, if any.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncUserRepositoryInterface,
+        email_filter: EmailFilter,
+        unit_of_work: Optional[AsyncUnitOfWorkInterface] = None,
+    ) -> None:
+        """Initialize a new instance of AsyncBloomFilteredUserRepository.
+
+        Args:
+            repository (AsyncUserRepositoryInterface): The repository to decorate.
+            email_filter (EmailFilter): The filter of the user emails, shared with the synchronous repository.
+            unit_of_work (AsyncUnitOfWorkInterface, optional): The unit of work the creates run in, whose commit adds the
+                created emails again.
+        """
+        self.repository = repository
+        self.email_filter = email_filter
+        self.unit_of_work = unit_of_work
+
+    @property
+    def stats(self) -> EmailFilterStats:
+        """Get the sizing and effectiveness metrics of the filter.
+
+        Returns:
+            (EmailFilterStats): A snapshot of the metrics.
+        """
+        return self.email_filter.stats
+
+    async def create_user(self, user: UserDTO) -> UserDTO:
+        """Create a new user and add its email to the filter.
+
+        Args:
+            user (UserDTO): The user DTO containing the user data.
+
+        Returns:
+            user_dto (UserDTO): The created user DTO.
+
+        Raises:
+            EmailAlreadyExistsError: If a user with the same email already exists.
+            Exception: If an error occurs during user creation.
+        """
+        try:
+            created_user = await self.repository.create_user(user)
+        except EmailAlreadyExistsError:
+            self.email_filter.add(user.email)
+            raise
+        self._add_emails([created_user.email])
+        return created_user
+
+    async def get_user_by_email(self, email: str) -> Optional[UserDTO]:
+        """Retrieve a user by their email, answering without the database when the filter rules it out.
+
+        Args:
+            email (str): The email of the user to retrieve.
+
+        Returns:
+            UserDTO | None: The user DTO if found, or None if the user is not found.
+
+        Raises:
+            Exception: If an error occurs while retrieving the user.
+        """
+        if not self.email_filter.might_contain(email):
+            return None
+        user = await self.repository.get_user_by_email(email)
+        if user is None:
+            self.email_filter.record_false_positive()
+        return user
+
+    async def get_user_by_id(self, user_id: int) -> Optional[UserDTO]:
+        """Retrieve a user by their ID from the decorated repository.
+
+        Args:
+            user_id (int): The ID of the user to retrieve.
+
+        Returns:
+            UserDTO | None: The user DTO if found, or None if the user is not found.
+
+        Raises:
+            Exception: If an error occurs while retrieving the user.
+        """
+        return await self.repository.get_user_by_id(user_id)
+
+    async def delete_user(self, user_id: int) -> None:
+        """Delete a user by their ID. The email stays in the filter until the next rebuild.
+
+        Args:
+            user_id (int): The ID of the user to delete.
+
+        Raises:
+            UserNotFoundError: If no user has the given ID.
+            Exception: If an error occurs while deleting the user.
+        """
+        await self.repository.delete_user(user_id)
+
+    def _add_emails(self, emails: List[str]) -> None:
+        """Add created emails to the filter now, and again once the unit of work commits, like BloomFilteredUserRepository.
+
+        Args:
+            emails (List[str]): The emails of the created users.
+        """
+        self.email_filter.update(emails)
+        if self.unit_of_work is not None:
+            self.unit_of_work.after_commit(lambda: self.email_filter.update(emails))
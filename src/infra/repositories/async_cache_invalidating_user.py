@@ -0,0 +1,110 @@
+from typing import Callable, Optional
+
+from src.applications.dtos import UserDTO
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+from src.domain.unit_of_work import AsyncUnitOfWorkInterface
+from src.infra.cache import TTLCache
+
+
+class AsyncCacheInvalidatingUserRepository(AsyncUserRepositoryInterface):
+    """Decorator of an asynchronous user repository that invalidates the user cache on writes.
+
+    The asynchronous writes do not go through CachedUserRepository, which caches the lookups of the
+    synchronous repository, so this decorator drops the entries of the shared cache they make stale:
+    right after the write, and again once the unit of work the write runs in commits. The lookups are
+    passed through uncached.
+
+    Attributes:
+        repository (AsyncUserRepositoryInterface): The decorated repository.
+        cache (TTLCache): The cache of the users shared with CachedUserRepository.
+        unit_of_work (AsyncUnitOfWorkInterface | None): The unit of work the writes run in, if any.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncUserRepositoryInterface,
+        cache: TTLCache,
+        unit_of_work: Optional[AsyncUnitOfWorkInterface] = None,
+    ) -> None:
+        """Initialize a new instance of AsyncCacheInvalidatingUserRepository.
+
+        Args:
+            repository (AsyncUserRepositoryInterface): The repository to decorate.
+            cache (TTLCache): The cache of the users shared with CachedUserRepository.
+            unit_of_work (AsyncUnitOfWorkInterface, optional): The unit of work the writes run in, whose commit
+                invalidates the written entries again.
+        """
+        self.repository = repository
+        self.cache = cache
+        self.unit_of_work = unit_of_work
+
+    async def create_user(self, user: UserDTO) -> UserDTO:
+        """Create a new user and invalidate the entry of its email.
+
+        Args:
+            user (UserDTO): The user DTO containing the user data.
+
+        Returns:
+            user_dto (UserDTO): The created user DTO.
+
+        Raises:
+            EmailAlreadyExistsError: If a user with the same email already exists.
+            Exception: If an error occurs during user creation.
+        """
+        try:
+            return await self.repository.create_user(user)
+        finally:
+            self._invalidate(lambda: self.cache.discard(("email", user.email)))
+
+    async def get_user_by_email(self, email: str) -> Optional[UserDTO]:
+        """Retrieve a user by their email from the decorated repository.
+
+        Args:
+            email (str): The email of the user to retrieve.
+
+        Returns:
+            UserDTO | None: The user DTO if found, or None if the user is not found.
+
+        Raises:
+            Exception: If an error occurs while retrieving the user.
+        """
+        return await self.repository.get_user_by_email(email)
+
+    async def get_user_by_id(self, user_id: int) -> Optional[UserDTO]:
+        """Retrieve a user by their ID from the decorated repository.
+
+        Args:
+            user_id (int): The ID of the user to retrieve.
+
+        Returns:
+            UserDTO | None: The user DTO if found, or None if the user is not found.
+
+        Raises:
+            Exception: If an error occurs while retrieving the user.
+        """
+        return await self.repository.get_user_by_id(user_id)
+
+    async def delete_user(self, user_id: int) -> None:
+        """Delete a user by their ID and invalidate every entry of the user.
+
+        Args:
+            user_id (int): The ID of the user to delete.
+
+        Raises:
+            UserNotFoundError: If no user has the given ID.
+            Exception: If an error occurs while deleting the user.
+        """
+        try:
+            await self.repository.delete_user(user_id)
+        finally:
+            self._invalidate(lambda: self.cache.discard_where(lambda user: user.id == user_id))
+
+    def _invalidate(self, discard: Callable[[], None]) -> None:
+        """Drop the entries made stale by a write now, and again once the unit of work commits.
+
+        Args:
+            discard (Callable[[], None]): Drops the stale entries.
+        """
+        discard()
+        if self.unit_of_work is not None:
+            self.unit_of_work.after_commit(discard)
@@ -0,0 +1,98 @@
+from typing import Optional
+
+from src.applications.dtos import UserDTO
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+from src.infra.cache import AsyncSingleFlight, SingleFlightStats
+
+
+class AsyncSingleFlightUserRepository(AsyncUserRepositoryInterface):
+    """Decorator of an asynchronous user repository that coalesces the identical lookups made concurrently.
+
+    The asyncio counterpart of SingleFlightUserRepository: concurrent lookups of the same email, or of
+    the same ID, await one query.
+
+    Attributes:
+        repository (AsyncUserRepositoryInterface): The decorated repository.
+        group (AsyncSingleFlight): The group the lookups are coalesced in, keyed by `("email", email)` and
+            `("id", user_id)`.
+    """
+
+    def __init__(self, repository: AsyncUserRepositoryInterface, group: Optional[AsyncSingleFlight] = None) -> None:
+        """Initialize a new instance of AsyncSingleFlightUserRepository.
+
+        Args:
+            repository (AsyncUserRepositoryInterface): The repository to decorate.
+            group (AsyncSingleFlight, optional): The group to coalesce the lookups in. A new one when omitted.
+        """
+        self.repository = repository
+        self.group = group or AsyncSingleFlight()
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        """Get the number of queries run and of lookups that shared one.
+
+        Returns:
+            (SingleFlightStats): The counters of the group.
+        """
+        return self.group.stats
+
+    async def create_user(self, user: UserDTO) -> UserDTO:
+        """Create a new user, and stop sharing the lookups of its email started before.
+
+        Args:
+            user (UserDTO): The user DTO containing the user data.
+
+        Returns:
+            user_dto (UserDTO): The created user DTO.
+
+        Raises:
+            EmailAlreadyExistsError: If a user with the same email already exists.
+            Exception: If an error occurs during user creation.
+        """
+        try:
+            return await self.repository.create_user(user)
+        finally:
+            self.group.forget(("email", user.email))
+
+    async def get_user_by_email(self, email: str) -> Optional[UserDTO]:
+        """Retrieve a user by their email, sharing the query of a concurrent lookup of the same email.
+
+        Args:
+            email (str): The email of the user to retrieve.
+
+        Returns:
+            UserDTO | None: The user DTO if found, or None if the user is not found.
+
+        Raises:
+            Exception: If an error occurs while retrieving the user.
+        """
+        return await self.group.do(("email", email), lambda: self.repository.get_user_by_email(email))
+
+    async def get_user_by_id(self, user_id: int) -> Optional[UserDTO]:
+        """Retrieve a user by their ID, sharing the query of a concurrent lookup of the same ID.
+
+        Args:
+            user_id (int): The ID of the user to retrieve.
+
+        Returns:
+            UserDTO | None: The user DTO if found, or None if the user is not found.
+
+        Raises:
+            Exception: If an error occurs while retrieving the user.
+        """
+        return await self.group.do(("id", user_id), lambda: self.repository.get_user_by_id(user_id))
+
+    async def delete_user(self, user_id: int) -> None:
+        """Delete a user by their ID, and stop sharing the lookups of its ID started before.
+
+        Args:
+            user_id (int): The ID of the user to delete.
+
+        Raises:
+            UserNotFoundError: If no user has the given ID.
+            Exception: If an error occurs while deleting the user.
+        """
+        try:
+            await self.repository.delete_user(user_id)
+        finally:
+            self.group.forget(("id", user_id))
@@ -0,0 +1,125 @@
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from src.applications.dtos import UserDTO
+from src.infra.db.settings.async_connection import AsyncDBConnectionHandler
+from src.infra.repositories.user import (
+    USER_COLUMNS,
+    deleted_row_count,
+    delete_user_statement,
+    insert_user_statement,
+    is_email_conflict,
+)
+from src.domain.exceptions import EmailAlreadyExistsError, UserNotFoundError
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+
+
+class AsyncUserRepository(AsyncUserRepositoryInterface):
+    """
+    Asynchronous repository implementation for user data storage using a relational database.
+
+    This repository uses the SQLAlchemy asyncio extension, so the queries do not block the event loop.
+    """
+
+    def __init__(self, db_connection: AsyncDBConnectionHandler):
+        self.db_connection = db_connection
+
+    async def create_user(self, user: UserDTO) -> UserDTO:
+        """
+        Create a new user with a single `INSERT ... RETURNING` statement.
+
+        Args:
+            user (UserDTO): The user DTO containing the user data.
+
+        Returns:
+            user_dto (UserDTO): The created user DTO.
+
+        Raises:
+            EmailAlreadyExistsError: If a user with the same email already exists.
+            Exception: If an error occurs during user creation.
+        """
+        async with self.db_connection as db_connection:
+            try:
+                statement = insert_user_statement(self.db_connection.engine.dialect.name, user)
+                db_user = (await db_connection.session.execute(statement)).first()
+                if db_user is None:
+                    raise EmailAlreadyExistsError(user.email)
+                await db_connection.commit()
+                return UserDTO(
+                    id=db_user.id,
+                    name=db_user.name,
+                    email=db_user.email,
+                    password=db_user.password,
+                    created_at=db_user.created_at,
+                )
+            except IntegrityError as exception:
+                await db_connection.rollback()
+                if is_email_conflict(exception):
+                    raise EmailAlreadyExistsError(user.email) from exception
+                raise exception
+            except Exception as exception:
+                await db_connection.rollback()
+                raise exception
+
+    async def get_user_by_email(self, email: str) -> Optional[UserDTO]:
+        """
+        Retrieve a user by their email from the database.
+
+        Args:
+            email (str): The email of the user to retrieve.
+
+        Returns:
+            UserDTO | None: The user DTO if found, or None if the user is not found.
+
+        Raises:
+            Exception: If an error occurs while retrieving the user.
+        """
+        async with self.db_connection as db_connection:
+            result = await db_connection.session.execute(select(*USER_COLUMNS).filter_by(email=email).limit(1))
+            row = result.first()
+            if row is None:
+                return None
+            return UserDTO(id=row.id, name=row.name, email=row.email, password=row.password, created_at=row.created_at)
+
+    async def get_user_by_id(self, user_id: int) -> Optional[UserDTO]:
+        """
+        Retrieve a user by their ID from the database.
+
+        Args:
+            user_id (int): The ID of the user to retrieve.
+
+        Returns:
+            UserDTO | None: The user DTO if found, or None if the user is not found.
+
+        Raises:
+            Exception: If an error occurs while retrieving the user.
+        """
+        async with self.db_connection as db_connection:
+            row = (await db_connection.session.execute(select(*USER_COLUMNS).filter_by(id=int(user_id)))).first()
+            if row is None:
+                return None
+            return UserDTO(id=row.id, name=row.name, email=row.email, password=row.password, created_at=row.created_at)
+
+    async def delete_user(self, user_id: int) -> None:
+        """
+        Delete a user by their ID from the database with a single `DELETE ... RETURNING` statement.
+
+        Args:
+            user_id (int): The ID of the user to delete.
+
+        Raises:
+            UserNotFoundError: If no user has the given ID.
+            Exception: If an error occurs while deleting the user.
+        """
+        async with self.db_connection as db_connection:
+            try:
+                dialect = self.db_connection.engine.dialect
+                result = await db_connection.session.execute(delete_user_statement(dialect, int(user_id)))
+                if deleted_row_count(dialect, result) == 0:
+                    raise UserNotFoundError(user_id)
+                await db_connection.commit()
+            except Exception as exception:
+                await db_connection.rollback()
+                raise exception
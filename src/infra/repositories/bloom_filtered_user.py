@@ -0,0 +1,517 @@
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional
+
+from src.applications.dtos import UserDTO
+from src.domain.exceptions import EmailAlreadyExistsError
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.unit_of_work import UnitOfWorkInterface
+from src.infra.cache import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class EmailFilterSettings:
+    """Settings of the Bloom filter of the user emails.
+
+    Attributes:
+        enabled (bool): Whether the user repository is wrapped with the email filter.
+        expected_items (int): The number of emails the filter is sized for at least.
+        false_positive_rate (float): The false-positive rate targeted at the expected number of emails.
+        batch_size (int): The number of emails fetched per round-trip when the filter is built.
+        rebuild_interval (float): The number of seconds between two rebuilds, 0 to disable.
+    """
+
+    enabled: bool = False
+    expected_items: int = 1_000_000
+    false_positive_rate: float = 0.01
+    batch_size: int = 10_000
+    rebuild_interval: float = 3600.0
+
+    @classmethod
+    def from_env(cls) -> "EmailFilterSettings":
+        """Build the email filter settings from environment variables.
+
+        The variables `EMAIL_FILTER_ENABLED`, `EMAIL_FILTER_EXPECTED_ITEMS`, `EMAIL_FILTER_FALSE_POSITIVE_RATE`,
+        `EMAIL_FILTER_BATCH_SIZE` and `EMAIL_FILTER_REBUILD_INTERVAL` override the defaults when they are set.
+
+        Returns:
+            (EmailFilterSettings): The email filter settings read from the environment.
+        """
+        return cls(
+            enabled=os.getenv("EMAIL_FILTER_ENABLED", str(cls.enabled)).lower() in ("1", "true", "yes"),
+            expected_items=int(os.getenv("EMAIL_FILTER_EXPECTED_ITEMS", cls.expected_items)),
+            false_positive_rate=float(os.getenv("EMAIL_FILTER_FALSE_POSITIVE_RATE", cls.false_positive_rate)),
+            batch_size=int(os.getenv("EMAIL_FILTER_BATCH_SIZE", cls.batch_size)),
+            rebuild_interval=float(os.getenv("EMAIL_FILTER_REBUILD_INTERVAL", cls.rebuild_interval)),
+        )
+
+
+@dataclass(frozen=True)
+class EmailFilterStats:
+    """Snapshot of the metrics of the email filter.
+
+    Attributes:
+        ready (bool): Whether the filter is built and answers lookups.
+        items (int): The number of emails added to the filter.
+        bit_size (int): The number of bits of the filter.
+        hash_count (int): The number of bits set per email.
+        memory_bytes (int): The size of the bit array.
+        estimated_false_positive_rate (float): The false-positive rate expected from the filter fill.
+        definite_misses (int): The lookups answered without querying the database.
+        false_positives (int): The lookups the filter let through that found no user.
+        observed_false_positive_rate (float): The share of the lookups for unknown emails the filter let through.
+        rebuilds (int): The number of successful builds of the filter.
+        last_build_seconds (float): The duration of the last successful build.
+    """
+
+    ready: bool
+    items: int
+    bit_size: int
+    hash_count: int
+    memory_bytes: int
+    estimated_false_positive_rate: float
+    definite_misses: int
+    false_positives: int
+    observed_false_positive_rate: float
+    rebuilds: int
+    last_build_seconds: float
+
+
+class EmailFilter:
+    """Bloom filter of the emails of the users, built from the database and rebuilt periodically.
+
+    The filter is built by `start` in streamed batches and rebuilt every `rebuild_interval` seconds to
+    forget deleted users. Until the first build succeeds, `might_contain` lets every email through.
+    One instance is shared by the repository decorators of both data paths, so an email created on
+    either path is known to the lookups of both.
+
+    The filter is local to the process: a user created by another worker is only known after the
+    next rebuild, so it suits deployments where one process serves the sign-ups, or a rebuild
+    interval short enough for the lag to be acceptable.
+
+    Attributes:
+        email_source (Callable[[int], Iterator[str]]): Streams every email, given a batch size.
+        settings (EmailFilterSettings): The settings of the filter.
+    """
+
+    def __init__(
+        self, email_source: Callable[[int], Iterator[str]], settings: Optional[EmailFilterSettings] = None
+    ) -> None:
+        """Initialize a new instance of EmailFilter, without building the filter.
+
+        Args:
+            email_source (Callable[[int], Iterator[str]]): Streams every email, given a batch size.
+            settings (EmailFilterSettings, optional): The settings of the filter. Read from the
+                environment when omitted.
+        """
+        self.email_source = email_source
+        self.settings = settings or EmailFilterSettings.from_env()
+        self._filter: Optional[BloomFilter] = None
+        self._pending_emails: Optional[list] = None
+        self._definite_misses = 0
+        self._false_positives = 0
+        self._rebuilds = 0
+        self._last_build_seconds = 0.0
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._rebuild_thread: Optional[threading.Thread] = None
+
+    @property
+    def ready(self) -> bool:
+        """Tell whether the filter is built and answers lookups.
+
+        Returns:
+            (bool): True once a build succeeded.
+        """
+        return self._filter is not None
+
+    @property
+    def stats(self) -> EmailFilterStats:
+        """Get the sizing and effectiveness metrics of the filter.
+
+        Returns:
+            (EmailFilterStats): A snapshot of the metrics.
+        """
+        bloom_filter = self._filter
+        with self._lock:
+            definite_misses = self._definite_misses
+            false_positives = self._false_positives
+        negatives = definite_misses + false_positives
+        return EmailFilterStats(
+            ready=bloom_filter is not None,
+            items=len(bloom_filter) if bloom_filter else 0,
+            bit_size=bloom_filter.bit_size if bloom_filter else 0,
+            hash_count=bloom_filter.hash_count if bloom_filter else 0,
+            memory_bytes=bloom_filter.memory_bytes if bloom_filter else 0,
+            estimated_false_positive_rate=bloom_filter.estimated_false_positive_rate() if bloom_filter else 0.0,
+            definite_misses=definite_misses,
+            false_positives=false_positives,
+            observed_false_positive_rate=false_positives / negatives if negatives else 0.0,
+            rebuilds=self._rebuilds,
+            last_build_seconds=self._last_build_seconds,
+        )
+
+    def start(self) -> None:
+        """Build the filter and start the periodic rebuilds.
+
+        A failed build is logged and leaves the lookups going to the database until a rebuild succeeds.
+        """
+        self.rebuild()
+        if self.settings.rebuild_interval > 0 and self._rebuild_thread is None:
+            self._rebuild_thread = threading.Thread(
+                target=self._rebuild_periodically, name="email-filter-rebuild", daemon=True
+            )
+            self._rebuild_thread.start()
+
+    def rebuild(self) -> bool:
+        """Build a new filter from the database and swap it in.
+
+        The emails added while the filter is built are replayed on the new filter before the swap. The
+        repository decorators add the created emails again once they are committed, so an email committed
+        after the stream passed it is replayed as well.
+
+        Returns:
+            (bool): Whether the build succeeded.
+        """
+        with self._build_lock:
+            started_at = time.perf_counter()
+            expected_items = max(self.settings.expected_items, 2 * len(self._filter or ()))
+            bloom_filter = BloomFilter(expected_items, self.settings.false_positive_rate)
+            with self._lock:
+                self._pending_emails = []
+            try:
+                bloom_filter.update(self.email_source(self.settings.batch_size))
+            except Exception:
+                logger.exception("Building the email filter failed.")
+                with self._lock:
+                    self._pending_emails = None
+                return False
+            with self._lock:
+                bloom_filter.update(self._pending_emails)
+                self._pending_emails = None
+                self._filter = bloom_filter
+                self._rebuilds += 1
+                self._last_build_seconds = time.perf_counter() - started_at
+            logger.info(
+                "Email filter built with %d emails in %.3fs (%d bytes).",
+                len(bloom_filter),
+                self._last_build_seconds,
+                bloom_filter.memory_bytes,
+            )
+            return True
+
+    def stop(self) -> None:
+        """Stop the periodic rebuilds."""
+        self._stopped.set()
+        if self._rebuild_thread is not None:
+            self._rebuild_thread.join()
+            self._rebuild_thread = None
+
+    def add(self, email: str) -> None:
+        """Add an email to the filter, and to the filter being built if any.
+
+        Args:
+            email (str): The email to add.
+        """
+        with self._lock:
+            if self._filter is not None:
+                self._filter.add(email)
+            if self._pending_emails is not None:
+                self._pending_emails.append(email)
+
+    def update(self, emails: List[str]) -> None:
+        """Add several emails to the filter, and to the filter being built if any.
+
+        Args:
+            emails (List[str]): The emails to add.
+        """
+        with self._lock:
+            if self._filter is not None:
+                self._filter.update(emails)
+            if self._pending_emails is not None:
+                self._pending_emails.extend(emails)
+
+    def might_contain(self, email: str) -> bool:
+        """Tell whether a user may have an email, counting the emails ruled out.
+
+        Args:
+            email (str): The email to look up.
+
+        Returns:
+            (bool): False when no user has the email for sure, True when one may have it or the filter is not built.
+        """
+        bloom_filter = self._filter
+        if bloom_filter is None or email in bloom_filter:
+            return True
+        with self._lock:
+            self._definite_misses += 1
+        return False
+
+    def candidates(self, emails: List[str]) -> List[str]:
+        """Leave out the emails no user has for sure, counting them.
+
+        Args:
+            emails (List[str]): The emails to look up.
+
+        Returns:
+            (List[str]): The emails a user may have, all of them when the filter is not built.
+        """
+        bloom_filter = self._filter
+        if bloom_filter is None:
+            return emails
+        candidates = [email for email in emails if email in bloom_filter]
+        with self._lock:
+            self._definite_misses += len(emails) - len(candidates)
+        return candidates
+
+    def record_false_positive(self) -> None:
+        """Count a lookup the filter let through that found no user, once the filter is built."""
+        if self._filter is None:
+            return
+        with self._lock:
+            self._false_positives += 1
+
+    def _rebuild_periodically(self) -> None:
+        """Rebuild the filter every `rebuild_interval` seconds until stopped."""
+        while not self._stopped.wait(self.settings.rebuild_interval):
+            self.rebuild()
+
+
+class BloomFilteredUserRepository(UserRepositoryInterface):
+    """Decorator of a user repository that answers lookups of unknown emails without the database.
+
+    `get_user_by_email` returns None for an email the email filter rules out, and the creates add
+    the emails of the users to the filter.
+
+    Attributes:
+        repository (UserRepositoryInterface): The decorated repository.
+        email_filter (EmailFilter): The filter of the user emails.
+        unit_of_work (UnitOfWorkInterface | None): The unit of work the creates run in, if any.
+    """
+
+    def __init__(
+        self,
+        repository: UserRepositoryInterface,
+        email_filter: EmailFilter,
+        unit_of_work: Optional[UnitOfWorkInterface] = None,
+    ) -> None:
+        """Initialize a new instance of BloomFilteredUserRepository.
+
+        Args:
+            repository (UserRepositoryInterface): The repository to decorate.
+            email_filter (EmailFilter): The filter of the user emails, shared with the asynchronous repository.
+            unit_of_work (UnitOfWorkInterface, optional): The unit of work the creates run in, whose commit adds the
+                created emails again.
+        """
+        self.repository = repository
+        self.email_filter = email_filter
+        self.unit_of_work = unit_of_work
+
+    @property
+    def stats(self) -> EmailFilterStats:
+        """Get the sizing and effectiveness metrics of the filter.
+
+        Returns:
+            (EmailFilterStats): A snapshot of the metrics.
+        """
+        return self.email_filter.stats
+
+    def create_user(self, user: UserDTO) -> UserDTO:
+        """Create a new user and add its email to the filter.
+
+        Args:
+            user (UserDTO): The user DTO containing the user data.
+
+        Returns:
+            user_dto (UserDTO): The created user DTO.
+
+        Raises:
+            EmailAlreadyExistsError: If a user with the same email already exists.
+            Exception: If an error occurs during user creation.
+        """
+        try:
+            created_user = self.repository.create_user(user)
+        except EmailAlreadyExistsError:
+            self.email_filter.add(user.email)
+            raise
+        self._add_emails([created_user.email])
+        return created_user
+
+    def create_users(self, users: List[UserDTO]) -> List[UserDTO]:
+        """Create several users and add their emails to the filter.
+
+        The emails of the users left out because they are taken are added as well, since they exist.
+
+        Args:
+            users (List[UserDTO]): The user DTOs containing the user data.
+
+        Returns:
+            List[UserDTO]: The created users. Users whose email is already taken are left out.
+
+        Raises:
+            Exception: If an error occurs during user creation.
+        """
+        created_users = self.repository.create_users(users)
+        self._add_emails([user.email for user in users])
+        return created_users
+
+    def get_user_by_email(self, email: str) -> Optional[UserDTO]:
+        """Retrieve a user by their email, answering without the database when the filter rules it out.
+
+        Args:
+            email (str): The email of the user to retrieve.
+
+        Returns:
+            UserDTO | None: The user DTO if found, or None if the user is not found.
+
+        Raises:
+            Exception: If an error occurs while retrieving the user.
+        """
+        if not self.email_filter.might_contain(email):
+            return None
+        user = self.repository.get_user_by_email(email)
+        if user is None:
+            self.email_filter.record_false_positive()
+        return user
+
+    def get_user_by_id(self, user_id: int) -> Optional[UserDTO]:
+        """Retrieve a user by their ID from the decorated repository.
+
+        Args:
+            user_id (int): The ID of the user to retrieve.
+
+        Returns:
+            UserDTO | None: The user DTO if found, or None if the user is not found.
+
+        Raises:
+            Exception: If an error occurs while retrieving the user.
+        """
+        return self.repository.get_user_by_id(user_id)
+
+    def get_users_by_ids(self, user_ids: List[int]) -> List[UserDTO]:
+        """Retrieve several users by their IDs from the decorated repository.
+
+        Args:
+            user_ids (List[int]): The IDs of the users to retrieve.
+
+        Returns:
+            List[UserDTO]: The users found. Unknown IDs are left out.
+
+        Raises:
+            Exception: If an error occurs while retrieving the users.
+        """
+        return self.repository.get_users_by_ids(user_ids)
+
+    def get_users_by_emails(self, emails: List[str]) -> List[UserDTO]:
+        """Retrieve several users by their emails, leaving out of the query the emails the filter rules out.
+
+        Args:
+            emails (List[str]): The emails of the users to retrieve.
+
+        Returns:
+            List[UserDTO]: The users found. Unknown emails are left out.
+
+        Raises:
+            Exception: If an error occurs while retrieving the users.
+        """
+        emails = self.email_filter.candidates(emails)
+        if not emails:
+            return []
+        return self.repository.get_users_by_emails(emails)
+
+    def list_users(self, after_id: Optional[int] = None, limit: int = 50) -> List[UserDTO]:
+        """Retrieve a page of users from the decorated repository.
+
+        Args:
+            after_id (int, optional): The ID of the last user of the previous page, None for the first page.
+            limit (int): The maximum number of users of the page.
+
+        Returns:
+            List[UserDTO]: The users of the page.
+
+        Raises:
+            Exception: If an error occurs while retrieving the users.
+        """
+        return self.repository.list_users(after_id=after_id, limit=limit)
+
+    def search_users(self, query: str, limit: int = 20) -> List[UserDTO]:
+        """Find users with the decorated repository.
+
+        Args:
+            query (str): The text to look for, case-insensitively.
+            limit (int): The maximum number of users to return.
+
+        Returns:
+            List[UserDTO]: The matching users.
+
+        Raises:
+            Exception: If an error occurs while searching the users.
+        """
+        return self.repository.search_users(query, limit=limit)
+
+    def estimate_user_count(self) -> int:
+        """Estimate the number of users with the decorated repository.
+
+        Returns:
+            int: The estimated number of users.
+
+        Raises:
+            Exception: If an error occurs while counting the users.
+        """
+        return self.repository.estimate_user_count()
+
+    def iter_users(self, batch_size: int = 1000) -> Iterator[UserDTO]:
+        """Stream every user from the decorated repository.
+
+        Args:
+            batch_size (int): The number of rows fetched per round-trip.
+
+        Returns:
+            Iterator[UserDTO]: The users, in ID order.
+        """
+        return self.repository.iter_users(batch_size)
+
+    def update_password(self, user_id: int, password_hash: str) -> None:
+        """Replace the password hash of a user with the decorated repository.
+
+        Args:
+            user_id (int): The ID of the user.
+            password_hash (str): The new password hash.
+
+        Raises:
+            UserNotFoundError: If no user has the given ID.
+            Exception: If an error occurs while updating the user.
+        """
+        self.repository.update_password(user_id, password_hash)
+
+    def delete_user(self, user_id: int) -> None:
+        """Delete a user by their ID. The email stays in the filter until the next rebuild.
+
+        Args:
+            user_id (int): The ID of the user to delete.
+
+        Raises:
+            UserNotFoundError: If no user has the given ID.
+            Exception: If an error occurs while deleting the user.
+        """
+        self.repository.delete_user(user_id)
+
+    def _add_emails(self, emails: List[str]) -> None:
+        """Add created emails to the filter now, and again once the unit of work commits.
+
+        A rebuild reads the emails committed when its stream runs, and replays the emails added while it
+        runs: an email added before the rebuild started but committed after the stream passed it would be
+        in neither, and be ruled out until the next rebuild.
+
+        Args:
+            emails (List[str]): The emails of the created users.
+        """
+        self.email_filter.update(emails)
+        if self.unit_of_work is not None:
+            self.unit_of_work.after_commit(lambda: self.email_filter.update(emails))
@@ -0,0 +1,303 @@
+import os
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional
+
+from src.applications.dtos import UserDTO
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.unit_of_work import UnitOfWorkInterface
+from src.infra.cache import CacheStats, TTLCache
+
+
+@dataclass(frozen=True)
+class UserCacheSettings:
+    """Settings of the read-through user cache.
+
+    Attributes:
+        enabled (bool): Whether the user repository is wrapped with the cache.
+        max_size (int): The maximum number of cached entries.
+        ttl (float): The number of seconds a cached user is fresh.
+        stale_while_revalidate (float): The number of seconds past the TTL a user is served while it is
+            refreshed in the background, 0 to disable.
+        stale_if_error (float): The number of seconds past the TTL a user is served when the database
+            fails, 0 to disable.
+    """
+
+    enabled: bool = False
+    max_size: int = 1024
+    ttl: float = 30.0
+    stale_while_revalidate: float = 0.0
+    stale_if_error: float = 0.0
+
+    @classmethod
+    def from_env(cls) -> "UserCacheSettings":
+        """Build the cache settings from environment variables.
+
+        The variables `USER_CACHE_ENABLED`, `USER_CACHE_MAX_SIZE`, `USER_CACHE_TTL`,
+        `USER_CACHE_STALE_WHILE_REVALIDATE` and `USER_CACHE_STALE_IF_ERROR` override the defaults
+        when they are set.
+
+        Returns:
+            (UserCacheSettings): The cache settings read from the environment.
+        """
+        return cls(
+            enabled=os.getenv("USER_CACHE_ENABLED", str(cls.enabled)).lower() in ("1", "true", "yes"),
+            max_size=int(os.getenv("USER_CACHE_MAX_SIZE", cls.max_size)),
+            ttl=float(os.getenv("USER_CACHE_TTL", cls.ttl)),
+            stale_while_revalidate=float(os.getenv("USER_CACHE_STALE_WHILE_REVALIDATE", cls.stale_while_revalidate)),
+            stale_if_error=float(os.getenv("USER_CACHE_STALE_IF_ERROR", cls.stale_if_error)),
+        )
+
+    def build_cache(self) -> TTLCache:
+        """Build an empty cache with these settings.
+
+        Returns:
+            (TTLCache): The cache.
+        """
+        return TTLCache(
+            max_size=self.max_size,
+            ttl=self.ttl,
+            stale_while_revalidate=self.stale_while_revalidate,
+            stale_if_error=self.stale_if_error,
+        )
+
+
+class CachedUserRepository(UserRepositoryInterface):
+    """Read-through cache decorator of a user repository.
+
+    The users found by `get_user_by_email` and `get_user_by_id` are kept in a size-bounded LRU
+    cache for a time to live, and the writes invalidate the entries they make stale. The entries
+    are invalidated right after the write, and again once the unit of work the write runs in
+    commits: a lookup made in between reads the row from before the commit, and could cache it
+    for a whole TTL otherwise. The cache is local to the process: a user deleted by another worker
+    is served until its entry expires, so the TTL bounds how stale a read can be.
+
+    Attributes:
+        repository (UserRepositoryInterface): The decorated repository.
+        cache (TTLCache): The cache of the users, keyed by `("email", email)` and `("id", user_id)`.
+        unit_of_work (UnitOfWorkInterface | None): The unit of work the writes run in, if any.
+    """
+
+    def __init__(
+        self,
+        repository: UserRepositoryInterface,
+        cache: Optional[TTLCache] = None,
+        unit_of_work: Optional[UnitOfWorkInterface] = None,
+    ) -> None:
+        """Initialize a new instance of CachedUserRepository.
+
+        Args:
+            repository (UserRepositoryInterface): The repository to decorate.
+            cache (TTLCache, optional): The cache to use. Built from the environment settings when omitted.
+            unit_of_work (UnitOfWorkInterface, optional): The unit of work the writes run in, whose commit
+                invalidates the written entries again.
+        """
+        self.repository = repository
+        self.cache = cache if cache is not None else UserCacheSettings.from_env().build_cache()
+        self.unit_of_work = unit_of_work
+
+    @property
+    def stats(self) -> CacheStats:
+        """Get the hit, miss and eviction counters of the cache.
+
+        Returns:
+            (CacheStats): The counters of the cache.
+        """
+        return self.cache.stats
+
+    def create_user(self, user: UserDTO) -> UserDTO:
+        """Create a new user and invalidate the entry of its email.
+
+        Args:
+            user (UserDTO): The user DTO containing the user data.
+
+        Returns:
+            user_dto (UserDTO): The created user DTO.
+
+        Raises:
+            EmailAlreadyExistsError: If a user with the same email already exists.
+            Exception: If an error occurs during user creation.
+        """
+        try:
+            return self.repository.create_user(user)
+        finally:
+            self._invalidate(lambda: self.cache.discard(("email", user.email)))
+
+    def create_users(self, users: List[UserDTO]) -> List[UserDTO]:
+        """Create several users and invalidate the entries of their emails.
+
+        Args:
+            users (List[UserDTO]): The user DTOs containing the user data.
+
+        Returns:
+            List[UserDTO]: The created users. Users whose email is already taken are left out.
+
+        Raises:
+            Exception: If an error occurs during user creation.
+        """
+        emails = [user.email for user in users]
+        try:
+            return self.repository.create_users(users)
+        finally:
+            self._invalidate(lambda: self._discard_emails(emails))
+
+    def get_user_by_email(self, email: str) -> Optional[UserDTO]:
+        """Retrieve a user by their email, from the cache when it holds a fresh entry.
+
+        Args:
+            email (str): The email of the user to retrieve.
+
+        Returns:
+            UserDTO | None: The user DTO if found, or None if the user is not found.
+
+        Raises:
+            Exception: If an error occurs while retrieving the user.
+        """
+        return self.cache.get_or_load(("email", email), lambda: self.repository.get_user_by_email(email))
+
+    def get_user_by_id(self, user_id: int) -> Optional[UserDTO]:
+        """Retrieve a user by their ID, from the cache when it holds a fresh entry.
+
+        Args:
+            user_id (int): The ID of the user to retrieve.
+
+        Returns:
+            UserDTO | None: The user DTO if found, or None if the user is not found.
+
+        Raises:
+            Exception: If an error occurs while retrieving the user.
+        """
+        return self.cache.get_or_load(("id", user_id), lambda: self.repository.get_user_by_id(user_id))
+
+    def get_users_by_ids(self, user_ids: List[int]) -> List[UserDTO]:
+        """Retrieve several users by their IDs from the decorated repository, bypassing the cache.
+
+        Args:
+            user_ids (List[int]): The IDs of the users to retrieve.
+
+        Returns:
+            List[UserDTO]: The users found. Unknown IDs are left out.
+
+        Raises:
+            Exception: If an error occurs while retrieving the users.
+        """
+        return self.repository.get_users_by_ids(user_ids)
+
+    def get_users_by_emails(self, emails: List[str]) -> List[UserDTO]:
+        """Retrieve several users by their emails from the decorated repository, bypassing the cache.
+
+        Args:
+            emails (List[str]): The emails of the users to retrieve.
+
+        Returns:
+            List[UserDTO]: The users found. Unknown emails are left out.
+
+        Raises:
+            Exception: If an error occurs while retrieving the users.
+        """
+        return self.repository.get_users_by_emails(emails)
+
+    def list_users(self, after_id: Optional[int] = None, limit: int = 50) -> List[UserDTO]:
+        """Retrieve a page of users from the decorated repository, bypassing the cache.
+
+        Args:
+            after_id (int, optional): The ID of the last user of the previous page, None for the first page.
+            limit (int): The maximum number of users of the page.
+
+        Returns:
+            List[UserDTO]: The users of the page.
+
+        Raises:
+            Exception: If an error occurs while retrieving the users.
+        """
+        return self.repository.list_users(after_id=after_id, limit=limit)
+
+    def search_users(self, query: str, limit: int = 20) -> List[UserDTO]:
+        """Find users with the decorated repository, bypassing the cache.
+
+        Args:
+            query (str): The text to look for, case-insensitively.
+            limit (int): The maximum number of users to return.
+
+        Returns:
+            List[UserDTO]: The matching users.
+
+        Raises:
+            Exception: If an error occurs while searching the users.
+        """
+        return self.repository.search_users(query, limit=limit)
+
+    def estimate_user_count(self) -> int:
+        """Estimate the number of users with the decorated repository.
+
+        Returns:
+            int: The estimated number of users.
+
+        Raises:
+            Exception: If an error occurs while counting the users.
+        """
+        return self.repository.estimate_user_count()
+
+    def iter_users(self, batch_size: int = 1000) -> Iterator[UserDTO]:
+        """Stream every user from the decorated repository, bypassing the cache.
+
+        Args:
+            batch_size (int): The number of rows fetched per round-trip.
+
+        Returns:
+            Iterator[UserDTO]: The users, in ID order.
+        """
+        return self.repository.iter_users(batch_size)
+
+    def update_password(self, user_id: int, password_hash: str) -> None:
+        """Replace the password hash of a user and invalidate every entry of the user.
+
+        Args:
+            user_id (int): The ID of the user.
+            password_hash (str): The new password hash.
+
+        Raises:
+            UserNotFoundError: If no user has the given ID.
+            Exception: If an error occurs while updating the user.
+        """
+        try:
+            self.repository.update_password(user_id, password_hash)
+        finally:
+            self._invalidate(lambda: self.cache.discard_where(lambda user: user.id == user_id))
+
+    def delete_user(self, user_id: int) -> None:
+        """Delete a user by their ID and invalidate every entry of the user.
+
+        Args:
+            user_id (int): The ID of the user to delete.
+
+        Raises:
+            UserNotFoundError: If no user has the given ID.
+            Exception: If an error occurs while deleting the user.
+        """
+        try:
+            self.repository.delete_user(user_id)
+        finally:
+            self._invalidate(lambda: self.cache.discard_where(lambda user: user.id == user_id))
+
+    def close(self) -> None:
+        """Stop the background refreshes of the cache."""
+        self.cache.close()
+
+    def _invalidate(self, discard: Callable[[], None]) -> None:
+        """Drop the entries made stale by a write now, and again once the unit of work commits.
+
+        Args:
+            discard (Callable[[], None]): Drops the stale entries.
+        """
+        discard()
+        if self.unit_of_work is not None:
+            self.unit_of_work.after_commit(discard)
+
+    def _discard_emails(self, emails: List[str]) -> None:
+        """Drop the entries of emails.
+
+        Args:
+            emails (List[str]): The emails.
+        """
+        for email in emails:
+            self.cache.discard(("email", email))
@@ -0,0 +1,80 @@
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+
+from src.infra.db.settings.connection import DBConnectionHandler
+from src.infra.models import RevokedTokenModel
+from src.domain.repositories.revoked_token import RevokedTokenRepositoryInterface
+
+
+class RevokedTokenRepository(RevokedTokenRepositoryInterface):
+    """
+    Repository implementation of the revoked access tokens using a relational database.
+    """
+
+    def __init__(self, db_connection: DBConnectionHandler):
+        self.db_connection = db_connection
+
+    def revoke_token(self, token_id: str, expires_at: datetime) -> None:
+        """
+        Record the revocation of a token. Revoking a token twice is not an error.
+
+        Args:
+            token_id (str): The unique ID of the token.
+            expires_at (datetime): When the token expires.
+
+        Raises:
+            Exception: If an error occurs while recording the revocation.
+        """
+        with self.db_connection as db_connection:
+            try:
+                db_connection.session.add(RevokedTokenModel(token_id=token_id, expires_at=expires_at))
+                db_connection.commit()
+            except IntegrityError:
+                db_connection.rollback()
+            except Exception as exception:
+                db_connection.rollback()
+                raise exception
+
+    def get_revoked_token_ids(self, now: datetime) -> List[str]:
+        """
+        Retrieve the IDs of the revoked tokens that have not expired yet, with one indexed range scan.
+
+        Args:
+            now (datetime): The current time, the tokens expired before it are left out.
+
+        Returns:
+            List[str]: The IDs of the revoked tokens.
+
+        Raises:
+            Exception: If an error occurs while retrieving the tokens.
+        """
+        with self.db_connection as db_connection:
+            statement = select(RevokedTokenModel.token_id).where(RevokedTokenModel.expires_at > now)
+            return list(db_connection.session.scalars(statement))
+
+    def delete_expired_tokens(self, now: datetime) -> int:
+        """
+        Forget the revoked tokens that have expired.
+
+        Args:
+            now (datetime): The current time.
+
+        Returns:
+            int: The number of forgotten tokens.
+
+        Raises:
+            Exception: If an error occurs while deleting the tokens.
+        """
+        with self.db_connection as db_connection:
+            try:
+                result = db_connection.session.execute(
+                    delete(RevokedTokenModel).where(RevokedTokenModel.expires_at <= now)
+                )
+                db_connection.commit()
+                return result.rowcount
+            except Exception as exception:
+                db_connection.rollback()
+                raise exception
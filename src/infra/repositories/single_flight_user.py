@@ -0,0 +1,215 @@
+from typing import Iterator, List, Optional
+
+from src.applications.dtos import UserDTO
+from src.domain.repositories.user import UserRepositoryInterface
+from src.infra.cache import SingleFlight, SingleFlightStats
+
+
+class SingleFlightUserRepository(UserRepositoryInterface):
+    """Decorator of a user repository that coalesces the identical lookups made concurrently.
+
+    Concurrent `get_user_by_email` calls for the same email, and `get_user_by_id` calls for the same
+    ID, share one query: the first call runs it and the others wait for its result. Placed under the
+    cache, it also turns the burst of misses that follows the expiry of a popular entry into a single
+    query. Creating or deleting a user makes the next lookups of its keys run a fresh query instead of
+    joining one started before the write.
+
+    Attributes:
+        repository (UserRepositoryInterface): The decorated repository.
+        group (SingleFlight): The group the lookups are coalesced in, keyed by `("email", email)` and
+            `("id", user_id)`.
+    """
+
+    def __init__(self, repository: UserRepositoryInterface, group: Optional[SingleFlight] = None) -> None:
+        """Initialize a new instance of SingleFlightUserRepository.
+
+        Args:
+            repository (UserRepositoryInterface): The repository to decorate.
+            group (SingleFlight, optional): The group to coalesce the lookups in. A new one when omitted.
+        """
+        self.repository = repository
+        self.group = group or SingleFlight()
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        """Get the number of queries run and of lookups that shared one.
+
+        Returns:
+            (SingleFlightStats): The counters of the group.
+        """
+        return self.group.stats
+
+    def create_user(self, user: UserDTO) -> UserDTO:
+        """Create a new user, and stop sharing the lookups of its email started before.
+
+        Args:
+            user (UserDTO): The user DTO containing the user data.
+
+        Returns:
+            user_dto (UserDTO): The created user DTO.
+
+        Raises:
+            EmailAlreadyExistsError: If a user with the same email already exists.
+            Exception: If an error occurs during user creation.
+        """
+        try:
+            return self.repository.create_user(user)
+        finally:
+            self.group.forget(("email", user.email))
+
+    def create_users(self, users: List[UserDTO]) -> List[UserDTO]:
+        """Create several users, and stop sharing the lookups of their emails started before.
+
+        Args:
+            users (List[UserDTO]): The user DTOs containing the user data.
+
+        Returns:
+            List[UserDTO]: The created users. Users whose email is already taken are left out.
+
+        Raises:
+            Exception: If an error occurs during user creation.
+        """
+        try:
+            return self.repository.create_users(users)
+        finally:
+            for user in users:
+                self.group.forget(("email", user.email))
+
+    def get_user_by_email(self, email: str) -> Optional[UserDTO]:
+        """Retrieve a user by their email, sharing the query of a concurrent lookup of the same email.
+
+        Args:
+            email (str): The email of the user to retrieve.
+
+        Returns:
+            UserDTO | None: The user DTO if found, or None if the user is not found.
+
+        Raises:
+            Exception: If an error occurs while retrieving the user.
+        """
+        return self.group.do(("email", email), lambda: self.repository.get_user_by_email(email))
+
+    def get_user_by_id(self, user_id: int) -> Optional[UserDTO]:
+        """Retrieve a user by their ID, sharing the query of a concurrent lookup of the same ID.
+
+        Args:
+            user_id (int): The ID of the user to retrieve.
+
+        Returns:
+            UserDTO | None: The user DTO if found, or None if the user is not found.
+
+        Raises:
+            Exception: If an error occurs while retrieving the user.
+        """
+        return self.group.do(("id", user_id), lambda: self.repository.get_user_by_id(user_id))
+
+    def get_users_by_ids(self, user_ids: List[int]) -> List[UserDTO]:
+        """Retrieve several users by their IDs from the decorated repository.
+
+        Args:
+            user_ids (List[int]): The IDs of the users to retrieve.
+
+        Returns:
+            List[UserDTO]: The users found. Unknown IDs are left out.
+
+        Raises:
+            Exception: If an error occurs while retrieving the users.
+        """
+        return self.repository.get_users_by_ids(user_ids)
+
+    def get_users_by_emails(self, emails: List[str]) -> List[UserDTO]:
+        """Retrieve several users by their emails from the decorated repository.
+
+        Args:
+            emails (List[str]): The emails of the users to retrieve.
+
+        Returns:
+            List[UserDTO]: The users found. Unknown emails are left out.
+
+        Raises:
+            Exception: If an error occurs while retrieving the users.
+        """
+        return self.repository.get_users_by_emails(emails)
+
+    def list_users(self, after_id: Optional[int] = None, limit: int = 50) -> List[UserDTO]:
+        """Retrieve a page of users from the decorated repository.
+
+        Args:
+            after_id (int, optional): The ID of the last user of the previous page, None for the first page.
+            limit (int): The maximum number of users of the page.
+
+        Returns:
+            List[UserDTO]: The users of the page.
+
+        Raises:
+            Exception: If an error occurs while retrieving the users.
+        """
+        return self.repository.list_users(after_id=after_id, limit=limit)
+
+    def search_users(self, query: str, limit: int = 20) -> List[UserDTO]:
+        """Find users with the decorated repository.
+
+        Args:
+            query (str): The text to look for, case-insensitively.
+            limit (int): The maximum number of users to return.
+
+        Returns:
+            List[UserDTO]: The matching users.
+
+        Raises:
+            Exception: If an error occurs while searching the users.
+        """
+        return self.repository.search_users(query, limit=limit)
+
+    def estimate_user_count(self) -> int:
+        """Estimate the number of users with the decorated repository.
+
+        Returns:
+            int: The estimated number of users.
+
+        Raises:
+            Exception: If an error occurs while counting the users.
+        """
+        return self.repository.estimate_user_count()
+
+    def iter_users(self, batch_size: int = 1000) -> Iterator[UserDTO]:
+        """Stream every user from the decorated repository.
+
+        Args:
+            batch_size (int): The number of rows fetched per round-trip.
+
+        Returns:
+            Iterator[UserDTO]: The users, in ID order.
+        """
+        return self.repository.iter_users(batch_size)
+
+    def update_password(self, user_id: int, password_hash: str) -> None:
+        """Replace the password hash of a user, and stop sharing the lookups of its ID started before.
+
+        Args:
+            user_id (int): The ID of the user.
+            password_hash (str): The new password hash.
+
+        Raises:
+            UserNotFoundError: If no user has the given ID.
+            Exception: If an error occurs while updating the user.
+        """
+        try:
+            self.repository.update_password(user_id, password_hash)
+        finally:
+            self.group.forget(("id", user_id))
+
+    def delete_user(self, user_id: int) -> None:
+        """Delete a user by their ID, and stop sharing the lookups of its ID started before.
+
+        Args:
+            user_id (int): The ID of the user to delete.
+
+        Raises:
+            UserNotFoundError: If no user has the given ID.
+            Exception: If an error occurs while deleting the user.
+        """
+        try:
+            self.repository.delete_user(user_id)
+        finally:
+            self.group.forget(("id", user_id))
@@ -1,9 +1,182 @@
-from typing import Optional
+from typing import Iterator, List, Optional
+
+from sqlalchemy import (
+    Column,
+    Delete,
+    Insert,
+    Result,
+    Select,
+    case,
+    column,
+    delete,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+    update,
+)
+from sqlalchemy.engine import Dialect
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+
 from src.applications.dtos import UserDTO
 from src.infra.db.settings.connection import DBConnectionHandler
-from src.infra.models import UserModel
+from src.infra.models import USER_SEARCH_TABLE, UserModel
+from src.domain.exceptions import EmailAlreadyExistsError, UserNotFoundError
 from src.domain.repositories.user import UserRepositoryInterface
 
+UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+# The columns of UserDTO, selected without loading the ORM entity.
+USER_COLUMNS = (UserModel.id, UserModel.name, UserModel.email, UserModel.password, UserModel.created_at)
+TRIGRAM_SEARCH_MIN_LENGTH = 3
+LOOKUP_CHUNK_SIZE = 500
+
+
+def insert_user_statement(dialect_name: str, user: UserDTO) -> Insert:
+    """
+    Build the statement that inserts a user and returns the created row in a single round-trip.
+
+    On PostgreSQL and SQLite a conflict on the unique email is skipped with `ON CONFLICT DO NOTHING`,
+    so the statement returns no row when the email is already taken. On other databases the
+    conflict raises an IntegrityError instead.
+
+    Args:
+        dialect_name (str): The name of the SQLAlchemy dialect the statement is executed on.
+        user (UserDTO): The user DTO containing the user data.
+
+    Returns:
+        (Insert): The `INSERT ... RETURNING` statement.
+    """
+    values = {"name": user.name, "email": user.email, "password": user.password}
+    if user.created_at is not None:
+        values["created_at"] = user.created_at
+    upsert = UPSERT_DIALECTS.get(dialect_name)
+    if upsert is None:
+        return insert(UserModel).values(**values).returning(*USER_COLUMNS)
+    return upsert(UserModel).values(**values).on_conflict_do_nothing(index_elements=["email"]).returning(*USER_COLUMNS)
+
+
+def insert_users_statement(dialect_name: str, users: List[UserDTO]) -> Insert:
+    """
+    Build the multi-row statement that inserts several users and returns the created rows.
+
+    As with `insert_user_statement`, rows whose email is already taken are skipped with
+    `ON CONFLICT DO NOTHING` on PostgreSQL and SQLite. The creation date is set by the database.
+
+    Args:
+        dialect_name (str): The name of the SQLAlchemy dialect the statement is executed on.
+        users (List[UserDTO]): The user DTOs containing the user data.
+
+    Returns:
+        (Insert): The multi-row `INSERT ... RETURNING` statement.
+    """
+    values = [{"name": user.name, "email": user.email, "password": user.password} for user in users]
+    upsert = UPSERT_DIALECTS.get(dialect_name)
+    if upsert is None:
+        return insert(UserModel).values(values).returning(*USER_COLUMNS)
+    return upsert(UserModel).values(values).on_conflict_do_nothing(index_elements=["email"]).returning(*USER_COLUMNS)
+
+
+def search_users_statement(dialect_name: str, query: str, limit: int) -> Select:
+    """
+    Build the statement that finds the users whose name or email contains a text, best matches first.
+
+    Users whose name or email starts with the text come first. On PostgreSQL the `ILIKE` filters are
+    served by the `pg_trgm` GIN indexes and the matches are ranked by trigram similarity. On SQLite,
+    texts of at least three characters are matched through the `users_search` FTS5 trigram table and
+    ranked by BM25. Other databases, and shorter texts on SQLite, fall back to a case-insensitive scan.
+
+    Args:
+        dialect_name (str): The name of the SQLAlchemy dialect the statement is executed on.
+        query (str): The text to look for.
+        limit (int): The maximum number of users to return.
+
+    Returns:
+        (Select): The search statement.
+    """
+    pattern = query.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    prefix_first = case(
+        (
+            or_(
+                UserModel.name.ilike(f"{pattern}%", escape="/"),
+                UserModel.email.ilike(f"{pattern}%", escape="/"),
+            ),
+            0,
+        ),
+        else_=1,
+    )
+    statement = select(*USER_COLUMNS).limit(limit)
+    if dialect_name == "sqlite" and len(query) >= TRIGRAM_SEARCH_MIN_LENGTH:
+        search = table(USER_SEARCH_TABLE, column("rowid"), column("rank"))
+        phrase = '"' + query.replace('"', '""') + '"'
+        return (
+            statement.select_from(UserModel)
+            .join(search, search.c.rowid == UserModel.id)
+            .where(literal_column(USER_SEARCH_TABLE).op("MATCH")(phrase))
+            .order_by(prefix_first, search.c.rank, UserModel.id)
+        )
+    statement = statement.where(
+        or_(UserModel.name.ilike(f"%{pattern}%", escape="/"), UserModel.email.ilike(f"%{pattern}%", escape="/"))
+    )
+    if dialect_name == "postgresql":
+        similarity = func.greatest(func.similarity(UserModel.name, query), func.similarity(UserModel.email, query))
+        return statement.order_by(prefix_first, similarity.desc(), UserModel.id)
+    return statement.order_by(prefix_first, UserModel.name, UserModel.id)
+
+
+def delete_user_statement(dialect: Dialect, user_id: int) -> Delete:
+    """
+    Build the statement that deletes a user by ID in a single round-trip.
+
+    The deleted ID is returned with `RETURNING` on databases that support it.
+
+    Args:
+        dialect (Dialect): The SQLAlchemy dialect the statement is executed on.
+        user_id (int): The ID of the user to delete.
+
+    Returns:
+        (Delete): The `DELETE ... WHERE id = :id` statement.
+    """
+    statement = delete(UserModel).where(UserModel.id == user_id)
+    if dialect.delete_returning:
+        statement = statement.returning(UserModel.id)
+    return statement
+
+
+def deleted_row_count(dialect: Dialect, result: Result) -> int:
+    """
+    Count the rows removed by a statement built with `delete_user_statement`.
+
+    Args:
+        dialect (Dialect): The SQLAlchemy dialect the statement was executed on.
+        result (Result): The result of the executed statement.
+
+    Returns:
+        (int): The number of deleted rows.
+    """
+    if dialect.delete_returning:
+        return len(result.all())
+    return result.rowcount
+
+
+def is_email_conflict(exception: IntegrityError) -> bool:
+    """
+    Check whether an IntegrityError was raised by the unique constraint on the user email.
+
+    Args:
+        exception (IntegrityError): The error raised by the database.
+
+    Returns:
+        (bool): True if the error is a duplicated email.
+    """
+    message = str(exception.orig)
+    return any(
+        name in message for name in ("uq_users_email", "ix_users_email", "UNIQUE constraint failed: users.email")
+    )
+
 
 class UserRepository(UserRepositoryInterface):
     """
@@ -17,7 +190,10 @@ class UserRepository(UserRepositoryInterface):
 
     def create_user(self, user: UserDTO) -> UserDTO:
         """
-        Create a new user.
+        Create a new user with a single `INSERT ... RETURNING` statement.
+
+        The unique constraint on the email detects duplicates, so no lookup is issued before the
+        insert and concurrent sign-ups with the same email cannot both succeed.
 
         Args:
             user (UserDTO): The user DTO containing the user data.
@@ -26,16 +202,16 @@ class UserRepository(UserRepositoryInterface):
             user_dto (UserDTO): The created user DTO.
 
         Raises:
+            EmailAlreadyExistsError: If a user with the same email already exists.
             Exception: If an error occurs during user creation.
         """
         with self.db_connection as db_connection:
             try:
-                db_user = UserModel(
-                    name=user.name, email=user.email, password=user.password, created_at=user.created_at
-                )
-                db_connection.session.add(db_user)
-                db_connection.session.commit()
-                db_connection.session.refresh(db_user)
+                statement = insert_user_statement(self.db_connection.engine.dialect.name, user)
+                db_user = db_connection.session.execute(statement).first()
+                if db_user is None:
+                    raise EmailAlreadyExistsError(user.email)
+                db_connection.commit()
                 return UserDTO(
                     id=db_user.id,
                     name=db_user.name,
@@ -43,11 +219,56 @@ class UserRepository(UserRepositoryInterface):
                     password=db_user.password,
                     created_at=db_user.created_at,
                 )
+            except IntegrityError as exception:
+                db_connection.rollback()
+                if is_email_conflict(exception):
+                    raise EmailAlreadyExistsError(user.email) from exception
+                raise exception
+            except Exception as exception:
+                db_connection.rollback()
+                raise exception
+
+    def create_users(self, users: List[UserDTO]) -> List[UserDTO]:
+        """
+        Create several users with a single multi-row `INSERT ... ON CONFLICT DO NOTHING RETURNING` statement.
+
+        On databases without `ON CONFLICT`, the users are inserted one by one in savepoints instead.
+
+        Args:
+            users (List[UserDTO]): The user DTOs containing the user data.
+
+        Returns:
+            List[UserDTO]: The created users. Users whose email is already taken are left out.
+
+        Raises:
+            Exception: If an error occurs during user creation.
+        """
+        if not users:
+            return []
+        dialect_name = self.db_connection.engine.dialect.name
+        with self.db_connection as db_connection:
+            try:
+                if dialect_name in UPSERT_DIALECTS:
+                    rows = db_connection.session.execute(insert_users_statement(dialect_name, users)).all()
+                else:
+                    rows = []
+                    for user in users:
+                        try:
+                            with db_connection.session.begin_nested():
+                                rows.append(
+                                    db_connection.session.execute(insert_user_statement(dialect_name, user)).one()
+                                )
+                        except IntegrityError as exception:
+                            if not is_email_conflict(exception):
+                                raise exception
+                db_connection.commit()
+                return [
+                    UserDTO(id=row.id, name=row.name, email=row.email, password=row.password, created_at=row.created_at)
+                    for row in rows
+                ]
             except Exception as exception:
-                db_connection.session.rollback()
+                db_connection.rollback()
                 raise exception
-            finally:
-                db_connection.session.close()
 
     def get_user_by_email(self, email: str) -> Optional[UserDTO]:
         """
@@ -63,19 +284,10 @@ class UserRepository(UserRepositoryInterface):
             Exception: If an error occurs while retrieving the user.
         """
         with self.db_connection as db_connection:
-            try:
-                db_user = db_connection.session.query(UserModel).filter_by(email=email).first()
-                if db_user:
-                    return UserDTO(
-                        id=db_user.id,
-                        name=db_user.name,
-                        email=db_user.email,
-                        password=db_user.password,
-                        created_at=db_user.created_at,
-                    )
+            row = db_connection.session.execute(select(*USER_COLUMNS).filter_by(email=email).limit(1)).first()
+            if row is None:
                 return None
-            finally:
-                db_connection.session.close()
+            return UserDTO(id=row.id, name=row.name, email=row.email, password=row.password, created_at=row.created_at)
 
     def get_user_by_id(self, user_id: int) -> Optional[UserDTO]:
         """
@@ -91,40 +303,226 @@ class UserRepository(UserRepositoryInterface):
             Exception: If an error occurs while retrieving the user.
         """
         with self.db_connection as db_connection:
-            try:
-                db_user = db_connection.session.query(UserModel).filter_by(id=user_id).first()
-                if db_user:
-                    return UserDTO(
-                        id=db_user.id,
-                        name=db_user.name,
-                        email=db_user.email,
-                        password=db_user.password,
-                        created_at=db_user.created_at,
-                    )
+            row = db_connection.session.execute(select(*USER_COLUMNS).filter_by(id=user_id)).first()
+            if row is None:
                 return None
-            finally:
-                db_connection.session.close()
+            return UserDTO(id=row.id, name=row.name, email=row.email, password=row.password, created_at=row.created_at)
+
+    def get_users_by_ids(self, user_ids: List[int]) -> List[UserDTO]:
+        """
+        Retrieve the users with the given IDs in as few queries as possible.
+
+        Args:
+            user_ids (List[int]): The IDs of the users to retrieve.
+
+        Returns:
+            List[UserDTO]: The users found, in no particular order. Unknown IDs are left out.
+
+        Raises:
+            Exception: If an error occurs while retrieving the users.
+        """
+        return self._get_users_where_in(UserModel.id, user_ids)
+
+    def get_users_by_emails(self, emails: List[str]) -> List[UserDTO]:
+        """
+        Retrieve the users with the given emails in as few queries as possible.
+
+        Args:
+            emails (List[str]): The emails of the users to retrieve.
+
+        Returns:
+            List[UserDTO]: The users found, in no particular order. Unknown emails are left out.
+
+        Raises:
+            Exception: If an error occurs while retrieving the users.
+        """
+        return self._get_users_where_in(UserModel.email, emails)
+
+    def _get_users_where_in(self, key: Column, values: List) -> List[UserDTO]:
+        """
+        Retrieve the users whose key is one of the values, with one `IN (...)` query per chunk of values.
+
+        The values are sent in chunks of `LOOKUP_CHUNK_SIZE` to stay within the bind parameter limits of
+        the databases, all on the same session.
+
+        Args:
+            key (Column): The unique column the users are looked up by.
+            values (List): The values of the key.
+
+        Returns:
+            List[UserDTO]: The users found.
+        """
+        values = list(dict.fromkeys(values))
+        if not values:
+            return []
+        users = []
+        with self.db_connection as db_connection:
+            for start in range(0, len(values), LOOKUP_CHUNK_SIZE):
+                rows = db_connection.session.execute(
+                    select(*USER_COLUMNS).where(key.in_(values[start : start + LOOKUP_CHUNK_SIZE]))
+                ).all()
+                users.extend(
+                    UserDTO(id=row.id, name=row.name, email=row.email, password=row.password, created_at=row.created_at)
+                    for row in rows
+                )
+        return users
+
+    def list_users(self, after_id: Optional[int] = None, limit: int = 50) -> List[UserDTO]:
+        """
+        Retrieve a page of users in ID order with keyset pagination.
+
+        The page starts right after `after_id` through the primary key index instead of skipping rows
+        with OFFSET, so a deep page costs the same as the first one.
+
+        Args:
+            after_id (int, optional): The ID of the last user of the previous page, None for the first page.
+            limit (int): The maximum number of users of the page.
+
+        Returns:
+            List[UserDTO]: The users of the page.
+
+        Raises:
+            Exception: If an error occurs while retrieving the users.
+        """
+        query = select(*USER_COLUMNS).order_by(UserModel.id).limit(limit)
+        if after_id is not None:
+            query = query.where(UserModel.id > after_id)
+        with self.db_connection as db_connection:
+            rows = db_connection.session.execute(query).all()
+            return [
+                UserDTO(id=row.id, name=row.name, email=row.email, password=row.password, created_at=row.created_at)
+                for row in rows
+            ]
+
+    def search_users(self, query: str, limit: int = 20) -> List[UserDTO]:
+        """
+        Find the users whose name or email contains a text, best matches first.
+
+        Args:
+            query (str): The text to look for, case-insensitively.
+            limit (int): The maximum number of users to return.
+
+        Returns:
+            List[UserDTO]: The matching users.
+
+        Raises:
+            Exception: If an error occurs while searching the users.
+        """
+        statement = search_users_statement(self.db_connection.engine.dialect.name, query, limit)
+        with self.db_connection as db_connection:
+            rows = db_connection.session.execute(statement).all()
+            return [
+                UserDTO(id=row.id, name=row.name, email=row.email, password=row.password, created_at=row.created_at)
+                for row in rows
+            ]
+
+    def estimate_user_count(self) -> int:
+        """
+        Estimate the number of users without scanning the table when the database keeps statistics.
+
+        On PostgreSQL the estimate is read from the planner statistics in `pg_class`, refreshed by
+        VACUUM and ANALYZE. Other databases, and a PostgreSQL table never analyzed, fall back to an exact count.
+
+        Returns:
+            int: The estimated number of users.
+
+        Raises:
+            Exception: If an error occurs while counting the users.
+        """
+        with self.db_connection as db_connection:
+            session = db_connection.session
+            if self.db_connection.engine.dialect.name == "postgresql":
+                estimate = session.execute(
+                    text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+                    {"table_name": UserModel.__tablename__},
+                ).scalar()
+                if estimate is not None and estimate >= 0:
+                    return estimate
+            return session.execute(select(func.count()).select_from(UserModel)).scalar_one()
+
+    def update_password(self, user_id: int, password_hash: str) -> None:
+        """
+        Replace the password hash of a user with a single `UPDATE` statement.
+
+        Args:
+            user_id (int): The ID of the user.
+            password_hash (str): The new password hash.
+
+        Raises:
+            UserNotFoundError: If no user has the given ID.
+            Exception: If an error occurs while updating the user.
+        """
+        with self.db_connection as db_connection:
+            try:
+                result = db_connection.session.execute(
+                    update(UserModel).where(UserModel.id == user_id).values(password=password_hash)
+                )
+                if result.rowcount == 0:
+                    raise UserNotFoundError(user_id)
+                db_connection.commit()
+            except Exception as exception:
+                db_connection.rollback()
+                raise exception
 
     def delete_user(self, user_id: int) -> None:
         """
-        Delete a user by their ID from the database.
+        Delete a user by their ID from the database with a single `DELETE ... RETURNING` statement.
 
         Args:
             user_id (int): The ID of the user to delete.
 
         Raises:
+            UserNotFoundError: If no user has the given ID.
             Exception: If an error occurs while deleting the user.
         """
         with self.db_connection as db_connection:
             try:
-                db_user = db_connection.session.query(UserModel).filter_by(id=user_id).first()
-                if db_user:
-                    db_connection.session.delete(db_user)
-                    db_connection.session.commit()
-                else:
-                    raise Exception("User not found")
+                dialect = self.db_connection.engine.dialect
+                result = db_connection.session.execute(delete_user_statement(dialect, user_id))
+                if deleted_row_count(dialect, result) == 0:
+                    raise UserNotFoundError(user_id)
+                db_connection.commit()
             except Exception as exception:
-                db_connection.session.rollback()
+                db_connection.rollback()
                 raise exception
-            finally:
-                db_connection.session.close()
+
+    def iter_users(self, batch_size: int = 1000) -> Iterator[UserDTO]:
+        """
+        Stream every user in ID order, fetching the rows from the database in batches.
+
+        The rows are read through a server-side cursor where the driver supports one, so memory stays
+        bounded by one batch whatever the size of the table. The generator opens its own session rather
+        than the per-thread session of the handler, since a streamed response may advance it from
+        different worker threads; the session is closed when the generator is exhausted or closed.
+
+        Args:
+            batch_size (int): The number of rows fetched per round-trip.
+
+        Yields:
+            user_dto (UserDTO): A user.
+        """
+        with self.db_connection.session_maker() as session:
+            result = session.execute(
+                select(*USER_COLUMNS).order_by(UserModel.id).execution_options(yield_per=batch_size)
+            )
+            for partition in result.partitions():
+                for row in partition:
+                    yield UserDTO(
+                        id=row.id, name=row.name, email=row.email, password=row.password, created_at=row.created_at
+                    )
+
+    def iter_emails(self, batch_size: int = 10_000) -> Iterator[str]:
+        """
+        Stream the email of every user, fetching the rows from the database in batches.
+
+        Args:
+            batch_size (int): The number of rows fetched per round-trip.
+
+        Yields:
+            email (str): The email of a user.
+        """
+        with self.db_connection as db_connection:
+            session = db_connection.session
+            result = session.execute(select(UserModel.email).execution_options(yield_per=batch_size))
+            for partition in result.scalars().partitions():
+                yield from partition
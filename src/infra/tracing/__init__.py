@@ -0,0 +1,6 @@
+from .context import SpanContext, format_traceparent, parse_traceparent
+from .exporters import InMemorySpanExporter, LoggingSpanExporter, SpanExporterInterface
+from .sampler import ParentBasedRatioSampler
+from .span import NonRecordingSpan, Span, SpanKind, StatusCode
+from .sql import trace_engine
+from .tracer import Tracer, TracingSettings, current_span, tracer
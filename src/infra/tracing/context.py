@@ -0,0 +1,83 @@
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+_TRACEPARENT = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})(-.*)?$")
+
+SAMPLED_FLAG = 0x01
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    """
+    The identity of a span, as propagated in the W3C Trace Context headers.
+
+    Attributes:
+        trace_id (int): The 128-bit ID of the trace.
+        span_id (int): The 64-bit ID of the span.
+        sampled (bool): Whether the trace is recorded.
+        remote (bool): Whether the span was started by another service.
+        trace_state (str): The vendor data of the `tracestate` header, passed on unchanged.
+    """
+
+    trace_id: int
+    span_id: int
+    sampled: bool
+    remote: bool = False
+    trace_state: str = ""
+
+    @property
+    def trace_id_hex(self) -> str:
+        """Get the trace ID as 32 lowercase hexadecimal digits."""
+        return f"{self.trace_id:032x}"
+
+    @property
+    def span_id_hex(self) -> str:
+        """Get the span ID as 16 lowercase hexadecimal digits."""
+        return f"{self.span_id:016x}"
+
+
+def parse_traceparent(traceparent: Optional[str], tracestate: Optional[str] = None) -> Optional[SpanContext]:
+    """
+    Read the span context of a caller from the W3C `traceparent` and `tracestate` headers.
+
+    Args:
+        traceparent (str, optional): The `traceparent` header, such as
+            `00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01`.
+        tracestate (str, optional): The `tracestate` header.
+
+    Returns:
+        (SpanContext | None): The remote span context, or None when the header is missing or invalid.
+    """
+    if not traceparent:
+        return None
+    match = _TRACEPARENT.match(traceparent.strip().lower())
+    if match is None:
+        return None
+    version, trace_id, span_id, flags, rest = match.groups()
+    # Version ff is forbidden, and version 00 has no fields after the flags.
+    if version == "ff" or (version == "00" and rest):
+        return None
+    trace_id, span_id = int(trace_id, 16), int(span_id, 16)
+    if not trace_id or not span_id:
+        return None
+    return SpanContext(
+        trace_id=trace_id,
+        span_id=span_id,
+        sampled=bool(int(flags, 16) & SAMPLED_FLAG),
+        remote=True,
+        trace_state=(tracestate or "").strip(),
+    )
+
+
+def format_traceparent(context: SpanContext) -> str:
+    """
+    Write the W3C `traceparent` header of a span context.
+
+    Args:
+        context (SpanContext): The span context.
+
+    Returns:
+        (str): The header value.
+    """
+    return f"00-{context.trace_id_hex}-{context.span_id_hex}-{SAMPLED_FLAG if context.sampled else 0:02x}"
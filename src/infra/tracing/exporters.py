@@ -0,0 +1,77 @@
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import List
+
+from .span import Span
+
+logger = logging.getLogger(__name__)
+
+
+class SpanExporterInterface(ABC):
+    """Interface of the destinations of the finished spans, as OpenTelemetry's `SpanExporter`."""
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """
+        Export a finished span.
+
+        Args:
+            span (Span): The span, once ended.
+        """
+
+    def shutdown(self) -> None:
+        """Release the resources of the exporter."""
+
+
+class InMemorySpanExporter(SpanExporterInterface):
+    """
+    Keeps the finished spans in memory, for tests.
+
+    Attributes:
+        spans (List[Span]): The finished spans, in the order they ended.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new, empty InMemorySpanExporter."""
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """
+        Keep a finished span.
+
+        Args:
+            span (Span): The span, once ended.
+        """
+        with self._lock:
+            self.spans.append(span)
+
+    def get_finished_spans(self) -> List[Span]:
+        """
+        Get the finished spans.
+
+        Returns:
+            (List[Span]): A copy of the finished spans, in the order they ended.
+        """
+        with self._lock:
+            return list(self.spans)
+
+    def clear(self) -> None:
+        """Forget the finished spans."""
+        with self._lock:
+            self.spans.clear()
+
+
+class LoggingSpanExporter(SpanExporterInterface):
+    """Logs each finished span as a line of JSON, for a log pipeline to ship to a tracing backend."""
+
+    def export(self, span: Span) -> None:
+        """
+        Log a finished span at the INFO level.
+
+        Args:
+            span (Span): The span, once ended.
+        """
+        logger.info("%s", json.dumps(span.to_dict(), default=str))
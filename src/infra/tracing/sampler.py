@@ -0,0 +1,48 @@
+from typing import Optional
+
+from .context import SpanContext
+
+_TRACE_ID_LIMIT = (1 << 64) - 1
+
+
+class ParentBasedRatioSampler:
+    """
+    Decide which traces are recorded, as OpenTelemetry's `parentbased_traceidratio` sampler.
+
+    A span with a parent follows the decision of its parent, so a trace is recorded whole or not
+    at all, even across services. A new trace is recorded when the lower 64 bits of its ID fall
+    under the ratio, so every service sampling at the same ratio takes the same decision.
+
+    Attributes:
+        ratio (float): The share of the new traces that are recorded, between 0 and 1.
+    """
+
+    def __init__(self, ratio: float = 1.0) -> None:
+        """
+        Initialize a new instance of ParentBasedRatioSampler.
+
+        Args:
+            ratio (float): The share of the new traces that are recorded, between 0 and 1.
+
+        Raises:
+            ValueError: If the ratio is not between 0 and 1.
+        """
+        if not 0.0 <= ratio <= 1.0:
+            raise ValueError("The sample ratio must be between 0 and 1.")
+        self.ratio = ratio
+        self._bound = round(ratio * (_TRACE_ID_LIMIT + 1))
+
+    def should_sample(self, trace_id: int, parent: Optional[SpanContext]) -> bool:
+        """
+        Decide whether a span is recorded.
+
+        Args:
+            trace_id (int): The ID of the trace of the span.
+            parent (SpanContext, optional): The context of the parent span, None for the root span of a trace.
+
+        Returns:
+            (bool): Whether the span is recorded.
+        """
+        if parent is not None:
+            return parent.sampled
+        return (trace_id & _TRACE_ID_LIMIT) < self._bound
@@ -0,0 +1,201 @@
+import time
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from .context import SpanContext
+
+if TYPE_CHECKING:
+    from .tracer import Tracer
+
+
+class SpanKind(Enum):
+    """The role of a span in a trace, as in OpenTelemetry."""
+
+    INTERNAL = 0
+    SERVER = 1
+    CLIENT = 2
+
+
+class StatusCode(Enum):
+    """The status of a span, as in OpenTelemetry."""
+
+    UNSET = 0
+    OK = 1
+    ERROR = 2
+
+
+class Span:
+    """
+    A timed operation of a trace, recorded and exported when it ends.
+
+    The fields follow the OpenTelemetry data model, so the exported spans can be forwarded to any
+    OpenTelemetry backend.
+
+    Attributes:
+        name (str): The name of the operation.
+        context (SpanContext): The identity of the span.
+        parent (SpanContext, optional): The identity of the parent span, None for the root span of a trace.
+        kind (SpanKind): The role of the span.
+        attributes (Dict[str, Any]): The attributes of the operation.
+        start_time (int): When the span started, in nanoseconds since the epoch.
+        end_time (int, optional): When the span ended, None while it runs.
+        status (StatusCode): The status of the operation.
+        status_description (str): Why the operation failed.
+    """
+
+    __slots__ = (
+        "name",
+        "context",
+        "parent",
+        "kind",
+        "attributes",
+        "start_time",
+        "end_time",
+        "status",
+        "status_description",
+        "_tracer",
+    )
+
+    recording = True
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        context: SpanContext,
+        parent: Optional[SpanContext] = None,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Start a new span.
+
+        Args:
+            tracer (Tracer): The tracer exporting the span when it ends.
+            name (str): The name of the operation.
+            context (SpanContext): The identity of the span.
+            parent (SpanContext, optional): The identity of the parent span.
+            kind (SpanKind): The role of the span.
+            attributes (Dict[str, Any], optional): The attributes of the operation.
+        """
+        self.name = name
+        self.context = context
+        self.parent = parent
+        self.kind = kind
+        self.attributes = dict(attributes) if attributes else {}
+        self.start_time = time.time_ns()
+        self.end_time: Optional[int] = None
+        self.status = StatusCode.UNSET
+        self.status_description = ""
+        self._tracer = tracer
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Get the duration of the span in seconds, None while it runs."""
+        return None if self.end_time is None else (self.end_time - self.start_time) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Set an attribute of the operation.
+
+        Args:
+            key (str): The name of the attribute.
+            value (Any): The value of the attribute.
+        """
+        self.attributes[key] = value
+
+    def update_name(self, name: str) -> None:
+        """
+        Rename the operation, once it is better known.
+
+        Args:
+            name (str): The new name.
+        """
+        self.name = name
+
+    def record_exception(self, exception: BaseException) -> None:
+        """
+        Mark the operation as failed by an exception.
+
+        Args:
+            exception (BaseException): The exception.
+        """
+        self.status = StatusCode.ERROR
+        self.status_description = f"{type(exception).__name__}: {exception}"
+        self.attributes["exception.type"] = type(exception).__name__
+        self.attributes["exception.message"] = str(exception)
+
+    def end(self) -> None:
+        """End the span and export it. Ending a span again has no effect."""
+        if self.end_time is not None:
+            return
+        self.end_time = time.time_ns()
+        self._tracer.export(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the span to a JSON-compatible dictionary, shaped as OpenTelemetry's `ReadableSpan.to_json`.
+
+        Returns:
+            (Dict[str, Any]): The span.
+        """
+        return {
+            "name": self.name,
+            "context": {
+                "trace_id": f"0x{self.context.trace_id_hex}",
+                "span_id": f"0x{self.context.span_id_hex}",
+                "trace_state": self.context.trace_state,
+            },
+            "kind": f"SpanKind.{self.kind.name}",
+            "parent_id": None if self.parent is None else f"0x{self.parent.span_id_hex}",
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "status": {"status_code": self.status.name, "description": self.status_description or None},
+            "attributes": self.attributes,
+        }
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the span.
+
+        Returns:
+            (str): The name, the IDs and the duration of the span.
+        """
+        return f"Span({self.name!r}, trace_id={self.context.trace_id_hex}, span_id={self.context.span_id_hex})"
+
+
+class NonRecordingSpan:
+    """
+    A span of a trace that is not recorded.
+
+    It carries the span context, so the decision not to record the trace is passed on to the
+    child spans and to the other services, but it records and exports nothing.
+
+    Attributes:
+        context (SpanContext): The identity of the span.
+    """
+
+    __slots__ = ("context",)
+
+    recording = False
+
+    def __init__(self, context: SpanContext) -> None:
+        """
+        Initialize a new instance of NonRecordingSpan.
+
+        Args:
+            context (SpanContext): The identity of the span.
+        """
+        self.context = context
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Ignore an attribute."""
+
+    def update_name(self, name: str) -> None:
+        """Ignore a new name."""
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Ignore an exception."""
+
+    def end(self) -> None:
+        """End nothing."""
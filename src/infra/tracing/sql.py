@@ -0,0 +1,63 @@
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+from .span import SpanKind
+from .tracer import current_span, tracer
+
+
+def trace_engine(engine: Engine) -> None:
+    """
+    Record a client span for each statement an engine executes inside a sampled trace.
+
+    Outside of a recording span the hooks only read a context variable. Tracing an engine twice
+    has no effect.
+
+    Args:
+        engine (Engine): The engine to trace, the `sync_engine` of an asyncio engine.
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def _before_cursor_execute(
+    connection: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    """Start the span of a statement, if the current span is recording."""
+    parent = current_span()
+    if context is None or parent is None or not parent.recording:
+        return
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+    context._trace_span = tracer.start_span(
+        operation,
+        kind=SpanKind.CLIENT,
+        attributes={
+            "db.system": connection.dialect.name,
+            "db.operation": operation,
+            "db.statement": statement,
+            "db.executemany": executemany,
+        },
+    )
+
+
+def _after_cursor_execute(
+    connection: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    """End the span of a statement."""
+    span = getattr(context, "_trace_span", None)
+    if span is not None:
+        context._trace_span = None
+        span.end()
+
+
+def _handle_error(exception_context: Any) -> None:
+    """End the span of a failed statement, recording the error."""
+    context = exception_context.execution_context
+    span = getattr(context, "_trace_span", None)
+    if span is not None:
+        context._trace_span = None
+        span.record_exception(exception_context.original_exception)
+        span.end()
@@ -0,0 +1,214 @@
+import os
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Union
+
+from .context import SpanContext
+from .exporters import InMemorySpanExporter, LoggingSpanExporter, SpanExporterInterface
+from .sampler import ParentBasedRatioSampler
+from .span import NonRecordingSpan, Span, SpanKind
+
+AnySpan = Union[Span, NonRecordingSpan]
+
+EXPORTERS = {"none": None, "memory": InMemorySpanExporter, "log": LoggingSpanExporter}
+
+_current_span: ContextVar[Optional[AnySpan]] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Optional[AnySpan]:
+    """
+    Get the span of the current context.
+
+    Returns:
+        (Span | NonRecordingSpan | None): The innermost current span, or None outside of a trace.
+    """
+    return _current_span.get()
+
+
+@dataclass(frozen=True)
+class TracingSettings:
+    """Settings of the tracing.
+
+    Attributes:
+        exporter (str): Where the finished spans go: `none` (tracing is off), `memory` or `log`.
+        sample_ratio (float): The share of the new traces that are recorded. The traces started by a caller
+            follow the decision of the caller.
+    """
+
+    exporter: str = "none"
+    sample_ratio: float = 1.0
+
+    @classmethod
+    def from_env(cls) -> "TracingSettings":
+        """Build the tracing settings from environment variables.
+
+        The variables `TRACING_EXPORTER` and `TRACING_SAMPLE_RATIO` override the defaults when they are set.
+
+        Returns:
+            (TracingSettings): The tracing settings read from the environment.
+
+        Raises:
+            ValueError: If the exporter is not supported.
+        """
+        exporter = os.getenv("TRACING_EXPORTER", cls.exporter).lower()
+        if exporter not in EXPORTERS:
+            raise ValueError(f"Unsupported tracing exporter '{exporter}', expected one of {tuple(EXPORTERS)}.")
+        return cls(exporter=exporter, sample_ratio=float(os.getenv("TRACING_SAMPLE_RATIO", cls.sample_ratio)))
+
+    def build_exporter(self) -> Optional[SpanExporterInterface]:
+        """Build the exporter of these settings.
+
+        Returns:
+            (SpanExporterInterface | None): The exporter, None when tracing is off.
+        """
+        exporter_class = EXPORTERS[self.exporter]
+        return None if exporter_class is None else exporter_class()
+
+
+class Tracer:
+    """
+    Starts the spans of the traces and hands them to an exporter when they end.
+
+    Without an exporter the tracer is disabled: the instrumented code checks `enabled` and skips
+    the tracing altogether, so the default costs nothing. When enabled, the sampler decides which
+    traces are recorded; the spans of the other traces are non-recording spans that only carry the
+    decision to their children.
+
+    Attributes:
+        exporter (SpanExporterInterface, optional): Where the finished spans go, None when tracing is off.
+        sampler (ParentBasedRatioSampler): Decides which traces are recorded.
+    """
+
+    def __init__(
+        self, exporter: Optional[SpanExporterInterface] = None, sampler: Optional[ParentBasedRatioSampler] = None
+    ) -> None:
+        """
+        Initialize a new instance of Tracer.
+
+        Args:
+            exporter (SpanExporterInterface, optional): Where the finished spans go. Tracing is off when omitted.
+            sampler (ParentBasedRatioSampler, optional): Decides which traces are recorded. Every trace is
+                recorded when omitted.
+        """
+        self.exporter = exporter
+        self.sampler = sampler or ParentBasedRatioSampler()
+
+    @property
+    def enabled(self) -> bool:
+        """Tell whether spans are started at all."""
+        return self.exporter is not None
+
+    def configure(
+        self, exporter: Optional[SpanExporterInterface], sampler: Optional[ParentBasedRatioSampler] = None
+    ) -> None:
+        """
+        Replace the exporter and the sampler, shutting the previous exporter down.
+
+        Args:
+            exporter (SpanExporterInterface, optional): Where the finished spans go, None to turn tracing off.
+            sampler (ParentBasedRatioSampler, optional): Decides which traces are recorded. Every trace is
+                recorded when omitted.
+        """
+        previous, self.exporter = self.exporter, exporter
+        self.sampler = sampler or ParentBasedRatioSampler()
+        if previous is not None and previous is not exporter:
+            previous.shutdown()
+
+    def configure_from_settings(self, settings: Optional[TracingSettings] = None) -> None:
+        """
+        Configure the tracer from tracing settings.
+
+        Args:
+            settings (TracingSettings, optional): The tracing settings. Read from the environment when omitted.
+        """
+        settings = settings or TracingSettings.from_env()
+        self.configure(settings.build_exporter(), ParentBasedRatioSampler(settings.sample_ratio))
+
+    def start_span(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+        parent: Optional[SpanContext] = None,
+    ) -> AnySpan:
+        """
+        Start a span, the child of `parent` or of the current span.
+
+        Args:
+            name (str): The name of the operation.
+            kind (SpanKind): The role of the span.
+            attributes (Dict[str, Any], optional): The attributes of the operation.
+            parent (SpanContext, optional): The context of the parent span, such as a remote caller. The current
+                span is the parent when omitted.
+
+        Returns:
+            (Span | NonRecordingSpan): The span, recording when the trace is sampled. The caller ends it.
+        """
+        if parent is None:
+            current = _current_span.get()
+            parent = None if current is None else current.context
+        trace_id = random.getrandbits(128) if parent is None else parent.trace_id
+        context = SpanContext(
+            trace_id=trace_id,
+            span_id=random.getrandbits(64) or 1,
+            sampled=self.sampler.should_sample(trace_id, parent),
+            trace_state="" if parent is None else parent.trace_state,
+        )
+        if not context.sampled:
+            return NonRecordingSpan(context)
+        return Span(self, name, context, parent=parent, kind=kind, attributes=attributes)
+
+    @contextmanager
+    def start_as_current_span(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+        parent: Optional[SpanContext] = None,
+    ) -> Iterator[AnySpan]:
+        """
+        Start a span, make it the current span of the block, and end it when the block exits.
+
+        An exception raised by the block is recorded on the span. Inside a trace that is not
+        sampled, the non-recording current span is reused instead of starting a new one.
+
+        Args:
+            name (str): The name of the operation.
+            kind (SpanKind): The role of the span.
+            attributes (Dict[str, Any], optional): The attributes of the operation.
+            parent (SpanContext, optional): The context of the parent span. The current span is the parent
+                when omitted.
+
+        Yields:
+            (Span | NonRecordingSpan): The span.
+        """
+        current = _current_span.get()
+        if parent is None and current is not None and not current.recording:
+            yield current
+            return
+        span = self.start_span(name, kind=kind, attributes=attributes, parent=parent)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exception:
+            span.record_exception(exception)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    def export(self, span: Span) -> None:
+        """
+        Hand a finished span to the exporter.
+
+        Args:
+            span (Span): The span, once ended.
+        """
+        exporter = self.exporter
+        if exporter is not None:
+            exporter.export(span)
+
+
+tracer = Tracer()
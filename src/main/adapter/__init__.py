@@ -1 +1,2 @@
 from .fast_api import fast_api_adapter
+from .user_records import read_user_records
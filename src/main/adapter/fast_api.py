@@ -1,19 +1,105 @@
-from src.domain.controller import ControllerInterface
-from src.presenters.helpers.http_types import HttpRequest, HttpResponse
+from typing import Any, Union
 
+from starlette.concurrency import run_in_threadpool
 
-def fast_api_adapter(request: any, api_route: ControllerInterface) -> HttpResponse:
+from src.applications.enums.auth.errors import AuthErrorsEnum
+from src.applications.enums.user.errors import UserErrorsEnum
+from src.domain.controller import AsyncControllerInterface, ControllerInterface
+from src.infra.metrics import metrics_registry
+from src.infra.profiling import current_profile
+from src.infra.tracing import tracer
+from src.presenters.helpers.http_types import HttpRequest, HttpResponse, Lazy
+
+USE_CASE_OUTCOMES = metrics_registry.counter(
+    "use_case_outcomes_total", "Outcomes of the use cases, by route.", ("use_case", "outcome")
+)
+
+# The name of each use case error, keyed by the message the controllers answer with.
+ERROR_OUTCOMES = {error.value: error.name for errors in (UserErrorsEnum, AuthErrorsEnum) for error in errors}
+
+
+def outcome_of(response: HttpResponse) -> str:
+    """
+    Name the outcome of a use case from the response of its controller.
+
+    Args:
+        response (HttpResponse): The response of the controller.
+
+    Returns:
+        (str): `SUCCESS`, the name of the use case error such as `EMAIL_ALREADY_EXISTS`, or `HTTP_<status>`
+            for the other failures.
+    """
+    if response.status_code < 400:
+        return "SUCCESS"
+    body = response.body
+    outcome = ERROR_OUTCOMES.get(body) if type(body) is str else None
+    return outcome or f"HTTP_{response.status_code}"
+
+
+async def fast_api_adapter(
+    request: any,
+    api_route: Union[ControllerInterface, AsyncControllerInterface],
+    body: Any = None,
+    model: Any = None,
+) -> HttpResponse:
     """Adapter function to process a FastAPI request and call the corresponding API route.
 
+    The headers, the query parameters and the path parameters are handed to the controller as lazy,
+    read-only views of the FastAPI request: they are only read when the controller uses them, and
+    nothing is copied. A body that FastAPI has already validated is passed as `model`, so the
+    controller does not check it again.
+
+    Asynchronous controllers are awaited on the event loop, while synchronous controllers, which
+    block on the database, are run in the worker threadpool. The outcome of the use case is counted
+    in the `use_case_outcomes_total` metric, under the name of the route. While tracing is on, the
+    call is traced in a `fast_api_adapter` span, so the time spent waiting for a worker thread
+    shows between it and the span of the controller.
+
     Args:
         request (any): The FastAPI request object.
-        api_route (ControllerInterface): The API route implementation that handles the request.
+        api_route (ControllerInterface | AsyncControllerInterface): The API route implementation that handles the request.
+        body (Any, optional): The body data of the request, as read by the route.
+        model (Any, optional): The body of the request, already validated by FastAPI.
 
     Returns:
         response (HttpResponse): The response data returned by the API route.
     """
     http_request = HttpRequest(
-        query=request.query_params, body=request.json, header=request.headers, path=request.path_params
+        header=Lazy(lambda: request.headers),
+        body=body,
+        query=Lazy(lambda: request.query_params),
+        path=Lazy(lambda: request.path_params),
+        model=model,
     )
-    response = api_route.route(http_request=http_request)
+    if tracer.enabled:
+        with tracer.start_as_current_span("fast_api_adapter", attributes={"app.controller": type(api_route).__name__}):
+            response = await call_controller(api_route, http_request)
+    else:
+        response = await call_controller(api_route, http_request)
+    route = request.scope.get("route")
+    if route is not None:
+        USE_CASE_OUTCOMES.labels(route.name, outcome_of(response)).inc()
     return response
+
+
+async def call_controller(
+    api_route: Union[ControllerInterface, AsyncControllerInterface], http_request: HttpRequest
+) -> HttpResponse:
+    """
+    Call a controller, awaiting an asynchronous one and running a synchronous one in the worker threadpool.
+
+    When the request is profiled, the worker thread is sampled as part of its profile.
+
+    Args:
+        api_route (ControllerInterface | AsyncControllerInterface): The controller.
+        http_request (HttpRequest): The request handed to the controller.
+
+    Returns:
+        (HttpResponse): The response of the controller.
+    """
+    if isinstance(api_route, AsyncControllerInterface):
+        return await api_route.route(http_request=http_request)
+    profile = current_profile()
+    if profile is not None:
+        return await run_in_threadpool(profile.run, api_route.route, http_request=http_request)
+    return await run_in_threadpool(api_route.route, http_request=http_request)
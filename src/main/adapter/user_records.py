@@ -0,0 +1,121 @@
+import json
+from typing import Any, AsyncIterator, Iterable, Iterator, Tuple, Union
+
+import anyio.from_thread
+from pydantic import ValidationError
+
+from src.main.fast_api.schemas import UserCreate
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+_END = object()
+
+
+async def read_user_records(request: Any) -> Iterator[Tuple[int, Union[dict, str]]]:
+    """Read the user records of a bulk import request.
+
+    A body sent with an NDJSON content type is parsed one line at a time while it is received, so the
+    import never holds the whole body in memory. The returned iterator pulls the body from the event
+    loop and must be consumed in a worker thread. Any other body is read as a JSON array.
+
+    Each record is validated against the UserCreate schema on its own: a row that is not valid JSON or
+    does not match the schema is yielded with its error message instead of failing the whole import.
+
+    Args:
+        request (any): The FastAPI request object.
+
+    Returns:
+        (Iterator[Tuple[int, Union[dict, str]]]): The number of each row, starting at 1, with the user
+            data or the error message of the row.
+
+    Raises:
+        ValueError: If a body that is not NDJSON is not a JSON array.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in NDJSON_CONTENT_TYPES:
+        return validate_records(_parse_lines(iterate_in_thread(_ndjson_lines(request.stream()))))
+    records = json.loads(await request.body() or b"null")
+    if not isinstance(records, list):
+        raise ValueError("The body must be a JSON array of users.")
+    return validate_records(records)
+
+
+def validate_records(records: Iterable[Any]) -> Iterator[Tuple[int, Union[dict, str]]]:
+    """Validate the records of a bulk import against the UserCreate schema.
+
+    Args:
+        records (Iterable[Any]): The decoded records, or the exceptions raised while decoding them.
+
+    Yields:
+        (Tuple[int, Union[dict, str]]): The number of each row with the user data or the error message.
+    """
+    for row, record in enumerate(records, start=1):
+        if isinstance(record, Exception):
+            yield row, f"Invalid JSON: {record}"
+            continue
+        try:
+            yield row, UserCreate.model_validate(record).model_dump()
+        except ValidationError as exception:
+            yield row, "; ".join(
+                f"{'.'.join(str(part) for part in error['loc']) or 'body'}: {error['msg']}"
+                for error in exception.errors()
+            )
+
+
+def iterate_in_thread(async_iterator: AsyncIterator[Any]) -> Iterator[Any]:
+    """Consume an asynchronous iterator from a worker thread, one item at a time.
+
+    Args:
+        async_iterator (AsyncIterator[Any]): The iterator, driven on the event loop.
+
+    Yields:
+        (Any): The items of the iterator.
+    """
+
+    async def next_item() -> Any:
+        try:
+            return await async_iterator.__anext__()
+        except StopAsyncIteration:
+            return _END
+
+    while True:
+        item = anyio.from_thread.run(next_item)
+        if item is _END:
+            return
+        yield item
+
+
+async def _ndjson_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Split a stream of body chunks into its non-blank lines.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The chunks of the body.
+
+    Yields:
+        (bytes): The lines of the body, blank lines excluded.
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
+
+
+def _parse_lines(lines: Iterable[bytes]) -> Iterator[Any]:
+    """Decode NDJSON lines, yielding the decoding error in place of an invalid line.
+
+    Args:
+        lines (Iterable[bytes]): The lines to decode.
+
+    Yields:
+        (Any): The decoded value of each line, or the ValueError raised while decoding it.
+    """
+    for line in lines:
+        try:
+            yield json.loads(line)
+        except ValueError as exception:
+            yield exception
@@ -0,0 +1,2 @@
+from .login import login_composer
+from .logout import logout_composer
@@ -0,0 +1,43 @@
+from src.applications.services.password_hasher import PasswordHasher
+from src.applications.use_cases.auth.login import LoginUseCase
+from src.infra.auth import HmacTokenService
+from src.infra.db.settings.connection import DBConnectionHandler
+from src.infra.repositories.revoked_token import RevokedTokenRepository
+from src.infra.repositories.user import UserRepository
+from src.domain.controller import ControllerInterface
+from src.domain.password_hasher import PasswordHasherInterface
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.token_service import TokenServiceInterface
+from src.presenters.controllers.auth.login import LoginController
+
+
+def login_composer(
+    repository: UserRepositoryInterface = None,
+    password_hasher: PasswordHasherInterface = None,
+    token_service: TokenServiceInterface = None,
+) -> ControllerInterface:
+    """
+    Compose the necessary components for the login route.
+
+    Args:
+        repository (UserRepositoryInterface, optional): The user repository to use. A database-backed
+            UserRepository is created when it is not provided.
+        password_hasher (PasswordHasherInterface, optional): The hasher the passwords are checked with.
+            A PasswordHasher configured from the environment is created when it is not provided.
+        token_service (TokenServiceInterface, optional): The service the access tokens are issued by.
+            An HmacTokenService configured from the environment is created when it is not provided.
+
+    Returns:
+        login_controller (ControllerInterface): An instance of the LoginController.
+    """
+    if repository is None:
+        repository = UserRepository(db_connection=DBConnectionHandler())
+    if password_hasher is None:
+        password_hasher = PasswordHasher()
+    if token_service is None:
+        token_service = HmacTokenService(revoked_token_repository=RevokedTokenRepository(DBConnectionHandler()))
+    login_use_case = LoginUseCase(
+        user_repository=repository, password_hasher=password_hasher, token_service=token_service
+    )
+    login_controller = LoginController(login_use_case=login_use_case)
+    return login_controller
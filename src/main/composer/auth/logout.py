@@ -0,0 +1,25 @@
+from src.applications.use_cases.auth.logout import LogoutUseCase
+from src.infra.auth import HmacTokenService
+from src.infra.db.settings.connection import DBConnectionHandler
+from src.infra.repositories.revoked_token import RevokedTokenRepository
+from src.domain.controller import ControllerInterface
+from src.domain.token_service import TokenServiceInterface
+from src.presenters.controllers.auth.logout import LogoutController
+
+
+def logout_composer(token_service: TokenServiceInterface = None) -> ControllerInterface:
+    """
+    Compose the necessary components for the logout route.
+
+    Args:
+        token_service (TokenServiceInterface, optional): The service the access tokens are revoked with.
+            An HmacTokenService configured from the environment is created when it is not provided.
+
+    Returns:
+        logout_controller (ControllerInterface): An instance of the LogoutController.
+    """
+    if token_service is None:
+        token_service = HmacTokenService(revoked_token_repository=RevokedTokenRepository(DBConnectionHandler()))
+    logout_use_case = LogoutUseCase(token_service=token_service)
+    logout_controller = LogoutController(logout_use_case=logout_use_case)
+    return logout_controller
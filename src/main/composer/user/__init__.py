@@ -1,3 +1,11 @@
 from .create_user import create_user_composer
 from .get_user import get_user_composer
 from .delete_user import delete_user_composer
+from .async_create_user import async_create_user_composer
+from .async_get_user import async_get_user_composer
+from .async_delete_user import async_delete_user_composer
+from .bulk_create_users import bulk_create_users_composer
+from .export_users import export_users_composer
+from .list_users import list_users_composer
+from .search_users import search_users_composer
+from .batch_get_users import batch_get_users_composer
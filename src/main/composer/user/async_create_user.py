@@ -0,0 +1,42 @@
+from src.applications.use_cases.user.async_create_user import AsyncCreateUserUseCase
+from src.applications.services.password_hasher import PasswordHasher
+from src.domain.password_hasher import PasswordHasherInterface
+from src.infra.db.settings.async_connection import AsyncDBConnectionHandler
+from src.infra.db.settings.async_unit_of_work import SqlAlchemyAsyncUnitOfWork
+from src.infra.repositories.async_user import AsyncUserRepository
+from src.domain.unit_of_work import AsyncUnitOfWorkInterface
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+from src.domain.controller import AsyncControllerInterface
+from src.presenters.controllers.user.async_create_user import AsyncCreateUserController
+
+
+def async_create_user_composer(
+    repository: AsyncUserRepositoryInterface = None,
+    unit_of_work: AsyncUnitOfWorkInterface = None,
+    password_hasher: PasswordHasherInterface = None,
+) -> AsyncControllerInterface:
+    """
+    Compose the asynchronous components of the create user route.
+
+    Args:
+        repository (AsyncUserRepositoryInterface, optional): The asynchronous user repository to use.
+            A database-backed AsyncUserRepository is created when it is not provided.
+        unit_of_work (AsyncUnitOfWorkInterface, optional): The unit of work the use case runs in.
+            A SqlAlchemyAsyncUnitOfWork on the database connection is created when it is not provided.
+        password_hasher (PasswordHasherInterface, optional): The hasher the passwords are stored hashed with.
+            A PasswordHasher configured from the environment is created when it is not provided.
+
+    Returns:
+        create_user_controller (AsyncControllerInterface): An instance of the AsyncCreateUserController.
+    """
+    if repository is None:
+        repository = AsyncUserRepository(db_connection=AsyncDBConnectionHandler())
+    if unit_of_work is None:
+        unit_of_work = SqlAlchemyAsyncUnitOfWork(db_connection=AsyncDBConnectionHandler())
+    if password_hasher is None:
+        password_hasher = PasswordHasher()
+    create_user_use_case = AsyncCreateUserUseCase(
+        user_repository=repository, unit_of_work=unit_of_work, password_hasher=password_hasher
+    )
+    create_user_controller = AsyncCreateUserController(create_user_use_case=create_user_use_case)
+    return create_user_controller
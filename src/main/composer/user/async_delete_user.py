@@ -0,0 +1,32 @@
+from src.applications.use_cases.user.async_delete_user import AsyncDeleteUserUseCase
+from src.infra.db.settings.async_connection import AsyncDBConnectionHandler
+from src.infra.db.settings.async_unit_of_work import SqlAlchemyAsyncUnitOfWork
+from src.infra.repositories.async_user import AsyncUserRepository
+from src.domain.unit_of_work import AsyncUnitOfWorkInterface
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+from src.domain.controller import AsyncControllerInterface
+from src.presenters.controllers.user.async_delete_user import AsyncDeleteUserController
+
+
+def async_delete_user_composer(
+    repository: AsyncUserRepositoryInterface = None, unit_of_work: AsyncUnitOfWorkInterface = None
+) -> AsyncControllerInterface:
+    """
+    Compose the asynchronous components of the delete user route.
+
+    Args:
+        repository (AsyncUserRepositoryInterface, optional): The asynchronous user repository to use.
+            A database-backed AsyncUserRepository is created when it is not provided.
+        unit_of_work (AsyncUnitOfWorkInterface, optional): The unit of work the use case runs in.
+            A SqlAlchemyAsyncUnitOfWork on the database connection is created when it is not provided.
+
+    Returns:
+        delete_user_controller (AsyncControllerInterface): An instance of the AsyncDeleteUserController.
+    """
+    if repository is None:
+        repository = AsyncUserRepository(db_connection=AsyncDBConnectionHandler())
+    if unit_of_work is None:
+        unit_of_work = SqlAlchemyAsyncUnitOfWork(db_connection=AsyncDBConnectionHandler())
+    delete_user_use_case = AsyncDeleteUserUseCase(user_repository=repository, unit_of_work=unit_of_work)
+    delete_user_controller = AsyncDeleteUserController(delete_user_use_case=delete_user_use_case)
+    return delete_user_controller
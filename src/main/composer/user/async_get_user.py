@@ -0,0 +1,24 @@
+from src.applications.use_cases.user.async_get_user import AsyncGetUserUseCase
+from src.infra.db.settings.async_connection import AsyncDBConnectionHandler
+from src.infra.repositories.async_user import AsyncUserRepository
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+from src.domain.controller import AsyncControllerInterface
+from src.presenters.controllers.user.async_get_user import AsyncGetUserController
+
+
+def async_get_user_composer(repository: AsyncUserRepositoryInterface = None) -> AsyncControllerInterface:
+    """
+    Compose the asynchronous components of the get user route.
+
+    Args:
+        repository (AsyncUserRepositoryInterface, optional): The asynchronous user repository to use.
+            A database-backed AsyncUserRepository is created when it is not provided.
+
+    Returns:
+        get_user_controller (AsyncControllerInterface): An instance of the AsyncGetUserController.
+    """
+    if repository is None:
+        repository = AsyncUserRepository(db_connection=AsyncDBConnectionHandler())
+    get_user_use_case = AsyncGetUserUseCase(user_repository=repository)
+    get_user_controller = AsyncGetUserController(get_user_use_case=get_user_use_case)
+    return get_user_controller
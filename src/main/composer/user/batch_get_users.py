@@ -0,0 +1,24 @@
+from src.applications.use_cases.user.batch_get_users import BatchGetUsersUseCase
+from src.infra.db.settings.connection import DBConnectionHandler
+from src.infra.repositories.user import UserRepository
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.controller import ControllerInterface
+from src.presenters.controllers.user.batch_get_users import BatchGetUsersController
+
+
+def batch_get_users_composer(repository: UserRepositoryInterface = None) -> ControllerInterface:
+    """
+    Compose the necessary components for the batch user lookup route.
+
+    Args:
+        repository (UserRepositoryInterface, optional): The user repository to use. A database-backed
+            UserRepository is created when it is not provided.
+
+    Returns:
+        batch_get_users_controller (ControllerInterface): An instance of the BatchGetUsersController.
+    """
+    if repository is None:
+        repository = UserRepository(db_connection=DBConnectionHandler())
+    batch_get_users_use_case = BatchGetUsersUseCase(user_repository=repository)
+    batch_get_users_controller = BatchGetUsersController(batch_get_users_use_case=batch_get_users_use_case)
+    return batch_get_users_controller
@@ -0,0 +1,49 @@
+import os
+
+from src.applications.use_cases.user.bulk_create_users import BulkCreateUsersUseCase
+from src.applications.services.password_hasher import PasswordHasher
+from src.domain.password_hasher import PasswordHasherInterface
+from src.infra.db.settings.connection import DBConnectionHandler
+from src.infra.db.settings.unit_of_work import SqlAlchemyUnitOfWork
+from src.infra.repositories.user import UserRepository
+from src.domain.unit_of_work import UnitOfWorkInterface
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.controller import ControllerInterface
+from src.presenters.controllers.user.bulk_create_users import BulkCreateUsersController
+
+
+def bulk_create_users_composer(
+    repository: UserRepositoryInterface = None,
+    unit_of_work: UnitOfWorkInterface = None,
+    password_hasher: PasswordHasherInterface = None,
+    batch_size: int = None,
+) -> ControllerInterface:
+    """
+    Compose the necessary components for the bulk user import route.
+
+    Args:
+        repository (UserRepositoryInterface, optional): The user repository to use. A database-backed
+            UserRepository is created when it is not provided.
+        unit_of_work (UnitOfWorkInterface, optional): The unit of work each batch runs in.
+            A SqlAlchemyUnitOfWork on the database connection is created when it is not provided.
+        password_hasher (PasswordHasherInterface, optional): The hasher the passwords are stored hashed with.
+            A PasswordHasher configured from the environment is created when it is not provided.
+        batch_size (int, optional): The number of users inserted per statement. Read from the
+            `USER_BULK_BATCH_SIZE` environment variable when omitted, and defaults to 1000.
+
+    Returns:
+        bulk_create_users_controller (ControllerInterface): An instance of the BulkCreateUsersController.
+    """
+    if repository is None:
+        repository = UserRepository(db_connection=DBConnectionHandler())
+    if unit_of_work is None:
+        unit_of_work = SqlAlchemyUnitOfWork(db_connection=DBConnectionHandler())
+    if batch_size is None:
+        batch_size = int(os.getenv("USER_BULK_BATCH_SIZE", 1000))
+    if password_hasher is None:
+        password_hasher = PasswordHasher()
+    bulk_create_users_use_case = BulkCreateUsersUseCase(
+        user_repository=repository, unit_of_work=unit_of_work, password_hasher=password_hasher, batch_size=batch_size
+    )
+    bulk_create_users_controller = BulkCreateUsersController(bulk_create_users_use_case=bulk_create_users_use_case)
+    return bulk_create_users_controller
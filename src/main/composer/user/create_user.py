@@ -1,11 +1,20 @@
 from src.applications.use_cases.user.create_user import CreateUserUseCase
+from src.applications.services.password_hasher import PasswordHasher
+from src.domain.password_hasher import PasswordHasherInterface
 from src.infra.db.settings.connection import DBConnectionHandler
+from src.infra.db.settings.unit_of_work import SqlAlchemyUnitOfWork
 from src.infra.repositories.user import UserRepository
+from src.domain.unit_of_work import UnitOfWorkInterface
+from src.domain.repositories.user import UserRepositoryInterface
 from src.domain.controller import ControllerInterface
 from src.presenters.controllers.user.create_user import CreateUserController
 
 
-def create_user_composer() -> ControllerInterface:
+def create_user_composer(
+    repository: UserRepositoryInterface = None,
+    unit_of_work: UnitOfWorkInterface = None,
+    password_hasher: PasswordHasherInterface = None,
+) -> ControllerInterface:
     """
     Compose the necessary components for creating a new user account route.
 
@@ -14,10 +23,25 @@ def create_user_composer() -> ControllerInterface:
     database, initializes the user repository, sets up the create user use case, and
     associates it with the appropriate controller.
 
+    Args:
+        repository (UserRepositoryInterface, optional): The user repository to use. A database-backed
+            UserRepository is created when it is not provided.
+        unit_of_work (UnitOfWorkInterface, optional): The unit of work the use case runs in.
+            A SqlAlchemyUnitOfWork on the database connection is created when it is not provided.
+        password_hasher (PasswordHasherInterface, optional): The hasher the passwords are stored hashed with.
+            A PasswordHasher configured from the environment is created when it is not provided.
+
     Returns:
         create_user_controller (ControllerInterface): An instance of the CreateUserController configured for creating new user accounts.
     """
-    repository = UserRepository(db_connection=DBConnectionHandler())
-    create_user_use_case = CreateUserUseCase(user_repository=repository)
+    if repository is None:
+        repository = UserRepository(db_connection=DBConnectionHandler())
+    if unit_of_work is None:
+        unit_of_work = SqlAlchemyUnitOfWork(db_connection=DBConnectionHandler())
+    if password_hasher is None:
+        password_hasher = PasswordHasher()
+    create_user_use_case = CreateUserUseCase(
+        user_repository=repository, unit_of_work=unit_of_work, password_hasher=password_hasher
+    )
     create_user_controller = CreateUserController(create_user_use_case=create_user_use_case)
     return create_user_controller
@@ -1,11 +1,16 @@
 from src.applications.use_cases.user.delete_user import DeleteUserUseCase
 from src.infra.db.settings.connection import DBConnectionHandler
+from src.infra.db.settings.unit_of_work import SqlAlchemyUnitOfWork
 from src.infra.repositories.user import UserRepository
+from src.domain.unit_of_work import UnitOfWorkInterface
+from src.domain.repositories.user import UserRepositoryInterface
 from src.domain.controller import ControllerInterface
 from src.presenters.controllers.user.delete_user import DeleteUserController
 
 
-def delete_user_composer() -> ControllerInterface:
+def delete_user_composer(
+    repository: UserRepositoryInterface = None, unit_of_work: UnitOfWorkInterface = None
+) -> ControllerInterface:
     """
     Compose the necessary components for deleting a user account route.
 
@@ -14,10 +19,19 @@ def delete_user_composer() -> ControllerInterface:
     database, initializes the user repository, sets up the delete user use case, and
     associates it with the appropriate controller.
 
+    Args:
+        repository (UserRepositoryInterface, optional): The user repository to use. A database-backed
+            UserRepository is created when it is not provided.
+        unit_of_work (UnitOfWorkInterface, optional): The unit of work the use case runs in.
+            A SqlAlchemyUnitOfWork on the database connection is created when it is not provided.
+
     Returns:
         delete_user_controller (ControllerInterface): An instance of the DeleteUserController configured for deleting user accounts.
     """
-    repository = UserRepository(db_connection=DBConnectionHandler())
-    delete_user_use_case = DeleteUserUseCase(user_repository=repository)
+    if repository is None:
+        repository = UserRepository(db_connection=DBConnectionHandler())
+    if unit_of_work is None:
+        unit_of_work = SqlAlchemyUnitOfWork(db_connection=DBConnectionHandler())
+    delete_user_use_case = DeleteUserUseCase(user_repository=repository, unit_of_work=unit_of_work)
     delete_user_controller = DeleteUserController(delete_user_use_case=delete_user_use_case)
     return delete_user_controller
@@ -0,0 +1,24 @@
+from src.applications.use_cases.user.export_users import ExportUsersUseCase
+from src.infra.db.settings.connection import DBConnectionHandler
+from src.infra.repositories.user import UserRepository
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.controller import ControllerInterface
+from src.presenters.controllers.user.export_users import ExportUsersController
+
+
+def export_users_composer(repository: UserRepositoryInterface = None) -> ControllerInterface:
+    """
+    Compose the necessary components for the user export route.
+
+    Args:
+        repository (UserRepositoryInterface, optional): The user repository to use. A database-backed
+            UserRepository is created when it is not provided.
+
+    Returns:
+        export_users_controller (ControllerInterface): An instance of the ExportUsersController.
+    """
+    if repository is None:
+        repository = UserRepository(db_connection=DBConnectionHandler())
+    export_users_use_case = ExportUsersUseCase(user_repository=repository)
+    export_users_controller = ExportUsersController(export_users_use_case=export_users_use_case)
+    return export_users_controller
@@ -3,16 +3,22 @@ from src.infra.db.settings.connection import DBConnectionHandler
 from src.presenters.controllers import GetUserController
 from src.applications.use_cases.user.get_user import GetUserUseCase
 from src.infra.repositories.user import UserRepository
+from src.domain.repositories.user import UserRepositoryInterface
 
 
-def get_user_composer() -> ControllerInterface:
+def get_user_composer(repository: UserRepositoryInterface = None) -> ControllerInterface:
     """Return a ControllerInterface object for composing user routes.
 
+    Args:
+        repository (UserRepositoryInterface, optional): The user repository to use. A database-backed
+            UserRepository is created when it is not provided.
+
     Returns:
         ControllerInterface: An object that implements the ControllerInterface interface
             for handling user routes.
     """
-    repository = UserRepository(db_connection=DBConnectionHandler())
+    if repository is None:
+        repository = UserRepository(db_connection=DBConnectionHandler())
     get_user_use_case = GetUserUseCase(user_repository=repository)
     get_user_route = GetUserController(get_user_use_case=get_user_use_case)
 
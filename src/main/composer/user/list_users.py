@@ -0,0 +1,24 @@
+from src.applications.use_cases.user.list_users import ListUsersUseCase
+from src.infra.db.settings.connection import DBConnectionHandler
+from src.infra.repositories.user import UserRepository
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.controller import ControllerInterface
+from src.presenters.controllers.user.list_users import ListUsersController
+
+
+def list_users_composer(repository: UserRepositoryInterface = None) -> ControllerInterface:
+    """
+    Compose the necessary components for the user listing route.
+
+    Args:
+        repository (UserRepositoryInterface, optional): The user repository to use. A database-backed
+            UserRepository is created when it is not provided.
+
+    Returns:
+        list_users_controller (ControllerInterface): An instance of the ListUsersController.
+    """
+    if repository is None:
+        repository = UserRepository(db_connection=DBConnectionHandler())
+    list_users_use_case = ListUsersUseCase(user_repository=repository)
+    list_users_controller = ListUsersController(list_users_use_case=list_users_use_case)
+    return list_users_controller
@@ -0,0 +1,24 @@
+from src.applications.use_cases.user.search_users import SearchUsersUseCase
+from src.infra.db.settings.connection import DBConnectionHandler
+from src.infra.repositories.user import UserRepository
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.controller import ControllerInterface
+from src.presenters.controllers.user.search_users import SearchUsersController
+
+
+def search_users_composer(repository: UserRepositoryInterface = None) -> ControllerInterface:
+    """
+    Compose the necessary components for the user search route.
+
+    Args:
+        repository (UserRepositoryInterface, optional): The user repository to use. A database-backed
+            UserRepository is created when it is not provided.
+
+    Returns:
+        search_users_controller (ControllerInterface): An instance of the SearchUsersController.
+    """
+    if repository is None:
+        repository = UserRepository(db_connection=DBConnectionHandler())
+    search_users_use_case = SearchUsersUseCase(user_repository=repository)
+    search_users_controller = SearchUsersController(search_users_use_case=search_users_use_case)
+    return search_users_controller
@@ -0,0 +1,2 @@
+from .container import Container, Lifetime, Provider, RequestScope
+from .providers import build_container
@@ -0,0 +1,289 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+class Lifetime(Enum):
+    """
+    Enum class representing how long an object built by the container lives.
+
+    Attributes:
+        SINGLETON (str): A single instance is built on first use and shared by the whole application.
+        REQUEST (str): A single instance is built per request scope and finalized when the scope ends.
+        TRANSIENT (str): A new instance is built every time it is resolved.
+    """
+
+    SINGLETON = "singleton"
+    REQUEST = "request"
+    TRANSIENT = "transient"
+
+
+@dataclass(frozen=True)
+class Provider:
+    """
+    Describes how the container builds a dependency.
+
+    Attributes:
+        factory (Callable[[Container], Any]): Builds the dependency, resolving its own dependencies from the container.
+        lifetime (Lifetime): How long the built instance lives.
+        finalizer (Callable[[Any], None], optional): Releases the instance when its lifetime ends.
+    """
+
+    factory: Callable[["Container"], Any]
+    lifetime: Lifetime = Lifetime.SINGLETON
+    finalizer: Optional[Callable[[Any], None]] = None
+
+
+@dataclass
+class RequestScope:
+    """
+    Holds the instances built during a single request.
+
+    Attributes:
+        instances (Dict[str, Any]): The request-scoped instances keyed by dependency name.
+        finalizers (List[Tuple[Callable[[Any], None], Any]]): The finalizers to run when the scope ends.
+    """
+
+    instances: Dict[str, Any] = field(default_factory=dict)
+    finalizers: List[Tuple[Callable[[Any], None], Any]] = field(default_factory=list)
+
+    def close(self) -> None:
+        """Run the finalizers of the scope, the most recently built instance first."""
+        while self.finalizers:
+            finalizer, instance = self.finalizers.pop()
+            finalizer(instance)
+
+
+class Container:
+    """
+    Lightweight dependency container.
+
+    The container builds the object graph of the application from registered providers. Singletons
+    are built once and shared, request-scoped instances are built once per `request_scope` and
+    transient instances are built on every resolution. Any provider can be overridden, which lets
+    tests and deployments swap an implementation in a single place.
+
+    The container records which dependencies each instance resolved while it was built, so an
+    override only rebuilds the overridden singleton and the singletons built on it, and finalizes
+    the instances it drops.
+
+    Methods:
+        register(key, factory, lifetime, finalizer): Register the provider of a dependency.
+        resolve(key): Get the instance of a dependency.
+        override(key, factory, lifetime, finalizer): Replace the provider of a dependency.
+        reset_overrides(): Remove every override.
+        request_scope(): Open a request scope.
+        shutdown(): Finalize and forget the singletons.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new, empty Container."""
+        self._providers: Dict[str, Provider] = {}
+        self._overrides: Dict[str, Provider] = {}
+        self._singletons: Dict[str, Tuple[Any, Optional[Callable[[Any], None]]]] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self._lock = threading.RLock()
+        self._request_scope: ContextVar[Optional[RequestScope]] = ContextVar(
+            f"container_request_scope_{id(self)}", default=None
+        )
+        self._building: ContextVar[Tuple[str, ...]] = ContextVar(f"container_building_{id(self)}", default=())
+
+    def register(
+        self,
+        key: str,
+        factory: Callable[["Container"], Any],
+        lifetime: Lifetime = Lifetime.SINGLETON,
+        finalizer: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """
+        Register the provider of a dependency.
+
+        Args:
+            key (str): The name of the dependency.
+            factory (Callable[[Container], Any]): Builds the dependency from the container.
+            lifetime (Lifetime): How long the built instance lives. Defaults to SINGLETON.
+            finalizer (Callable[[Any], None], optional): Releases the instance when its lifetime ends.
+        """
+        self._providers[key] = Provider(factory=factory, lifetime=lifetime, finalizer=finalizer)
+
+    def resolve(self, key: str) -> Any:
+        """
+        Get the instance of a dependency, building it according to its lifetime.
+
+        Args:
+            key (str): The name of the dependency.
+
+        Returns:
+            (Any): The instance of the dependency.
+
+        Raises:
+            KeyError: If no provider is registered for the dependency.
+            RuntimeError: If a request-scoped dependency is resolved outside of a request scope.
+        """
+        provider = self._overrides.get(key) or self._providers.get(key)
+        if provider is None:
+            raise KeyError(f"No provider registered for '{key}'.")
+        building = self._building.get()
+        if building:
+            self._dependents.setdefault(key, set()).add(building[-1])
+        if provider.lifetime is Lifetime.SINGLETON:
+            return self._resolve_singleton(key, provider)
+        if provider.lifetime is Lifetime.REQUEST:
+            return self._resolve_request_scoped(key, provider)
+        return self._build(key, provider)
+
+    def override(
+        self,
+        key: str,
+        factory: Callable[["Container"], Any],
+        lifetime: Lifetime = Lifetime.SINGLETON,
+        finalizer: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """
+        Replace the provider of a dependency until the overrides are reset.
+
+        The singleton of the dependency and the singletons built on it are finalized and dropped,
+        so they are rebuilt with the override. The other singletons are kept.
+
+        Args:
+            key (str): The name of the dependency.
+            factory (Callable[[Container], Any]): Builds the replacement from the container.
+            lifetime (Lifetime): How long the built instance lives. Defaults to SINGLETON.
+            finalizer (Callable[[Any], None], optional): Releases the instance when its lifetime ends.
+        """
+        with self._lock:
+            self._overrides[key] = Provider(factory=factory, lifetime=lifetime, finalizer=finalizer)
+            evicted = self._evict([key])
+        self._finalize(evicted)
+
+    def reset_overrides(self) -> None:
+        """Remove every override, and finalize and drop the singletons built with them."""
+        with self._lock:
+            overridden = list(self._overrides)
+            self._overrides.clear()
+            evicted = self._evict(overridden)
+        self._finalize(evicted)
+
+    @contextmanager
+    def request_scope(self) -> Iterator[RequestScope]:
+        """
+        Open a request scope for the current context.
+
+        Request-scoped dependencies resolved inside the scope are shared until it ends, and their
+        finalizers run when it ends.
+
+        Yields:
+            (RequestScope): The opened request scope.
+        """
+        scope = RequestScope()
+        token = self._request_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            self._request_scope.reset(token)
+            scope.close()
+
+    def shutdown(self) -> None:
+        """Finalize and forget the singletons built by the container."""
+        with self._lock:
+            singletons = list(self._singletons.values())
+            self._singletons.clear()
+        self._finalize(singletons)
+
+    def _evict(self, keys: Iterable[str]) -> List[Tuple[Any, Optional[Callable[[Any], None]]]]:
+        """
+        Drop the singletons of dependencies and of every singleton built on them.
+
+        Args:
+            keys (Iterable[str]): The names of the dependencies.
+
+        Returns:
+            (List[Tuple[Any, Callable[[Any], None] | None]]): The dropped instances with their finalizer, in the order
+                they were built, to be finalized once the lock is released.
+        """
+        with self._lock:
+            stale = set()
+            pending = list(keys)
+            while pending:
+                key = pending.pop()
+                if key not in stale:
+                    stale.add(key)
+                    pending.extend(self._dependents.get(key, ()))
+            return [self._singletons.pop(key) for key in list(self._singletons) if key in stale]
+
+    @staticmethod
+    def _finalize(singletons: List[Tuple[Any, Optional[Callable[[Any], None]]]]) -> None:
+        """
+        Run the finalizers of singletons, the most recently built first.
+
+        Args:
+            singletons (List[Tuple[Any, Callable[[Any], None] | None]]): The instances with the finalizer of the
+                provider that built them, in the order they were built.
+        """
+        for instance, finalizer in reversed(singletons):
+            if finalizer is not None:
+                finalizer(instance)
+
+    def _build(self, key: str, provider: Provider) -> Any:
+        """
+        Build an instance, recording it as the dependent of what its factory resolves.
+
+        Args:
+            key (str): The name of the dependency.
+            provider (Provider): The provider of the dependency.
+
+        Returns:
+            (Any): The new instance.
+        """
+        token = self._building.set(self._building.get() + (key,))
+        try:
+            return provider.factory(self)
+        finally:
+            self._building.reset(token)
+
+    def _resolve_singleton(self, key: str, provider: Provider) -> Any:
+        """
+        Get a singleton, building it on first use.
+
+        Args:
+            key (str): The name of the dependency.
+            provider (Provider): The provider of the dependency.
+
+        Returns:
+            (Any): The singleton instance.
+        """
+        try:
+            return self._singletons[key][0]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._singletons:
+                self._singletons[key] = (self._build(key, provider), provider.finalizer)
+            return self._singletons[key][0]
+
+    def _resolve_request_scoped(self, key: str, provider: Provider) -> Any:
+        """
+        Get a request-scoped instance, building it on first use in the current scope.
+
+        Args:
+            key (str): The name of the dependency.
+            provider (Provider): The provider of the dependency.
+
+        Returns:
+            (Any): The request-scoped instance.
+
+        Raises:
+            RuntimeError: If there is no open request scope.
+        """
+        scope = self._request_scope.get()
+        if scope is None:
+            raise RuntimeError(f"'{key}' is request-scoped and was resolved outside of a request scope.")
+        if key not in scope.instances:
+            instance = self._build(key, provider)
+            scope.instances[key] = instance
+            if provider.finalizer is not None:
+                scope.finalizers.append((provider.finalizer, instance))
+        return scope.instances[key]
@@ -0,0 +1,271 @@
+import os
+from typing import Optional
+
+from src.applications.services.password_hasher import PasswordHasher
+from src.infra.auth import HmacTokenService
+from src.infra.cache import TTLCache
+from src.infra.db.settings.async_connection import AsyncDBConnectionHandler
+from src.infra.db.settings.async_unit_of_work import SqlAlchemyAsyncUnitOfWork
+from src.infra.db.settings.connection import DBConnectionHandler
+from src.infra.db.settings.unit_of_work import SqlAlchemyUnitOfWork
+from src.infra.repositories.async_bloom_filtered_user import AsyncBloomFilteredUserRepository
+from src.infra.repositories.async_cache_invalidating_user import AsyncCacheInvalidatingUserRepository
+from src.infra.repositories.async_single_flight_user import AsyncSingleFlightUserRepository
+from src.infra.repositories.async_user import AsyncUserRepository
+from src.infra.repositories.bloom_filtered_user import BloomFilteredUserRepository, EmailFilter, EmailFilterSettings
+from src.infra.repositories.cached_user import CachedUserRepository, UserCacheSettings
+from src.infra.repositories.revoked_token import RevokedTokenRepository
+from src.infra.repositories.single_flight_user import SingleFlightUserRepository
+from src.infra.repositories.user import UserRepository
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+from src.domain.repositories.user import UserRepositoryInterface
+from src.main.composer.auth import login_composer, logout_composer
+from src.main.composer.user import (
+    async_create_user_composer,
+    async_delete_user_composer,
+    async_get_user_composer,
+    batch_get_users_composer,
+    bulk_create_users_composer,
+    create_user_composer,
+    delete_user_composer,
+    export_users_composer,
+    get_user_composer,
+    list_users_composer,
+    search_users_composer,
+)
+from src.main.container.container import Container, Lifetime
+
+DATA_ACCESS_MODES = ("sync", "async")
+
+
+def stop_email_filter(email_filter: Optional[EmailFilter]) -> None:
+    """
+    Stop the periodic rebuilds of the email filter, if it is enabled.
+
+    Args:
+        email_filter (EmailFilter | None): The email filter, None when it is disabled.
+    """
+    if email_filter is not None:
+        email_filter.stop()
+
+
+def close_user_cache(cache: Optional[TTLCache]) -> None:
+    """
+    Stop the background refreshes of the user cache, if it is enabled.
+
+    Args:
+        cache (TTLCache | None): The user cache, None when it is disabled.
+    """
+    if cache is not None:
+        cache.close()
+
+
+def build_container(
+    data_access_mode: Optional[str] = None,
+    user_cache_settings: Optional[UserCacheSettings] = None,
+    email_filter_settings: Optional[EmailFilterSettings] = None,
+    single_flight: Optional[bool] = None,
+) -> Container:
+    """
+    Build the dependency container of the application.
+
+    The controller, use case and repository graph is registered with a singleton lifetime, so it is
+    built once at startup instead of on every request. The `user_repository` provider is the single
+    place to swap the repository implementation used by every user route, and the `unit_of_work`
+    provider opens the single session and transaction the write use cases run their repository calls in.
+    The `password_hasher` provider owns the process pool the passwords are hashed in, and the `token_service`
+    provider the periodic reloads of the revoked access tokens; both are stopped at shutdown.
+    Unless single-flight is disabled, the concurrent identical lookups of both user repositories share
+    one query. The synchronous repository is then wrapped with CachedUserRepository when the user cache is enabled,
+    and with BloomFilteredUserRepository, built when the repository is first resolved, when the email
+    filter is enabled. The `user_cache` and `email_filter` providers hold the cache and the filter, None
+    when they are disabled, which the asynchronous repository keeps up to date on its writes, since both
+    repositories write the same users.
+
+    The user controllers are served by the blocking SQLAlchemy data path (`sync`, run in the worker
+    threadpool) or by the asyncio data path (`async`, awaited on the event loop), so both can be
+    compared side by side. The bulk import, the export, the listing, the search, the batch lookup and the
+    login always run on the synchronous path; the first two stream rows between the request and the
+    database from worker threads.
+
+    Args:
+        data_access_mode (str, optional): Either `sync` or `async`. Read from the `DATA_ACCESS_MODE`
+            environment variable when omitted, and defaults to `sync`.
+        user_cache_settings (UserCacheSettings, optional): The settings of the user cache. Read from the
+            environment when omitted.
+        email_filter_settings (EmailFilterSettings, optional): The settings of the email filter. Read from
+            the environment when omitted.
+        single_flight (bool, optional): Whether the concurrent identical lookups are coalesced. Read from the
+            `USER_SINGLE_FLIGHT_ENABLED` environment variable when omitted, and enabled by default.
+
+    Returns:
+        container (Container): The container with the application dependencies registered.
+
+    Raises:
+        ValueError: If the data access mode is not supported.
+    """
+    data_access_mode = (data_access_mode or os.getenv("DATA_ACCESS_MODE", "sync")).lower()
+    if data_access_mode not in DATA_ACCESS_MODES:
+        raise ValueError(f"Unsupported data access mode '{data_access_mode}', expected one of {DATA_ACCESS_MODES}.")
+
+    container = Container()
+    container.register("db_connection", lambda _: DBConnectionHandler(), Lifetime.SINGLETON)
+    user_cache_settings = user_cache_settings or UserCacheSettings.from_env()
+    email_filter_settings = email_filter_settings or EmailFilterSettings.from_env()
+    if single_flight is None:
+        single_flight = os.getenv("USER_SINGLE_FLIGHT_ENABLED", "true").lower() in ("1", "true", "yes")
+
+    container.register(
+        "user_cache",
+        lambda _: user_cache_settings.build_cache() if user_cache_settings.enabled else None,
+        Lifetime.SINGLETON,
+        finalizer=close_user_cache,
+    )
+
+    def build_email_filter(c: Container) -> Optional[EmailFilter]:
+        if not email_filter_settings.enabled:
+            return None
+        database_repository = UserRepository(db_connection=c.resolve("db_connection"))
+        email_filter = EmailFilter(email_source=database_repository.iter_emails, settings=email_filter_settings)
+        email_filter.start()
+        return email_filter
+
+    container.register("email_filter", build_email_filter, Lifetime.SINGLETON, finalizer=stop_email_filter)
+
+    def build_user_repository(c: Container) -> UserRepositoryInterface:
+        repository = UserRepository(db_connection=c.resolve("db_connection"))
+        if single_flight:
+            repository = SingleFlightUserRepository(repository=repository)
+        user_cache = c.resolve("user_cache")
+        if user_cache is not None:
+            repository = CachedUserRepository(
+                repository=repository, cache=user_cache, unit_of_work=c.resolve("unit_of_work")
+            )
+        email_filter = c.resolve("email_filter")
+        if email_filter is not None:
+            repository = BloomFilteredUserRepository(
+                repository=repository, email_filter=email_filter, unit_of_work=c.resolve("unit_of_work")
+            )
+        return repository
+
+    container.register("user_repository", build_user_repository, Lifetime.SINGLETON)
+    container.register(
+        "unit_of_work",
+        lambda c: SqlAlchemyUnitOfWork(db_connection=c.resolve("db_connection")),
+        Lifetime.SINGLETON,
+    )
+    container.register("async_db_connection", lambda _: AsyncDBConnectionHandler(), Lifetime.SINGLETON)
+
+    def build_async_user_repository(c: Container) -> AsyncUserRepositoryInterface:
+        repository = AsyncUserRepository(db_connection=c.resolve("async_db_connection"))
+        if single_flight:
+            repository = AsyncSingleFlightUserRepository(repository=repository)
+        user_cache = c.resolve("user_cache")
+        if user_cache is not None:
+            repository = AsyncCacheInvalidatingUserRepository(
+                repository=repository, cache=user_cache, unit_of_work=c.resolve("async_unit_of_work")
+            )
+        email_filter = c.resolve("email_filter")
+        if email_filter is not None:
+            repository = AsyncBloomFilteredUserRepository(
+                repository=repository, email_filter=email_filter, unit_of_work=c.resolve("async_unit_of_work")
+            )
+        return repository
+
+    container.register("async_user_repository", build_async_user_repository, Lifetime.SINGLETON)
+    container.register(
+        "async_unit_of_work",
+        lambda c: SqlAlchemyAsyncUnitOfWork(db_connection=c.resolve("async_db_connection")),
+        Lifetime.SINGLETON,
+    )
+
+    container.register(
+        "password_hasher", lambda _: PasswordHasher(), Lifetime.SINGLETON, finalizer=PasswordHasher.close
+    )
+
+    if data_access_mode == "async":
+        repository_key, unit_of_work_key = "async_user_repository", "async_unit_of_work"
+        create_composer, get_composer, delete_composer = (
+            async_create_user_composer,
+            async_get_user_composer,
+            async_delete_user_composer,
+        )
+    else:
+        repository_key, unit_of_work_key = "user_repository", "unit_of_work"
+        create_composer, get_composer, delete_composer = create_user_composer, get_user_composer, delete_user_composer
+    container.register(
+        "create_user_controller",
+        lambda c: create_composer(
+            repository=c.resolve(repository_key),
+            unit_of_work=c.resolve(unit_of_work_key),
+            password_hasher=c.resolve("password_hasher"),
+        ),
+        Lifetime.SINGLETON,
+    )
+    container.register(
+        "get_user_controller",
+        lambda c: get_composer(repository=c.resolve(repository_key)),
+        Lifetime.SINGLETON,
+    )
+    container.register(
+        "delete_user_controller",
+        lambda c: delete_composer(repository=c.resolve(repository_key), unit_of_work=c.resolve(unit_of_work_key)),
+        Lifetime.SINGLETON,
+    )
+    container.register(
+        "bulk_create_users_controller",
+        lambda c: bulk_create_users_composer(
+            repository=c.resolve("user_repository"),
+            unit_of_work=c.resolve("unit_of_work"),
+            password_hasher=c.resolve("password_hasher"),
+        ),
+        Lifetime.SINGLETON,
+    )
+    container.register(
+        "export_users_controller",
+        lambda c: export_users_composer(repository=c.resolve("user_repository")),
+        Lifetime.SINGLETON,
+    )
+    container.register(
+        "list_users_controller",
+        lambda c: list_users_composer(repository=c.resolve("user_repository")),
+        Lifetime.SINGLETON,
+    )
+    container.register(
+        "search_users_controller",
+        lambda c: search_users_composer(repository=c.resolve("user_repository")),
+        Lifetime.SINGLETON,
+    )
+    container.register(
+        "batch_get_users_controller",
+        lambda c: batch_get_users_composer(repository=c.resolve("user_repository")),
+        Lifetime.SINGLETON,
+    )
+
+    container.register(
+        "revoked_token_repository",
+        lambda c: RevokedTokenRepository(db_connection=c.resolve("db_connection")),
+        Lifetime.SINGLETON,
+    )
+
+    def build_token_service(c: Container) -> HmacTokenService:
+        token_service = HmacTokenService(revoked_token_repository=c.resolve("revoked_token_repository"))
+        token_service.start()
+        return token_service
+
+    container.register("token_service", build_token_service, Lifetime.SINGLETON, finalizer=HmacTokenService.stop)
+    container.register(
+        "login_controller",
+        lambda c: login_composer(
+            repository=c.resolve("user_repository"),
+            password_hasher=c.resolve("password_hasher"),
+            token_service=c.resolve("token_service"),
+        ),
+        Lifetime.SINGLETON,
+    )
+    container.register(
+        "logout_controller",
+        lambda c: logout_composer(token_service=c.resolve("token_service")),
+        Lifetime.SINGLETON,
+    )
+    return container
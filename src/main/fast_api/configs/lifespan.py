@@ -0,0 +1,62 @@
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
+
+from src.infra.db.settings import engine_registry
+from src.infra.metrics import CacheCollector, EmailFilterCollector, metrics_registry
+from src.infra.tracing import tracer
+from src.main.container import build_container
+from src.main.tracing import instrument_layers
+
+STARTUP_DEPENDENCIES = (
+    "create_user_controller",
+    "get_user_controller",
+    "delete_user_controller",
+    "bulk_create_users_controller",
+    "export_users_controller",
+    "list_users_controller",
+    "search_users_controller",
+    "batch_get_users_controller",
+    "login_controller",
+    "logout_controller",
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manage the resources that live as long as the application.
+
+    The dependency container is built at startup and stored in `app.state.container`, so the
+    controller, use case and repository graph is not rebuilt on every request. The controllers are
+    resolved before the first request is accepted, in the threadpool since building them may read
+    the database (the email filter is loaded there). Unless it was configured beforehand, the tracer is
+    configured from the environment, and while tracing is on the loaded controllers, use cases and
+    repositories are traced. The counters of the user cache and of the email filter are exported
+    with the metrics while the application runs. At shutdown the
+    container singletons are finalized and the shared database engines are disposed, so their
+    pooled connections are closed cleanly instead of being dropped with the process.
+
+    Args:
+        app (FastAPI): The FastAPI application.
+    """
+    app.state.container = build_container()
+    for key in STARTUP_DEPENDENCIES:
+        await run_in_threadpool(app.state.container.resolve, key)
+    user_cache = app.state.container.resolve("user_cache")
+    email_filter = app.state.container.resolve("email_filter")
+    collectors = (
+        CacheCollector(lambda: {} if user_cache is None else {"user": user_cache}),
+        EmailFilterCollector(lambda: email_filter),
+    )
+    for collector in collectors:
+        metrics_registry.register_collector(collector)
+    if not tracer.enabled:
+        tracer.configure_from_settings()
+    if tracer.enabled:
+        instrument_layers()
+    yield
+    for collector in collectors:
+        metrics_registry.unregister_collector(collector)
+    app.state.container.shutdown()
+    await engine_registry.dispose_all_async()
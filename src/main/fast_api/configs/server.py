@@ -3,6 +3,16 @@ import os
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from src.main.fast_api.configs.lifespan import lifespan
+from src.main.fast_api.middlewares import (
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    QueryCountMiddleware,
+    RequestScopeMiddleware,
+    TracingMiddleware,
+)
+from src.main.fast_api.responses import ORJSONResponse
+from src.main.fast_api.routers import metrics
 from src.main.fast_api.routers.api_routers import router
 
 
@@ -15,6 +25,8 @@ app = FastAPI(
     version="0.0.1",
     docs_url="/swagger/doc",
     redoc_url="/swagger/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -28,4 +40,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(RequestScopeMiddleware)
+app.add_middleware(QueryCountMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(TracingMiddleware)
+
 app.include_router(router, prefix="/api")
+app.include_router(metrics.router)
@@ -0,0 +1,2 @@
+from .auth import authenticate
+from .container import provide
@@ -0,0 +1,44 @@
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from src.applications.dtos import TokenClaimsDTO
+from src.domain.exceptions import InvalidTokenError
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+async def authenticate(
+    request: Request, credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
+) -> TokenClaimsDTO:
+    """
+    FastAPI dependency that authenticates a request by its `Authorization: Bearer` access token.
+
+    The token is verified in memory by the `token_service` of the application container, so
+    authenticating a request reads neither the users nor a sessions table.
+
+    Args:
+        request (Request): The HTTP request object.
+        credentials (HTTPAuthorizationCredentials, optional): The credentials of the `Authorization` header.
+
+    Returns:
+        (TokenClaimsDTO): The verified claims of the token.
+
+    Raises:
+        HTTPException: A 401 error when the token is missing, malformed, forged, expired or revoked.
+    """
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    try:
+        return request.app.state.container.resolve("token_service").verify(credentials.credentials)
+    except InvalidTokenError as exception:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(exception),
+            headers={"WWW-Authenticate": 'Bearer error="invalid_token"'},
+        )
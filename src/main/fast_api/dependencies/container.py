@@ -0,0 +1,22 @@
+from typing import Any, Callable
+
+from fastapi import Request
+
+
+def provide(key: str) -> Callable[[Request], Any]:
+    """
+    Create a FastAPI dependency that resolves a dependency from the application container.
+
+    The container is built once in the application lifespan and stored in `app.state.container`.
+
+    Args:
+        key (str): The name of the dependency registered in the container.
+
+    Returns:
+        (Callable[[Request], Any]): A dependency callable to use with `Depends`.
+    """
+
+    async def dependency(request: Request) -> Any:
+        return request.app.state.container.resolve(key)
+
+    return dependency
@@ -0,0 +1,5 @@
+from .metrics import MetricsMiddleware
+from .profiling import ProfilingMiddleware, ProfilingSettings
+from .query_count import QueryCountMiddleware, QueryCountSettings
+from .request_scope import RequestScopeMiddleware
+from .tracing import TracingMiddleware
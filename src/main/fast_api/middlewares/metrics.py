@@ -0,0 +1,80 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infra.metrics import metrics_registry
+
+REQUEST_DURATION = metrics_registry.histogram(
+    "http_request_duration_seconds", "Duration of the HTTP requests.", ("method", "route", "status")
+)
+REQUESTS_IN_FLIGHT = metrics_registry.gauge("http_requests_in_flight", "HTTP requests being handled.", ("method",))
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Name the route of a handled request in the metric labels.
+
+    Args:
+        scope (Scope): The ASGI connection scope, once the request is handled.
+
+    Returns:
+        (str): The path template of the API route, such as `/api/users/{user_id}`, the path of the other
+            routes of the application, or `unmatched` when no route matched.
+    """
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    return scope["path"] if "endpoint" in scope else "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware that measures the duration and the concurrency of the HTTP requests.
+
+    The duration is observed in a histogram labelled with the method, the route template and the
+    status of the response, so the label values stay few whatever the paths requested. The
+    metrics are updated on the event loop thread without locks.
+
+    Attributes:
+        app (ASGIApp): The wrapped ASGI application.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Initialize a new instance of MetricsMiddleware.
+
+        Args:
+            app (ASGIApp): The wrapped ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI call, measuring HTTP requests.
+
+        Args:
+            scope (Scope): The ASGI connection scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_flight = REQUESTS_IN_FLIGHT.labels(scope["method"])
+        in_flight.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_flight.dec()
+            REQUEST_DURATION.labels(scope["method"], route_template(scope), str(status)).observe(
+                time.perf_counter() - started_at
+            )
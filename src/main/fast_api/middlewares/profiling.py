@@ -0,0 +1,201 @@
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs
+
+import orjson
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infra.profiling import Profile, to_collapsed, to_speedscope, verify_profile_token
+
+logger = logging.getLogger(__name__)
+
+# The file extension, the media type and the renderer of each profile format.
+FORMATS: Dict[str, Tuple[str, str, Callable[[Profile], bytes]]] = {
+    "speedscope": (".speedscope.json", "application/json", lambda profile: orjson.dumps(to_speedscope(profile))),
+    "collapsed": (".collapsed.txt", "text/plain; charset=utf-8", lambda profile: to_collapsed(profile).encode()),
+}
+
+
+@dataclass(frozen=True)
+class ProfilingSettings:
+    """Settings of the on-demand request profiler.
+
+    Attributes:
+        secret (str): The secret signing the profiling tokens, empty to refuse every token.
+        sample_rate (float): The share of the requests profiled without a token, 0 to disable.
+        interval (float): The number of seconds between two samples of the stack.
+        directory (str): The directory the profiles are written to.
+        path_prefix (str): The prefix of the paths of the requests that may be profiled.
+        format (str): The format of the profiles: `speedscope` or `collapsed` (folded stacks for flame graphs).
+    """
+
+    secret: str = ""
+    sample_rate: float = 0.0
+    interval: float = 0.001
+    directory: str = "profiles"
+    path_prefix: str = "/api/users"
+    format: str = "speedscope"
+
+    @classmethod
+    def from_env(cls) -> "ProfilingSettings":
+        """Build the profiler settings from environment variables.
+
+        The variables `PROFILING_SECRET`, `PROFILING_SAMPLE_RATE`, `PROFILING_INTERVAL`,
+        `PROFILING_DIRECTORY`, `PROFILING_PATH_PREFIX` and `PROFILING_FORMAT` override the defaults
+        when they are set.
+
+        Returns:
+            (ProfilingSettings): The profiler settings read from the environment.
+
+        Raises:
+            ValueError: If the format is not supported.
+        """
+        profile_format = os.getenv("PROFILING_FORMAT", cls.format).lower()
+        if profile_format not in FORMATS:
+            raise ValueError(f"Unsupported profile format '{profile_format}', expected one of {tuple(FORMATS)}.")
+        return cls(
+            secret=os.getenv("PROFILING_SECRET", cls.secret),
+            sample_rate=float(os.getenv("PROFILING_SAMPLE_RATE", cls.sample_rate)),
+            interval=float(os.getenv("PROFILING_INTERVAL", cls.interval)),
+            directory=os.getenv("PROFILING_DIRECTORY", cls.directory),
+            path_prefix=os.getenv("PROFILING_PATH_PREFIX", cls.path_prefix),
+            format=profile_format,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Tell whether any request may be profiled."""
+        return bool(self.secret) or self.sample_rate > 0
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware running a sampling profiler on selected HTTP requests.
+
+    A request is profiled when it carries a token signed with the profiling secret, in the
+    `X-Profile` header or the `profile` query parameter, or when it is drawn in the configured
+    share of the requests. Only the requests under `path_prefix` are considered.
+
+    The profile is written to `directory`. A request carrying a token gets the name of the file in
+    the `X-Profile` response header, or, when it asks for `inline` output in the `X-Profile-Output`
+    header or the `profile_output` query parameter, the profile itself as the response, its
+    status being sent in the `X-Profile-Status` header.
+
+    Attributes:
+        app (ASGIApp): The wrapped ASGI application.
+        settings (ProfilingSettings): The profiler settings.
+    """
+
+    def __init__(self, app: ASGIApp, settings: Optional[ProfilingSettings] = None) -> None:
+        """
+        Initialize a new instance of ProfilingMiddleware.
+
+        Args:
+            app (ASGIApp): The wrapped ASGI application.
+            settings (ProfilingSettings, optional): The profiler settings. Read from the environment when omitted.
+        """
+        self.app = app
+        self.settings = settings or ProfilingSettings.from_env()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI call, profiling the selected HTTP requests.
+
+        Args:
+            scope (Scope): The ASGI connection scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
+        """
+        settings = self.settings
+        if scope["type"] != "http" or not settings.enabled or not scope["path"].startswith(settings.path_prefix):
+            await self.app(scope, receive, send)
+            return
+        token, output = self.read_options(scope)
+        requested = token is not None and verify_profile_token(settings.secret, token)
+        if token is not None and not requested:
+            logger.warning("Refused an invalid or expired profiling token for %s %s.", scope["method"], scope["path"])
+        if not requested and not (settings.sample_rate and random.random() < settings.sample_rate):
+            await self.app(scope, receive, send)
+            return
+
+        inline = requested and output == "inline"
+        extension, media_type, render = FORMATS[settings.format]
+        profile = Profile(f"{scope['method']} {scope['path']}", interval=settings.interval)
+        file_name = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{profile.id}{extension}"
+        status = 500
+
+        async def send_with_profile(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if requested and not inline:
+                    message["headers"] = [*message.get("headers", []), (b"x-profile", file_name.encode())]
+            if not inline:
+                await send(message)
+
+        with profile:
+            await self.app(scope, receive, send_with_profile)
+
+        if not inline:
+            try:
+                content = await run_in_threadpool(render, profile)
+                await run_in_threadpool(self.write, file_name, content)
+            except Exception:
+                # The response is already sent: a failed profile must not fail the request.
+                logger.exception("Could not write the profile of %s %s.", scope["method"], scope["path"])
+            return
+        content = await run_in_threadpool(render, profile)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", media_type.encode()),
+                    (b"content-length", str(len(content)).encode()),
+                    (b"x-profile-status", str(status).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": content})
+
+    @staticmethod
+    def read_options(scope: Scope) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Read the profiling token and the requested output of a request.
+
+        Args:
+            scope (Scope): The ASGI connection scope.
+
+        Returns:
+            (Tuple[str | None, str | None]): The token and the output, from the headers or else the query string.
+        """
+        token = output = None
+        for name, value in scope["headers"]:
+            if name == b"x-profile":
+                token = value.decode("latin-1")
+            elif name == b"x-profile-output":
+                output = value.decode("latin-1").lower()
+        if token is None and b"profile" in scope["query_string"]:
+            query = parse_qs(scope["query_string"].decode("latin-1"))
+            token = query.get("profile", [None])[0]
+            output = output or query.get("profile_output", [""])[0].lower() or None
+        return token, output
+
+    def write(self, file_name: str, content: bytes) -> None:
+        """
+        Write a profile to the profile directory, creating it if needed.
+
+        Args:
+            file_name (str): The name of the profile file.
+            content (bytes): The rendered profile.
+        """
+        os.makedirs(self.settings.directory, exist_ok=True)
+        path = os.path.join(self.settings.directory, file_name)
+        with open(path, "wb") as file:
+            file.write(content)
+        logger.info("Profile of the request written to %s.", path)
@@ -0,0 +1,107 @@
+import logging
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infra.db.settings import track_queries
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class QueryCountSettings:
+    """Settings of the per-request SQL statement counter.
+
+    Attributes:
+        expose_headers (bool): Whether the responses carry the `X-DB-Queries` and `X-DB-Time` headers, in
+            debug mode only.
+        repeated_statement_threshold (int): The number of executions of one statement during a request
+            from which it is logged as a likely N+1 query.
+    """
+
+    expose_headers: bool = False
+    repeated_statement_threshold: int = 5
+
+    @classmethod
+    def from_env(cls) -> "QueryCountSettings":
+        """Build the statement counter settings from environment variables.
+
+        The headers are exposed when `DEBUG` is set to a true value, and `DB_QUERY_REPEAT_THRESHOLD`
+        overrides the default threshold when it is set.
+
+        Returns:
+            (QueryCountSettings): The statement counter settings read from the environment.
+        """
+        return cls(
+            expose_headers=os.getenv("DEBUG", str(cls.expose_headers)).lower() in ("1", "true", "yes"),
+            repeated_statement_threshold=int(os.getenv("DB_QUERY_REPEAT_THRESHOLD", cls.repeated_statement_threshold)),
+        )
+
+
+class QueryCountMiddleware:
+    """
+    ASGI middleware that counts the SQL statements and the database time of every HTTP request.
+
+    The counts are logged at the DEBUG level once the response is sent, and a statement executed
+    `repeated_statement_threshold` times or more is logged as a warning, since it is usually a
+    query run once per item of a list. In debug mode the response carries the counts in the
+    `X-DB-Queries` and `X-DB-Time` (milliseconds) headers; for a streamed response they cover the
+    statements executed before its headers were sent.
+
+    Attributes:
+        app (ASGIApp): The wrapped ASGI application.
+        settings (QueryCountSettings): The statement counter settings.
+    """
+
+    def __init__(self, app: ASGIApp, settings: Optional[QueryCountSettings] = None) -> None:
+        """
+        Initialize a new instance of QueryCountMiddleware.
+
+        Args:
+            app (ASGIApp): The wrapped ASGI application.
+            settings (QueryCountSettings, optional): The statement counter settings. Read from the environment
+                when omitted.
+        """
+        self.app = app
+        self.settings = settings or QueryCountSettings.from_env()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI call, tracking the statements executed for HTTP requests.
+
+        Args:
+            scope (Scope): The ASGI connection scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with track_queries() as stats:
+            if self.settings.expose_headers:
+
+                async def send_with_counts(message: Message) -> None:
+                    if message["type"] == "http.response.start":
+                        headers = MutableHeaders(scope=message)
+                        headers["X-DB-Queries"] = str(stats.count)
+                        headers["X-DB-Time"] = f"{stats.duration * 1e3:.3f}"
+                    await send(message)
+
+                await self.app(scope, receive, send_with_counts)
+            else:
+                await self.app(scope, receive, send)
+
+        logger.debug(
+            "%s %s ran %d queries in %.3f ms", scope["method"], scope["path"], stats.count, stats.duration * 1e3
+        )
+        for statement, count in stats.repeated_statements(self.settings.repeated_statement_threshold):
+            logger.warning(
+                "%s %s ran the same statement %d times, a likely N+1 query: %s",
+                scope["method"],
+                scope["path"],
+                count,
+                statement,
+            )
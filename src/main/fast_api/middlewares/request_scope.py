@@ -0,0 +1,37 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class RequestScopeMiddleware:
+    """
+    ASGI middleware that opens a container request scope around every HTTP request.
+
+    Request-scoped dependencies resolved while handling the request are shared during the request
+    and finalized once the response has been sent.
+
+    Attributes:
+        app (ASGIApp): The wrapped ASGI application.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Initialize a new instance of RequestScopeMiddleware.
+
+        Args:
+            app (ASGIApp): The wrapped ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI call, opening a request scope for HTTP requests.
+
+        Args:
+            scope (Scope): The ASGI connection scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with scope["app"].state.container.request_scope():
+            await self.app(scope, receive, send)
@@ -0,0 +1,66 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infra.tracing import SpanKind, parse_traceparent, tracer
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware that starts the server span of every HTTP request.
+
+    The span continues the trace of the caller when the request carries the W3C `traceparent`
+    and `tracestate` headers, and follows the sampling decision of the caller. It is named after
+    the method and the route template once the request is routed, such as
+    `GET /api/users/{user_id}`. The middleware does nothing while tracing is off.
+
+    Attributes:
+        app (ASGIApp): The wrapped ASGI application.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Initialize a new instance of TracingMiddleware.
+
+        Args:
+            app (ASGIApp): The wrapped ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI call, tracing HTTP requests.
+
+        Args:
+            scope (Scope): The ASGI connection scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
+        """
+        if scope["type"] != "http" or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+        headers = {name: value for name, value in scope["headers"] if name in (b"traceparent", b"tracestate")}
+        parent = parse_traceparent(
+            headers.get(b"traceparent", b"").decode("latin-1"), headers.get(b"tracestate", b"").decode("latin-1")
+        )
+        method = scope["method"]
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        with tracer.start_as_current_span(
+            method,
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+            parent=parent,
+        ) as span:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    span.update_name(f"{method} {route.path}")
+                    span.set_attribute("http.route", route.path)
+                span.set_attribute("http.response.status_code", status)
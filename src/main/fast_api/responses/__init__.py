@@ -0,0 +1,3 @@
+from .orjson_response import ORJSONResponse
+from .auth import encode_access_token
+from .user import encode_default_response, encode_user
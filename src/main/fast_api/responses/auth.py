@@ -0,0 +1,16 @@
+from typing import Any, Dict
+
+from src.applications.dtos import AccessTokenDTO
+
+
+def encode_access_token(token: AccessTokenDTO) -> Dict[str, Any]:
+    """
+    Build the `AccessToken` representation of an issued token straight from its DTO.
+
+    Args:
+        token (AccessTokenDTO): The token to encode.
+
+    Returns:
+        (Dict[str, Any]): The fields of `AccessToken`.
+    """
+    return {"access_token": token.access_token, "token_type": token.token_type, "expires_at": token.expires_at}
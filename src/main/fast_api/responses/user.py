@@ -0,0 +1,32 @@
+from typing import Any, Dict
+
+from src.applications.dtos import UserDTO
+
+
+def encode_user(user: UserDTO) -> Dict[str, Any]:
+    """
+    Build the `UserOut` representation of a user straight from its DTO.
+
+    The routes return this dictionary instead of a `UserOut` model, so the user is not validated a
+    second time on its way out: the fields come from the database and already have the right types.
+
+    Args:
+        user (UserDTO): The user to encode.
+
+    Returns:
+        (Dict[str, Any]): The fields of `UserOut`, without the password.
+    """
+    return {"name": user.name, "email": user.email, "id": user.id, "created_at": user.created_at}
+
+
+def encode_default_response(user: UserDTO) -> Dict[str, Any]:
+    """
+    Build the `DefaultResponse` representation of a user straight from its DTO.
+
+    Args:
+        user (UserDTO): The user to encode.
+
+    Returns:
+        (Dict[str, Any]): The fields of `DefaultResponse`.
+    """
+    return {"type": "Users", "attributes": encode_user(user)}
@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 
+from src.main.fast_api.routers import auth
 from src.main.fast_api.routers import users
 from src.main.fast_api.routers import swagger_api
 
@@ -7,3 +8,4 @@ router = APIRouter()
 
 router.include_router(swagger_api.router, prefix="", tags=["Swagger Redirect"])
 router.include_router(users.router, prefix="/users", tags=["User"])
+router.include_router(auth.router, prefix="/auth", tags=["Auth"])
@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Depends, status, Request, HTTPException
+
+from src.applications.dtos import TokenClaimsDTO
+from src.domain.controller import ControllerInterface
+from src.main.adapter import fast_api_adapter
+from src.main.fast_api.dependencies import authenticate, provide
+from src.main.fast_api.responses import ORJSONResponse, encode_access_token
+from src.main.fast_api.schemas import AccessToken, LoginRequest
+
+router = APIRouter()
+
+
+@router.post(
+    "/login",
+    status_code=status.HTTP_200_OK,
+    summary="Log in",
+    description=(
+        "Check the email and the password of a user and issue a signed access token, to send in the "
+        "`Authorization: Bearer` header of the authenticated requests until it expires."
+    ),
+    response_model=AccessToken,
+)
+async def login(
+    credentials: LoginRequest,
+    request: Request,
+    controller: ControllerInterface = Depends(provide("login_controller")),
+):
+    """
+    Log a user in.
+
+    The password is checked in the password hashing processes, so the check does not hold the
+    request workers or the event loop.
+
+    Args:
+        credentials (LoginRequest): The email and the password of the user.
+        request (Request): The HTTP request object.
+        controller (ControllerInterface): The controller built once by the application container.
+
+    Returns:
+        (ORJSONResponse): The access token, shaped as `AccessToken` and encoded from the DTO without revalidation.
+    """
+    response = await fast_api_adapter(request=request, api_route=controller, model=credentials)
+    if response.status_code != status.HTTP_200_OK:
+        raise HTTPException(
+            status_code=response.status_code, detail=response.body, headers={"WWW-Authenticate": "Bearer"}
+        )
+
+    return ORJSONResponse(encode_access_token(response.body))
+
+
+@router.post(
+    "/logout",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Log out",
+    description="Revoke the access token the request is authenticated with.",
+)
+async def logout(
+    request: Request,
+    claims: TokenClaimsDTO = Depends(authenticate),
+    controller: ControllerInterface = Depends(provide("logout_controller")),
+):
+    """
+    Log a user out by revoking their access token.
+
+    Args:
+        request (Request): The HTTP request object.
+        claims (TokenClaimsDTO): The verified claims of the access token.
+        controller (ControllerInterface): The controller built once by the application container.
+    """
+    response = await fast_api_adapter(request=request, api_route=controller, body={"claims": claims})
+    if response.status_code != status.HTTP_200_OK:
+        raise HTTPException(status_code=response.status_code, detail=response.body)
@@ -0,0 +1,30 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from src.infra.db.settings import engine_registry
+from src.infra.metrics import CONTENT_TYPE, PoolCollector, metrics_registry
+
+router = APIRouter()
+
+metrics_registry.register_collector(PoolCollector(engine_registry.engines))
+
+
+@router.get(
+    "/metrics",
+    summary="Metrics",
+    description="The metrics of this worker process in the Prometheus text format.",
+    response_class=Response,
+    include_in_schema=False,
+)
+def metrics():
+    """
+    Expose the metrics in the Prometheus text format.
+
+    The request durations and concurrency, the use case outcomes, the state of the database
+    connection pools and the counters of the user cache and of the email filter are those of the
+    worker process that answers, so each worker is scraped on its own.
+
+    Returns:
+        (Response): The metrics, with the Prometheus text format content type.
+    """
+    return Response(metrics_registry.render(), headers={"Content-Type": CONTENT_TYPE})
@@ -1,8 +1,21 @@
-from fastapi import APIRouter, status, Request, HTTPException
+from typing import Union
 
-from src.main.adapter import fast_api_adapter
-from src.main.composer.user import get_user_composer, create_user_composer, delete_user_composer
-from src.main.fast_api.schemas import UserCreate, UserOut, DefaultResponse
+from fastapi import APIRouter, Depends, status, Request, HTTPException
+from fastapi.responses import StreamingResponse
+
+from src.domain.controller import AsyncControllerInterface, ControllerInterface
+from src.main.adapter import fast_api_adapter, read_user_records
+from src.main.fast_api.dependencies import provide
+from src.main.fast_api.responses import ORJSONResponse, encode_default_response, encode_user
+from src.main.fast_api.schemas import (
+    BulkCreateReport,
+    DefaultResponse,
+    UserBatchLookup,
+    UserBatchResult,
+    UserCreate,
+    UserPage,
+    UserSearchResult,
+)
 
 router = APIRouter()
 
@@ -14,7 +27,11 @@ router = APIRouter()
     description="Create a new user with the provided data in the request body.",
     response_model=DefaultResponse,
 )
-def create_user(user: UserCreate, request: Request):
+async def create_user(
+    user: UserCreate,
+    request: Request,
+    controller: Union[ControllerInterface, AsyncControllerInterface] = Depends(provide("create_user_controller")),
+):
     """
     Create a new user.
 
@@ -24,22 +41,100 @@ def create_user(user: UserCreate, request: Request):
     Args:
         user (UserCreate): The user creation data from the request body.
         request (Request): The HTTP request object.
+        controller (ControllerInterface | AsyncControllerInterface): The controller built once by the application
+            container.
 
     Returns:
-        (dict): A dictionary containing the details of the created user.
+        (ORJSONResponse): The details of the created user, encoded from the DTO without revalidation.
     """
-    request.json = user.__dict__
-    response = fast_api_adapter(request=request, api_route=create_user_composer())
+    response = await fast_api_adapter(request=request, api_route=controller, model=user)
     if response.status_code != status.HTTP_201_CREATED:
         raise HTTPException(status_code=response.status_code, detail=response.body)
 
-    user_out = UserOut(
-        id=response.body.id,
-        email=response.body.email,
-        name=response.body.name,
-        created_at=response.body.created_at,
+    return ORJSONResponse(encode_default_response(response.body), status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    summary="Import users in bulk",
+    description=(
+        "Create many users from a JSON array, or from NDJSON (one user per line) streamed with the "
+        "`application/x-ndjson` content type. Every row is validated on its own, and the report lists "
+        "the created users and the rows that failed."
+    ),
+    response_model=BulkCreateReport,
+)
+async def bulk_create_users(
+    request: Request,
+    controller: ControllerInterface = Depends(provide("bulk_create_users_controller")),
+):
+    """
+    Import users in bulk.
+
+    The rows are inserted in batches as they are read, so an NDJSON import is streamed from the
+    request body to the database. A row fails when it is not valid, or when its email is already
+    taken by an existing user or by an earlier row of the import.
+
+    Args:
+        request (Request): The HTTP request object.
+        controller (ControllerInterface): The controller built once by the application container.
+
+    Returns:
+        (dict): The report of the import, with the created users and the failed rows.
+    """
+    try:
+        records = await read_user_records(request)
+    except ValueError as exception:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exception))
+    response = await fast_api_adapter(request=request, api_route=controller, body=records)
+    if response.status_code != status.HTTP_200_OK:
+        raise HTTPException(status_code=response.status_code, detail=response.body)
+
+    return response.body
+
+
+@router.post(
+    "/batch",
+    status_code=status.HTTP_200_OK,
+    summary="Get users in batch",
+    description=(
+        "Resolve up to 1000 users by ID (`ids`) and by email (`emails`) in one request. The users found are "
+        "keyed by the requested identifier, and the identifiers no user has are listed as missing."
+    ),
+    response_model=UserBatchResult,
+)
+async def batch_get_users(
+    lookup: UserBatchLookup,
+    request: Request,
+    controller: ControllerInterface = Depends(provide("batch_get_users_controller")),
+):
+    """
+    Resolve many users in one request.
+
+    The IDs and the emails are each looked up with one `IN (...)` query per chunk of identifiers,
+    instead of one request and one query per user.
+
+    Args:
+        lookup (UserBatchLookup): The identifiers of the users from the request body.
+        request (Request): The HTTP request object.
+        controller (ControllerInterface): The controller built once by the application container.
+
+    Returns:
+        (ORJSONResponse): The users found and the missing identifiers, shaped as `UserBatchResult`.
+    """
+    response = await fast_api_adapter(request=request, api_route=controller, model=lookup)
+    if response.status_code != status.HTTP_200_OK:
+        raise HTTPException(status_code=response.status_code, detail=response.body)
+
+    return ORJSONResponse(
+        {
+            "users_by_id": {user_id: encode_user(user) for user_id, user in response.body["users_by_id"].items()},
+            "users_by_email": {email: encode_user(user) for email, user in response.body["users_by_email"].items()},
+            "missing_ids": response.body["missing_ids"],
+            "missing_emails": response.body["missing_emails"],
+        }
     )
-    return DefaultResponse(type="Users", attributes=user_out)
 
 
 @router.get(
@@ -47,8 +142,12 @@ def create_user(user: UserCreate, request: Request):
     status_code=status.HTTP_200_OK,
     summary="Get user by email",
     description="Retrieve a user by their email.",
+    response_model=DefaultResponse,
 )
-def get_user(request: Request):
+async def get_user(
+    request: Request,
+    controller: Union[ControllerInterface, AsyncControllerInterface] = Depends(provide("get_user_controller")),
+):
     """
     Retrieve a user by their email.
 
@@ -56,21 +155,127 @@ def get_user(request: Request):
 
     Args:
         request (Request): The HTTP request object.
+        controller (ControllerInterface | AsyncControllerInterface): The controller built once by the application
+            container.
+
+    Returns:
+        (ORJSONResponse): The details of the retrieved user, encoded from the DTO without revalidation.
+    """
+    response = await fast_api_adapter(request=request, api_route=controller)
+    if response.status_code != status.HTTP_200_OK:
+        raise HTTPException(status_code=response.status_code, detail=response.body)
+
+    return ORJSONResponse(encode_default_response(response.body))
+
+
+@router.get(
+    "/list",
+    status_code=status.HTTP_200_OK,
+    summary="List users",
+    description=(
+        "Page through the users in ID order. Pass the `next_cursor` of a page as `cursor` (or the ID of its "
+        "last user as `after_id`) to get the next one, `limit` to size the page, and `include_total=true` "
+        "for an estimate of the number of users."
+    ),
+    response_model=UserPage,
+)
+async def list_users(
+    request: Request,
+    controller: ControllerInterface = Depends(provide("list_users_controller")),
+):
+    """
+    List users with keyset pagination.
+
+    A page is read from the primary key index right after the last user of the previous page, so
+    the cost of a page does not grow with its depth.
+
+    Args:
+        request (Request): The HTTP request object.
+        controller (ControllerInterface): The controller built once by the application container.
+
+    Returns:
+        (ORJSONResponse): The users of the page and the cursor of the next page, shaped as `UserPage`.
+    """
+    response = await fast_api_adapter(request=request, api_route=controller)
+    if response.status_code != status.HTTP_200_OK:
+        raise HTTPException(status_code=response.status_code, detail=response.body)
+
+    return ORJSONResponse(
+        {
+            "users": [encode_user(user) for user in response.body["users"]],
+            "next_cursor": response.body["next_cursor"],
+            "total_estimate": response.body["total_estimate"],
+        }
+    )
+
+
+@router.get(
+    "/search",
+    status_code=status.HTTP_200_OK,
+    summary="Search users",
+    description=(
+        "Find the users whose name or email contains the `q` text, case-insensitively. Users whose name or "
+        "email starts with the text come first, then the closest matches. `limit` caps the number of results."
+    ),
+    response_model=UserSearchResult,
+)
+async def search_users(
+    request: Request,
+    controller: ControllerInterface = Depends(provide("search_users_controller")),
+):
+    """
+    Search users by name or email.
+
+    The search is served by trigram indexes (pg_trgm on PostgreSQL, an FTS5 trigram table on SQLite),
+    so substring lookups do not scan the users table.
+
+    Args:
+        request (Request): The HTTP request object.
+        controller (ControllerInterface): The controller built once by the application container.
+
+    Returns:
+        (ORJSONResponse): The matching users, shaped as `UserSearchResult`.
+    """
+    response = await fast_api_adapter(request=request, api_route=controller)
+    if response.status_code != status.HTTP_200_OK:
+        raise HTTPException(status_code=response.status_code, detail=response.body)
+
+    return ORJSONResponse({"users": [encode_user(user) for user in response.body]})
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    summary="Export every user",
+    description="Stream every user, without their password, as NDJSON (`format=ndjson`, the default) or CSV (`format=csv`).",
+    response_class=StreamingResponse,
+)
+async def export_users(
+    request: Request,
+    controller: ControllerInterface = Depends(provide("export_users_controller")),
+):
+    """
+    Export every user.
+
+    The users are read from the database in batches through a server-side cursor and written to the
+    response as they are read, so the memory used by an export does not grow with the number of users.
+
+    Args:
+        request (Request): The HTTP request object.
+        controller (ControllerInterface): The controller built once by the application container.
 
     Returns:
-        (dict): A dictionary containing the details of the retrieved user.
+        (StreamingResponse): The streamed export.
     """
-    response = fast_api_adapter(request=request, api_route=get_user_composer())
+    response = await fast_api_adapter(request=request, api_route=controller)
     if response.status_code != status.HTTP_200_OK:
         raise HTTPException(status_code=response.status_code, detail=response.body)
 
-    user_out = UserOut(
-        id=response.body.id,
-        email=response.body.email,
-        name=response.body.name,
-        created_at=response.body.created_at,
+    return StreamingResponse(
+        response.body["content"],
+        media_type=response.body["media_type"],
+        headers={"Content-Disposition": f'attachment; filename="users.{response.body["format"]}"'},
     )
-    return DefaultResponse(type="Users", attributes=user_out)
 
 
 @router.delete(
@@ -79,7 +284,10 @@ def get_user(request: Request):
     summary="Delete user by ID",
     description="Delete a user by their ID.",
 )
-def delete_user(request: Request):
+async def delete_user(
+    request: Request,
+    controller: Union[ControllerInterface, AsyncControllerInterface] = Depends(provide("delete_user_controller")),
+):
     """
     Delete a user by their ID.
 
@@ -87,11 +295,13 @@ def delete_user(request: Request):
 
     Args:
         request (Request): The HTTP request object.
+        controller (ControllerInterface | AsyncControllerInterface): The controller built once by the application
+            container.
 
     Returns:
         (dict): Returns a dictionary with a message indicating success or failure
     """
-    response = fast_api_adapter(request=request, api_route=delete_user_composer())
+    response = await fast_api_adapter(request=request, api_route=controller)
     if response.status_code != status.HTTP_200_OK:
         raise HTTPException(status_code=response.status_code, detail=response.body)
 
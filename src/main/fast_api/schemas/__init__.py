@@ -2,3 +2,9 @@ from .user.user_base import User, UserBase
 from .user.user_create import UserCreate
 from .user.user_out import UserOut
 from .user.default_response import DefaultResponse
+from .user.bulk_create_report import BulkCreateReport, BulkCreatedUser, BulkFailedRow
+from .user.user_page import UserPage
+from .user.user_search_result import UserSearchResult
+from .user.user_batch import UserBatchLookup, UserBatchResult
+from .auth.login_request import LoginRequest
+from .auth.access_token import AccessToken
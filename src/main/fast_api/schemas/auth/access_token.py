@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class AccessToken(BaseModel):
+    """
+    Schema for an issued access token.
+
+    Attributes:
+        access_token (str): The signed token, sent back in the `Authorization: Bearer` header.
+        token_type (str): The scheme the token is presented with, `bearer`.
+        expires_at (datetime): When the token expires.
+    """
+
+    access_token: str
+    token_type: str
+    expires_at: datetime
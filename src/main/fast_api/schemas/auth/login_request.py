@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+
+class LoginRequest(BaseModel):
+    """
+    Schema for the credentials of a login.
+
+    Attributes:
+        email (str): The email of the user.
+        password (str): The password of the user.
+    """
+
+    email: str
+    password: str
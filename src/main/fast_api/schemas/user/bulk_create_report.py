@@ -0,0 +1,50 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class BulkCreatedUser(BaseModel):
+    """
+    Pydantic schema representing a user created by a bulk import.
+
+    Attributes:
+        row (int): The number of the row in the import, starting at 1.
+        id (int): The ID of the created user.
+        email (str): The email of the created user.
+    """
+
+    row: int
+    id: int
+    email: str
+
+
+class BulkFailedRow(BaseModel):
+    """
+    Pydantic schema representing a row of a bulk import that was not created.
+
+    Attributes:
+        row (int): The number of the row in the import, starting at 1.
+        email (str, optional): The email of the row, when it could be read.
+        error (str): The reason the row was not created.
+    """
+
+    row: int
+    email: Optional[str] = None
+    error: str
+
+
+class BulkCreateReport(BaseModel):
+    """
+    Pydantic schema representing the report of a bulk import.
+
+    Attributes:
+        created_count (int): The number of created users.
+        failed_count (int): The number of rows that were not created.
+        created (List[BulkCreatedUser]): The created users.
+        failed (List[BulkFailedRow]): The rows that were not created.
+    """
+
+    created_count: int
+    failed_count: int
+    created: List[BulkCreatedUser]
+    failed: List[BulkFailedRow]
@@ -0,0 +1,35 @@
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+from src.main.fast_api.schemas.user.user_out import UserOut
+
+
+class UserBatchLookup(BaseModel):
+    """
+    Pydantic schema representing a batch lookup of users.
+
+    Attributes:
+        ids (List[int]): The IDs of the users to resolve.
+        emails (List[str]): The emails of the users to resolve.
+    """
+
+    ids: List[int] = []
+    emails: List[str] = []
+
+
+class UserBatchResult(BaseModel):
+    """
+    Pydantic schema representing the result of a batch lookup of users.
+
+    Attributes:
+        users_by_id (Dict[int, UserOut]): The users found, keyed by requested ID.
+        users_by_email (Dict[str, UserOut]): The users found, keyed by requested email.
+        missing_ids (List[int]): The requested IDs no user has.
+        missing_emails (List[str]): The requested emails no user has.
+    """
+
+    users_by_id: Dict[int, UserOut]
+    users_by_email: Dict[str, UserOut]
+    missing_ids: List[int]
+    missing_emails: List[str]
@@ -0,0 +1,20 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from src.main.fast_api.schemas.user.user_out import UserOut
+
+
+class UserPage(BaseModel):
+    """
+    Pydantic schema representing a page of users.
+
+    Attributes:
+        users (List[UserOut]): The users of the page, in ID order.
+        next_cursor (str, optional): The cursor of the next page, None on the last page.
+        total_estimate (int, optional): The estimated number of users, when it was requested.
+    """
+
+    users: List[UserOut]
+    next_cursor: Optional[str] = None
+    total_estimate: Optional[int] = None
@@ -0,0 +1,16 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from src.main.fast_api.schemas.user.user_out import UserOut
+
+
+class UserSearchResult(BaseModel):
+    """
+    Pydantic schema representing the result of a user search.
+
+    Attributes:
+        users (List[UserOut]): The matching users, best matches first.
+    """
+
+    users: List[UserOut]
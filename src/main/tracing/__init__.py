@@ -0,0 +1 @@
+from .layers import instrument_layers, uninstrument_layers
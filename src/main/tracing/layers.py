@@ -0,0 +1,124 @@
+import functools
+import importlib
+import inspect
+import pkgutil
+from typing import Callable, Dict, Iterator, Tuple
+
+from src.infra.tracing import current_span, tracer
+
+# The packages of the interfaces whose implementations are traced, by layer.
+LAYER_PACKAGES = {
+    "controller": "src.domain.controller",
+    "use_case": "src.domain.use_cases",
+    "repository": "src.domain.repositories",
+}
+
+_originals: Dict[Tuple[type, str], Callable] = {}
+
+
+def layer_interfaces() -> Iterator[Tuple[str, type]]:
+    """
+    List the abstract interfaces of the traced layers.
+
+    Yields:
+        (Tuple[str, type]): The layer and the interface, for every abstract class defined in the
+            modules of `LAYER_PACKAGES`.
+    """
+    for layer, package_name in LAYER_PACKAGES.items():
+        package = importlib.import_module(package_name)
+        modules = [package]
+        if hasattr(package, "__path__"):
+            modules += [
+                importlib.import_module(module.name)
+                for module in pkgutil.walk_packages(package.__path__, f"{package_name}.")
+                if not module.ispkg
+            ]
+        for module in modules:
+            for value in vars(module).values():
+                if inspect.isclass(value) and inspect.isabstract(value) and value.__module__ == module.__name__:
+                    yield layer, value
+
+
+def implementations(interface: type) -> Iterator[type]:
+    """
+    List the loaded concrete classes implementing an interface.
+
+    Args:
+        interface (type): The interface.
+
+    Yields:
+        (type): Every concrete subclass, however indirect.
+    """
+    for subclass in interface.__subclasses__():
+        if not inspect.isabstract(subclass):
+            yield subclass
+        yield from implementations(subclass)
+
+
+def traced(function: Callable, name: str, layer: str) -> Callable:
+    """
+    Wrap a method in a span, started only inside a trace.
+
+    Calls made outside of a request, such as the background refreshes, start no trace of their own.
+
+    Args:
+        function (Callable): The method.
+        name (str): The name of the span, such as `GetUserUseCase.get_user_by_email`.
+        layer (str): The layer of the method.
+
+    Returns:
+        (Callable): The wrapped method, a coroutine function when the method is one.
+    """
+    attributes = {"code.namespace": name.rsplit(".", 1)[0], "code.function": function.__name__, "app.layer": layer}
+
+    if inspect.iscoroutinefunction(function):
+
+        @functools.wraps(function)
+        async def async_wrapper(*args, **kwargs):
+            if current_span() is None:
+                return await function(*args, **kwargs)
+            with tracer.start_as_current_span(name, attributes=attributes):
+                return await function(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if current_span() is None:
+            return function(*args, **kwargs)
+        with tracer.start_as_current_span(name, attributes=attributes):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+def instrument_layers() -> None:
+    """
+    Trace the methods of the loaded controllers, use cases and repositories.
+
+    Each method of an interface of `LAYER_PACKAGES` is wrapped, on every loaded class that
+    implements it, so the code of the layers is left untouched and nothing is wrapped while tracing
+    is off. The generator methods, whose work happens after they return, are left out. The classes
+    must be loaded first, by building the dependency container. Instrumenting again only wraps the
+    classes loaded since.
+    """
+    for layer, interface in layer_interfaces():
+        for cls in implementations(interface):
+            for method_name in interface.__abstractmethods__:
+                function = vars(cls).get(method_name)
+                if (
+                    (cls, method_name) in _originals
+                    or not inspect.isfunction(function)
+                    or inspect.isgeneratorfunction(function)
+                    or inspect.isasyncgenfunction(function)
+                ):
+                    continue
+                _originals[(cls, method_name)] = function
+                setattr(cls, method_name, traced(function, f"{cls.__name__}.{method_name}", layer))
+
+
+def uninstrument_layers() -> None:
+    """Restore the methods wrapped by `instrument_layers`."""
+    while _originals:
+        (cls, method_name), function = _originals.popitem()
+        setattr(cls, method_name, function)
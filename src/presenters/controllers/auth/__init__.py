@@ -0,0 +1,2 @@
+from .login import LoginController
+from .logout import LogoutController
@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from src.domain.use_cases.auth.login import LoginUseCaseInterface
+from src.domain.controller import ControllerInterface
+from src.presenters.helpers.http_types import HttpRequest, HttpResponse, HttpErrors, HttpSuccess
+
+
+@dataclass
+class LoginController(ControllerInterface):
+    """
+    A controller for logging users in.
+
+    This controller handles HTTP requests carrying the email and the password of a user, and
+    answers with an access token. It utilizes the LoginUseCase to check the credentials.
+
+    Attributes:
+        login_use_case (LoginUseCaseInterface): An instance of the LoginUseCaseInterface responsible
+            for checking the credentials and issuing the tokens.
+    """
+
+    login_use_case: LoginUseCaseInterface
+
+    def route(self, http_request: HttpRequest) -> HttpResponse:
+        """
+        Handle the incoming HTTP request and issue an access token if the credentials are right.
+
+        Args:
+            http_request (HttpRequest): The incoming HTTP request object.
+
+        Returns:
+            HttpResponse: A 200 response with the access token, a 401 response when the credentials
+                are wrong, or a 422 response when the body misses a field.
+        """
+        credentials = self.credentials_from_request(http_request)
+        if credentials is None:
+            http_error = HttpErrors.error_422()
+            return HttpResponse(status_code=http_error["status_code"], body=http_error["body"])
+        response = self.login_use_case.login(*credentials)
+        if response["success"] is False:
+            http_error = HttpErrors.error_401()
+            return HttpResponse(status_code=http_error["status_code"], body=response["data"])
+        http_success = HttpSuccess.success_200(data=response["data"])
+        return HttpResponse(status_code=http_success["status_code"], body=http_success["body"])
+
+    @staticmethod
+    def credentials_from_request(http_request: HttpRequest) -> Optional[Tuple[str, str]]:
+        """
+        Read the email and the password from the validated model of the HTTP request, or else from its body.
+
+        Args:
+            http_request (HttpRequest): The incoming HTTP request object.
+
+        Returns:
+            Tuple[str, str] | None: The email and the password, or None when the body misses one of them.
+        """
+        model = http_request.model
+        if model is not None:
+            return model.email, model.password
+        body = http_request.body
+        if not body or "email" not in body or "password" not in body:
+            return None
+        return body["email"], body["password"]
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+from src.domain.use_cases.auth.logout import LogoutUseCaseInterface
+from src.domain.controller import ControllerInterface
+from src.presenters.helpers.http_types import HttpRequest, HttpResponse, HttpErrors, HttpSuccess
+
+
+@dataclass
+class LogoutController(ControllerInterface):
+    """
+    A controller for logging users out.
+
+    This controller handles authenticated HTTP requests and revokes the access token they carry.
+
+    Attributes:
+        logout_use_case (LogoutUseCaseInterface): An instance of the LogoutUseCaseInterface responsible
+            for revoking the tokens.
+    """
+
+    logout_use_case: LogoutUseCaseInterface
+
+    def route(self, http_request: HttpRequest) -> HttpResponse:
+        """
+        Handle the incoming HTTP request and revoke the access token it was authenticated with.
+
+        Args:
+            http_request (HttpRequest): The incoming HTTP request object, with the verified token
+                claims under the `claims` key of its body.
+
+        Returns:
+            HttpResponse: A 200 response once the token is revoked, or a 422 response without claims.
+        """
+        if not http_request.body or http_request.body.get("claims") is None:
+            http_error = HttpErrors.error_422()
+            return HttpResponse(status_code=http_error["status_code"], body=http_error["body"])
+        response = self.logout_use_case.logout(http_request.body["claims"])
+        http_success = HttpSuccess.success_200(data=response["data"])
+        return HttpResponse(status_code=http_success["status_code"], body=http_success["body"])
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+
+from src.domain.use_cases.user.async_create_user import AsyncCreateUserUseCaseInterface
+from src.domain.controller import AsyncControllerInterface
+from src.presenters.controllers.user.create_user import CreateUserController
+from src.presenters.helpers.http_types import HttpRequest, HttpResponse, HttpErrors
+
+
+@dataclass
+class AsyncCreateUserController(AsyncControllerInterface):
+    """
+    An asynchronous controller for creating new user accounts.
+
+    This controller handles the same HTTP requests as CreateUserController, awaiting an asynchronous
+    use case instead of blocking a worker thread.
+
+    Attributes:
+        create_user_use_case (AsyncCreateUserUseCaseInterface): An instance of the AsyncCreateUserUseCaseInterface
+            responsible for creating user accounts.
+    """
+
+    create_user_use_case: AsyncCreateUserUseCaseInterface
+
+    async def route(self, http_request: HttpRequest) -> HttpResponse:
+        """
+        Handle the incoming HTTP request and create a new user account if the provided data is valid.
+
+        Args:
+            http_request (HttpRequest): The incoming HTTP request object.
+
+        Returns:
+            HttpResponse: An HTTP response indicating the outcome of the request.
+        """
+        user_dto = CreateUserController.user_dto_from_request(http_request)
+        if user_dto is None:
+            http_error = HttpErrors.error_422()
+            return HttpResponse(status_code=http_error["status_code"], body=http_error["body"])
+        response = await self.create_user_use_case.create_user(user_dto=user_dto)
+        return CreateUserController.to_http_response(response)
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+
+from src.domain.use_cases.user.async_delete_user import AsyncDeleteUserUseCaseInterface
+from src.domain.controller import AsyncControllerInterface
+from src.presenters.controllers.user.delete_user import DeleteUserController
+from src.presenters.helpers.http_types import HttpRequest, HttpResponse, HttpErrors
+
+
+@dataclass
+class AsyncDeleteUserController(AsyncControllerInterface):
+    """
+    Represents an asynchronous controller for handling HTTP requests to delete a user.
+
+    Args:
+        delete_user_use_case (AsyncDeleteUserUseCaseInterface): An instance of AsyncDeleteUserUseCaseInterface
+            that provides the necessary functionality to delete user data.
+    """
+
+    delete_user_use_case: AsyncDeleteUserUseCaseInterface
+
+    async def route(self, http_request: HttpRequest) -> HttpResponse:
+        """
+        Handle the HTTP request to delete a user.
+
+        Args:
+            http_request (HttpRequest): An HTTP request object containing the request data.
+
+        Returns:
+            (HttpResponse): An HTTP response object containing the result of the user deletion operation.
+        """
+        try:
+            user_id = DeleteUserController.user_id_from_request(http_request)
+        except ValueError:
+            http_error = HttpErrors.error_400()
+            return HttpResponse(status_code=http_error["status_code"], body=http_error["body"])
+        if user_id is None:
+            http_error = HttpErrors.error_422()
+            return HttpResponse(status_code=http_error["status_code"], body=http_error["body"])
+        response = await self.delete_user_use_case.delete_user(user_id=user_id)
+        return DeleteUserController.to_http_response(response)
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+
+from src.domain.use_cases.user.async_get_user import AsyncGetUserUseCaseInterface
+from src.domain.controller import AsyncControllerInterface
+from src.presenters.controllers.user.get_user import GetUserController
+from src.presenters.helpers.http_types import HttpRequest, HttpResponse, HttpErrors
+
+
+@dataclass
+class AsyncGetUserController(AsyncControllerInterface):
+    """
+    Represents an asynchronous controller for handling HTTP requests related to retrieving user data.
+
+    Args:
+        get_user_use_case (AsyncGetUserUseCaseInterface): An instance of AsyncGetUserUseCaseInterface that provides
+            the necessary functionality to fetch user data.
+    """
+
+    get_user_use_case: AsyncGetUserUseCaseInterface
+
+    async def route(self, http_request: HttpRequest) -> HttpResponse:
+        """
+        Handle the HTTP request to retrieve user data.
+
+        Args:
+            http_request (HttpRequest): An HTTP request object containing the request data.
+
+        Returns:
+            (HttpResponse): An HTTP response object containing the result of the user retrieval operation.
+        """
+        email = GetUserController.email_from_request(http_request)
+        if email is None:
+            http_error = HttpErrors.error_422()
+            return HttpResponse(status_code=http_error["status_code"], body=http_error["body"])
+        response = await self.get_user_use_case.get_user_by_email(email=email)
+        return GetUserController.to_http_response(response)
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from src.domain.use_cases.user.batch_get_users import BatchGetUsersUseCaseInterface
+from src.domain.controller import ControllerInterface
+from src.presenters.helpers.http_types import HttpRequest, HttpResponse, HttpErrors, HttpSuccess
+
+
+@dataclass
+class BatchGetUsersController(ControllerInterface):
+    """
+    A controller for resolving many user accounts in one request.
+
+    The body of the request holds the 'ids' and the 'emails' of the users to resolve.
+
+    Attributes:
+        batch_get_users_use_case (BatchGetUsersUseCaseInterface): An instance of the BatchGetUsersUseCaseInterface
+            responsible for resolving the users.
+        max_identifiers (int): The largest number of IDs and emails accepted in one request.
+    """
+
+    batch_get_users_use_case: BatchGetUsersUseCaseInterface
+    max_identifiers: int = 1000
+
+    def route(self, http_request: HttpRequest) -> HttpResponse:
+        """
+        Handle the HTTP request and resolve the requested users.
+
+        Args:
+            http_request (HttpRequest): The incoming HTTP request object.
+
+        Returns:
+            HttpResponse: A 200 response with the users keyed by identifier and the missing identifiers, or a
+                422 response when the body holds no identifier, too many, or identifiers of the wrong type.
+        """
+        identifiers = self.identifiers_from_request(http_request)
+        if identifiers is None:
+            http_error = HttpErrors.error_422()
+            return HttpResponse(status_code=http_error["status_code"], body=http_error["body"])
+        user_ids, emails = identifiers
+        response = self.batch_get_users_use_case.get_users(user_ids=user_ids, emails=emails)
+        http_success = HttpSuccess.success_200(data=response["data"])
+        return HttpResponse(status_code=http_success["status_code"], body=http_success["body"])
+
+    def identifiers_from_request(self, http_request: HttpRequest) -> Optional[Tuple[List[int], List[str]]]:
+        """
+        Read the IDs and the emails from the validated model of the HTTP request, or else from its body.
+
+        The types of a validated model are not checked again, only the number of identifiers is.
+
+        Args:
+            http_request (HttpRequest): The incoming HTTP request object.
+
+        Returns:
+            Tuple[List[int], List[str]] | None: The IDs and the emails, or None when they are invalid.
+        """
+        model = http_request.model
+        if model is not None:
+            user_ids, emails = model.ids, model.emails
+        else:
+            body = http_request.body or {}
+            user_ids = body.get("ids") or []
+            emails = body.get("emails") or []
+            if not isinstance(user_ids, list) or not isinstance(emails, list):
+                return None
+            if not all(isinstance(user_id, int) and not isinstance(user_id, bool) for user_id in user_ids):
+                return None
+            if not all(isinstance(email, str) for email in emails):
+                return None
+        if not 1 <= len(user_ids) + len(emails) <= self.max_identifiers:
+            return None
+        return user_ids, emails
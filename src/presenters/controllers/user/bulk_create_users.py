@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
+
+from src.applications.dtos.user import UserDTO
+from src.domain.use_cases.user.bulk_create_users import BulkCreateUsersUseCaseInterface
+from src.domain.controller import ControllerInterface
+from src.presenters.controllers.user.create_user import CreateUserController
+from src.presenters.helpers.http_types import HttpRequest, HttpResponse, HttpErrors, HttpSuccess
+
+
+@dataclass
+class BulkCreateUsersController(ControllerInterface):
+    """
+    A controller for importing many user accounts at once.
+
+    This controller handles HTTP requests whose body is an iterable of `(row, record)` pairs, where
+    the record is either the data of a user or the message of the error that made the row unreadable.
+    The valid records are handed lazily to the BulkCreateUsersUseCase, and the rows that fail
+    validation are reported next to the rows the use case could not create.
+
+    Attributes:
+        bulk_create_users_use_case (BulkCreateUsersUseCaseInterface): An instance of the
+            BulkCreateUsersUseCaseInterface responsible for creating the user accounts.
+    """
+
+    bulk_create_users_use_case: BulkCreateUsersUseCaseInterface
+
+    def route(self, http_request: HttpRequest) -> HttpResponse:
+        """
+        Handle the incoming HTTP request and create the user accounts of the valid rows.
+
+        Args:
+            http_request (HttpRequest): The incoming HTTP request object.
+
+        Returns:
+            HttpResponse: A 200 response with the import report, or a 422 response when there is no body.
+        """
+        if http_request.body is None:
+            http_error = HttpErrors.error_422()
+            return HttpResponse(status_code=http_error["status_code"], body=http_error["body"])
+        invalid_rows: List[dict] = []
+        response = self.bulk_create_users_use_case.create_users(self.valid_rows(http_request.body, invalid_rows))
+        report = response["data"]
+        failed = sorted(report["failed"] + invalid_rows, key=lambda failure: failure["row"])
+        http_success = HttpSuccess.success_200(
+            data={
+                "created_count": len(report["created"]),
+                "failed_count": len(failed),
+                "created": report["created"],
+                "failed": failed,
+            }
+        )
+        return HttpResponse(status_code=http_success["status_code"], body=http_success["body"])
+
+    @staticmethod
+    def valid_rows(rows: Iterator[Tuple[int, object]], invalid_rows: List[dict]) -> Iterator[Tuple[int, UserDTO]]:
+        """
+        Build the user DTOs of the valid rows, recording the invalid ones as they go by.
+
+        Args:
+            rows (Iterator[Tuple[int, object]]): The `(row, record)` pairs of the import, where the record
+                is a dictionary with the user data or the error message of an unreadable row.
+            invalid_rows (List[dict]): The failed entries of the invalid rows, extended in place.
+
+        Yields:
+            (Tuple[int, UserDTO]): The number of each valid row and its user DTO.
+        """
+        for row, record in rows:
+            if isinstance(record, str):
+                invalid_rows.append({"row": row, "email": None, "error": record})
+                continue
+            user_dto = CreateUserController.user_dto_from_request(HttpRequest(body=record))
+            if user_dto is None:
+                email = record.get("email") if isinstance(record, dict) else None
+                invalid_rows.append({"row": row, "email": email, "error": "Missing required field."})
+                continue
+            yield row, user_dto
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from src.applications.dtos.user import UserDTO
 from src.domain.use_cases.user.create_user import CreateUserUseCaseInterface
@@ -31,22 +32,49 @@ class CreateUserController(ControllerInterface):
         Returns:
             HttpResponse: An HTTP response indicating the outcome of the request.
         """
-        response = None
-        if http_request.body:
-            body_params = http_request.body.keys()
-            if "name" in body_params and "email" in body_params and "password" in body_params:
-                user_dto = UserDTO(
-                    id=None,
-                    name=http_request.body["name"],
-                    email=http_request.body["email"],
-                    password=http_request.body["password"],
-                    created_at=None,
-                )
-                response = self.create_user_use_case.create_user(user_dto=user_dto)
-            else:
-                http_error = HttpErrors.error_422()
-                response = {"success": False, "data": http_error["body"], "status_code": http_error["status_code"]}
-                return HttpResponse(status_code=http_error["status_code"], body=http_error["body"])
+        user_dto = self.user_dto_from_request(http_request)
+        if user_dto is None:
+            http_error = HttpErrors.error_422()
+            return HttpResponse(status_code=http_error["status_code"], body=http_error["body"])
+        response = self.create_user_use_case.create_user(user_dto=user_dto)
+        return self.to_http_response(response)
+
+    @staticmethod
+    def user_dto_from_request(http_request: HttpRequest) -> Optional[UserDTO]:
+        """
+        Build the user DTO from the validated model of the HTTP request, or else from its body.
+
+        Args:
+            http_request (HttpRequest): The incoming HTTP request object.
+
+        Returns:
+            UserDTO | None: The user DTO, or None when the body misses a required field.
+        """
+        model = http_request.model
+        if model is not None:
+            return UserDTO(id=None, name=model.name, email=model.email, password=model.password, created_at=None)
+        body = http_request.body
+        if not body or "name" not in body or "email" not in body or "password" not in body:
+            return None
+        return UserDTO(
+            id=None,
+            name=body["name"],
+            email=body["email"],
+            password=body["password"],
+            created_at=None,
+        )
+
+    @staticmethod
+    def to_http_response(response: dict) -> HttpResponse:
+        """
+        Convert the result of the create user use case to an HTTP response.
+
+        Args:
+            response (dict): The result of the use case, with the 'data' and 'success' keys.
+
+        Returns:
+            HttpResponse: A 201 response with the created user, or a 400 response with the error.
+        """
         if response["success"] is False:
             http_error = HttpErrors.error_400()
             return HttpResponse(status_code=http_error["status_code"], body=response["data"])
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from src.domain.use_cases.user.delete_user import DeleteUserUseCaseInterface
 from src.presenters.helpers.http_types import HttpRequest, HttpResponse, HttpErrors, HttpSuccess
@@ -33,18 +34,55 @@ class DeleteUserController(ControllerInterface):
                 If the user is not found or any error occurs during retrieval, it returns an appropriate
                 error response with the corresponding status code and error message in the 'body'.
         """
-        response = None
-        if http_request.path:
-            path_string_params = http_request.path.keys()
-            if "user_id" in path_string_params:
-                user_id = http_request.path["user_id"]
-                response = self.delete_user_use_case.delete_user(user_id=user_id)
-            else:
-                http_error = HttpErrors.error_422()
-                response = {"success": False, "data": http_error["body"], "status_code": http_error["status_code"]}
-                return HttpResponse(status_code=http_error["status_code"], body=http_error["body"])
-            if response["success"] is False:
-                http_error = HttpErrors.error_400()
-                return HttpResponse(status_code=http_error["status_code"], body=response["data"])
-            http_success = HttpSuccess.success_200(data=response["data"])
-            return HttpResponse(status_code=http_success["status_code"], body=http_success["body"])
+        try:
+            user_id = self.user_id_from_request(http_request)
+        except ValueError:
+            http_error = HttpErrors.error_400()
+            return HttpResponse(status_code=http_error["status_code"], body=http_error["body"])
+        if user_id is None:
+            http_error = HttpErrors.error_422()
+            return HttpResponse(status_code=http_error["status_code"], body=http_error["body"])
+        response = self.delete_user_use_case.delete_user(user_id=user_id)
+        return self.to_http_response(response)
+
+    @staticmethod
+    def user_id_from_request(http_request: HttpRequest) -> Optional[int]:
+        """
+        Read the user ID from the path parameters of the HTTP request.
+
+        The path parameters of the web framework are strings, so the ID is converted to the integer
+        the repositories and their caches are keyed by.
+
+        Args:
+            http_request (HttpRequest): An HTTP request object containing the request data.
+
+        Returns:
+            int | None: The user ID, or None when it is not in the path parameters.
+
+        Raises:
+            ValueError: If the user ID is not an integer.
+        """
+        if not http_request.path or "user_id" not in http_request.path:
+            return None
+        user_id = http_request.path["user_id"]
+        try:
+            return int(user_id)
+        except (TypeError, ValueError) as error:
+            raise ValueError(f"The user ID '{user_id}' is not an integer.") from error
+
+    @staticmethod
+    def to_http_response(response: dict) -> HttpResponse:
+        """
+        Convert the result of the delete user use case to an HTTP response.
+
+        Args:
+            response (dict): The result of the use case, with the 'data' and 'success' keys.
+
+        Returns:
+            HttpResponse: A 200 response with the success message, or a 400 response with the error.
+        """
+        if response["success"] is False:
+            http_error = HttpErrors.error_400()
+            return HttpResponse(status_code=http_error["status_code"], body=response["data"])
+        http_success = HttpSuccess.success_200(data=response["data"])
+        return HttpResponse(status_code=http_success["status_code"], body=http_success["body"])
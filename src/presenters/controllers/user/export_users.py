@@ -0,0 +1,126 @@
+import csv
+import io
+import json
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Iterator, List
+
+from src.applications.dtos.user import UserDTO
+from src.domain.use_cases.user.export_users import ExportUsersUseCaseInterface
+from src.domain.controller import ControllerInterface
+from src.presenters.helpers.http_types import HttpRequest, HttpResponse, HttpErrors, HttpSuccess
+
+EXPORT_FIELDS = ("id", "name", "email", "created_at")
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+@dataclass
+class ExportUsersController(ControllerInterface):
+    """
+    A controller for exporting every user account as NDJSON or CSV.
+
+    The export is streamed: the body of the response holds an iterator of text chunks, each chunk
+    encoding `chunk_size` users, so the users are formatted as they are read from the database. The
+    passwords are never exported.
+
+    Attributes:
+        export_users_use_case (ExportUsersUseCaseInterface): An instance of the ExportUsersUseCaseInterface
+            responsible for streaming the users.
+        chunk_size (int): The number of users encoded per chunk of the response.
+    """
+
+    export_users_use_case: ExportUsersUseCaseInterface
+    chunk_size: int = 500
+
+    def route(self, http_request: HttpRequest) -> HttpResponse:
+        """
+        Handle the HTTP request and stream the users in the requested format.
+
+        Args:
+            http_request (HttpRequest): The incoming HTTP request object, with the optional 'format'
+                query parameter (`ndjson` by default, or `csv`).
+
+        Returns:
+            HttpResponse: A 200 response whose body holds the 'format', the 'media_type' and the 'content'
+                iterator of the export, or a 422 response when the format is not supported.
+        """
+        export_format = (http_request.query or {}).get("format", "ndjson")
+        if export_format not in EXPORT_MEDIA_TYPES:
+            http_error = HttpErrors.error_422()
+            return HttpResponse(status_code=http_error["status_code"], body=http_error["body"])
+        users = self.export_users_use_case.export_users()["data"]
+        encode = self.encode_ndjson if export_format == "ndjson" else self.encode_csv
+        http_success = HttpSuccess.success_200(
+            data={
+                "format": export_format,
+                "media_type": EXPORT_MEDIA_TYPES[export_format],
+                "content": encode(self.chunks(users)),
+            }
+        )
+        return HttpResponse(status_code=http_success["status_code"], body=http_success["body"])
+
+    def chunks(self, users: Iterable[UserDTO]) -> Iterator[List[UserDTO]]:
+        """
+        Group the users into lists of `chunk_size`.
+
+        Args:
+            users (Iterable[UserDTO]): The users to group.
+
+        Yields:
+            (List[UserDTO]): The next users.
+        """
+        users = iter(users)
+        while True:
+            chunk = list(islice(users, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    @staticmethod
+    def encode_ndjson(chunks: Iterable[List[UserDTO]]) -> Iterator[str]:
+        """
+        Encode the users as JSON objects, one per line.
+
+        Args:
+            chunks (Iterable[List[UserDTO]]): The users, grouped in chunks.
+
+        Yields:
+            (str): The lines of a chunk.
+        """
+        for chunk in chunks:
+            yield "".join(
+                json.dumps(
+                    {
+                        "id": user.id,
+                        "name": user.name,
+                        "email": user.email,
+                        "created_at": user.created_at.isoformat() if user.created_at else None,
+                    }
+                )
+                + "\n"
+                for user in chunk
+            )
+
+    @staticmethod
+    def encode_csv(chunks: Iterable[List[UserDTO]]) -> Iterator[str]:
+        """
+        Encode the users as CSV rows, after a header row.
+
+        Args:
+            chunks (Iterable[List[UserDTO]]): The users, grouped in chunks.
+
+        Yields:
+            (str): The header, then the rows of a chunk.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_FIELDS)
+        yield buffer.getvalue()
+        for chunk in chunks:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(
+                (user.id, user.name, user.email, user.created_at.isoformat() if user.created_at else "")
+                for user in chunk
+            )
+            yield buffer.getvalue()
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from src.domain.use_cases.user.get_user import GetUserUseCaseInterface
 from src.presenters.helpers.http_types import HttpRequest, HttpResponse, HttpErrors, HttpSuccess
@@ -33,18 +34,41 @@ class GetUserController(ControllerInterface):
                 If the user is not found or any error occurs during retrieval, it returns an appropriate
                 error response with the corresponding status code and error message in the 'body'.
         """
-        response = None
-        if http_request.query:
-            query_string_params = http_request.query.keys()
-            if "email" in query_string_params:
-                email = http_request.query["email"]
-                response = self.get_user_use_case.get_user_by_email(email=email)
-            else:
-                http_error = HttpErrors.error_422()
-                response = {"success": False, "data": http_error["body"], "status_code": http_error["status_code"]}
-                return HttpResponse(status_code=http_error["status_code"], body=http_error["body"])
-            if response["success"] is False:
-                http_error = HttpErrors.error_404()
-                return HttpResponse(status_code=http_error["status_code"], body=response["data"])
-            http_success = HttpSuccess.success_200(data=response["data"])
-            return HttpResponse(status_code=http_success["status_code"], body=http_success["body"])
+        email = self.email_from_request(http_request)
+        if email is None:
+            http_error = HttpErrors.error_422()
+            return HttpResponse(status_code=http_error["status_code"], body=http_error["body"])
+        response = self.get_user_use_case.get_user_by_email(email=email)
+        return self.to_http_response(response)
+
+    @staticmethod
+    def email_from_request(http_request: HttpRequest) -> Optional[str]:
+        """
+        Read the email from the query parameters of the HTTP request.
+
+        Args:
+            http_request (HttpRequest): An HTTP request object containing the request data.
+
+        Returns:
+            str | None: The email, or None when it is not in the query parameters.
+        """
+        if not http_request.query or "email" not in http_request.query:
+            return None
+        return http_request.query["email"]
+
+    @staticmethod
+    def to_http_response(response: dict) -> HttpResponse:
+        """
+        Convert the result of the get user use case to an HTTP response.
+
+        Args:
+            response (dict): The result of the use case, with the 'data' and 'success' keys.
+
+        Returns:
+            HttpResponse: A 200 response with the user, or a 404 response with the error.
+        """
+        if response["success"] is False:
+            http_error = HttpErrors.error_404()
+            return HttpResponse(status_code=http_error["status_code"], body=response["data"])
+        http_success = HttpSuccess.success_200(data=response["data"])
+        return HttpResponse(status_code=http_success["status_code"], body=http_success["body"])
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from src.domain.use_cases.user.list_users import ListUsersUseCaseInterface
+from src.domain.controller import ControllerInterface
+from src.presenters.helpers.cursor import decode_cursor, encode_cursor
+from src.presenters.helpers.http_types import HttpRequest, HttpResponse, HttpErrors, HttpSuccess
+
+
+@dataclass
+class ListUsersController(ControllerInterface):
+    """
+    A controller for paging through the user accounts.
+
+    The page is selected by the opaque 'cursor' query parameter returned with the previous page, or by
+    the raw 'after_id' query parameter, and sized by 'limit'. With 'include_total=true', the page
+    carries an estimate of the total number of users.
+
+    Attributes:
+        list_users_use_case (ListUsersUseCaseInterface): An instance of the ListUsersUseCaseInterface
+            responsible for retrieving the pages.
+        default_limit (int): The number of users of a page when 'limit' is not given.
+        max_limit (int): The largest 'limit' accepted.
+    """
+
+    list_users_use_case: ListUsersUseCaseInterface
+    default_limit: int = 50
+    max_limit: int = 500
+
+    def route(self, http_request: HttpRequest) -> HttpResponse:
+        """
+        Handle the HTTP request and return the requested page of users.
+
+        Args:
+            http_request (HttpRequest): The incoming HTTP request object.
+
+        Returns:
+            HttpResponse: A 200 response whose body holds the 'users' of the page, the 'next_cursor' (None on
+                the last page) and the 'total_estimate', or a 422 response when a query parameter is invalid.
+        """
+        page = self.page_from_request(http_request)
+        if page is None:
+            http_error = HttpErrors.error_422()
+            return HttpResponse(status_code=http_error["status_code"], body=http_error["body"])
+        after_id, limit, include_total = page
+        response = self.list_users_use_case.list_users(after_id=after_id, limit=limit, include_total=include_total)
+        data = response["data"]
+        next_after_id = data["next_after_id"]
+        http_success = HttpSuccess.success_200(
+            data={
+                "users": data["users"],
+                "next_cursor": encode_cursor(next_after_id) if next_after_id is not None else None,
+                "total_estimate": data["total_estimate"],
+            }
+        )
+        return HttpResponse(status_code=http_success["status_code"], body=http_success["body"])
+
+    def page_from_request(self, http_request: HttpRequest) -> Optional[Tuple[Optional[int], int, bool]]:
+        """
+        Read the page parameters from the query parameters of the HTTP request.
+
+        Args:
+            http_request (HttpRequest): The incoming HTTP request object.
+
+        Returns:
+            Tuple[int | None, int, bool] | None: The 'after_id', 'limit' and 'include_total' of the page, or
+                None when a parameter is invalid.
+        """
+        query = http_request.query or {}
+        try:
+            limit = int(query.get("limit", self.default_limit))
+            if query.get("cursor"):
+                after_id = decode_cursor(query["cursor"])
+            elif query.get("after_id"):
+                after_id = int(query["after_id"])
+            else:
+                after_id = None
+        except ValueError:
+            return None
+        if not 1 <= limit <= self.max_limit:
+            return None
+        include_total = str(query.get("include_total", "false")).lower() in ("1", "true", "yes")
+        return after_id, limit, include_total
@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from src.domain.use_cases.user.search_users import SearchUsersUseCaseInterface
+from src.domain.controller import ControllerInterface
+from src.presenters.helpers.http_types import HttpRequest, HttpResponse, HttpErrors, HttpSuccess
+
+
+@dataclass
+class SearchUsersController(ControllerInterface):
+    """
+    A controller for searching user accounts by name or email.
+
+    The text to look for is read from the 'q' query parameter, and the number of results from 'limit'.
+
+    Attributes:
+        search_users_use_case (SearchUsersUseCaseInterface): An instance of the SearchUsersUseCaseInterface
+            responsible for the search.
+        default_limit (int): The number of results when 'limit' is not given.
+        max_limit (int): The largest 'limit' accepted.
+    """
+
+    search_users_use_case: SearchUsersUseCaseInterface
+    default_limit: int = 20
+    max_limit: int = 100
+
+    def route(self, http_request: HttpRequest) -> HttpResponse:
+        """
+        Handle the HTTP request and return the matching users.
+
+        Args:
+            http_request (HttpRequest): The incoming HTTP request object.
+
+        Returns:
+            HttpResponse: A 200 response with the list of the matching users, or a 422 response when the
+                text is blank or the limit is invalid.
+        """
+        search = self.search_from_request(http_request)
+        if search is None:
+            http_error = HttpErrors.error_422()
+            return HttpResponse(status_code=http_error["status_code"], body=http_error["body"])
+        query, limit = search
+        response = self.search_users_use_case.search_users(query, limit=limit)
+        http_success = HttpSuccess.success_200(data=response["data"])
+        return HttpResponse(status_code=http_success["status_code"], body=http_success["body"])
+
+    def search_from_request(self, http_request: HttpRequest) -> Optional[Tuple[str, int]]:
+        """
+        Read the text and the limit of the search from the query parameters of the HTTP request.
+
+        Args:
+            http_request (HttpRequest): The incoming HTTP request object.
+
+        Returns:
+            Tuple[str, int] | None: The text and the limit, or None when either is invalid.
+        """
+        query = http_request.query or {}
+        text = (query.get("q") or "").strip()
+        try:
+            limit = int(query.get("limit", self.default_limit))
+        except ValueError:
+            return None
+        if not text or not 1 <= limit <= self.max_limit:
+            return None
+        return text, limit
@@ -0,0 +1,42 @@
+import base64
+import binascii
+import json
+
+
+def encode_cursor(after_id: int) -> str:
+    """
+    Encode the position of a page into an opaque cursor token.
+
+    The token hides the pagination key from the clients, so the key can change without breaking them.
+
+    Args:
+        after_id (int): The ID of the last item of the previous page.
+
+    Returns:
+        (str): The URL-safe cursor token.
+    """
+    payload = json.dumps({"after_id": after_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Decode a cursor token built by `encode_cursor`.
+
+    Args:
+        cursor (str): The cursor token.
+
+    Returns:
+        (int): The ID of the last item of the previous page.
+
+    Raises:
+        ValueError: If the token is not a valid cursor.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        after_id = payload["after_id"]
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError) as exception:
+        raise ValueError("Invalid cursor.") from exception
+    if not isinstance(after_id, int) or isinstance(after_id, bool):
+        raise ValueError("Invalid cursor.")
+    return after_id
@@ -1,4 +1,4 @@
-from .http_request import HttpRequest
+from .http_request import HttpRequest, Lazy
 from .http_response import HttpResponse
 from .http_errors import HttpErrors
 from .http_success import HttpSuccess
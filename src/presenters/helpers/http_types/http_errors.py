@@ -38,3 +38,15 @@ class HttpErrors:
                 an error message for Not Found.
         """
         return {"status_code": 404, "body": {"error": "Not Found"}}
+
+    @staticmethod
+    def error_401():
+        """
+        Returns a dictionary representing an HTTP 401 Unauthorized error response.
+
+        Returns:
+            (Dict[str, Union[int, Dict[str, str]]]): The HTTP error response with 'status_code' and 'body' keys.
+                The 'status_code' key contains the HTTP status code 401, and the 'body' key contains
+                an error message for Unauthorized.
+        """
+        return {"status_code": 401, "body": {"error": "Unauthorized"}}
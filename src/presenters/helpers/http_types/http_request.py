@@ -1,19 +1,129 @@
-from typing import Dict
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional
+
+
+class Lazy:
+    """
+    A part of an HTTP request that is read from the web framework only when a controller uses it.
+
+    Attributes:
+        load (Callable[[], Any]): Reads the part from the request of the web framework.
+    """
+
+    __slots__ = ("load",)
+
+    def __init__(self, load: Callable[[], Any]) -> None:
+        """
+        Initialize a new instance of Lazy.
+
+        Args:
+            load (Callable[[], Any]): Reads the part from the request of the web framework.
+        """
+        self.load = load
+
+
+def read_only(value: Any) -> Any:
+    """
+    Wrap a dictionary in a read-only view, without copying it.
+
+    Args:
+        value (Any): A part of the request.
+
+    Returns:
+        (Any): A read-only view of the dictionary, or the value itself when it is not a dictionary.
+    """
+    return MappingProxyType(value) if type(value) is dict else value
 
 
-@dataclass
 class HttpRequest:
     """
     Represents an HTTP request.
 
+    The parts of the request are read-only views: a dictionary is wrapped in a `MappingProxyType`
+    instead of being copied. A part given as `Lazy` is read on first access only, so the adapter of
+    a web framework can hand its request over without converting the headers, the query string or
+    the path parameters that the controller never looks at.
+
+    When the web framework has already validated the body into a model, the model is carried as
+    `model`, and a controller reads its attributes instead of checking the keys of `body` again.
+
     Attributes:
-        header (Dict, optional): A dictionary containing the headers of the HTTP request.
-        body (Dict, optional): A dictionary containing the body data of the HTTP request.
-        query (Dict, optional): A dictionary containing the query parameters of the HTTP request.
+        header (Mapping, optional): The headers of the HTTP request.
+        body (Any, optional): The body data of the HTTP request.
+        query (Mapping, optional): The query parameters of the HTTP request.
+        path (Mapping, optional): The path parameters of the HTTP request.
+        model (Any, optional): The body of the HTTP request, already validated by the web framework.
     """
 
-    header: Dict = None
-    body: Dict = None
-    query: Dict = None
-    path: Dict = None
+    __slots__ = ("_header", "_body", "_query", "_path", "model")
+
+    def __init__(
+        self,
+        header: Optional[Mapping] = None,
+        body: Any = None,
+        query: Optional[Mapping] = None,
+        path: Optional[Mapping] = None,
+        model: Any = None,
+    ) -> None:
+        """
+        Initialize a new instance of HttpRequest.
+
+        Args:
+            header (Mapping | Lazy, optional): The headers of the HTTP request.
+            body (Any, optional): The body data of the HTTP request.
+            query (Mapping | Lazy, optional): The query parameters of the HTTP request.
+            path (Mapping | Lazy, optional): The path parameters of the HTTP request.
+            model (Any, optional): The body of the HTTP request, already validated by the web framework.
+        """
+        self._header = read_only(header)
+        self._body = read_only(body)
+        self._query = read_only(query)
+        self._path = read_only(path)
+        self.model = model
+
+    @property
+    def header(self) -> Optional[Mapping]:
+        """Get the headers of the HTTP request, reading them on first access."""
+        if type(self._header) is Lazy:
+            self._header = read_only(self._header.load())
+        return self._header
+
+    @property
+    def body(self) -> Any:
+        """Get the body data of the HTTP request, reading it on first access."""
+        if type(self._body) is Lazy:
+            self._body = read_only(self._body.load())
+        return self._body
+
+    @property
+    def query(self) -> Optional[Mapping]:
+        """Get the query parameters of the HTTP request, reading them on first access."""
+        if type(self._query) is Lazy:
+            self._query = read_only(self._query.load())
+        return self._query
+
+    @property
+    def path(self) -> Optional[Mapping]:
+        """Get the path parameters of the HTTP request, reading them on first access."""
+        if type(self._path) is Lazy:
+            self._path = read_only(self._path.load())
+        return self._path
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the request, without reading its lazy parts.
+
+        Returns:
+            (str): A string representation of the request.
+        """
+        parts = ", ".join(
+            f"{name}={'<lazy>' if type(value) is Lazy else repr(value)}"
+            for name, value in (
+                ("header", self._header),
+                ("body", self._body),
+                ("query", self._query),
+                ("path", self._path),
+                ("model", self.model),
+            )
+        )
+        return f"HttpRequest({parts})"
@@ -1,2 +1,26 @@
+import pytest
+
 from src.infra.models import *
 from .fixtures import *
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Run the asynchronous tests on the asyncio event loop.
+
+    Returns:
+        (str): The name of the anyio backend.
+    """
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hashing(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Hash the passwords with cheap PBKDF2 parameters in the calling thread, so the tests stay fast.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): The pytest monkeypatch fixture.
+    """
+    monkeypatch.setenv("PASSWORD_HASH_ALGORITHM", "pbkdf2_sha256")
+    monkeypatch.setenv("PASSWORD_HASH_PBKDF2_ITERATIONS", "1000")
+    monkeypatch.setenv("PASSWORD_HASH_WORKERS", "0")
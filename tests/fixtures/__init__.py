@@ -1,3 +1,6 @@
 from tests.fixtures.infra.entities import *
 from tests.fixtures.infra.db.db_connection import *
+from tests.fixtures.infra.db.async_db_connection import *
+from tests.fixtures.infra.db.query_counter import *
 from tests.fixtures.infra.fast_api import *
+from tests.fixtures.infra.tracing.span_exporter import *
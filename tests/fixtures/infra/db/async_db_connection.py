@@ -0,0 +1,24 @@
+from typing import AsyncGenerator
+import pytest
+
+from src.infra.db.settings import AsyncDBConnectionHandler, DBConnectionHandler, engine_registry
+
+
+@pytest.fixture
+async def async_db_connection(db_connection: DBConnectionHandler) -> AsyncGenerator[AsyncDBConnectionHandler, None]:
+    """Fixture for creating an asynchronous connection handler to the test database.
+
+    The tables are created by the `db_connection` fixture, and this fixture connects to the same
+    SQLite database through aiosqlite. After the test is finished, the asyncio engine is disposed.
+
+    Args:
+        db_connection (DBConnectionHandler): A database connection handler for the test database.
+
+    Yields:
+        async_db_connection (AsyncDBConnectionHandler): An asynchronous connection handler for the test database.
+    """
+    connection = AsyncDBConnectionHandler(connection_string=db_connection.connection_string)
+    try:
+        yield connection
+    finally:
+        await engine_registry.dispose_async(connection.connection_string)
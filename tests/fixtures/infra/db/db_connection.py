@@ -3,7 +3,7 @@ from typing import Generator
 import pytest
 from sqlalchemy.orm import sessionmaker
 
-from src.infra.db.settings import Base, DBConnectionHandler
+from src.infra.db.settings import Base, DBConnectionHandler, engine_registry
 
 
 @pytest.fixture
@@ -11,8 +11,8 @@ def db_connection() -> Generator[DBConnectionHandler, None, None]:
     """Fixture for creating a test database session.
 
     This fixture sets up a temporary SQLite database connection for testing purposes.
-    A connection to the database is yielded, and after the test is finished, the connection
-    is closed, and the temporary database file is removed.
+    A connection to the database is yielded, and after the test is finished, the shared engine
+    is disposed, and the temporary database file is removed.
 
     Yields:
         db_connection (DBConnectionHandler): A database connection handler for the test database.
@@ -24,6 +24,7 @@ def db_connection() -> Generator[DBConnectionHandler, None, None]:
         yield connection
     finally:
         Base.metadata.drop_all(bind=connection.engine)
+        engine_registry.dispose(connection_string)
         try:
             os.remove("test.db")
         except FileNotFoundError:
@@ -0,0 +1,32 @@
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Iterator
+
+import pytest
+
+from src.infra.db.settings import QueryStats, track_queries
+
+
+@pytest.fixture
+def max_queries() -> Callable[[int], ContextManager[QueryStats]]:
+    """Fixture asserting a budget of SQL statements.
+
+    The fixture is a context manager factory: the statements executed inside the block, including
+    those of the requests sent with the TestClient, are counted, and the test fails when they exceed
+    the budget. The failure lists every statement, so the extra query is easy to spot.
+
+    Example:
+        with max_queries(1):
+            client.get("/api/users/", params={"email": email})
+
+    Returns:
+        (Callable[[int], ContextManager[QueryStats]]): Builds the context manager checking a budget.
+    """
+
+    @contextmanager
+    def budget(limit: int) -> Iterator[QueryStats]:
+        with track_queries() as stats:
+            yield stats
+        statements = "\n".join(f"  {count}x {statement}" for statement, count in stats.statements.most_common())
+        assert stats.count <= limit, f"{stats.count} queries ran, the budget is {limit}:\n{statements}"
+
+    return budget
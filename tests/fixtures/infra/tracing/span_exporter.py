@@ -0,0 +1,27 @@
+from typing import Any, Generator
+
+import pytest
+
+from src.infra.tracing import InMemorySpanExporter, tracer
+from src.main.tracing import instrument_layers, uninstrument_layers
+
+
+@pytest.fixture
+def span_exporter() -> Generator[InMemorySpanExporter, Any, None]:
+    """Fixture turning tracing on, with every trace recorded in memory.
+
+    The controllers, use cases and repositories are traced for the duration of the test, and tracing
+    is turned off again afterwards. Request the fixture before `client`, so the application keeps
+    this exporter when it starts.
+
+    Yields:
+        Generator[InMemorySpanExporter, Any, None]: The exporter holding the finished spans.
+    """
+    exporter = InMemorySpanExporter()
+    tracer.configure(exporter)
+    instrument_layers()
+    try:
+        yield exporter
+    finally:
+        uninstrument_layers()
+        tracer.configure(None)
@@ -0,0 +1,21 @@
+import pytest
+
+from benchmarks.load.runner import run_load
+from benchmarks.load.scenario import OPERATIONS, TrafficMix
+from benchmarks.load.targets import in_process_client
+
+
+@pytest.mark.anyio
+async def test_run_load_reports_every_route_of_the_mix(db_connection):
+    """Test that a short in-process run sends every operation of the mix and gets the expected statuses."""
+    mix = TrafficMix.parse(",".join(OPERATIONS))
+
+    async with in_process_client(concurrency=4) as client:
+        report = await run_load(client, mix, concurrency=4, duration=0.5, warmup=0.1, seed_users=20)
+
+    assert report["settings"]["concurrency"] == 4
+    assert report["total"]["requests"] > 0
+    assert report["total"]["error_rate"] == 0.0
+    assert set(report["routes"]) == {route for route, _ in OPERATIONS.values()}
+    for summary in report["routes"].values():
+        assert set(summary["latency_ms"]) == {"p50", "p95", "p99", "mean", "max"}
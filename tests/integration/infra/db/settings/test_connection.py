@@ -1,4 +1,6 @@
-from src.infra.db.settings import DBConnectionHandler
+import pytest
+
+from src.infra.db.settings import DBConnectionHandler, EngineRegistry, PoolSettings, engine_registry
 
 
 class TestDatabaseConnection:
@@ -23,3 +25,53 @@ class TestDatabaseConnection:
         engine = db_connection_handle.get_engine()
 
         assert engine is not None
+
+    def test_handlers_share_the_engine_of_a_connection_string(self):
+        """
+        Test that handlers created for the same connection string share one engine.
+
+        The engine owns the connection pool, so creating a handler per request must not
+        create a new engine and a new, cold pool.
+        """
+        connection_string = "sqlite:///./shared_engine.db"
+        try:
+            first_handler = DBConnectionHandler(connection_string=connection_string)
+            second_handler = DBConnectionHandler(connection_string=connection_string)
+
+            assert first_handler.get_engine() is second_handler.get_engine()
+        finally:
+            engine_registry.dispose(connection_string)
+
+    def test_dispose_all_forgets_the_registered_engines(self):
+        """
+        Test that disposing the registry closes the engines and creates new ones on the next use.
+        """
+        registry = EngineRegistry(pool_settings=PoolSettings())
+        engine = registry.get_engine("sqlite://")
+
+        registry.dispose_all()
+
+        assert registry.get_engine("sqlite://") is not engine
+        registry.dispose_all()
+
+    def test_pool_settings_are_read_from_the_environment(self, monkeypatch: pytest.MonkeyPatch):
+        """
+        Test that the pool settings are read from the environment variables.
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): The pytest monkeypatch fixture.
+        """
+        monkeypatch.setenv("DB_POOL_SIZE", "20")
+        monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+        monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+        monkeypatch.setenv("DB_POOL_RECYCLE", "300")
+        monkeypatch.setenv("DB_POOL_TIMEOUT", "2.5")
+
+        pool_settings = PoolSettings.from_env()
+        engine = EngineRegistry(pool_settings=pool_settings).get_engine("sqlite:///./pool_settings.db")
+
+        assert pool_settings == PoolSettings(
+            pool_size=20, max_overflow=0, pool_pre_ping=False, pool_recycle=300, pool_timeout=2.5
+        )
+        assert engine.pool.size() == 20
+        engine.dispose()
@@ -0,0 +1,49 @@
+from sqlalchemy import text
+
+from src.infra.db.settings import EngineRegistry, current_query_stats, instrument_engine, track_queries
+
+
+class TestQueryCounter:
+    """Tests of the SQL statement counter of the registry engines."""
+
+    def test_statements_are_counted_and_timed_while_tracked(self):
+        """Test that the statements executed inside `track_queries` are counted, timed and grouped by text."""
+        engine = EngineRegistry().get_engine("sqlite://")
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 0"))
+            with track_queries() as stats:
+                assert current_query_stats() is stats
+                for _ in range(3):
+                    connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+            connection.execute(text("SELECT 3"))
+
+        assert current_query_stats() is None
+        assert stats.count == 4
+        assert stats.duration > 0
+        assert stats.statements == {"SELECT 1": 3, "SELECT 2": 1}
+        assert stats.repeated_statements(threshold=3) == [("SELECT 1", 3)]
+        engine.dispose()
+
+    def test_nested_trackers_record_in_every_open_tracker(self):
+        """Test that a statement is recorded by the inner tracker and by the tracker it was opened in."""
+        engine = EngineRegistry().get_engine("sqlite://")
+        with engine.connect() as connection:
+            with track_queries() as outer:
+                connection.execute(text("SELECT 1"))
+                with track_queries() as inner:
+                    connection.execute(text("SELECT 2"))
+
+        assert inner.count == 1
+        assert outer.count == 2
+        engine.dispose()
+
+    def test_instrumenting_an_engine_twice_counts_a_statement_once(self):
+        """Test that instrumenting an already instrumented engine does not add a second pair of hooks."""
+        engine = EngineRegistry().get_engine("sqlite://")
+        instrument_engine(engine)
+        with engine.connect() as connection, track_queries() as stats:
+            connection.execute(text("SELECT 1"))
+
+        assert stats.count == 1
+        engine.dispose()
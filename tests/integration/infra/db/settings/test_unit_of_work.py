@@ -0,0 +1,172 @@
+import pytest
+from sqlalchemy import event
+
+from src.applications.dtos import UserDTO
+from src.infra.db.settings import (
+    AsyncDBConnectionHandler,
+    DBConnectionHandler,
+    SqlAlchemyAsyncUnitOfWork,
+    SqlAlchemyUnitOfWork,
+)
+from src.infra.repositories.async_user import AsyncUserRepository
+from src.infra.repositories.user import UserRepository
+
+
+def make_user(email: str) -> UserDTO:
+    """Build a sample user with the given email.
+
+    Args:
+        email (str): The email of the user.
+
+    Returns:
+        user_dto (UserDTO): A UserDTO instance representing a sample user.
+    """
+    return UserDTO(id=None, name="John Doe", email=email, password="password123", created_at=None)
+
+
+class TestSqlAlchemyUnitOfWork:
+    """Test cases for the SqlAlchemyUnitOfWork class."""
+
+    def test_repository_calls_share_one_checkout_and_commit_once(self, db_connection: DBConnectionHandler):
+        """Test that the repository calls made in a unit of work use one connection and are committed together.
+
+        Args:
+            db_connection (DBConnectionHandler): A database connection handler for the test database.
+        """
+        checkouts = []
+        event.listen(db_connection.engine, "checkout", lambda *args: checkouts.append(args))
+        user_repository = UserRepository(db_connection=db_connection)
+        unit_of_work = SqlAlchemyUnitOfWork(db_connection=db_connection)
+
+        with unit_of_work:
+            first_user = user_repository.create_user(make_user("first@example.com"))
+            second_user = user_repository.create_user(make_user("second@example.com"))
+            assert user_repository.get_user_by_id(first_user.id) == first_user
+            unit_of_work.commit()
+
+        assert len(checkouts) == 1
+        assert user_repository.get_user_by_id(second_user.id) == second_user
+
+    def test_work_is_discarded_without_commit(self, db_connection: DBConnectionHandler):
+        """Test that leaving a unit of work without committing discards the work.
+
+        Args:
+            db_connection (DBConnectionHandler): A database connection handler for the test database.
+        """
+        user_repository = UserRepository(db_connection=db_connection)
+
+        with pytest.raises(RuntimeError):
+            with SqlAlchemyUnitOfWork(db_connection=db_connection):
+                user_repository.create_user(make_user("first@example.com"))
+                raise RuntimeError("boom")
+
+        assert user_repository.get_user_by_email("first@example.com") is None
+
+    def test_nested_unit_of_work_joins_the_outermost(self, db_connection: DBConnectionHandler):
+        """Test that a nested unit of work shares the session and leaves the commit to the outermost one.
+
+        Args:
+            db_connection (DBConnectionHandler): A database connection handler for the test database.
+        """
+        user_repository = UserRepository(db_connection=db_connection)
+        unit_of_work = SqlAlchemyUnitOfWork(db_connection=db_connection)
+
+        with unit_of_work:
+            session = unit_of_work.session
+            with SqlAlchemyUnitOfWork(db_connection=DBConnectionHandler(db_connection.connection_string)) as nested:
+                assert nested.session is session
+                user_repository.create_user(make_user("first@example.com"))
+                nested.commit()
+
+        assert unit_of_work.session is None
+        assert user_repository.get_user_by_email("first@example.com") is None
+
+    def test_after_commit_callbacks_run_once_the_outermost_block_commits(self, db_connection: DBConnectionHandler):
+        """Test that the after-commit callbacks wait for the commit of the outermost block, whichever instance
+        registered them.
+
+        Args:
+            db_connection (DBConnectionHandler): A database connection handler for the test database.
+        """
+        user_repository = UserRepository(db_connection=db_connection)
+        unit_of_work = SqlAlchemyUnitOfWork(db_connection=db_connection)
+        committed = []
+
+        with unit_of_work:
+            with SqlAlchemyUnitOfWork(db_connection=db_connection) as nested:
+                user_repository.create_user(make_user("first@example.com"))
+                nested.after_commit(lambda: committed.append(user_repository.get_user_by_email("first@example.com")))
+                nested.commit()
+                assert committed == []
+            unit_of_work.commit()
+
+        assert [user.email for user in committed] == ["first@example.com"]
+
+    def test_after_commit_callbacks_are_dropped_with_the_discarded_work(self, db_connection: DBConnectionHandler):
+        """Test that the after-commit callbacks of a unit of work left without committing never run.
+
+        Args:
+            db_connection (DBConnectionHandler): A database connection handler for the test database.
+        """
+        unit_of_work = SqlAlchemyUnitOfWork(db_connection=db_connection)
+        committed = []
+
+        with unit_of_work:
+            unit_of_work.after_commit(lambda: committed.append("first"))
+        with unit_of_work:
+            unit_of_work.commit()
+        unit_of_work.after_commit(lambda: committed.append("second"))
+
+        assert committed == ["second"]
+
+
+@pytest.mark.anyio
+class TestSqlAlchemyAsyncUnitOfWork:
+    """Test cases for the SqlAlchemyAsyncUnitOfWork class."""
+
+    async def test_repository_calls_are_committed_together(self, async_db_connection: AsyncDBConnectionHandler):
+        """Test that the repository calls made in a unit of work are committed together.
+
+        Args:
+            async_db_connection (AsyncDBConnectionHandler): An asynchronous handler for the test database.
+        """
+        user_repository = AsyncUserRepository(db_connection=async_db_connection)
+        unit_of_work = SqlAlchemyAsyncUnitOfWork(db_connection=async_db_connection)
+
+        async with unit_of_work:
+            first_user = await user_repository.create_user(make_user("first@example.com"))
+            await user_repository.create_user(make_user("second@example.com"))
+            await unit_of_work.commit()
+
+        assert await user_repository.get_user_by_id(first_user.id) == first_user
+
+    async def test_work_is_discarded_without_commit(self, async_db_connection: AsyncDBConnectionHandler):
+        """Test that leaving a unit of work without committing discards the work.
+
+        Args:
+            async_db_connection (AsyncDBConnectionHandler): An asynchronous handler for the test database.
+        """
+        user_repository = AsyncUserRepository(db_connection=async_db_connection)
+
+        async with SqlAlchemyAsyncUnitOfWork(db_connection=async_db_connection):
+            await user_repository.create_user(make_user("first@example.com"))
+
+        assert await user_repository.get_user_by_email("first@example.com") is None
+
+    async def test_after_commit_callbacks_run_once_committed(self, async_db_connection: AsyncDBConnectionHandler):
+        """Test that the after-commit callbacks run after the commit, and not when the work is discarded.
+
+        Args:
+            async_db_connection (AsyncDBConnectionHandler): An asynchronous handler for the test database.
+        """
+        unit_of_work = SqlAlchemyAsyncUnitOfWork(db_connection=async_db_connection)
+        committed = []
+
+        async with unit_of_work:
+            unit_of_work.after_commit(lambda: committed.append("discarded"))
+        async with unit_of_work:
+            unit_of_work.after_commit(lambda: committed.append("committed"))
+            assert committed == []
+            await unit_of_work.commit()
+
+        assert committed == ["committed"]
@@ -0,0 +1,43 @@
+from sqlalchemy import text
+
+from src.infra.db.settings import EngineRegistry, PoolSettings
+from src.infra.metrics import PoolCollector
+from src.infra.metrics.pool import POOL_CHECKOUT_WAIT, database_label
+
+
+class TestPoolMetrics:
+    """Test cases for the connection pool metrics of the registry engines."""
+
+    def test_checkouts_are_timed_and_the_pool_state_is_collected(self, tmp_path):
+        """Test that checking a connection out is observed, and the pool gauges follow the connections in use."""
+        registry = EngineRegistry(PoolSettings(pool_size=2, max_overflow=1))
+        engine = registry.get_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+        wait = POOL_CHECKOUT_WAIT.labels(database_label(engine))
+        checkouts_before = wait.snapshot()[0][-1]
+        collector = PoolCollector(registry.engines)
+
+        with engine.connect() as first, engine.connect() as second, engine.connect() as third:
+            for connection in (first, second, third):
+                connection.execute(text("SELECT 1"))
+            samples = {family.name: family.samples[0][2] for family in collector()}
+
+        assert wait.snapshot()[0][-1] == checkouts_before + 3
+        assert samples == {"db_pool_checked_out": 3, "db_pool_checked_in": 0, "db_pool_overflow": 1, "db_pool_size": 2}
+        registry.dispose_all()
+
+    def test_pool_stays_timed_after_the_engine_is_disposed(self, tmp_path):
+        """Test that the pool recreated by `dispose` keeps timing the checkouts."""
+        engine = EngineRegistry().get_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+
+        engine.dispose()
+
+        assert engine.pool.metrics_timed
+        engine.dispose()
+
+    def test_in_memory_pools_are_skipped(self):
+        """Test that pools without a size, such as those of in-memory SQLite databases, report no gauges."""
+        registry = EngineRegistry()
+        registry.get_engine("sqlite://")
+
+        assert all(not family.samples for family in PoolCollector(registry.engines)())
+        registry.dispose_all()
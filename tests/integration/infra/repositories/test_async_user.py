@@ -0,0 +1,94 @@
+import pytest
+
+from src.applications.dtos import UserDTO
+from src.infra.db.settings import AsyncDBConnectionHandler
+from src.infra.repositories.async_user import AsyncUserRepository
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+from src.domain.exceptions import EmailAlreadyExistsError, UserNotFoundError
+
+
+@pytest.mark.anyio
+class TestAsyncUserRepository:
+    """Test cases for the AsyncUserRepository class."""
+
+    @pytest.fixture
+    def user_repository(self, async_db_connection: AsyncDBConnectionHandler) -> AsyncUserRepositoryInterface:
+        """Create an instance of AsyncUserRepository with the test database.
+
+        Args:
+            async_db_connection (AsyncDBConnectionHandler): An asynchronous connection handler for the test database.
+
+        Returns:
+            user_repository (AsyncUserRepositoryInterface): An instance of AsyncUserRepository.
+        """
+        return AsyncUserRepository(db_connection=async_db_connection)
+
+    @pytest.fixture
+    def user_dto(self) -> UserDTO:
+        """
+        Fixture that returns a sample UserDTO instance for testing.
+
+        Returns:
+            user_dto (UserDTO): A UserDTO instance representing a sample user.
+        """
+        return UserDTO(id=None, name="John Doe", email="johndoe@example.com", password="password123", created_at=None)
+
+    async def test_create_user(self, user_repository: AsyncUserRepositoryInterface, user_dto: UserDTO):
+        """Test creating a new user.
+
+        Args:
+            user_repository (AsyncUserRepositoryInterface): An instance of AsyncUserRepository.
+            user_dto (UserDTO): UserDTO fixture containing sample user data.
+        """
+        created_user = await user_repository.create_user(user_dto)
+
+        assert isinstance(created_user, UserDTO)
+        assert created_user.id is not None
+
+    async def test_create_user_with_duplicated_email(
+        self, user_repository: AsyncUserRepositoryInterface, user_dto: UserDTO
+    ):
+        """Test that creating a user with an email already in use raises EmailAlreadyExistsError.
+
+        Args:
+            user_repository (AsyncUserRepositoryInterface): An instance of AsyncUserRepository.
+            user_dto (UserDTO): UserDTO fixture containing sample user data.
+        """
+        await user_repository.create_user(user_dto)
+
+        with pytest.raises(EmailAlreadyExistsError):
+            await user_repository.create_user(user_dto)
+
+    async def test_get_user_by_email(self, user_repository: AsyncUserRepositoryInterface, user_dto: UserDTO):
+        """Test fetching a user by email, when it exists and when it does not.
+
+        Args:
+            user_repository (AsyncUserRepositoryInterface): An instance of AsyncUserRepository.
+            user_dto (UserDTO): UserDTO fixture containing sample user data.
+        """
+        created_user = await user_repository.create_user(user_dto)
+
+        assert await user_repository.get_user_by_email(email=created_user.email) == created_user
+        assert await user_repository.get_user_by_email(email="test@example.com") is None
+
+    async def test_delete_user(self, user_repository: AsyncUserRepositoryInterface, user_dto: UserDTO):
+        """Test the deletion of a user.
+
+        Args:
+            user_repository (AsyncUserRepositoryInterface): An instance of AsyncUserRepository.
+            user_dto (UserDTO): UserDTO fixture containing sample user data.
+        """
+        created_user = await user_repository.create_user(user_dto)
+
+        await user_repository.delete_user(created_user.id)
+
+        assert await user_repository.get_user_by_id(created_user.id) is None
+
+    async def test_delete_user_with_invalid_id(self, user_repository: AsyncUserRepositoryInterface):
+        """Test deleting a user with an ID that does not exist.
+
+        Args:
+            user_repository (AsyncUserRepositoryInterface): An instance of AsyncUserRepository.
+        """
+        with pytest.raises(UserNotFoundError):
+            await user_repository.delete_user(9999)
@@ -0,0 +1,25 @@
+from datetime import datetime, timedelta, timezone
+
+from src.infra.db.settings.connection import DBConnectionHandler
+from src.infra.repositories.revoked_token import RevokedTokenRepository
+
+
+class TestRevokedTokenRepository:
+    """Test cases for the RevokedTokenRepository class."""
+
+    def test_revoked_tokens_are_listed_until_they_expire(self, db_connection: DBConnectionHandler):
+        """
+        Test that the revoked tokens are listed until they expire, and that expired ones are deleted.
+
+        Args:
+            db_connection (DBConnectionHandler): A database connection handler for the test database.
+        """
+        repository = RevokedTokenRepository(db_connection=db_connection)
+        now = datetime.now(timezone.utc)
+        repository.revoke_token("expired", now - timedelta(minutes=1))
+        repository.revoke_token("active", now + timedelta(minutes=1))
+        repository.revoke_token("active", now + timedelta(minutes=1))
+
+        assert repository.get_revoked_token_ids(now) == ["active"]
+        assert repository.delete_expired_tokens(now) == 1
+        assert repository.get_revoked_token_ids(now - timedelta(minutes=2)) == ["active"]
@@ -1,9 +1,14 @@
+from dataclasses import replace
+
 import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy import event
 
 from src.applications.dtos import UserDTO
 from src.infra.db.settings.connection import DBConnectionHandler
 from src.infra.repositories.user import UserRepository
 from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.exceptions import EmailAlreadyExistsError, UserNotFoundError
 
 
 class TestUserRepository:
@@ -53,12 +58,23 @@ class TestUserRepository:
         created_user = user_repository.create_user(user_dto)
         assert isinstance(created_user, UserDTO)
 
+    def test_create_user_with_duplicated_email(self, user_repository: UserRepositoryInterface, user_dto: UserDTO):
+        """Test that creating a user with an email already in use raises EmailAlreadyExistsError.
+
+        Args:
+            user_repository (UserRepositoryInterface): An instance of UserRepository.
+            user_dto (UserDTO): UserDTO fixture containing sample user data.
+        """
+        user_repository.create_user(user_dto)
+
+        with pytest.raises(EmailAlreadyExistsError):
+            user_repository.create_user(user_dto)
+
     def test_create_user_with_exception(self, user_repository: UserRepositoryInterface, user_dto: UserDTO):
         """Test creating a user with an exception raised during creation."""
 
-        user_dto.email = None
         with pytest.raises(Exception):
-            user_repository.create_user(user_dto)
+            user_repository.create_user(replace(user_dto, email=None))
 
     def test_get_user_by_email_when_found_user(
         self,
@@ -116,7 +132,149 @@ class TestUserRepository:
             user_repository (UserRepositoryInterface): An instance of UserRepository.
 
         Raises:
-            Exception: If the 'delete_user' method does not handle the invalid ID case correctly.
+            UserNotFoundError: If the 'delete_user' method does not handle the invalid ID case correctly.
         """
-        with pytest.raises(Exception):
+        with pytest.raises(UserNotFoundError):
             user_repository.delete_user(9999)
+
+    def test_update_password(self, user_repository: UserRepositoryInterface, user_dto: UserDTO):
+        """
+        Test that the password hash of a user is replaced, and that an unknown ID is reported.
+
+        Args:
+            user_repository (UserRepositoryInterface): An instance of UserRepository.
+            user_dto (UserDTO): A UserDTO instance representing a sample user.
+        """
+        created_user = user_repository.create_user(user_dto)
+
+        user_repository.update_password(created_user.id, "new-hash")
+
+        assert user_repository.get_user_by_id(created_user.id).password == "new-hash"
+        with pytest.raises(UserNotFoundError):
+            user_repository.update_password(9999, "new-hash")
+
+    def test_iter_emails_streams_every_email(self, user_repository: UserRepositoryInterface, user_dto: UserDTO):
+        """Test that the emails of every user are streamed in batches.
+
+        Args:
+            user_repository (UserRepositoryInterface): An instance of UserRepository.
+            user_dto (UserDTO): UserDTO fixture containing sample user data.
+        """
+        emails = {f"user{index}@example.com" for index in range(5)}
+        for email in emails:
+            user_repository.create_user(replace(user_dto, email=email))
+
+        assert set(user_repository.iter_emails(batch_size=2)) == emails
+
+    def test_create_users_skips_taken_emails(self, user_repository: UserRepositoryInterface, user_dto: UserDTO):
+        """Test that several users are created at once, leaving out those whose email is taken.
+
+        Args:
+            user_repository (UserRepositoryInterface): An instance of UserRepository.
+            user_dto (UserDTO): UserDTO fixture containing sample user data.
+        """
+        user_repository.create_user(user_dto)
+        users = [
+            UserDTO(id=None, name="Jane Doe", email="jane@example.com", password="secret", created_at=None),
+            UserDTO(id=None, name="John Doe", email=user_dto.email, password="secret", created_at=None),
+            UserDTO(id=None, name="Jim Doe", email="jim@example.com", password="secret", created_at=None),
+        ]
+
+        created_users = user_repository.create_users(users)
+
+        assert sorted(user.email for user in created_users) == ["jane@example.com", "jim@example.com"]
+        assert all(user.id is not None and user.created_at is not None for user in created_users)
+        assert user_repository.get_user_by_email("jim@example.com") == next(
+            user for user in created_users if user.email == "jim@example.com"
+        )
+        assert user_repository.create_users([]) == []
+
+    def test_iter_users_streams_every_user_in_id_order(
+        self, user_repository: UserRepositoryInterface, user_dto: UserDTO
+    ):
+        """Test that every user is streamed in ID order, in batches.
+
+        Args:
+            user_repository (UserRepositoryInterface): An instance of UserRepository.
+            user_dto (UserDTO): UserDTO fixture containing sample user data.
+        """
+        created_users = []
+        for index in range(5):
+            created_users.append(user_repository.create_user(replace(user_dto, email=f"user{index}@example.com")))
+
+        assert list(user_repository.iter_users(batch_size=2)) == created_users
+
+    def test_list_users_pages_by_id(self, user_repository: UserRepositoryInterface, user_dto: UserDTO):
+        """Test that the users are paged in ID order after the given ID, and counted.
+
+        Args:
+            user_repository (UserRepositoryInterface): An instance of UserRepository.
+            user_dto (UserDTO): UserDTO fixture containing sample user data.
+        """
+        created_users = []
+        for index in range(5):
+            created_users.append(user_repository.create_user(replace(user_dto, email=f"user{index}@example.com")))
+
+        first_page = user_repository.list_users(limit=2)
+        second_page = user_repository.list_users(after_id=first_page[-1].id, limit=2)
+        last_page = user_repository.list_users(after_id=created_users[3].id, limit=2)
+
+        assert first_page == created_users[:2]
+        assert second_page == created_users[2:4]
+        assert last_page == created_users[4:]
+        assert user_repository.estimate_user_count() == 5
+
+    def test_search_users_by_name_and_email(self, user_repository: UserRepositoryInterface):
+        """Test that users are found by a part of their name or email, prefix matches first.
+
+        Args:
+            user_repository (UserRepositoryInterface): An instance of UserRepository.
+        """
+        for name, email in [
+            ("Maria Johnson", "maria@example.com"),
+            ("John Smith", "smith@example.com"),
+            ("Ann Lee", "johnny_lee@example.com"),
+            ("Bob Stone", "bob@example.com"),
+        ]:
+            user_repository.create_user(UserDTO(id=None, name=name, email=email, password="secret", created_at=None))
+        deleted_user = user_repository.create_user(
+            UserDTO(id=None, name="John Gone", email="gone@example.com", password="secret", created_at=None)
+        )
+        user_repository.delete_user(deleted_user.id)
+
+        names = [user.name for user in user_repository.search_users("JOHN")]
+        short_names = [user.name for user in user_repository.search_users("jo")]
+
+        assert set(names[:2]) == {"John Smith", "Ann Lee"}
+        assert names[2:] == ["Maria Johnson"]
+        assert set(short_names) == {"Maria Johnson", "John Smith", "Ann Lee"}
+        assert [user.name for user in user_repository.search_users("y_l")] == ["Ann Lee"]
+        assert user_repository.search_users("%") == []
+        assert len(user_repository.search_users("example", limit=2)) == 2
+
+    def test_get_users_by_ids_and_emails_in_chunks(
+        self, mocker: MockerFixture, user_repository: UserRepositoryInterface, user_dto: UserDTO
+    ):
+        """Test that many users are resolved by ID and by email, one query per chunk of identifiers.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+            user_repository (UserRepositoryInterface): An instance of UserRepository.
+            user_dto (UserDTO): UserDTO fixture containing sample user data.
+        """
+        mocker.patch("src.infra.repositories.user.LOOKUP_CHUNK_SIZE", 2)
+        created_users = []
+        for index in range(5):
+            created_users.append(user_repository.create_user(replace(user_dto, email=f"user{index}@example.com")))
+        statements = []
+        event.listen(
+            user_repository.db_connection.engine, "before_cursor_execute", lambda *args: statements.append(args)
+        )
+
+        by_ids = user_repository.get_users_by_ids([user.id for user in created_users] + [9999, created_users[0].id])
+        by_emails = user_repository.get_users_by_emails(["user1@example.com", "unknown@example.com"])
+
+        assert sorted(by_ids, key=lambda user: user.id) == created_users
+        assert by_emails == [created_users[1]]
+        assert len(statements) == 4
+        assert user_repository.get_users_by_ids([]) == []
@@ -0,0 +1,58 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from src.infra.db.settings import EngineRegistry
+from src.infra.tracing import InMemorySpanExporter, SpanKind, StatusCode, tracer
+
+
+@pytest.fixture
+def exporter():
+    """Fixture turning the global tracer on with an in-memory exporter."""
+    exporter = InMemorySpanExporter()
+    tracer.configure(exporter)
+    yield exporter
+    tracer.configure(None)
+
+
+@pytest.fixture
+def engine():
+    """Fixture providing an in-memory SQLite engine, traced by the engine registry."""
+    engine = EngineRegistry().get_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+def test_statements_are_traced_inside_a_span(exporter, engine):
+    """Test that each statement run inside a span gets a client span, the child of the current span."""
+    with tracer.start_as_current_span("request") as parent:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1")).scalar()
+
+    statement, request = exporter.get_finished_spans()
+    assert request is parent
+    assert statement.name == "SELECT"
+    assert statement.kind is SpanKind.CLIENT
+    assert statement.parent == parent.context
+    assert statement.attributes["db.system"] == "sqlite"
+    assert statement.attributes["db.statement"] == "SELECT 1"
+
+
+def test_statements_outside_a_span_are_not_traced(exporter, engine):
+    """Test that statements run outside a request, such as at startup, start no trace."""
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1")).scalar()
+
+    assert exporter.get_finished_spans() == []
+
+
+def test_failed_statement_span_records_the_error(exporter, engine):
+    """Test that the span of a statement that fails is ended with an error status."""
+    with tracer.start_as_current_span("request"):
+        with engine.connect() as connection:
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM missing"))
+
+    statement = exporter.get_finished_spans()[0]
+    assert statement.attributes["db.statement"] == "SELECT * FROM missing"
+    assert statement.status is StatusCode.ERROR
@@ -0,0 +1,65 @@
+import pytest
+from fastapi.testclient import TestClient
+
+
+class TestAuthEndpoints:
+    """Test cases for the login and logout endpoints."""
+
+    @pytest.fixture
+    def user_data(self, client: TestClient) -> dict:
+        """
+        Fixture that creates a user and provides their data.
+
+        Args:
+            client (TestClient): The TestClient instance to make requests.
+
+        Returns:
+            user_data (dict): User data in the format {"email": str, "name": str, "password": str}.
+        """
+        user_data = {"email": "test@example.com", "name": "Test User", "password": "testpassword"}
+        client.post("api/users/", json=user_data)
+        return user_data
+
+    def test_login_issues_a_token_that_logout_revokes(self, client: TestClient, user_data: dict):
+        """
+        Test that the token issued by a login authenticates the logout, and is rejected once revoked.
+
+        Args:
+            client (TestClient): The TestClient instance to make requests.
+            user_data (dict): The data of the created user.
+        """
+        response = client.post("api/auth/login", json={"email": user_data["email"], "password": user_data["password"]})
+
+        assert response.status_code == 200
+        assert response.json()["token_type"] == "bearer"
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        assert client.post("api/auth/logout", headers=headers).status_code == 204
+        response = client.post("api/auth/logout", headers=headers)
+        assert response.status_code == 401
+        assert response.headers["WWW-Authenticate"].startswith("Bearer")
+
+    @pytest.mark.parametrize("email, password", [("test@example.com", "wrong"), ("unknown@example.com", "x")])
+    def test_login_with_wrong_credentials(self, client: TestClient, user_data: dict, email: str, password: str):
+        """
+        Test that a wrong password and an unknown email are rejected alike.
+
+        Args:
+            client (TestClient): The TestClient instance to make requests.
+            user_data (dict): The data of the created user.
+            email (str): The email of the login.
+            password (str): The password of the login.
+        """
+        response = client.post("api/auth/login", json={"email": email, "password": password})
+
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Invalid email or password."
+
+    def test_logout_without_a_valid_token(self, client: TestClient):
+        """
+        Test that a request without a token, or with a forged one, is not authenticated.
+
+        Args:
+            client (TestClient): The TestClient instance to make requests.
+        """
+        assert client.post("api/auth/logout").status_code == 401
+        assert client.post("api/auth/logout", headers={"Authorization": "Bearer forged.token"}).status_code == 401
@@ -0,0 +1,73 @@
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.infra.db.settings.connection import DBConnectionHandler
+from src.main.fast_api.configs.server import app
+
+USER = {"name": "Metrics User", "email": "metrics@example.com", "password": "password123"}
+
+
+def sample(metrics: str, name: str) -> float:
+    """
+    Read the value of a sample from the metrics.
+
+    Args:
+        metrics (str): The metrics in the Prometheus text format.
+        name (str): The name of the sample, with its labels.
+
+    Returns:
+        (float): The value of the sample, 0 when it is not in the metrics.
+    """
+    match = re.search(rf"^{re.escape(name)} (\S+)$", metrics, re.MULTILINE)
+    return float(match.group(1)) if match else 0.0
+
+
+def test_metrics_count_the_requests_and_the_use_case_outcomes(client: TestClient):
+    """Test that /metrics reports the request durations per route and status and the use case outcomes."""
+    before = client.get("/metrics").text
+
+    created = client.post("/api/users/", json=USER)
+    client.post("/api/users/", json=USER)
+    client.get("/api/users/", params={"email": "unknown@example.com"})
+    client.delete(f"/api/users/{created.json()['attributes']['id']}")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/plain; version=0.0.4; charset=utf-8"
+    after = response.text
+    for name in (
+        'use_case_outcomes_total{use_case="create_user",outcome="SUCCESS"}',
+        'use_case_outcomes_total{use_case="create_user",outcome="EMAIL_ALREADY_EXISTS"}',
+        'use_case_outcomes_total{use_case="get_user",outcome="READ_NOT_FOUND"}',
+        'http_request_duration_seconds_count{method="POST",route="/api/users/",status="201"}',
+        'http_request_duration_seconds_count{method="DELETE",route="/api/users/{user_id}",status="200"}',
+    ):
+        assert sample(after, name) == sample(before, name) + 1, name
+    assert sample(after, 'http_requests_in_flight{method="GET"}') == 1
+    assert "# TYPE db_pool_checkout_wait_seconds histogram" in after
+    assert 'db_pool_checked_out{database="sqlite:///./test.db"}' in after
+
+
+def test_metrics_report_the_user_cache_and_the_email_filter(
+    db_connection: DBConnectionHandler, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that /metrics reports the counters of the user cache and the size and false positives of the email filter."""
+    monkeypatch.setenv("USER_CACHE_ENABLED", "true")
+    monkeypatch.setenv("EMAIL_FILTER_ENABLED", "true")
+    monkeypatch.setenv("EMAIL_FILTER_EXPECTED_ITEMS", "1000")
+
+    with TestClient(app) as client:
+        client.post("/api/users/", json=USER)
+        client.get("/api/users/", params={"email": USER["email"]})
+        client.get("/api/users/", params={"email": USER["email"]})
+        client.get("/api/users/", params={"email": "unknown@example.com"})
+        metrics = client.get("/metrics").text
+
+    assert sample(metrics, 'cache_hits_total{cache="user"}') == 1
+    assert sample(metrics, 'cache_misses_total{cache="user"}') == 1
+    assert sample(metrics, "email_filter_memory_bytes") > 0
+    assert sample(metrics, "email_filter_definite_misses_total") == 1
+    assert "# TYPE email_filter_estimated_false_positive_rate gauge" in metrics
+    assert "cache_hits_total" not in client.get("/metrics").text
@@ -0,0 +1,33 @@
+from fastapi.testclient import TestClient
+
+from src.infra.db.settings.connection import DBConnectionHandler
+from src.applications.use_cases.user.create_user import CreateUserUseCase
+from src.infra.profiling import function_name, sign_profile_token
+from src.main.fast_api.configs.server import app
+from src.main.fast_api.middlewares import ProfilingMiddleware, ProfilingSettings
+from src.presenters.controllers.user.create_user import CreateUserController
+
+SECRET = "profiling-secret"
+USER = {"name": "Profiled User", "email": "profiled@example.com", "password": "password123"}
+
+
+def test_profile_follows_the_request_into_the_worker_thread(db_connection: DBConnectionHandler):
+    """Test that the profile of a users route covers the controller, the use case and the repository."""
+    profiled_app = ProfilingMiddleware(app, ProfilingSettings(secret=SECRET, interval=0.0002))
+    with TestClient(profiled_app) as client:
+        response = client.post(
+            "/api/users/",
+            json=USER,
+            headers={"X-Profile": sign_profile_token(SECRET), "X-Profile-Output": "inline"},
+        )
+
+    assert response.headers["X-Profile-Status"] == "201"
+    document = response.json()
+    frames = [frame["name"] for frame in document["shared"]["frames"]]
+    (profile,) = document["profiles"]
+    assert profile["samples"]
+    assert all(
+        frames[sample[0]] == function_name(ProfilingMiddleware.__call__.__code__) for sample in profile["samples"]
+    )
+    assert function_name(CreateUserController.route.__code__) in frames
+    assert function_name(CreateUserUseCase.create_user.__code__) in frames
@@ -0,0 +1,44 @@
+import pytest
+from fastapi.testclient import TestClient
+
+USER = {"name": "Budget User", "email": "budget@example.com", "password": "password123"}
+EMAILS = [f"budget{index}@example.com" for index in range(5)]
+NEW_USERS = [{**USER, "email": f"new{index}@example.com"} for index in range(20)]
+
+
+@pytest.fixture
+def user(client: TestClient) -> dict:
+    """Fixture creating a user, with a few more for the lists."""
+    client.post("/api/users/bulk", json=[{**USER, "email": email} for email in EMAILS])
+    return client.post("/api/users/", json=USER).json()["attributes"]
+
+
+@pytest.mark.parametrize(
+    "method, path, options, status_code, budget",
+    [
+        ("post", "/api/users/", {"json": {**USER, "email": "new@example.com"}}, 201, 1),
+        ("post", "/api/users/bulk", {"json": NEW_USERS}, 200, 1),
+        ("get", "/api/users/", {"params": {"email": USER["email"]}}, 200, 1),
+        ("get", "/api/users/", {"params": {"email": "unknown@example.com"}}, 404, 1),
+        ("get", "/api/users/list", {"params": {"limit": 3}}, 200, 1),
+        ("get", "/api/users/list", {"params": {"limit": 3, "include_total": True}}, 200, 2),
+        ("get", "/api/users/search", {"params": {"q": "budget"}}, 200, 1),
+        ("post", "/api/users/batch", {"json": {"emails": EMAILS}}, 200, 1),
+        ("get", "/api/users/export", {}, 200, 1),
+        ("post", "/api/auth/login", {"json": {"email": USER["email"], "password": USER["password"]}}, 200, 1),
+    ],
+)
+def test_endpoint_query_budget(client: TestClient, user: dict, max_queries, method, path, options, status_code, budget):
+    """Test that each endpoint stays within its budget of SQL statements, however many users it handles."""
+    with max_queries(budget):
+        response = getattr(client, method)(path, **options)
+
+    assert response.status_code == status_code
+
+
+def test_delete_query_budget(client: TestClient, user: dict, max_queries):
+    """Test that deleting a user, and failing to delete an unknown one, take a single statement."""
+    with max_queries(1):
+        assert client.delete(f"/api/users/{user['id']}").status_code == 200
+    with max_queries(1):
+        assert client.delete(f"/api/users/{user['id']}").status_code == 400
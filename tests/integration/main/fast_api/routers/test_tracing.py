@@ -0,0 +1,55 @@
+from fastapi.testclient import TestClient
+
+from src.infra.tracing import InMemorySpanExporter, SpanKind, parse_traceparent, tracer
+
+USER = {"name": "Traced User", "email": "traced@example.com", "password": "password123"}
+TRACEPARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+def test_request_is_traced_across_every_layer(span_exporter: InMemorySpanExporter, client: TestClient):
+    """Test that a request continues the trace of its caller down to its SQL statement, one span per layer."""
+    client.post("/api/users/", json=USER)
+    span_exporter.clear()
+
+    response = client.get("/api/users/", params={"email": USER["email"]}, headers={"traceparent": TRACEPARENT})
+
+    assert response.status_code == 200
+    spans = span_exporter.get_finished_spans()
+    by_id = {span.context.span_id: span for span in spans}
+    (server,) = [span for span in spans if span.kind is SpanKind.SERVER]
+    (statement,) = [span for span in spans if span.kind is SpanKind.CLIENT]
+    chain = []
+    span = statement
+    while span is not None:
+        chain.append(span)
+        span = by_id.get(span.parent.span_id)
+    assert chain[-1] is server
+    assert server.parent == parse_traceparent(TRACEPARENT)
+    assert server.name == "GET /api/users/"
+    assert server.attributes["http.route"] == "/api/users/"
+    assert server.attributes["http.response.status_code"] == 200
+    assert {span.context.trace_id for span in spans} == {server.context.trace_id}
+    assert server.context.trace_id_hex == "0af7651916cd43dd8448eb211c80319c"
+    assert [(span.name, span.attributes.get("app.layer")) for span in reversed(chain)] == [
+        ("GET /api/users/", None),
+        ("fast_api_adapter", None),
+        ("GetUserController.route", "controller"),
+        ("GetUserUseCase.get_user_by_email", "use_case"),
+        ("SingleFlightUserRepository.get_user_by_email", "repository"),
+        ("UserRepository.get_user_by_email", "repository"),
+        ("SELECT", None),
+    ]
+
+
+def test_caller_decision_not_to_sample_is_followed(span_exporter: InMemorySpanExporter, client: TestClient):
+    """Test that a request whose caller did not sample its trace records no span."""
+    client.get("/api/users/", params={"email": USER["email"]}, headers={"traceparent": TRACEPARENT[:-2] + "00"})
+
+    assert span_exporter.get_finished_spans() == []
+
+
+def test_requests_are_not_traced_by_default(client: TestClient):
+    """Test that no tracing happens when it is not configured."""
+    client.get("/api/users/", params={"email": USER["email"]})
+
+    assert not tracer.enabled
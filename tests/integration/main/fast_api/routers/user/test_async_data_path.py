@@ -0,0 +1,103 @@
+from typing import Any, Generator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.applications.enums.user.success import UserSuccessEnum
+from src.infra.db.settings.connection import DBConnectionHandler
+from src.main.fast_api.configs.server import app
+from src.presenters.controllers.user.async_get_user import AsyncGetUserController
+
+
+class TestAsyncDataPath:
+    """
+    Test cases for the user endpoints served by the asyncio data path.
+
+    The application container is built with `DATA_ACCESS_MODE=async`, so the endpoints await the
+    asynchronous controllers, use cases and repository instead of running in the threadpool.
+    """
+
+    @pytest.fixture
+    def async_client(
+        self, db_connection: DBConnectionHandler, monkeypatch: pytest.MonkeyPatch
+    ) -> Generator[TestClient, Any, None]:
+        """
+        Fixture that returns a TestClient for the application configured with the asyncio data path.
+
+        Args:
+            db_connection (DBConnectionHandler): A database connection handler for the test database.
+            monkeypatch (pytest.MonkeyPatch): The pytest monkeypatch fixture.
+
+        Yields:
+            TestClient: A TestClient instance for testing.
+        """
+        monkeypatch.setenv("DATA_ACCESS_MODE", "async")
+        monkeypatch.setenv("SQLALCHEMY_ASYNC_DATABASE_URL", db_connection.connection_string)
+        with TestClient(app) as test_client:
+            yield test_client
+
+    def test_user_lifecycle(self, async_client: TestClient):
+        """
+        Test creating, retrieving and deleting a user through the asyncio data path.
+
+        Args:
+            async_client (TestClient): The TestClient fixture configured with the asyncio data path.
+        """
+        user_data = {"email": "test@example.com", "name": "Test User", "password": "testpassword"}
+
+        assert isinstance(async_client.app.state.container.resolve("get_user_controller"), AsyncGetUserController)
+        assert async_client.post("/api/users/", json=user_data).status_code == 201
+        assert async_client.post("/api/users/", json=user_data).status_code == 400
+        get_user_response = async_client.get(f"/api/users/?email={user_data['email']}")
+        assert get_user_response.status_code == 200
+        user_id = get_user_response.json()["attributes"]["id"]
+        delete_user_response = async_client.delete(f"/api/users/{user_id}")
+        assert delete_user_response.json()["detail"] == UserSuccessEnum.DELETE_SUCCESS.value
+        assert async_client.get(f"/api/users/?email={user_data['email']}").status_code == 404
+        assert async_client.delete(f"/api/users/{user_id}").status_code == 400
+
+    def test_deleted_user_cannot_log_in_with_the_user_cache(
+        self, async_client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Test that a user deleted through the asyncio data path is dropped from the cache the login reads.
+
+        Args:
+            async_client (TestClient): The TestClient fixture configured with the asyncio data path.
+            monkeypatch (pytest.MonkeyPatch): The pytest monkeypatch fixture.
+        """
+        monkeypatch.setenv("USER_CACHE_ENABLED", "true")
+        monkeypatch.setenv("USER_CACHE_TTL", "3600")
+        user_data = {"email": "test@example.com", "name": "Test User", "password": "testpassword"}
+        credentials = {"email": user_data["email"], "password": user_data["password"]}
+
+        with TestClient(app) as client:
+            client.post("/api/users/", json=user_data)
+            assert client.post("/api/auth/login", json=credentials).status_code == 200
+            user_id = client.get(f"/api/users/?email={user_data['email']}").json()["attributes"]["id"]
+            assert client.delete(f"/api/users/{user_id}").status_code == 200
+
+            assert client.post("/api/auth/login", json=credentials).status_code == 401
+
+    def test_created_user_is_known_to_the_synchronous_routes_with_the_email_filter(
+        self, async_client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Test that a user created through the asyncio data path is found by the login and the batch lookup,
+        which read through the email filter of the synchronous repository.
+
+        Args:
+            async_client (TestClient): The TestClient fixture configured with the asyncio data path.
+            monkeypatch (pytest.MonkeyPatch): The pytest monkeypatch fixture.
+        """
+        monkeypatch.setenv("EMAIL_FILTER_ENABLED", "true")
+        monkeypatch.setenv("EMAIL_FILTER_EXPECTED_ITEMS", "1000")
+        user_data = {"email": "test@example.com", "name": "Test User", "password": "testpassword"}
+        credentials = {"email": user_data["email"], "password": user_data["password"]}
+
+        with TestClient(app) as client:
+            assert client.post("/api/users/", json=user_data).status_code == 201
+
+            assert client.post("/api/auth/login", json=credentials).status_code == 200
+            batch_response = client.post("/api/users/batch", json={"emails": [user_data["email"]]})
+            assert batch_response.json()["missing_emails"] == []
@@ -0,0 +1,40 @@
+from fastapi.testclient import TestClient
+
+
+class TestBatchGetUsersEndpoint:
+    """Test cases for the batch user lookup endpoint."""
+
+    def test_batch_get_users(self, client: TestClient):
+        """
+        Test that the users are returned keyed by identifier, with the missing identifiers.
+
+        Args:
+            client (TestClient): The TestClient instance to make requests.
+        """
+        users = [
+            {"email": f"user{index}@example.com", "name": f"User {index}", "password": "secret"} for index in range(3)
+        ]
+        created = client.post("api/users/bulk", json=users).json()["created"]
+        first_id = created[0]["id"]
+
+        response = client.post(
+            "api/users/batch", json={"ids": [first_id, 9999], "emails": ["user2@example.com", "nobody@example.com"]}
+        )
+
+        assert response.status_code == 200
+        result = response.json()
+        assert result["users_by_id"][str(first_id)]["email"] == "user0@example.com"
+        assert result["users_by_email"]["user2@example.com"]["name"] == "User 2"
+        assert result["missing_ids"] == [9999]
+        assert result["missing_emails"] == ["nobody@example.com"]
+
+    def test_batch_get_users_without_identifiers(self, client: TestClient):
+        """
+        Test that a lookup without identifiers is rejected.
+
+        Args:
+            client (TestClient): The TestClient instance to make requests.
+        """
+        response = client.post("api/users/batch", json={})
+
+        assert response.status_code == 422
@@ -0,0 +1,79 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from src.applications.enums.user.errors import UserErrorsEnum
+
+
+class TestBulkCreateUsersEndpoint:
+    """Test cases for the bulk user import endpoint."""
+
+    def test_import_json_array(self, client: TestClient):
+        """
+        Test that a JSON array is imported and that taken emails and invalid rows are reported.
+
+        Args:
+            client (TestClient): The TestClient instance to make requests.
+        """
+        client.post("api/users/", json={"email": "taken@example.com", "name": "Taken", "password": "secret"})
+        users = [
+            {"email": "first@example.com", "name": "First", "password": "secret"},
+            {"email": "taken@example.com", "name": "Taken", "password": "secret"},
+            {"email": "second@example.com", "name": "Second"},
+            {"email": "third@example.com", "name": "Third", "password": "secret"},
+        ]
+
+        response = client.post("api/users/bulk", json=users)
+
+        assert response.status_code == 200
+        report = response.json()
+        assert [created["row"] for created in report["created"]] == [1, 4]
+        assert report["created_count"] == 2
+        assert [(failed["row"], failed["email"]) for failed in report["failed"]] == [
+            (2, "taken@example.com"),
+            (3, None),
+        ]
+        assert report["failed"][0]["error"] == UserErrorsEnum.EMAIL_ALREADY_EXISTS.value
+        assert "password" in report["failed"][1]["error"]
+        assert client.get("api/users/", params={"email": "third@example.com"}).status_code == 200
+
+    def test_import_ndjson_stream(self, client: TestClient):
+        """
+        Test that an NDJSON body is imported line by line, reporting the lines that are not valid JSON.
+
+        Args:
+            client (TestClient): The TestClient instance to make requests.
+        """
+        lines = [
+            json.dumps({"email": "first@example.com", "name": "First", "password": "secret"}),
+            "{not json",
+            "",
+            json.dumps({"email": "first@example.com", "name": "Again", "password": "secret"}),
+            json.dumps({"email": "second@example.com", "name": "Second", "password": "secret"}),
+        ]
+
+        def body():
+            for line in lines:
+                yield (line + "\n").encode()
+
+        response = client.post("api/users/bulk", content=body(), headers={"content-type": "application/x-ndjson"})
+
+        assert response.status_code == 200
+        report = response.json()
+        assert [(created["row"], created["email"]) for created in report["created"]] == [
+            (1, "first@example.com"),
+            (4, "second@example.com"),
+        ]
+        assert [failed["row"] for failed in report["failed"]] == [2, 3]
+        assert report["failed"][0]["error"].startswith("Invalid JSON")
+
+    def test_import_rejects_a_body_that_is_not_an_array(self, client: TestClient):
+        """
+        Test that a JSON body that is not an array is rejected.
+
+        Args:
+            client (TestClient): The TestClient instance to make requests.
+        """
+        response = client.post("api/users/bulk", json={"email": "first@example.com"})
+
+        assert response.status_code == 422
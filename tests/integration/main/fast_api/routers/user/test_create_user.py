@@ -1,6 +1,10 @@
 import pytest
 from fastapi.testclient import TestClient
 
+from src.applications.services.password_hasher import PasswordHashingSettings, verify_password
+from src.infra.db.settings.connection import DBConnectionHandler
+from src.infra.repositories.user import UserRepository
+
 
 class TestCreateUserEndpoint:
     """
@@ -58,3 +62,25 @@ class TestCreateUserEndpoint:
         response = client.post("api/users/", json=user_data)
 
         assert response.status_code == 400
+
+    def test_create_user_stores_a_password_hash(
+        self, client: TestClient, db_connection: DBConnectionHandler, user_data: dict
+    ):
+        """
+        Test that the create_user endpoint stores a hash of the password instead of the password.
+
+        Parameters:
+            client (TestClient): The TestClient instance to make requests.
+            db_connection (DBConnectionHandler): A database connection handler for the test database.
+            user_data (dict): User data for creating a new user in the request body.
+
+        """
+        client.post("api/users/", json=user_data)
+
+        stored_user = UserRepository(db_connection=db_connection).get_user_by_email(user_data["email"])
+
+        assert stored_user.password != user_data["password"]
+        assert verify_password(user_data["password"], stored_user.password, PasswordHashingSettings.from_env()) == (
+            True,
+            None,
+        )
@@ -1,7 +1,11 @@
+from typing import Any, Generator
+
 import pytest
 from fastapi.testclient import TestClient
 
 from src.applications.enums.user.success import UserSuccessEnum
+from src.infra.db.settings.connection import DBConnectionHandler
+from src.main.fast_api.configs.server import app
 
 
 class TestDeleteUserByEmailEndpoint:
@@ -68,3 +72,46 @@ class TestDeleteUserByEmailEndpoint:
         non_existent_id = 999
         response = client.delete(f"/api/users/{non_existent_id}")
         assert response.status_code == 400
+
+    def test_delete_user_with_an_id_that_is_not_an_integer(self, client: TestClient):
+        """
+        Test deleting a user with an ID that is not an integer.
+
+        Args:
+            client (TestClient): FastAPI TestClient instance.
+        """
+        response = client.delete("/api/users/not-an-id")
+        assert response.status_code == 400
+
+    @pytest.fixture
+    def cached_client(
+        self, db_connection: DBConnectionHandler, monkeypatch: pytest.MonkeyPatch
+    ) -> Generator[TestClient, Any, None]:
+        """
+        Fixture that returns a TestClient for the application with the read-through user cache on.
+
+        Args:
+            db_connection (DBConnectionHandler): A database connection handler for the test database.
+            monkeypatch (pytest.MonkeyPatch): The pytest monkeypatch fixture.
+
+        Yields:
+            TestClient: A TestClient instance for testing.
+        """
+        monkeypatch.setenv("USER_CACHE_ENABLED", "true")
+        monkeypatch.setenv("USER_CACHE_TTL", "3600")
+        with TestClient(app) as test_client:
+            yield test_client
+
+    def test_deleted_user_is_not_served_from_the_cache(self, cached_client: TestClient, user_data: dict):
+        """
+        Test that deleting a user invalidates the cached lookup of its email.
+
+        Args:
+            cached_client (TestClient): The TestClient fixture with the user cache on.
+            user_data (dict): User data used for the test.
+        """
+        cached_client.post("/api/users/", json=user_data)
+        user_id = cached_client.get("/api/users/", params={"email": user_data["email"]}).json()["attributes"]["id"]
+
+        assert cached_client.delete(f"/api/users/{user_id}").status_code == 200
+        assert cached_client.get("/api/users/", params={"email": user_data["email"]}).status_code == 404
@@ -0,0 +1,67 @@
+import csv
+import io
+import json
+
+from fastapi.testclient import TestClient
+
+
+class TestExportUsersEndpoint:
+    """Test cases for the user export endpoint."""
+
+    def create_users(self, client: TestClient, count: int) -> None:
+        """
+        Create sample users through the bulk import endpoint.
+
+        Args:
+            client (TestClient): The TestClient instance to make requests.
+            count (int): The number of users to create.
+        """
+        users = [
+            {"email": f"user{index}@example.com", "name": f"User {index}", "password": "secret"}
+            for index in range(count)
+        ]
+        client.post("api/users/bulk", json=users)
+
+    def test_export_ndjson(self, client: TestClient):
+        """
+        Test that every user is streamed as NDJSON without their password.
+
+        Args:
+            client (TestClient): The TestClient instance to make requests.
+        """
+        self.create_users(client, 3)
+
+        response = client.get("api/users/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        users = [json.loads(line) for line in response.text.splitlines()]
+        assert [user["email"] for user in users] == [f"user{index}@example.com" for index in range(3)]
+        assert all("password" not in user for user in users)
+
+    def test_export_csv(self, client: TestClient):
+        """
+        Test that every user is streamed as a CSV attachment.
+
+        Args:
+            client (TestClient): The TestClient instance to make requests.
+        """
+        self.create_users(client, 2)
+
+        response = client.get("api/users/export", params={"format": "csv"})
+
+        assert response.status_code == 200
+        assert response.headers["content-disposition"] == 'attachment; filename="users.csv"'
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [row["name"] for row in rows] == ["User 0", "User 1"]
+
+    def test_export_with_unsupported_format(self, client: TestClient):
+        """
+        Test that an unsupported format is rejected.
+
+        Args:
+            client (TestClient): The TestClient instance to make requests.
+        """
+        response = client.get("api/users/export", params={"format": "xml"})
+
+        assert response.status_code == 422
@@ -1,6 +1,13 @@
+from datetime import datetime
+from unittest.mock import Mock
+
 import pytest
 from fastapi.testclient import TestClient
 
+from src.applications.dtos import UserDTO
+from src.domain.controller import ControllerInterface
+from src.presenters.helpers.http_types import HttpResponse
+
 
 class TestGetUserByEmailEndpoint:
     """
@@ -68,3 +75,26 @@ class TestGetUserByEmailEndpoint:
         non_existent_email = "nonexistent@example.com"
         response = client.get(f"/api/users/?email={non_existent_email}")
         assert response.status_code == 404
+
+    def test_get_user_with_overridden_controller(self, client: TestClient):
+        """
+        Test that the controller of the endpoint can be overridden through the application container.
+
+        Args:
+            client (TestClient): FastAPI TestClient instance.
+        """
+        user_dto = UserDTO(
+            id=1, name="Test User", email="test@example.com", password="testpassword", created_at=datetime.now()
+        )
+        controller = Mock(spec=ControllerInterface)
+        controller.route.return_value = HttpResponse(status_code=200, body=user_dto)
+        container = client.app.state.container
+        container.override("get_user_controller", lambda _: controller)
+        try:
+            response = client.get(f"/api/users/?email={user_dto.email}")
+        finally:
+            container.reset_overrides()
+
+        assert response.status_code == 200
+        assert response.json()["attributes"]["email"] == user_dto.email
+        controller.route.assert_called_once()
@@ -0,0 +1,42 @@
+from fastapi.testclient import TestClient
+
+
+class TestListUsersEndpoint:
+    """Test cases for the user listing endpoint."""
+
+    def test_list_users_follows_the_cursors(self, client: TestClient):
+        """
+        Test that following the cursors walks through every user once, in ID order.
+
+        Args:
+            client (TestClient): The TestClient instance to make requests.
+        """
+        users = [
+            {"email": f"user{index}@example.com", "name": f"User {index}", "password": "secret"} for index in range(5)
+        ]
+        client.post("api/users/bulk", json=users)
+
+        emails = []
+        params = {"limit": 2, "include_total": "true"}
+        while True:
+            response = client.get("api/users/list", params=params)
+            assert response.status_code == 200
+            page = response.json()
+            assert page["total_estimate"] == 5
+            emails.extend(user["email"] for user in page["users"])
+            if page["next_cursor"] is None:
+                break
+            params["cursor"] = page["next_cursor"]
+
+        assert emails == [user["email"] for user in users]
+
+    def test_list_users_with_invalid_limit(self, client: TestClient):
+        """
+        Test that an invalid limit is rejected.
+
+        Args:
+            client (TestClient): The TestClient instance to make requests.
+        """
+        response = client.get("api/users/list", params={"limit": 0})
+
+        assert response.status_code == 422
@@ -0,0 +1,35 @@
+from fastapi.testclient import TestClient
+
+
+class TestSearchUsersEndpoint:
+    """Test cases for the user search endpoint."""
+
+    def test_search_users(self, client: TestClient):
+        """
+        Test that the users matching the text are returned, prefix matches first.
+
+        Args:
+            client (TestClient): The TestClient instance to make requests.
+        """
+        users = [
+            {"email": "maria@example.com", "name": "Maria Johnson", "password": "secret"},
+            {"email": "john@example.com", "name": "John Smith", "password": "secret"},
+            {"email": "bob@example.com", "name": "Bob Stone", "password": "secret"},
+        ]
+        client.post("api/users/bulk", json=users)
+
+        response = client.get("api/users/search", params={"q": "john"})
+
+        assert response.status_code == 200
+        assert [user["name"] for user in response.json()["users"]] == ["John Smith", "Maria Johnson"]
+
+    def test_search_users_without_text(self, client: TestClient):
+        """
+        Test that a search without text is rejected.
+
+        Args:
+            client (TestClient): The TestClient instance to make requests.
+        """
+        response = client.get("api/users/search")
+
+        assert response.status_code == 422
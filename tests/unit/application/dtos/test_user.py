@@ -1,5 +1,22 @@
-from src.applications.dtos.user import UserDTO
+import sys
+from dataclasses import FrozenInstanceError, dataclass, replace
 from datetime import datetime
+from typing import Optional
+
+import pytest
+
+from src.applications.dtos.user import UserDTO
+
+
+@dataclass
+class UnslottedUserRecord:
+    """A user record with the fields of UserDTO and one `__dict__` per instance, as the DTO was before slots."""
+
+    id: Optional[int]
+    name: str
+    email: str
+    password: str
+    created_at: Optional[datetime]
 
 
 class TestUserDTO:
@@ -37,3 +54,23 @@ class TestUserDTO:
         assert user.email == "janesmith@example.com"
         assert user.password == "password"
         assert user.created_at is None
+
+    def test_user_dto_is_immutable(self):
+        """Test that a UserDTO cannot be changed in place, only copied with `dataclasses.replace`.
+
+        The DTO is shared by the caches and the use cases, so an in-place change would leak to other requests.
+        """
+        user = UserDTO(id=1, name="Jane Smith", email="janesmith@example.com", password="password", created_at=None)
+
+        with pytest.raises(FrozenInstanceError):
+            user.email = "other@example.com"
+        assert not hasattr(user, "__dict__")
+        assert replace(user, email="other@example.com").email == "other@example.com"
+        assert user.email == "janesmith@example.com"
+
+    def test_user_dto_is_smaller_than_an_unslotted_record(self):
+        """Test that a slotted UserDTO takes less memory than a record holding the same fields in a `__dict__`."""
+        fields = (1, "Jane Smith", "janesmith@example.com", "password", None)
+        unslotted = UnslottedUserRecord(*fields)
+
+        assert sys.getsizeof(UserDTO(*fields)) < sys.getsizeof(unslotted) + sys.getsizeof(unslotted.__dict__)
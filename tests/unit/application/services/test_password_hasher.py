@@ -0,0 +1,119 @@
+import pytest
+
+from src.applications.services.password_hasher import (
+    PBKDF2_SHA256,
+    PasswordHasher,
+    PasswordHashingSettings,
+    identify_algorithm,
+    password_needs_rehash,
+)
+
+
+class TestPasswordHasher:
+    """Test cases for the PasswordHasher class."""
+
+    @pytest.fixture
+    def settings(self) -> PasswordHashingSettings:
+        """
+        Fixture that returns cheap PBKDF2 settings hashing in the calling thread.
+
+        Returns:
+            settings (PasswordHashingSettings): The password hashing settings.
+        """
+        return PasswordHashingSettings(algorithm=PBKDF2_SHA256, workers=0, pbkdf2_iterations=1000)
+
+    def test_hash_is_salted_and_verified(self, settings: PasswordHashingSettings):
+        """
+        Test that a password is hashed with a random salt and that only the password matches its hash.
+
+        Args:
+            settings (PasswordHashingSettings): The settings fixture.
+        """
+        password_hasher = PasswordHasher(settings)
+
+        password_hash = password_hasher.hash("password123")
+
+        assert password_hash.startswith("pbkdf2_sha256$1000$")
+        assert password_hasher.hash("password123") != password_hash
+        assert password_hasher.verify("password123", password_hash) == (True, None)
+        assert password_hasher.verify("password124", password_hash) == (False, None)
+
+    def test_outdated_hash_is_rehashed_on_verify(self, settings: PasswordHashingSettings):
+        """
+        Test that verifying a hash made with other cost parameters returns a hash made with the current ones.
+
+        Args:
+            settings (PasswordHashingSettings): The settings fixture.
+        """
+        old_hash = PasswordHasher(settings).hash("password123")
+        password_hasher = PasswordHasher(
+            PasswordHashingSettings(algorithm=PBKDF2_SHA256, workers=0, pbkdf2_iterations=2000)
+        )
+
+        valid, new_hash = password_hasher.verify("password123", old_hash)
+
+        assert valid is True
+        assert new_hash.startswith("pbkdf2_sha256$2000$")
+        assert password_hasher.verify("password123", new_hash) == (True, None)
+        assert password_hasher.verify("password124", old_hash) == (False, None)
+
+    def test_unknown_hash_never_matches(self, settings: PasswordHashingSettings):
+        """
+        Test that a value that is not a supported hash, such as a plain text password, never matches.
+
+        Args:
+            settings (PasswordHashingSettings): The settings fixture.
+        """
+        assert identify_algorithm("password123") is None
+        assert password_needs_rehash("password123", settings) is True
+        assert PasswordHasher(settings).verify("password123", "password123") == (False, None)
+
+    def test_hashing_runs_in_the_process_pool(self):
+        """Test that the hashes made in the process pool, one by one or in a batch, verify."""
+        password_hasher = PasswordHasher(
+            PasswordHashingSettings(algorithm=PBKDF2_SHA256, workers=2, pbkdf2_iterations=1000)
+        )
+        try:
+            passwords = [f"password{index}" for index in range(5)]
+            password_hashes = password_hasher.hash_many(passwords)
+
+            assert len(set(password_hashes)) == 5
+            assert all(
+                password_hasher.verify(password, password_hash) == (True, None)
+                for password, password_hash in zip(passwords, password_hashes)
+            )
+            assert password_hasher._executor is not None
+        finally:
+            password_hasher.close()
+
+        assert password_hasher._executor is None
+
+    @pytest.mark.anyio
+    async def test_asynchronous_hashing(self, settings: PasswordHashingSettings):
+        """
+        Test that the asynchronous methods hash and verify like the synchronous ones.
+
+        Args:
+            settings (PasswordHashingSettings): The settings fixture.
+        """
+        password_hasher = PasswordHasher(settings)
+
+        password_hash = await password_hasher.hash_async("password123")
+
+        assert await password_hasher.verify_async("password123", password_hash) == (True, None)
+
+    def test_settings_are_read_from_the_environment(self, monkeypatch: pytest.MonkeyPatch):
+        """
+        Test that the settings are read from the environment variables, and that unusable algorithms are refused.
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): The pytest monkeypatch fixture.
+        """
+        monkeypatch.setenv("PASSWORD_HASH_WORKERS", "3")
+        monkeypatch.setenv("PASSWORD_HASH_PBKDF2_ITERATIONS", "1234")
+
+        settings = PasswordHashingSettings.from_env()
+
+        assert (settings.algorithm, settings.workers, settings.pbkdf2_iterations) == (PBKDF2_SHA256, 3, 1234)
+        with pytest.raises(ValueError):
+            PasswordHashingSettings(algorithm="md5")
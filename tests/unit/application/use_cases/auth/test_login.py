@@ -0,0 +1,103 @@
+from datetime import datetime, timezone
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.applications.dtos import AccessTokenDTO, UserDTO
+from src.applications.enums.auth.errors import AuthErrorsEnum
+from src.applications.use_cases.auth.login import LoginUseCase
+from src.domain.password_hasher import PasswordHasherInterface
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.token_service import TokenServiceInterface
+
+
+class TestLoginUseCase:
+    """Test suite for the LoginUseCase class."""
+
+    @pytest.fixture
+    def user_dto(self) -> UserDTO:
+        """
+        Fixture that returns a sample UserDTO instance with a password hash.
+
+        Returns:
+            user_dto (UserDTO): A UserDTO instance representing a sample user.
+        """
+        return UserDTO(id=1, name="John Doe", email="johndoe@example.com", password="stored-hash", created_at=None)
+
+    @pytest.fixture
+    def access_token(self) -> AccessTokenDTO:
+        """
+        Fixture that returns a sample access token.
+
+        Returns:
+            access_token (AccessTokenDTO): The access token.
+        """
+        return AccessTokenDTO(access_token="token", token_type="bearer", expires_at=datetime.now(timezone.utc))
+
+    @pytest.fixture
+    def use_case(self, mocker: MockerFixture, user_dto: UserDTO, access_token: AccessTokenDTO) -> LoginUseCase:
+        """
+        Fixture that returns the use case on a mocked repository, hasher and token service.
+
+        Args:
+            mocker (MockerFixture): The pytest mocker fixture.
+            user_dto (UserDTO): The UserDTO fixture.
+            access_token (AccessTokenDTO): The access token fixture.
+
+        Returns:
+            use_case (LoginUseCase): The login use case.
+        """
+        user_repository = mocker.Mock(spec=UserRepositoryInterface)
+        user_repository.get_user_by_email.side_effect = lambda email: user_dto if email == user_dto.email else None
+        password_hasher = mocker.Mock(spec=PasswordHasherInterface)
+        password_hasher.verify.side_effect = lambda password, password_hash: (password == "password123", None)
+        password_hasher.hash.return_value = "decoy-hash"
+        token_service = mocker.Mock(spec=TokenServiceInterface)
+        token_service.issue.return_value = access_token
+        return LoginUseCase(
+            user_repository=user_repository, password_hasher=password_hasher, token_service=token_service
+        )
+
+    def test_login_issues_a_token(self, use_case: LoginUseCase, user_dto: UserDTO, access_token: AccessTokenDTO):
+        """
+        Test that the right credentials get an access token for the user.
+
+        Args:
+            use_case (LoginUseCase): The use case fixture.
+            user_dto (UserDTO): The UserDTO fixture.
+            access_token (AccessTokenDTO): The access token fixture.
+        """
+        assert use_case.login(user_dto.email, "password123") == {"data": access_token, "success": True}
+        use_case.password_hasher.verify.assert_called_once_with("password123", "stored-hash")
+        use_case.token_service.issue.assert_called_once_with(user_dto.id)
+        use_case.user_repository.update_password.assert_not_called()
+
+    def test_wrong_password_and_unknown_email_are_rejected_alike(self, use_case: LoginUseCase, user_dto: UserDTO):
+        """
+        Test that a wrong password and an unknown email get the same error, both after a password check.
+
+        Args:
+            use_case (LoginUseCase): The use case fixture.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        error = {"data": AuthErrorsEnum.INVALID_CREDENTIALS.value, "success": False}
+
+        assert use_case.login(user_dto.email, "wrong") == error
+        assert use_case.login("unknown@example.com", "password123") == error
+        assert use_case.password_hasher.verify.call_count == 2
+        use_case.password_hasher.verify.assert_called_with("password123", "decoy-hash")
+        use_case.token_service.issue.assert_not_called()
+
+    def test_outdated_hash_is_replaced(self, use_case: LoginUseCase, user_dto: UserDTO):
+        """
+        Test that the hash returned by the password check replaces the stored one.
+
+        Args:
+            use_case (LoginUseCase): The use case fixture.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        use_case.password_hasher.verify.side_effect = None
+        use_case.password_hasher.verify.return_value = (True, "new-hash")
+
+        assert use_case.login(user_dto.email, "password123")["success"] is True
+        use_case.user_repository.update_password.assert_called_once_with(user_dto.id, "new-hash")
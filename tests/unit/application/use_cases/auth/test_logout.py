@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+
+from pytest_mock import MockerFixture
+
+from src.applications.dtos import TokenClaimsDTO
+from src.applications.use_cases.auth.logout import LogoutUseCase
+from src.domain.token_service import TokenServiceInterface
+
+
+class TestLogoutUseCase:
+    """Test suite for the LogoutUseCase class."""
+
+    def test_logout_revokes_the_token(self, mocker: MockerFixture):
+        """
+        Test that logging out revokes the token of the request.
+
+        Args:
+            mocker (MockerFixture): The pytest mocker fixture.
+        """
+        token_service = mocker.Mock(spec=TokenServiceInterface)
+        now = datetime.now(timezone.utc)
+        claims = TokenClaimsDTO(subject=1, token_id="token-id", issued_at=now, expires_at=now)
+
+        result = LogoutUseCase(token_service=token_service).logout(claims)
+
+        assert result == {"data": None, "success": True}
+        token_service.revoke.assert_called_once_with(claims)
@@ -0,0 +1,125 @@
+from dataclasses import replace
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.applications.dtos.user import UserDTO
+from src.applications.use_cases.user.async_create_user import AsyncCreateUserUseCase
+from src.applications.enums.user.errors import UserErrorsEnum
+from src.domain.exceptions import EmailAlreadyExistsError
+from src.domain.password_hasher import PasswordHasherInterface
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+from src.domain.unit_of_work import AsyncUnitOfWorkInterface
+
+
+@pytest.mark.anyio
+class TestAsyncCreateUserUseCase:
+    """Test suite for the AsyncCreateUserUseCase class."""
+
+    @pytest.fixture
+    def user_dto(self) -> UserDTO:
+        """
+        Fixture that returns a sample UserDTO instance for testing.
+
+        Returns:
+            user_dto (UserDTO): A UserDTO instance representing a sample user.
+        """
+        return UserDTO(id=None, name="John Doe", email="johndoe@example.com", password="password123", created_at=None)
+
+    @pytest.fixture
+    def user_repository(self, mocker: MockerFixture) -> AsyncUserRepositoryInterface:
+        """
+        Fixture that returns a mocked asynchronous user repository.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+
+        Returns:
+            user_repository (AsyncUserRepositoryInterface): A mocked asynchronous user repository.
+        """
+        return mocker.AsyncMock(spec=AsyncUserRepositoryInterface)
+
+    @pytest.fixture
+    def unit_of_work(self, mocker: MockerFixture) -> AsyncUnitOfWorkInterface:
+        """
+        Fixture that returns a mocked asynchronous unit of work.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+
+        Returns:
+            unit_of_work (AsyncUnitOfWorkInterface): A mocked asynchronous unit of work.
+        """
+        return mocker.AsyncMock(spec=AsyncUnitOfWorkInterface)
+
+    @pytest.fixture
+    def password_hasher(self, mocker: MockerFixture) -> PasswordHasherInterface:
+        """
+        Fixture that returns a mocked password hasher.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+
+        Returns:
+            password_hasher (PasswordHasherInterface): A mocked password hasher hashing every password to "hashed".
+        """
+        password_hasher = mocker.Mock(spec=PasswordHasherInterface)
+        password_hasher.hash_async = mocker.AsyncMock(return_value="hashed")
+        return password_hasher
+
+    async def test_create_user_correctly(
+        self,
+        user_repository: AsyncUserRepositoryInterface,
+        unit_of_work: AsyncUnitOfWorkInterface,
+        password_hasher: PasswordHasherInterface,
+        user_dto: UserDTO,
+    ):
+        """
+        Test that the use case hashes the password, awaits the repository and returns the created user.
+
+        Args:
+            user_repository (AsyncUserRepositoryInterface): The mocked repository.
+            unit_of_work (AsyncUnitOfWorkInterface): The mocked unit of work.
+            password_hasher (PasswordHasherInterface): The mocked password hasher.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        user_repository.create_user.return_value = user_dto
+
+        use_case = AsyncCreateUserUseCase(
+            user_repository=user_repository, unit_of_work=unit_of_work, password_hasher=password_hasher
+        )
+
+        result = await use_case.create_user(user_dto)
+
+        assert result == {"data": user_dto, "success": True}
+        user_repository.create_user.assert_awaited_once_with(replace(user_dto, password="hashed"))
+        password_hasher.hash_async.assert_awaited_once_with("password123")
+        user_repository.get_user_by_email.assert_not_awaited()
+        unit_of_work.commit.assert_awaited_once()
+
+    async def test_create_user_when_the_user_has_already_been_created(
+        self,
+        user_repository: AsyncUserRepositoryInterface,
+        unit_of_work: AsyncUnitOfWorkInterface,
+        password_hasher: PasswordHasherInterface,
+        user_dto: UserDTO,
+    ):
+        """
+        Test that the use case returns an error when the email already exists.
+
+        Args:
+            user_repository (AsyncUserRepositoryInterface): The mocked repository.
+            unit_of_work (AsyncUnitOfWorkInterface): The mocked unit of work.
+            password_hasher (PasswordHasherInterface): The mocked password hasher.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        user_repository.create_user.side_effect = EmailAlreadyExistsError(user_dto.email)
+
+        use_case = AsyncCreateUserUseCase(
+            user_repository=user_repository, unit_of_work=unit_of_work, password_hasher=password_hasher
+        )
+
+        result = await use_case.create_user(user_dto)
+
+        assert result == {"data": UserErrorsEnum.EMAIL_ALREADY_EXISTS.value, "success": False}
+        unit_of_work.commit.assert_not_awaited()
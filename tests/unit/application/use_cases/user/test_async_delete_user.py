@@ -0,0 +1,81 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from src.applications.dtos.user import UserDTO
+from src.applications.use_cases.user.async_delete_user import AsyncDeleteUserUseCase
+from src.applications.enums.user.errors import UserErrorsEnum
+from src.applications.enums.user.success import UserSuccessEnum
+from src.domain.exceptions import UserNotFoundError
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+from src.domain.unit_of_work import AsyncUnitOfWorkInterface
+
+
+@pytest.mark.anyio
+class TestAsyncDeleteUserUseCase:
+    """Test cases for the AsyncDeleteUserUseCase class."""
+
+    @pytest.fixture
+    def user_repository(self, mocker: MockerFixture) -> AsyncUserRepositoryInterface:
+        """
+        Fixture that returns a mocked asynchronous user repository.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+
+        Returns:
+            user_repository (AsyncUserRepositoryInterface): A mocked asynchronous user repository.
+        """
+        return mocker.AsyncMock(spec=AsyncUserRepositoryInterface)
+
+    @pytest.fixture
+    def unit_of_work(self, mocker: MockerFixture) -> AsyncUnitOfWorkInterface:
+        """
+        Fixture that returns a mocked asynchronous unit of work.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+
+        Returns:
+            unit_of_work (AsyncUnitOfWorkInterface): A mocked asynchronous unit of work.
+        """
+        return mocker.AsyncMock(spec=AsyncUnitOfWorkInterface)
+
+    async def test_delete_user_successful_deletion(
+        self, user_repository: AsyncUserRepositoryInterface, unit_of_work: AsyncUnitOfWorkInterface
+    ):
+        """
+        Test that the use case deletes an existing user.
+
+        Args:
+            user_repository (AsyncUserRepositoryInterface): The mocked repository.
+            unit_of_work (AsyncUnitOfWorkInterface): The mocked unit of work.
+        """
+        user_dto = UserDTO(id=1, name="John Doe", email="johndoe@example.com", password="password123", created_at=None)
+
+        result = await AsyncDeleteUserUseCase(user_repository=user_repository, unit_of_work=unit_of_work).delete_user(
+            user_id=user_dto.id
+        )
+
+        assert result == {"data": UserSuccessEnum.DELETE_SUCCESS.value, "success": True}
+        user_repository.delete_user.assert_awaited_once_with(user_id=user_dto.id)
+        user_repository.get_user_by_id.assert_not_awaited()
+        unit_of_work.commit.assert_awaited_once()
+
+    async def test_delete_user_do_not_found_a_user(
+        self, user_repository: AsyncUserRepositoryInterface, unit_of_work: AsyncUnitOfWorkInterface
+    ):
+        """
+        Test that the use case returns an error when the user does not exist.
+
+        Args:
+            user_repository (AsyncUserRepositoryInterface): The mocked repository.
+            unit_of_work (AsyncUnitOfWorkInterface): The mocked unit of work.
+        """
+        user_repository.delete_user.side_effect = UserNotFoundError(1)
+
+        result = await AsyncDeleteUserUseCase(user_repository=user_repository, unit_of_work=unit_of_work).delete_user(
+            user_id=1
+        )
+
+        assert result == {"data": UserErrorsEnum.READ_NOT_FOUND.value, "success": False}
+        unit_of_work.commit.assert_not_awaited()
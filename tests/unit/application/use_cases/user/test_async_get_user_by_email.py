@@ -0,0 +1,52 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from src.applications.dtos.user import UserDTO
+from src.applications.use_cases.user.async_get_user import AsyncGetUserUseCase
+from src.applications.enums.user.errors import UserErrorsEnum
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+
+
+@pytest.mark.anyio
+class TestAsyncGetUserByEmail:
+    """Test cases for the AsyncGetUserUseCase class."""
+
+    @pytest.fixture
+    def user_repository(self, mocker: MockerFixture) -> AsyncUserRepositoryInterface:
+        """
+        Fixture that returns a mocked asynchronous user repository.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+
+        Returns:
+            user_repository (AsyncUserRepositoryInterface): A mocked asynchronous user repository.
+        """
+        return mocker.AsyncMock(spec=AsyncUserRepositoryInterface)
+
+    async def test_get_user_by_email_when_return_a_user(self, user_repository: AsyncUserRepositoryInterface):
+        """
+        Test that the use case returns the user found by the repository.
+
+        Args:
+            user_repository (AsyncUserRepositoryInterface): The mocked repository.
+        """
+        user_dto = UserDTO(id=1, name="John Doe", email="johndoe@example.com", password="password123", created_at=None)
+        user_repository.get_user_by_email.return_value = user_dto
+
+        result = await AsyncGetUserUseCase(user_repository=user_repository).get_user_by_email(email=user_dto.email)
+
+        assert result == {"data": user_dto, "success": True}
+
+    async def test_get_user_by_email_when_not_found_a_user(self, user_repository: AsyncUserRepositoryInterface):
+        """
+        Test that the use case returns an error when the user is not found.
+
+        Args:
+            user_repository (AsyncUserRepositoryInterface): The mocked repository.
+        """
+        user_repository.get_user_by_email.return_value = None
+
+        result = await AsyncGetUserUseCase(user_repository=user_repository).get_user_by_email(email="test@example.com")
+
+        assert result == {"data": UserErrorsEnum.READ_NOT_FOUND.value, "success": False}
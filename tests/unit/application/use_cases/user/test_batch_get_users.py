@@ -0,0 +1,52 @@
+from pytest_mock import MockerFixture
+
+from src.applications.dtos.user import UserDTO
+from src.applications.use_cases.user.batch_get_users import BatchGetUsersUseCase
+from src.domain.repositories.user import UserRepositoryInterface
+
+
+class TestBatchGetUsersUseCase:
+    """Test suite for the BatchGetUsersUseCase class."""
+
+    def test_get_users_keys_the_users_and_reports_the_missing(self, mocker: MockerFixture):
+        """
+        Test that the users are keyed by requested identifier and the unknown identifiers reported, in order.
+
+        Args:
+            mocker (MockerFixture): The pytest mocker fixture.
+        """
+        first = UserDTO(id=1, name="John Doe", email="john@example.com", password="secret", created_at=None)
+        second = UserDTO(id=2, name="Jane Doe", email="jane@example.com", password="secret", created_at=None)
+        user_repository = mocker.Mock(spec=UserRepositoryInterface)
+        user_repository.get_users_by_ids.return_value = [second, first]
+        user_repository.get_users_by_emails.return_value = [second]
+        use_case = BatchGetUsersUseCase(user_repository=user_repository)
+
+        result = use_case.get_users(user_ids=[3, 1, 2, 1], emails=["jane@example.com", "nobody@example.com"])
+
+        assert result == {
+            "data": {
+                "users_by_id": {1: first, 2: second},
+                "users_by_email": {"jane@example.com": second},
+                "missing_ids": [3],
+                "missing_emails": ["nobody@example.com"],
+            },
+            "success": True,
+        }
+        user_repository.get_users_by_ids.assert_called_once_with([3, 1, 2])
+
+    def test_get_users_skips_the_empty_lookups(self, mocker: MockerFixture):
+        """
+        Test that no lookup is made for an empty list of identifiers.
+
+        Args:
+            mocker (MockerFixture): The pytest mocker fixture.
+        """
+        user_repository = mocker.Mock(spec=UserRepositoryInterface)
+        user_repository.get_users_by_ids.return_value = []
+        use_case = BatchGetUsersUseCase(user_repository=user_repository)
+
+        result = use_case.get_users(user_ids=[1], emails=[])
+
+        assert result["data"]["missing_ids"] == [1]
+        user_repository.get_users_by_emails.assert_not_called()
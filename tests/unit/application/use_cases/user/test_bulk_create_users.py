@@ -0,0 +1,149 @@
+from typing import List
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.applications.dtos.user import UserDTO
+from src.applications.use_cases.user.bulk_create_users import BulkCreateUsersUseCase
+from src.applications.enums.user.errors import UserErrorsEnum
+from src.domain.password_hasher import PasswordHasherInterface
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.unit_of_work import UnitOfWorkInterface
+
+
+def make_user(email: str, user_id: int = None) -> UserDTO:
+    """Build a sample user with the given email.
+
+    Args:
+        email (str): The email of the user.
+        user_id (int, optional): The ID of the user.
+
+    Returns:
+        user_dto (UserDTO): A UserDTO instance representing a sample user.
+    """
+    return UserDTO(id=user_id, name="John Doe", email=email, password="password123", created_at=None)
+
+
+class TestBulkCreateUsersUseCase:
+    """Test suite for the BulkCreateUsersUseCase class."""
+
+    @pytest.fixture
+    def user_repository(self, mocker: MockerFixture) -> UserRepositoryInterface:
+        """
+        Fixture that returns a mocked user repository creating every user but `taken@example.com`.
+
+        Args:
+            mocker (MockerFixture): The pytest mocker fixture.
+
+        Returns:
+            user_repository (UserRepositoryInterface): The mocked repository.
+            password_hasher (PasswordHasherInterface): The mocked password hasher.
+        """
+        user_repository = mocker.Mock(spec=UserRepositoryInterface)
+
+        def create_users(users: List[UserDTO]) -> List[UserDTO]:
+            return [
+                make_user(user.email, user_id=index)
+                for index, user in enumerate(users, start=1)
+                if user.email != "taken@example.com"
+            ]
+
+        user_repository.create_users.side_effect = create_users
+        return user_repository
+
+    @pytest.fixture
+    def password_hasher(self, mocker: MockerFixture) -> PasswordHasherInterface:
+        """
+        Fixture that returns a mocked password hasher prefixing the passwords with `hashed:`.
+
+        Args:
+            mocker (MockerFixture): The pytest mocker fixture.
+
+        Returns:
+            password_hasher (PasswordHasherInterface): The mocked password hasher.
+        """
+        password_hasher = mocker.Mock(spec=PasswordHasherInterface)
+        password_hasher.hash_many.side_effect = lambda passwords: [f"hashed:{password}" for password in passwords]
+        return password_hasher
+
+    def test_rows_are_created_in_batches(
+        self, mocker: MockerFixture, user_repository: UserRepositoryInterface, password_hasher: PasswordHasherInterface
+    ):
+        """
+        Test that the rows are hashed and inserted `batch_size` at a time, each batch in its own committed unit of work.
+
+        Args:
+            mocker (MockerFixture): The pytest mocker fixture.
+            user_repository (UserRepositoryInterface): The mocked repository.
+            password_hasher (PasswordHasherInterface): The mocked password hasher.
+        """
+        unit_of_work = mocker.MagicMock(spec=UnitOfWorkInterface)
+        use_case = BulkCreateUsersUseCase(
+            user_repository=user_repository, unit_of_work=unit_of_work, password_hasher=password_hasher, batch_size=2
+        )
+        rows = [(row, make_user(f"user{row}@example.com")) for row in range(1, 6)]
+
+        result = use_case.create_users(iter(rows))
+
+        assert result["success"] is True
+        assert [created["row"] for created in result["data"]["created"]] == [1, 2, 3, 4, 5]
+        assert result["data"]["failed"] == []
+        assert [len(call.args[0]) for call in user_repository.create_users.call_args_list] == [2, 2, 1]
+        assert unit_of_work.commit.call_count == 3
+        stored_passwords = {
+            user.password for call in user_repository.create_users.call_args_list for user in call.args[0]
+        }
+        assert stored_passwords == {"hashed:password123"}
+
+    def test_taken_and_repeated_emails_are_reported(
+        self, mocker: MockerFixture, user_repository: UserRepositoryInterface, password_hasher: PasswordHasherInterface
+    ):
+        """
+        Test that rows whose email exists in the database or earlier in the import are reported as failed.
+
+        Args:
+            mocker (MockerFixture): The pytest mocker fixture.
+            user_repository (UserRepositoryInterface): The mocked repository.
+            password_hasher (PasswordHasherInterface): The mocked password hasher.
+        """
+        unit_of_work = mocker.MagicMock(spec=UnitOfWorkInterface)
+        use_case = BulkCreateUsersUseCase(
+            user_repository=user_repository, unit_of_work=unit_of_work, password_hasher=password_hasher
+        )
+        rows = [
+            (1, make_user("first@example.com")),
+            (2, make_user("taken@example.com")),
+            (3, make_user("first@example.com")),
+        ]
+
+        result = use_case.create_users(rows)
+
+        error = UserErrorsEnum.EMAIL_ALREADY_EXISTS.value
+        assert result["data"]["created"] == [{"row": 1, "id": 1, "email": "first@example.com"}]
+        assert sorted(result["data"]["failed"], key=lambda failure: failure["row"]) == [
+            {"row": 2, "email": "taken@example.com", "error": error},
+            {"row": 3, "email": "first@example.com", "error": error},
+        ]
+        user_repository.create_users.assert_called_once()
+
+    def test_empty_import_does_not_touch_the_database(
+        self, mocker: MockerFixture, user_repository: UserRepositoryInterface, password_hasher: PasswordHasherInterface
+    ):
+        """
+        Test that an import without rows creates nothing.
+
+        Args:
+            mocker (MockerFixture): The pytest mocker fixture.
+            user_repository (UserRepositoryInterface): The mocked repository.
+            password_hasher (PasswordHasherInterface): The mocked password hasher.
+        """
+        unit_of_work = mocker.MagicMock(spec=UnitOfWorkInterface)
+        use_case = BulkCreateUsersUseCase(
+            user_repository=user_repository, unit_of_work=unit_of_work, password_hasher=password_hasher
+        )
+
+        result = use_case.create_users([])
+
+        assert result == {"data": {"created": [], "failed": []}, "success": True}
+        user_repository.create_users.assert_not_called()
+        unit_of_work.__enter__.assert_not_called()
@@ -1,8 +1,13 @@
+from dataclasses import replace
+
 from pytest_mock import MockerFixture
 
 from src.applications.dtos.user import UserDTO
 from src.applications.use_cases.user.create_user import CreateUserUseCase
 from src.applications.enums.user.errors import UserErrorsEnum
+from src.domain.exceptions import EmailAlreadyExistsError
+from src.domain.password_hasher import PasswordHasherInterface
+from src.domain.unit_of_work import UnitOfWorkInterface
 from src.infra.db.settings.connection import DBConnectionHandler
 from src.infra.repositories.user import UserRepository
 
@@ -16,7 +21,7 @@ class TestCreateUserUseCase:
 
         This test ensures that the create_user method of CreateUserUseCase correctly handles the creation
         of a new user by verifying that the expected user DTO is returned and that the create_user method
-        of the user repository is called with the correct arguments.
+        of the user repository is called with the hashed password.
 
         Args:
             mocker (MockerFixture): The pytest mocker fixture.
@@ -24,7 +29,12 @@ class TestCreateUserUseCase:
 
         """
         user_repository = mocker.Mock(spec=UserRepository(db_connection=db_connection))
-        user_service = CreateUserUseCase(user_repository=user_repository)
+        unit_of_work = mocker.MagicMock(spec=UnitOfWorkInterface)
+        password_hasher = mocker.Mock(spec=PasswordHasherInterface)
+        password_hasher.hash.return_value = "hashed"
+        user_service = CreateUserUseCase(
+            user_repository=user_repository, unit_of_work=unit_of_work, password_hasher=password_hasher
+        )
 
         user_dto = UserDTO(
             id=None,
@@ -42,10 +52,13 @@ class TestCreateUserUseCase:
         )
 
         user_repository.create_user.return_value = created_user_dto
-        user_repository.get_user_by_email.return_value = None
         result = user_service.create_user(user_dto)
-        assert {"data": result, "success": True}
-        user_repository.create_user.assert_called_once_with(user_dto)
+        assert result == {"data": created_user_dto, "success": True}
+        user_repository.create_user.assert_called_once_with(replace(user_dto, password="hashed"))
+        password_hasher.hash.assert_called_once_with("password123")
+        user_repository.get_user_by_email.assert_not_called()
+        unit_of_work.__enter__.assert_called_once()
+        unit_of_work.commit.assert_called_once()
 
     def test_create_user_when_the_user_has_already_been_created(
         self, mocker: MockerFixture, db_connection: DBConnectionHandler
@@ -54,7 +67,8 @@ class TestCreateUserUseCase:
         Test the create_user method of CreateUserUseCase when the user has already been created.
 
         This test verifies that the create_user method of CreateUserUseCase correctly handles the case
-        when a user with the same email already exists by ensuring that the appropriate error response is returned.
+        when the repository reports that the email already exists by ensuring that the appropriate error response
+        is returned.
 
         Args:
             mocker (MockerFixture): The pytest mocker fixture.
@@ -62,17 +76,19 @@ class TestCreateUserUseCase:
 
         """
         user_repository = mocker.Mock(spec=UserRepository(db_connection=db_connection))
-        user_service = CreateUserUseCase(user_repository=user_repository)
+        unit_of_work = mocker.MagicMock(spec=UnitOfWorkInterface)
+        password_hasher = mocker.Mock(spec=PasswordHasherInterface)
+        password_hasher.hash.return_value = "hashed"
+        user_service = CreateUserUseCase(
+            user_repository=user_repository, unit_of_work=unit_of_work, password_hasher=password_hasher
+        )
 
         user_dto = UserDTO(
             id=None, name="John Doe", email="johndoe@example.com", password="password123", created_at=None
         )
-        created_user_dto = UserDTO(
-            name="John Doe", email="johndoe@example.com", password="password123", id=None, created_at=None
-        )
 
-        user_repository.create_user.return_value = created_user_dto
-        user_repository.get_user_by_email.return_value = created_user_dto
+        user_repository.create_user.side_effect = EmailAlreadyExistsError(user_dto.email)
         result = user_service.create_user(user_dto)
 
         assert result == {"data": UserErrorsEnum.EMAIL_ALREADY_EXISTS.value, "success": False}
+        unit_of_work.commit.assert_not_called()
@@ -5,7 +5,9 @@ from src.applications.dtos.user import UserDTO
 from src.applications.use_cases.user.delete_user import DeleteUserUseCase
 from src.applications.enums.user.errors import UserErrorsEnum
 from src.applications.enums.user.success import UserSuccessEnum
+from src.domain.exceptions import UserNotFoundError
 from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.unit_of_work import UnitOfWorkInterface
 from src.domain.use_cases.user.delete_user import DeleteUserUseCaseInterface
 from src.infra.db.settings.connection import DBConnectionHandler
 from src.infra.repositories.user import UserRepository
@@ -49,17 +51,33 @@ class TestDeleteUserUserCase:
         return user_repository
 
     @pytest.fixture
-    def delete_user_use_case(self, user_repository: UserRepositoryInterface) -> DeleteUserUseCaseInterface:
+    def unit_of_work(self, mocker: MockerFixture) -> UnitOfWorkInterface:
+        """
+        Fixture that returns a mocked unit of work.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+
+        Returns:
+            unit_of_work (UnitOfWorkInterface): A mocked unit of work.
+        """
+        return mocker.MagicMock(spec=UnitOfWorkInterface)
+
+    @pytest.fixture
+    def delete_user_use_case(
+        self, user_repository: UserRepositoryInterface, unit_of_work: UnitOfWorkInterface
+    ) -> DeleteUserUseCaseInterface:
         """
         Fixture that sets up the DeleteUserUseCase with a mocked UserRepository.
 
         Args:
             user_repository (UserRepositoryInterface): The UserRepository fixture.
+            unit_of_work (UnitOfWorkInterface): The mocked unit of work fixture.
 
         Returns:
             delete_user_use_case (DeleteUserUseCaseInterface): An instance of DeleteUserUseCase with the mock UserRepository.
         """
-        delete_user_use_case = DeleteUserUseCase(user_repository=user_repository)
+        delete_user_use_case = DeleteUserUseCase(user_repository=user_repository, unit_of_work=unit_of_work)
         return delete_user_use_case
 
     def test_delete_user_successful_deletion(
@@ -77,12 +95,12 @@ class TestDeleteUserUserCase:
             mocker (MockerFixture): The MockerFixture for creating mocks and spies.
 
         """
-        delete_user_use_case.user_repository.get_user_by_id.return_value = user_dto
-
         mock_delete_user_method = mocker.patch.object(delete_user_use_case.user_repository, "delete_user")
         response = delete_user_use_case.delete_user(user_id=user_dto.id)
 
         mock_delete_user_method.assert_called_once_with(user_id=user_dto.id)
+        delete_user_use_case.user_repository.get_user_by_id.assert_not_called()
+        delete_user_use_case.unit_of_work.commit.assert_called_once()
         assert response == {"data": UserSuccessEnum.DELETE_SUCCESS.value, "success": True}
 
     def test_delete_user_do_not_found_a_user(
@@ -98,10 +116,11 @@ class TestDeleteUserUserCase:
             user_dto (UserDTO): The UserDTO representing the user to be deleted.
         """
         # Arrange
-        delete_user_use_case.user_repository.get_user_by_id.return_value = None
+        delete_user_use_case.user_repository.delete_user.side_effect = UserNotFoundError(user_dto.id)
 
         # Act
         response = delete_user_use_case.delete_user(user_id=user_dto.id)
 
         # Assert
         assert response == {"data": UserErrorsEnum.READ_NOT_FOUND.value, "success": False}
+        delete_user_use_case.unit_of_work.commit.assert_not_called()
@@ -0,0 +1,25 @@
+from pytest_mock import MockerFixture
+
+from src.applications.use_cases.user.export_users import ExportUsersUseCase
+from src.domain.repositories.user import UserRepositoryInterface
+
+
+class TestExportUsersUseCase:
+    """Test suite for the ExportUsersUseCase class."""
+
+    def test_export_users_streams_from_the_repository(self, mocker: MockerFixture):
+        """
+        Test that the export hands out the lazy iterator of the repository with the configured batch size.
+
+        Args:
+            mocker (MockerFixture): The pytest mocker fixture.
+        """
+        user_repository = mocker.Mock(spec=UserRepositoryInterface)
+        users = iter([])
+        user_repository.iter_users.return_value = users
+        use_case = ExportUsersUseCase(user_repository=user_repository, batch_size=50)
+
+        result = use_case.export_users()
+
+        assert result == {"data": users, "success": True}
+        user_repository.iter_users.assert_called_once_with(batch_size=50)
@@ -0,0 +1,57 @@
+from pytest_mock import MockerFixture
+
+from src.applications.dtos.user import UserDTO
+from src.applications.use_cases.user.list_users import ListUsersUseCase
+from src.domain.repositories.user import UserRepositoryInterface
+
+
+def make_user(user_id: int) -> UserDTO:
+    """Build a sample user with the given ID.
+
+    Args:
+        user_id (int): The ID of the user.
+
+    Returns:
+        user_dto (UserDTO): A UserDTO instance representing a sample user.
+    """
+    return UserDTO(id=user_id, name="John Doe", email=f"user{user_id}@example.com", password="secret", created_at=None)
+
+
+class TestListUsersUseCase:
+    """Test suite for the ListUsersUseCase class."""
+
+    def test_list_users_with_next_page(self, mocker: MockerFixture):
+        """
+        Test that one extra user is fetched to detect the next page, and left out of the page.
+
+        Args:
+            mocker (MockerFixture): The pytest mocker fixture.
+        """
+        user_repository = mocker.Mock(spec=UserRepositoryInterface)
+        user_repository.list_users.return_value = [make_user(4), make_user(5), make_user(6)]
+        use_case = ListUsersUseCase(user_repository=user_repository)
+
+        result = use_case.list_users(after_id=3, limit=2)
+
+        assert result == {
+            "data": {"users": [make_user(4), make_user(5)], "next_after_id": 5, "total_estimate": None},
+            "success": True,
+        }
+        user_repository.list_users.assert_called_once_with(after_id=3, limit=3)
+        user_repository.estimate_user_count.assert_not_called()
+
+    def test_list_users_last_page_with_total(self, mocker: MockerFixture):
+        """
+        Test that the last page has no next page, and carries the estimate when requested.
+
+        Args:
+            mocker (MockerFixture): The pytest mocker fixture.
+        """
+        user_repository = mocker.Mock(spec=UserRepositoryInterface)
+        user_repository.list_users.return_value = [make_user(1)]
+        user_repository.estimate_user_count.return_value = 1
+        use_case = ListUsersUseCase(user_repository=user_repository)
+
+        result = use_case.list_users(limit=2, include_total=True)
+
+        assert result["data"] == {"users": [make_user(1)], "next_after_id": None, "total_estimate": 1}
@@ -0,0 +1,26 @@
+from pytest_mock import MockerFixture
+
+from src.applications.dtos.user import UserDTO
+from src.applications.use_cases.user.search_users import SearchUsersUseCase
+from src.domain.repositories.user import UserRepositoryInterface
+
+
+class TestSearchUsersUseCase:
+    """Test suite for the SearchUsersUseCase class."""
+
+    def test_search_users(self, mocker: MockerFixture):
+        """
+        Test that the search is delegated to the repository with the text stripped.
+
+        Args:
+            mocker (MockerFixture): The pytest mocker fixture.
+        """
+        user_repository = mocker.Mock(spec=UserRepositoryInterface)
+        users = [UserDTO(id=1, name="John Doe", email="john@example.com", password="secret", created_at=None)]
+        user_repository.search_users.return_value = users
+        use_case = SearchUsersUseCase(user_repository=user_repository)
+
+        result = use_case.search_users("  john ", limit=5)
+
+        assert result == {"data": users, "success": True}
+        user_repository.search_users.assert_called_once_with("john", limit=5)
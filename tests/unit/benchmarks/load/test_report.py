@@ -0,0 +1,35 @@
+import pytest
+
+from benchmarks.load.report import LoadReport, percentile
+
+
+@pytest.mark.parametrize("rank, expected", [(0, 1), (50, 50), (95, 95), (99, 99), (100, 100)])
+def test_percentile_uses_the_nearest_rank(rank, expected):
+    """Test that a percentile is the smallest value at least that share of the values are lower than or equal to."""
+    assert percentile(list(range(1, 101)), rank) == expected
+
+
+def test_percentile_of_no_values_is_zero():
+    """Test that the percentiles of a route without requests are 0."""
+    assert percentile([], 99) == 0.0
+
+
+def test_report_summarizes_each_route_and_the_total():
+    """Test that the report counts the requests, errors and status codes of each route and of the run."""
+    report = LoadReport()
+    for latency in (0.001, 0.002, 0.003, 0.004):
+        report.record("GET /api/users/", latency, 200, True)
+    report.record("DELETE /api/users/{user_id}", 0.010, 404, False)
+    report.record("DELETE /api/users/{user_id}", 0.020, None, False)
+
+    summary = report.to_dict(duration=2.0, settings={"concurrency": 4})
+
+    assert summary["settings"] == {"concurrency": 4}
+    assert summary["total"]["requests"] == 6
+    assert summary["total"]["requests_per_second"] == 3.0
+    assert summary["total"]["error_rate"] == pytest.approx(1 / 3, abs=1e-4)
+    reads = summary["routes"]["GET /api/users/"]
+    assert reads["requests_per_second"] == 2.0
+    assert reads["error_rate"] == 0.0
+    assert reads["latency_ms"] == {"p50": 2.0, "p95": 4.0, "p99": 4.0, "mean": 2.5, "max": 4.0}
+    assert summary["routes"]["DELETE /api/users/{user_id}"]["status_codes"] == {"404": 1, "error": 1}
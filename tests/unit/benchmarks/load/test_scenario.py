@@ -0,0 +1,40 @@
+from collections import Counter
+from random import Random
+
+import pytest
+
+from benchmarks.load.scenario import TrafficMix
+
+
+def test_parse_reads_the_weight_of_each_operation():
+    """Test that a traffic mix is parsed from `operation=weight` pairs, a missing weight counting as 1."""
+    mix = TrafficMix.parse("create=2, get=7,delete")
+
+    assert mix.operations == ("create", "get", "delete")
+    assert mix.to_dict() == {"create": 2.0, "get": 7.0, "delete": 1.0}
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("update=1", "Unknown operation"),
+        ("get=often", "must be a number"),
+        ("get=0", "must be positive"),
+        (" , ", "no operation"),
+    ],
+)
+def test_parse_rejects_invalid_mixes(text, message):
+    """Test that an unknown operation, a weight that is not a positive number and an empty mix are rejected."""
+    with pytest.raises(ValueError, match=message):
+        TrafficMix.parse(text)
+
+
+def test_choose_draws_the_operations_in_proportion_to_their_weights():
+    """Test that the operations are drawn about as often as their share of the weights."""
+    mix = TrafficMix.parse("create=1,get=3")
+    random = Random(0)
+
+    drawn = Counter(mix.choose(random) for _ in range(10_000))
+
+    assert set(drawn) == {"create", "get"}
+    assert drawn["get"] / drawn["create"] == pytest.approx(3, rel=0.1)
@@ -0,0 +1,45 @@
+import pytest
+
+from benchmarks.regression import find_regressions
+
+
+def result(seconds: float) -> dict:
+    """
+    Build the result of a benchmark whose statistics are all the same.
+
+    Args:
+        seconds (float): The time of a call.
+
+    Returns:
+        (dict): The result.
+    """
+    return {"min": seconds, "median": seconds, "mean": seconds}
+
+
+def test_only_slowdowns_beyond_the_threshold_are_regressions():
+    """Test that a benchmark is a regression when it got slower than its baseline by more than the threshold."""
+    baseline = {
+        "fast": result(1.0),
+        "same": result(1.0),
+        "slow": result(1.0),
+        "slower": result(1.0),
+        "gone": result(1.0),
+    }
+    current = {"fast": result(0.5), "same": result(1.2), "slow": result(1.3), "slower": result(2.0), "new": result(9.0)}
+
+    regressions = find_regressions(current, baseline, threshold=0.25)
+
+    assert [regression.name for regression in regressions] == ["slower", "slow"]
+    assert regressions[0].ratio == 2.0
+    assert str(regressions[0]) == "slower: 1000000.00 us -> 2000000.00 us (+100%)"
+
+
+def test_compared_statistic_is_configurable():
+    """Test that the statistic compared can be chosen, and must be a known one."""
+    baseline = {"bench": {"min": 1.0, "median": 1.0, "mean": 1.0}}
+    current = {"bench": {"min": 1.0, "median": 2.0, "mean": 2.0}}
+
+    assert find_regressions(current, baseline, statistic="min") == []
+    assert len(find_regressions(current, baseline, statistic="median")) == 1
+    with pytest.raises(ValueError):
+        find_regressions(current, baseline, statistic="max")
@@ -0,0 +1,34 @@
+from benchmarks.timer import measure, measure_allocations
+
+
+def test_measure_calibrates_and_runs_the_setup_before_each_round():
+    """Test that the calls of each round are prepared by the setup, and the timings are per call."""
+    prepared = []
+
+    def setup(calls: int) -> None:
+        prepared.extend(range(calls))
+
+    result = measure("pop", lambda: prepared.pop(), rounds=3, round_time=0.001, setup=setup)
+
+    assert prepared == []
+    assert result.name == "pop"
+    assert (result.rounds, result.iterations > 0) == (3, True)
+    assert 0 < result.min <= result.median <= max(result.mean, result.median)
+    assert set(result.to_dict()) == {"name", "rounds", "iterations", "min", "median", "mean", "stdev", "allocated"}
+    assert result.allocated is None
+
+
+def test_measure_allocations_counts_the_kept_results_but_not_the_temporaries():
+    """Test that the bytes of the returned objects are counted per call, and the freed ones are not."""
+    kept = measure_allocations(lambda: bytearray(1000), calls=100)
+    freed = measure_allocations(lambda: len(bytearray(1000)), calls=100)
+
+    assert kept >= 1000
+    assert freed < 100
+
+
+def test_measure_reports_the_allocations_when_asked():
+    """Test that the allocations are measured next to the timings on demand."""
+    result = measure("bytearray", lambda: bytearray(1000), rounds=1, round_time=0.001, allocations=True)
+
+    assert result.allocated >= 1000
@@ -43,3 +43,11 @@ class TestUserEntity:
             id=None, name="john", email="john@example.com", password="password", created_at=datetime.now()
         )
         assert user_entity.id is None
+
+    def test_user_entity_is_slotted(self, user_entity):
+        """Test that UserEntity keeps its fields in slots, without a `__dict__` per instance.
+
+        Args:
+            user_entity (UserEntity): The UserEntity instance to test.
+        """
+        assert not hasattr(user_entity, "__dict__")
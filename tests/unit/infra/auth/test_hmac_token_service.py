@@ -0,0 +1,168 @@
+from datetime import datetime, timezone
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.domain.exceptions import InvalidTokenError
+from src.domain.repositories.revoked_token import RevokedTokenRepositoryInterface
+from src.infra.auth import HmacTokenService, TokenSettings
+
+
+class FakeClock:
+    """Wall clock whose time only moves when the test advances it."""
+
+    def __init__(self) -> None:
+        """Initialize the clock at a fixed date."""
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        """Get the current time."""
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """
+        Move the clock forward.
+
+        Args:
+            seconds (float): The number of seconds to move forward.
+        """
+        self.now += seconds
+
+
+class TestHmacTokenService:
+    """Test cases for the HmacTokenService class."""
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        """
+        Fixture that returns a clock controlled by the test.
+
+        Returns:
+            clock (FakeClock): The clock.
+        """
+        return FakeClock()
+
+    @pytest.fixture
+    def revoked_token_repository(self, mocker: MockerFixture) -> RevokedTokenRepositoryInterface:
+        """
+        Fixture that returns a mocked repository without revoked tokens.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+
+        Returns:
+            revoked_token_repository (RevokedTokenRepositoryInterface): The mocked repository.
+        """
+        revoked_token_repository = mocker.Mock(spec=RevokedTokenRepositoryInterface)
+        revoked_token_repository.get_revoked_token_ids.return_value = []
+        return revoked_token_repository
+
+    @pytest.fixture
+    def token_service(
+        self, revoked_token_repository: RevokedTokenRepositoryInterface, clock: FakeClock
+    ) -> HmacTokenService:
+        """
+        Fixture that returns a token service issuing tokens valid for 60 seconds, without periodic reloads.
+
+        Args:
+            revoked_token_repository (RevokedTokenRepositoryInterface): The mocked repository fixture.
+            clock (FakeClock): The clock fixture.
+
+        Returns:
+            token_service (HmacTokenService): The token service.
+        """
+        settings = TokenSettings(secret="secret", ttl=60, revocation_refresh_interval=0)
+        return HmacTokenService(revoked_token_repository=revoked_token_repository, settings=settings, clock=clock)
+
+    def test_issued_token_is_verified_from_the_cache(self, token_service: HmacTokenService, clock: FakeClock):
+        """
+        Test that an issued token carries its claims and that its signature is checked only once.
+
+        Args:
+            token_service (HmacTokenService): The token service fixture.
+            clock (FakeClock): The clock fixture.
+        """
+        access_token = token_service.issue(42)
+
+        claims = token_service.verify(access_token.access_token)
+
+        assert access_token.token_type == "bearer"
+        assert claims.subject == 42
+        assert claims.expires_at == access_token.expires_at == datetime.fromtimestamp(clock.now + 60, timezone.utc)
+        assert token_service.verify(access_token.access_token) == claims
+        assert (token_service.stats.misses, token_service.stats.hits) == (1, 1)
+
+    def test_forged_and_malformed_tokens_are_rejected(self, token_service: HmacTokenService):
+        """
+        Test that a token whose payload was altered, or signed with another key, is rejected.
+
+        Args:
+            token_service (HmacTokenService): The token service fixture.
+        """
+        payload, signature = token_service.issue(42).access_token.split(".")
+        other_service = HmacTokenService(
+            revoked_token_repository=token_service.revoked_token_repository,
+            settings=TokenSettings(secret="other", revocation_refresh_interval=0),
+        )
+
+        for token in (f"{payload}x.{signature}", other_service.issue(42).access_token, "garbage", "é.é"):
+            with pytest.raises(InvalidTokenError):
+                token_service.verify(token)
+
+    def test_expired_token_is_rejected(self, token_service: HmacTokenService, clock: FakeClock):
+        """
+        Test that a token is rejected once it expired, even when its claims are cached.
+
+        Args:
+            token_service (HmacTokenService): The token service fixture.
+            clock (FakeClock): The clock fixture.
+        """
+        token = token_service.issue(42).access_token
+        token_service.verify(token)
+        clock.advance(60)
+
+        with pytest.raises(InvalidTokenError, match="expired"):
+            token_service.verify(token)
+
+    def test_revoked_tokens_are_rejected(
+        self, token_service: HmacTokenService, revoked_token_repository: RevokedTokenRepositoryInterface
+    ):
+        """
+        Test that a token revoked by this worker is rejected at once, and one revoked by another at the next reload.
+
+        Args:
+            token_service (HmacTokenService): The token service fixture.
+            revoked_token_repository (RevokedTokenRepositoryInterface): The mocked repository fixture.
+        """
+        token_service.start()
+        local_token, remote_token = token_service.issue(1).access_token, token_service.issue(2).access_token
+        local_claims, remote_claims = token_service.verify(local_token), token_service.verify(remote_token)
+
+        token_service.revoke(local_claims)
+        revoked_token_repository.get_revoked_token_ids.return_value = [local_claims.token_id, remote_claims.token_id]
+
+        with pytest.raises(InvalidTokenError, match="revoked"):
+            token_service.verify(local_token)
+        assert token_service.verify(remote_token) == remote_claims
+        assert token_service.refresh_revocations() is True
+        with pytest.raises(InvalidTokenError, match="revoked"):
+            token_service.verify(remote_token)
+        revoked_token_repository.revoke_token.assert_called_once_with(local_claims.token_id, local_claims.expires_at)
+
+    def test_failed_reload_keeps_the_revocation_list(
+        self, token_service: HmacTokenService, revoked_token_repository: RevokedTokenRepositoryInterface
+    ):
+        """
+        Test that a reload failing keeps the tokens revoked before.
+
+        Args:
+            token_service (HmacTokenService): The token service fixture.
+            revoked_token_repository (RevokedTokenRepositoryInterface): The mocked repository fixture.
+        """
+        token = token_service.issue(1).access_token
+        token_service.revoke(token_service.verify(token))
+        revoked_token_repository.get_revoked_token_ids.side_effect = RuntimeError("database down")
+
+        assert token_service.refresh_revocations() is False
+        with pytest.raises(InvalidTokenError, match="revoked"):
+            token_service.verify(token)
@@ -0,0 +1,39 @@
+import pytest
+
+from src.infra.cache import BloomFilter
+
+
+class TestBloomFilter:
+    """Test cases for the BloomFilter class."""
+
+    def test_added_items_are_always_found(self):
+        """Test that the filter has no false negatives."""
+        bloom_filter = BloomFilter(expected_items=1_000, false_positive_rate=0.01)
+        emails = [f"user{index}@example.com" for index in range(1_000)]
+
+        bloom_filter.update(emails)
+
+        assert all(email in bloom_filter for email in emails)
+        assert len(bloom_filter) == 1_000
+
+    def test_false_positive_rate_stays_near_the_target(self):
+        """Test that the observed false-positive rate is close to the targeted one at the expected size."""
+        bloom_filter = BloomFilter(expected_items=5_000, false_positive_rate=0.01)
+        bloom_filter.update(f"user{index}@example.com" for index in range(5_000))
+
+        false_positives = sum(f"unknown{index}@example.com" in bloom_filter for index in range(20_000))
+
+        assert false_positives / 20_000 < 0.02
+        assert bloom_filter.estimated_false_positive_rate() == pytest.approx(0.01, rel=0.2)
+
+    def test_filter_is_sized_from_the_expected_items(self):
+        """Test that a filter for a million emails at 1% fits in about 1.2 MB with 7 hash functions."""
+        bloom_filter = BloomFilter(expected_items=1_000_000, false_positive_rate=0.01)
+
+        assert bloom_filter.memory_bytes == pytest.approx(1_198_132, rel=0.01)
+        assert bloom_filter.hash_count == 7
+
+    def test_invalid_false_positive_rate_raises(self):
+        """Test that a false-positive rate outside of ]0, 1[ is rejected."""
+        with pytest.raises(ValueError):
+            BloomFilter(expected_items=10, false_positive_rate=1)
@@ -0,0 +1,179 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.infra.cache import AsyncSingleFlight, SingleFlight
+
+
+def wait_for(condition) -> None:
+    """
+    Wait until a condition holds, for at most 5 seconds.
+
+    Args:
+        condition (Callable[[], bool]): The condition to wait for.
+    """
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def call(target):
+    """
+    Call a function, returning the exception it raises instead of raising it.
+
+    Args:
+        target (Callable[[], Any]): The function to call.
+
+    Returns:
+        (Any): The result or the exception of the call.
+    """
+    try:
+        return target()
+    except Exception as exception:
+        return exception
+
+
+class TestSingleFlight:
+    """Test cases for the SingleFlight class."""
+
+    def test_concurrent_calls_share_one_run(self):
+        """Test that the calls made for a key while one is in flight receive its result."""
+        group = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        runs = []
+
+        def function():
+            runs.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return "value"
+
+        leader = threading.Thread(target=lambda: group.do("key", function))
+        leader.start()
+        started.wait(timeout=5)
+        followers = [threading.Thread(target=lambda: runs.append(group.do("key", function))) for _ in range(4)]
+        for follower in followers:
+            follower.start()
+        wait_for(lambda: group.stats.shared == 4)
+        release.set()
+        leader.join(timeout=5)
+        for follower in followers:
+            follower.join(timeout=5)
+
+        assert runs == [1] + ["value"] * 4
+        assert group.stats.calls == 1
+        assert group.stats.shared == 4
+
+    def test_exception_is_shared(self):
+        """Test that the exception of the call in flight is raised to every caller that joined it."""
+        group = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def function():
+            started.set()
+            release.wait(timeout=5)
+            raise RuntimeError("boom")
+
+        leader = threading.Thread(target=lambda: call(lambda: group.do("key", function)))
+        leader.start()
+        started.wait(timeout=5)
+        outcomes = []
+        followers = [
+            threading.Thread(target=lambda: outcomes.append(call(lambda: group.do("key", function)))) for _ in range(2)
+        ]
+        for follower in followers:
+            follower.start()
+        wait_for(lambda: group.stats.shared == 2)
+        release.set()
+        leader.join(timeout=5)
+        for follower in followers:
+            follower.join(timeout=5)
+
+        assert len(outcomes) == 2
+        assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+        assert group.stats.calls == 1
+
+    def test_sequential_calls_run_again(self):
+        """Test that nothing is cached once a call completed."""
+        group = SingleFlight()
+        results = iter(["first", "second"])
+
+        assert group.do("key", lambda: next(results)) == "first"
+        assert group.do("key", lambda: next(results)) == "second"
+        assert group.stats.calls == 2
+        assert group.stats.shared == 0
+
+    def test_forget_makes_the_next_call_run(self):
+        """Test that a call made after forgetting the key runs instead of joining the call in flight."""
+        group = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(timeout=5)
+            return "stale"
+
+        leader = threading.Thread(target=lambda: group.do("key", slow))
+        leader.start()
+        started.wait(timeout=5)
+        group.forget("key")
+
+        assert group.do("key", lambda: "fresh") == "fresh"
+        release.set()
+        leader.join(timeout=5)
+        assert group.stats.shared == 0
+
+
+@pytest.mark.anyio
+class TestAsyncSingleFlight:
+    """Test cases for the AsyncSingleFlight class."""
+
+    async def test_concurrent_calls_share_one_run(self):
+        """Test that the coroutines awaiting the same key share one run."""
+        group = AsyncSingleFlight()
+        runs = []
+
+        async def function():
+            runs.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(group.do("key", function) for _ in range(5)))
+
+        assert results == ["value"] * 5
+        assert runs == [1]
+        assert group.stats.calls == 1
+        assert group.stats.shared == 4
+
+    async def test_exception_is_shared(self):
+        """Test that the exception of the call in flight is raised to every coroutine that joined it."""
+        group = AsyncSingleFlight()
+
+        async def function():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(*(group.do("key", function) for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert group.stats.calls == 1
+
+    async def test_cancelled_follower_leaves_the_call_running(self):
+        """Test that cancelling a coroutine that joined a call does not cancel the call."""
+        group = AsyncSingleFlight()
+
+        async def function():
+            await asyncio.sleep(0.01)
+            return "value"
+
+        leader = asyncio.ensure_future(group.do("key", function))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(group.do("key", function))
+        await asyncio.sleep(0)
+        follower.cancel()
+
+        assert await leader == "value"
+        with pytest.raises(asyncio.CancelledError):
+            await follower
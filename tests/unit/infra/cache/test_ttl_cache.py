@@ -0,0 +1,173 @@
+import threading
+
+import pytest
+
+from src.infra.cache import TTLCache
+
+
+class FakeClock:
+    """Clock whose time only moves when the test advances it."""
+
+    def __init__(self) -> None:
+        """Initialize the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Get the current time."""
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """
+        Move the clock forward.
+
+        Args:
+            seconds (float): The number of seconds to move forward.
+        """
+        self.now += seconds
+
+
+class TestTTLCache:
+    """Test cases for the TTLCache class."""
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        """
+        Fixture that returns a clock controlled by the test.
+
+        Returns:
+            clock (FakeClock): The clock.
+        """
+        return FakeClock()
+
+    def test_fresh_entries_are_served_without_loading(self, clock: FakeClock):
+        """
+        Test that a value is loaded once and then served from the cache until its TTL.
+
+        Args:
+            clock (FakeClock): The clock fixture.
+        """
+        cache = TTLCache(ttl=10, clock=clock)
+        loads = []
+
+        def loader():
+            loads.append(1)
+            return "value"
+
+        assert cache.get_or_load("key", loader) == "value"
+        clock.advance(9)
+        assert cache.get_or_load("key", loader) == "value"
+        clock.advance(1)
+        assert cache.get_or_load("key", loader) == "value"
+
+        assert len(loads) == 2
+        assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+    def test_none_is_not_cached(self, clock: FakeClock):
+        """
+        Test that a missing value is looked up again on the next call.
+
+        Args:
+            clock (FakeClock): The clock fixture.
+        """
+        cache = TTLCache(clock=clock)
+
+        cache.get_or_load("key", lambda: None)
+        cache.get_or_load("key", lambda: None)
+
+        assert cache.stats.misses == 2
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self, clock: FakeClock):
+        """
+        Test that the least recently used entry is evicted above the size bound.
+
+        Args:
+            clock (FakeClock): The clock fixture.
+        """
+        cache = TTLCache(max_size=2, clock=clock)
+        cache.set("first", 1)
+        cache.set("second", 2)
+        cache.get_or_load("first", lambda: 0)
+
+        cache.set("third", 3)
+
+        assert cache.get_or_load("second", lambda: None) is None
+        assert cache.get_or_load("first", lambda: 0) == 1
+        assert cache.stats.evictions == 1
+
+    def test_discarded_entries_are_reloaded(self, clock: FakeClock):
+        """
+        Test that discarding entries forces the next lookup to load the value.
+
+        Args:
+            clock (FakeClock): The clock fixture.
+        """
+        cache = TTLCache(clock=clock)
+        cache.set("first", 1)
+        cache.set("second", 2)
+
+        cache.discard("first")
+        cache.discard_where(lambda value: value == 2)
+
+        assert cache.get_or_load("first", lambda: 10) == 10
+        assert cache.get_or_load("second", lambda: 20) == 20
+
+    def test_a_load_racing_with_an_invalidation_is_not_cached(self, clock: FakeClock):
+        """
+        Test that a value loaded while the key is invalidated is returned but not cached.
+
+        Args:
+            clock (FakeClock): The clock fixture.
+        """
+        cache = TTLCache(clock=clock)
+
+        def loader():
+            cache.discard("key")
+            return "stale"
+
+        assert cache.get_or_load("key", loader) == "stale"
+        assert len(cache) == 0
+
+    def test_stale_entry_is_served_while_it_is_refreshed(self, clock: FakeClock):
+        """
+        Test that stale-while-revalidate serves the expired value and refreshes it in the background.
+
+        Args:
+            clock (FakeClock): The clock fixture.
+        """
+        cache = TTLCache(ttl=10, stale_while_revalidate=5, clock=clock)
+        cache.set("key", "old")
+        clock.advance(12)
+        refreshed = threading.Event()
+
+        def loader():
+            refreshed.set()
+            return "new"
+
+        assert cache.get_or_load("key", loader) == "old"
+        assert refreshed.wait(timeout=5)
+        cache.close()
+
+        assert cache.get_or_load("key", loader) == "new"
+        assert (cache.stats.stale_hits, cache.stats.refreshes, cache.stats.hits) == (1, 1, 1)
+
+    def test_stale_entry_is_served_when_the_loader_fails(self, clock: FakeClock):
+        """
+        Test that serve-stale-on-error returns the expired value when the loader raises.
+
+        Args:
+            clock (FakeClock): The clock fixture.
+        """
+        cache = TTLCache(ttl=10, stale_if_error=30, clock=clock)
+        cache.set("key", "old")
+        clock.advance(20)
+
+        def loader():
+            raise ConnectionError("database unavailable")
+
+        assert cache.get_or_load("key", loader) == "old"
+        assert cache.stats.stale_on_error == 1
+
+        clock.advance(20)
+        with pytest.raises(ConnectionError):
+            cache.get_or_load("key", loader)
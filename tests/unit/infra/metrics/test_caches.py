@@ -0,0 +1,56 @@
+from src.infra.cache import TTLCache
+from src.infra.metrics import CacheCollector, EmailFilterCollector, MetricsRegistry
+from src.infra.repositories.bloom_filtered_user import EmailFilter, EmailFilterSettings
+
+
+class TestCacheMetrics:
+    """Test cases for the collectors of the user cache and the email filter."""
+
+    def test_cache_counters_are_collected_per_cache(self):
+        """Test that the hit, miss and eviction counters and the size of a cache are reported under its name."""
+        cache = TTLCache(max_size=1, ttl=60)
+        cache.get_or_load("first", lambda: 1)
+        cache.get_or_load("first", lambda: 1)
+        cache.get_or_load("second", lambda: 2)
+
+        samples = {family.name: family.samples for family in CacheCollector(lambda: {"user": cache})()}
+
+        assert samples["cache_hits_total"] == [("", {"cache": "user"}, 1.0)]
+        assert samples["cache_misses_total"] == [("", {"cache": "user"}, 2.0)]
+        assert samples["cache_evictions_total"] == [("", {"cache": "user"}, 1.0)]
+        assert samples["cache_entries"] == [("", {"cache": "user"}, 1.0)]
+
+    def test_email_filter_size_and_false_positive_rates_are_collected(self):
+        """Test that the memory size, the false-positive rates and the lookup counters of the filter are reported."""
+        email_filter = EmailFilter(
+            email_source=lambda batch_size: iter(["known@example.com"]),
+            settings=EmailFilterSettings(enabled=True, expected_items=1_000, rebuild_interval=0),
+        )
+        email_filter.start()
+        email_filter.might_contain("unknown@example.com")
+        email_filter.record_false_positive()
+
+        samples = {family.name: family.samples[0][2] for family in EmailFilterCollector(lambda: email_filter)()}
+
+        assert samples["email_filter_ready"] == 1.0
+        assert samples["email_filter_items"] == 1.0
+        assert samples["email_filter_memory_bytes"] == email_filter.stats.memory_bytes > 0
+        assert 0 < samples["email_filter_estimated_false_positive_rate"] < 0.01
+        assert samples["email_filter_observed_false_positive_rate"] == 0.5
+        assert samples["email_filter_definite_misses_total"] == 1.0
+        assert samples["email_filter_false_positives_total"] == 1.0
+
+    def test_disabled_email_filter_reports_nothing(self):
+        """Test that no family is collected while the email filter is disabled."""
+        assert EmailFilterCollector(lambda: None)() == []
+
+    def test_unregistered_collector_is_not_rendered(self):
+        """Test that a collector removed from the registry is no longer collected."""
+        registry = MetricsRegistry()
+        collector = CacheCollector(lambda: {"user": TTLCache()})
+        registry.register_collector(collector)
+        assert 'cache_entries{cache="user"} 0' in registry.render()
+
+        registry.unregister_collector(collector)
+
+        assert "cache_entries" not in registry.render()
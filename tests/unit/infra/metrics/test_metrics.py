@@ -0,0 +1,104 @@
+import threading
+
+import pytest
+
+from src.infra.metrics import MetricFamily, MetricsRegistry
+
+
+class TestMetrics:
+    """Test cases for the counters, gauges and histograms."""
+
+    def test_counter_sums_the_increments_of_every_thread(self):
+        """Test that increments made concurrently from many threads are all counted, without locks."""
+        counter = MetricsRegistry().counter("events_total", "Events.", ("kind",))
+
+        def increment():
+            for _ in range(10_000):
+                counter.labels("a").inc()
+
+        threads = [threading.Thread(target=increment) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.labels("a").value == 80_000
+        assert counter.labels("b").value == 0
+
+    def test_gauge_goes_up_and_down(self):
+        """Test that a gauge is the sum of its increments and decrements."""
+        gauge = MetricsRegistry().gauge("in_flight", "In flight.")
+
+        gauge.labels().inc(3)
+        gauge.labels().dec()
+
+        assert gauge.labels().value == 2
+
+    def test_histogram_buckets_are_cumulative_and_inclusive(self):
+        """Test that an observation counts in every bucket whose upper bound it does not exceed."""
+        histogram = MetricsRegistry().histogram("duration_seconds", "Duration.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.labels().observe(value)
+
+        counts, total = histogram.labels().snapshot()
+
+        assert histogram.upper_bounds == (0.1, 1.0, float("inf"))
+        assert counts == [2, 3, 4]
+        assert total == pytest.approx(2.65)
+
+    def test_labels_must_match_the_label_names(self):
+        """Test that a child cannot be requested with the wrong number of label values."""
+        counter = MetricsRegistry().counter("events_total", "Events.", ("kind",))
+
+        with pytest.raises(ValueError, match="expects the labels"):
+            counter.labels("a", "b")
+
+
+class TestMetricsRegistry:
+    """Test cases for the MetricsRegistry class."""
+
+    def test_metrics_are_registered_once_per_name(self):
+        """Test that asking for a metric again returns the registered one, and a type conflict is refused."""
+        registry = MetricsRegistry()
+        counter = registry.counter("events_total", "Events.")
+
+        assert registry.counter("events_total", "Events.") is counter
+        with pytest.raises(ValueError, match="already registered as a counter"):
+            registry.gauge("events_total", "Events.")
+
+    def test_render_uses_the_prometheus_text_format(self):
+        """Test that the metrics and the collected families are rendered with their help, type and samples."""
+        registry = MetricsRegistry()
+        registry.counter("outcomes_total", "Use case outcomes.", ("outcome",)).labels('SAY "HI"').inc(2)
+        registry.histogram("duration_seconds", "Duration.", ("route",), buckets=(0.5,)).labels("/a").observe(0.25)
+        registry.gauge("in_flight", "In flight.").labels().inc()
+
+        assert registry.render() == (
+            "# HELP outcomes_total Use case outcomes.\n"
+            "# TYPE outcomes_total counter\n"
+            'outcomes_total{outcome="SAY \\"HI\\""} 2\n'
+            "# HELP duration_seconds Duration.\n"
+            "# TYPE duration_seconds histogram\n"
+            'duration_seconds_bucket{route="/a",le="0.5"} 1\n'
+            'duration_seconds_bucket{route="/a",le="+Inf"} 1\n'
+            'duration_seconds_sum{route="/a"} 0.25\n'
+            'duration_seconds_count{route="/a"} 1\n'
+            "# HELP in_flight In flight.\n"
+            "# TYPE in_flight gauge\n"
+            "in_flight 1\n"
+        )
+
+    def test_collectors_are_called_at_each_collection(self):
+        """Test that a registered collector computes its families when the metrics are collected."""
+        registry = MetricsRegistry()
+        calls = []
+
+        def collector():
+            calls.append(1)
+            return [MetricFamily("pool_size", "gauge", "Size.", [("", {}, float(len(calls)))])]
+
+        registry.register_collector(collector)
+        registry.register_collector(collector)
+
+        assert "pool_size 1\n" in registry.render()
+        assert "pool_size 2\n" in registry.render()
@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+from src.infra.profiling import AWAIT, Profile, function_name, to_collapsed, to_speedscope
+
+
+def handler():
+    """A function standing for a request handler in the sampled stacks."""
+
+
+def query():
+    """A function standing for a database query in the sampled stacks."""
+
+
+def build_profile() -> Profile:
+    """
+    Build a profile of three samples.
+
+    Returns:
+        (Profile): The profile.
+    """
+    profile = Profile("GET /api/users/")
+    profile.samples = [
+        ((handler.__code__, query.__code__), 0.002),
+        ((handler.__code__, query.__code__), 0.001),
+        ((handler.__code__, AWAIT), 0.004),
+    ]
+    profile.duration = 0.007
+    return profile
+
+
+def test_speedscope_document_shares_the_frames_of_the_samples():
+    """Test that the speedscope document is a sampled profile whose samples index shared frames."""
+    document = to_speedscope(build_profile())
+
+    frames = document["shared"]["frames"]
+    (profile,) = document["profiles"]
+    assert document["$schema"] == "https://www.speedscope.app/file-format-schema.json"
+    assert [frame["name"] for frame in frames] == ["handler", "query", AWAIT]
+    assert frames[0]["file"] == __file__
+    assert frames[0]["line"] == handler.__code__.co_firstlineno
+    assert profile["type"] == "sampled"
+    assert profile["unit"] == "seconds"
+    assert profile["endValue"] == 0.007
+    assert profile["samples"] == [[0, 1], [0, 1], [0, 2]]
+    assert profile["weights"] == [0.002, 0.001, 0.004]
+
+
+def test_collapsed_stacks_sum_the_weight_of_each_stack():
+    """Test that the folded stacks list each distinct stack once, with its weight in microseconds."""
+    assert to_collapsed(build_profile()) == "handler;query 3000\nhandler;[await] 4000\n"
+
+
+def test_function_name_falls_back_to_the_bare_name_without_a_qualified_name():
+    """Test that a function is named after its bare name where the code has no qualified name, as on Python 3.10."""
+    code = SimpleNamespace(co_name="get_user_by_email", co_filename="repository.py", co_firstlineno=1)
+
+    assert function_name(code) == "get_user_by_email"
+    assert function_name(AWAIT) == AWAIT
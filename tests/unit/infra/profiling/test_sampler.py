@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+import pytest
+from starlette.concurrency import run_in_threadpool
+
+from src.infra.profiling import AWAIT, Profile, current_profile, function_name
+
+
+def busy(seconds: float) -> None:
+    """
+    Keep the CPU busy.
+
+    Args:
+        seconds (float): For how long.
+    """
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def blocking_work() -> None:
+    """Run on a worker thread, as a synchronous controller does."""
+    busy(0.03)
+
+
+async def handle_request(profile: Profile) -> None:
+    """
+    Stand for a request profiled on the event loop, in a worker thread and while awaiting.
+
+    Args:
+        profile (Profile): The profile of the request.
+    """
+    with profile:
+        assert current_profile() is profile
+        busy(0.03)
+        await run_in_threadpool(profile.run, blocking_work)
+        await asyncio.sleep(0.03)
+
+
+def time_in(profile: Profile, function: object) -> float:
+    """
+    Sum the weight of the samples of a profile whose stack includes a function.
+
+    Args:
+        profile (Profile): The profile.
+        function (object): The function, or the name of a synthetic function such as `[await]`.
+
+    Returns:
+        (float): The number of seconds sampled in the function.
+    """
+    return sum(
+        weight
+        for stack, weight in profile.samples
+        if any(code is getattr(function, "__code__", function) for code in stack)
+    )
+
+
+@pytest.mark.anyio
+async def test_profile_samples_the_event_loop_the_worker_thread_and_the_awaits():
+    """Test that a profile covers the request on the event loop, in its worker thread and while it awaits."""
+    profile = Profile("request", interval=0.001)
+
+    await handle_request(profile)
+
+    assert current_profile() is None
+    assert profile.duration >= 0.09
+    assert profile.samples
+    assert all(stack[0] is handle_request.__code__ for stack, _ in profile.samples)
+    assert function_name(profile.samples[0][0][0]) == "handle_request"
+    sampled = sum(weight for _, weight in profile.samples)
+    shares = {
+        "event loop": (time_in(profile, busy) - time_in(profile, blocking_work)) / sampled,
+        "worker thread": time_in(profile, blocking_work) / sampled,
+        "await": time_in(profile, AWAIT) / sampled,
+    }
+    assert all(0.1 < share < 0.8 for share in shares.values()), shares
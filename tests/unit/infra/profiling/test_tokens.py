@@ -0,0 +1,34 @@
+from src.infra.profiling import sign_profile_token, verify_profile_token
+
+SECRET = "profiling-secret"
+
+
+def test_signed_token_is_valid_until_it_expires():
+    """Test that a token is accepted before its expiry and refused after it."""
+    token = sign_profile_token(SECRET, ttl=60, now=1000)
+
+    assert verify_profile_token(SECRET, token, now=1059)
+    assert not verify_profile_token(SECRET, token, now=1060)
+
+
+def test_token_signed_with_another_secret_is_refused():
+    """Test that a token is only accepted with the secret that signed it."""
+    assert not verify_profile_token(SECRET, sign_profile_token("another-secret", now=1000), now=1000)
+
+
+def test_tampered_token_is_refused():
+    """Test that extending the expiry of a token invalidates its signature."""
+    expires_at, signature = sign_profile_token(SECRET, ttl=60, now=1000).split(".")
+
+    assert not verify_profile_token(SECRET, f"{int(expires_at) + 3600}.{signature}", now=1000)
+
+
+def test_every_token_is_refused_without_a_secret():
+    """Test that profiling on demand is disabled while no secret is configured."""
+    assert not verify_profile_token("", sign_profile_token("", now=1000), now=1000)
+
+
+def test_malformed_token_is_refused():
+    """Test that a token that is not `<expiry>.<signature>` is refused."""
+    assert not verify_profile_token(SECRET, "not-a-token", now=1000)
+    assert not verify_profile_token(SECRET, "", now=1000)
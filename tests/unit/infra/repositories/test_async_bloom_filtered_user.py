@@ -0,0 +1,80 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from src.applications.dtos import UserDTO
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+from src.domain.repositories.user import UserRepositoryInterface
+from src.infra.repositories.async_bloom_filtered_user import AsyncBloomFilteredUserRepository
+from src.infra.repositories.bloom_filtered_user import BloomFilteredUserRepository, EmailFilter, EmailFilterSettings
+
+
+@pytest.mark.anyio
+class TestAsyncBloomFilteredUserRepository:
+    """Test cases for the AsyncBloomFilteredUserRepository class."""
+
+    @pytest.fixture
+    def user_dto(self) -> UserDTO:
+        """
+        Fixture that returns a sample UserDTO instance for testing.
+
+        Returns:
+            user_dto (UserDTO): A UserDTO instance representing a sample user.
+        """
+        return UserDTO(id=1, name="John Doe", email="johndoe@example.com", password="password123", created_at=None)
+
+    @pytest.fixture
+    def email_filter(self) -> EmailFilter:
+        """
+        Fixture that returns an email filter built from an empty database.
+
+        Returns:
+            email_filter (EmailFilter): The built email filter.
+        """
+        email_filter = EmailFilter(
+            email_source=lambda batch_size: iter([]),
+            settings=EmailFilterSettings(enabled=True, expected_items=1_000, rebuild_interval=0),
+        )
+        email_filter.start()
+        return email_filter
+
+    async def test_unknown_email_is_answered_without_the_database(
+        self, mocker: MockerFixture, email_filter: EmailFilter
+    ):
+        """
+        Test that a lookup of an email the filter rules out does not reach the decorated repository.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+            email_filter (EmailFilter): The email filter fixture.
+        """
+        repository = mocker.AsyncMock(spec=AsyncUserRepositoryInterface)
+        filtered_repository = AsyncBloomFilteredUserRepository(repository=repository, email_filter=email_filter)
+
+        assert await filtered_repository.get_user_by_email("unknown@example.com") is None
+
+        repository.get_user_by_email.assert_not_called()
+        assert filtered_repository.stats.definite_misses == 1
+
+    async def test_created_email_is_known_to_the_synchronous_lookups(
+        self, mocker: MockerFixture, email_filter: EmailFilter, user_dto: UserDTO
+    ):
+        """
+        Test that a user created on the asynchronous path is looked up by the synchronous repository sharing
+        the filter.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+            email_filter (EmailFilter): The email filter fixture.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        async_repository = mocker.AsyncMock(spec=AsyncUserRepositoryInterface)
+        async_repository.create_user.return_value = user_dto
+        repository = mocker.Mock(spec=UserRepositoryInterface)
+        repository.get_user_by_email.return_value = user_dto
+
+        await AsyncBloomFilteredUserRepository(repository=async_repository, email_filter=email_filter).create_user(
+            user_dto
+        )
+        filtered_repository = BloomFilteredUserRepository(repository=repository, email_filter=email_filter)
+
+        assert filtered_repository.get_user_by_email(user_dto.email) == user_dto
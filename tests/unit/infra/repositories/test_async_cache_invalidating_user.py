@@ -0,0 +1,84 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from src.applications.dtos import UserDTO
+from src.domain.exceptions import EmailAlreadyExistsError
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+from src.domain.unit_of_work import AsyncUnitOfWorkInterface
+from src.infra.cache import TTLCache
+from src.infra.repositories.async_cache_invalidating_user import AsyncCacheInvalidatingUserRepository
+
+
+@pytest.mark.anyio
+class TestAsyncCacheInvalidatingUserRepository:
+    """Test cases for the AsyncCacheInvalidatingUserRepository class."""
+
+    @pytest.fixture
+    def user_dto(self) -> UserDTO:
+        """
+        Fixture that returns a sample UserDTO instance for testing.
+
+        Returns:
+            user_dto (UserDTO): A UserDTO instance representing a sample user.
+        """
+        return UserDTO(id=1, name="John Doe", email="johndoe@example.com", password="password123", created_at=None)
+
+    @pytest.fixture
+    def cache(self, user_dto: UserDTO) -> TTLCache:
+        """
+        Fixture that returns a cache holding both entries of the sample user.
+
+        Args:
+            user_dto (UserDTO): The UserDTO fixture.
+
+        Returns:
+            cache (TTLCache): The cache.
+        """
+        cache = TTLCache(max_size=16, ttl=60)
+        cache.set(("email", user_dto.email), user_dto)
+        cache.set(("id", user_dto.id), user_dto)
+        return cache
+
+    async def test_delete_invalidates_every_entry_of_the_user_now_and_after_the_commit(
+        self, mocker: MockerFixture, cache: TTLCache, user_dto: UserDTO
+    ):
+        """
+        Test that deleting a user drops its entries, and drops them again once the unit of work commits.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+            cache (TTLCache): The cache fixture.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        unit_of_work = mocker.MagicMock(spec=AsyncUnitOfWorkInterface)
+        repository = AsyncCacheInvalidatingUserRepository(
+            repository=mocker.AsyncMock(spec=AsyncUserRepositoryInterface), cache=cache, unit_of_work=unit_of_work
+        )
+
+        await repository.delete_user(user_dto.id)
+        assert len(cache) == 0
+        cache.set(("id", user_dto.id), user_dto)
+        (after_commit,), _ = unit_of_work.after_commit.call_args
+        after_commit()
+
+        assert len(cache) == 0
+
+    async def test_failed_create_still_invalidates_the_email_entry(
+        self, mocker: MockerFixture, cache: TTLCache, user_dto: UserDTO
+    ):
+        """
+        Test that the email entry is dropped even when the decorated repository fails to create the user.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+            cache (TTLCache): The cache fixture.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        decorated_repository = mocker.AsyncMock(spec=AsyncUserRepositoryInterface)
+        decorated_repository.create_user.side_effect = EmailAlreadyExistsError(user_dto.email)
+        repository = AsyncCacheInvalidatingUserRepository(repository=decorated_repository, cache=cache)
+
+        with pytest.raises(EmailAlreadyExistsError):
+            await repository.create_user(user_dto)
+
+        assert len(cache) == 1
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.applications.dtos import UserDTO
+from src.domain.repositories.async_user import AsyncUserRepositoryInterface
+from src.infra.repositories.async_single_flight_user import AsyncSingleFlightUserRepository
+
+
+@pytest.mark.anyio
+class TestAsyncSingleFlightUserRepository:
+    """Test cases for the AsyncSingleFlightUserRepository class."""
+
+    @pytest.fixture
+    def user_dto(self) -> UserDTO:
+        """
+        Fixture that returns a sample UserDTO instance for testing.
+
+        Returns:
+            user_dto (UserDTO): A UserDTO instance representing a sample user.
+        """
+        return UserDTO(id=1, name="John Doe", email="johndoe@example.com", password="password123", created_at=None)
+
+    @pytest.fixture
+    def repository(self, mocker: MockerFixture, user_dto: UserDTO) -> AsyncUserRepositoryInterface:
+        """
+        Fixture that returns a mocked asynchronous user repository answering lookups after a delay.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+            user_dto (UserDTO): The UserDTO fixture.
+
+        Returns:
+            repository (AsyncUserRepositoryInterface): The mocked repository.
+        """
+
+        async def slow_lookup(*args):
+            await asyncio.sleep(0.01)
+            return user_dto
+
+        repository = mocker.AsyncMock(spec=AsyncUserRepositoryInterface)
+        repository.get_user_by_email.side_effect = slow_lookup
+        repository.get_user_by_id.side_effect = slow_lookup
+        return repository
+
+    async def test_concurrent_lookups_share_one_query(
+        self, repository: AsyncUserRepositoryInterface, user_dto: UserDTO
+    ):
+        """
+        Test that the concurrent lookups of one email and of one ID await one query each.
+
+        Args:
+            repository (AsyncUserRepositoryInterface): The mocked repository.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        single_flight_repository = AsyncSingleFlightUserRepository(repository=repository)
+
+        results = await asyncio.gather(
+            *(single_flight_repository.get_user_by_email(user_dto.email) for _ in range(3)),
+            *(single_flight_repository.get_user_by_id(user_dto.id) for _ in range(3)),
+        )
+
+        assert results == [user_dto] * 6
+        repository.get_user_by_email.assert_awaited_once_with(user_dto.email)
+        repository.get_user_by_id.assert_awaited_once_with(user_dto.id)
+        assert single_flight_repository.stats.shared == 4
+
+    async def test_create_user_forgets_the_lookup_in_flight(
+        self, repository: AsyncUserRepositoryInterface, user_dto: UserDTO
+    ):
+        """
+        Test that a lookup started after a user is created does not join the lookup started before.
+
+        Args:
+            repository (AsyncUserRepositoryInterface): The mocked repository.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        single_flight_repository = AsyncSingleFlightUserRepository(repository=repository)
+
+        before = asyncio.ensure_future(single_flight_repository.get_user_by_email(user_dto.email))
+        await asyncio.sleep(0)
+        await single_flight_repository.create_user(user_dto)
+        after = asyncio.ensure_future(single_flight_repository.get_user_by_email(user_dto.email))
+        await asyncio.gather(before, after)
+
+        assert repository.get_user_by_email.await_count == 2
+        assert single_flight_repository.stats.shared == 0
@@ -0,0 +1,261 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.applications.dtos import UserDTO
+from src.domain.exceptions import EmailAlreadyExistsError
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.unit_of_work import UnitOfWorkInterface
+from src.infra.repositories.bloom_filtered_user import BloomFilteredUserRepository, EmailFilter, EmailFilterSettings
+
+
+class TestBloomFilteredUserRepository:
+    """Test cases for the BloomFilteredUserRepository class."""
+
+    @pytest.fixture
+    def user_dto(self) -> UserDTO:
+        """
+        Fixture that returns a sample UserDTO instance for testing.
+
+        Returns:
+            user_dto (UserDTO): A UserDTO instance representing a sample user.
+        """
+        return UserDTO(id=1, name="John Doe", email="johndoe@example.com", password="password123", created_at=None)
+
+    @pytest.fixture
+    def repository(self, mocker: MockerFixture) -> UserRepositoryInterface:
+        """
+        Fixture that returns a mocked user repository.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+
+        Returns:
+            repository (UserRepositoryInterface): The mocked repository.
+        """
+        return mocker.Mock(spec=UserRepositoryInterface)
+
+    @pytest.fixture
+    def filtered_repository(
+        self, repository: UserRepositoryInterface, user_dto: UserDTO
+    ) -> BloomFilteredUserRepository:
+        """
+        Fixture that returns the mocked repository decorated with a built email filter.
+
+        Args:
+            repository (UserRepositoryInterface): The mocked repository fixture.
+            user_dto (UserDTO): The UserDTO fixture, whose email is in the database.
+
+        Returns:
+            filtered_repository (BloomFilteredUserRepository): The decorated repository.
+        """
+        email_filter = EmailFilter(
+            email_source=lambda batch_size: iter([user_dto.email]),
+            settings=EmailFilterSettings(enabled=True, expected_items=1_000, rebuild_interval=0),
+        )
+        email_filter.start()
+        return BloomFilteredUserRepository(repository=repository, email_filter=email_filter)
+
+    def test_unknown_email_is_answered_without_the_database(
+        self, filtered_repository: BloomFilteredUserRepository, repository: UserRepositoryInterface
+    ):
+        """
+        Test that a lookup of an email the filter rules out does not reach the decorated repository.
+
+        Args:
+            filtered_repository (BloomFilteredUserRepository): The decorated repository.
+            repository (UserRepositoryInterface): The mocked repository.
+        """
+        assert filtered_repository.get_user_by_email("unknown@example.com") is None
+
+        repository.get_user_by_email.assert_not_called()
+        assert filtered_repository.stats.definite_misses == 1
+
+    def test_known_email_is_looked_up(
+        self, filtered_repository: BloomFilteredUserRepository, repository: UserRepositoryInterface, user_dto: UserDTO
+    ):
+        """
+        Test that a lookup of an email in the filter reaches the decorated repository.
+
+        Args:
+            filtered_repository (BloomFilteredUserRepository): The decorated repository.
+            repository (UserRepositoryInterface): The mocked repository.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        repository.get_user_by_email.return_value = user_dto
+
+        assert filtered_repository.get_user_by_email(user_dto.email) == user_dto
+
+    def test_created_emails_are_added(
+        self, filtered_repository: BloomFilteredUserRepository, repository: UserRepositoryInterface
+    ):
+        """
+        Test that the emails of created users, and of rejected duplicates, are added to the filter.
+
+        Args:
+            filtered_repository (BloomFilteredUserRepository): The decorated repository.
+            repository (UserRepositoryInterface): The mocked repository.
+        """
+        created_user = UserDTO(id=2, name="Jane Doe", email="jane@example.com", password="secret", created_at=None)
+        repository.create_user.return_value = created_user
+        filtered_repository.create_user(created_user)
+        duplicated_user = UserDTO(id=None, name="Jim Doe", email="jim@example.com", password="secret", created_at=None)
+        repository.create_user.side_effect = EmailAlreadyExistsError(duplicated_user.email)
+        with pytest.raises(EmailAlreadyExistsError):
+            filtered_repository.create_user(duplicated_user)
+
+        filtered_repository.get_user_by_email(created_user.email)
+        filtered_repository.get_user_by_email(duplicated_user.email)
+
+        assert repository.get_user_by_email.call_count == 2
+
+    def test_bulk_created_emails_are_added(
+        self, filtered_repository: BloomFilteredUserRepository, repository: UserRepositoryInterface
+    ):
+        """
+        Test that the emails of a bulk creation are added to the filter, taken ones included.
+
+        Args:
+            filtered_repository (BloomFilteredUserRepository): The decorated repository.
+            repository (UserRepositoryInterface): The mocked repository.
+        """
+        created_user = UserDTO(id=2, name="Jane Doe", email="jane@example.com", password="secret", created_at=None)
+        taken_user = UserDTO(id=None, name="Jim Doe", email="jim@example.com", password="secret", created_at=None)
+        repository.create_users.return_value = [created_user]
+
+        assert filtered_repository.create_users([created_user, taken_user]) == [created_user]
+        filtered_repository.get_user_by_email(created_user.email)
+        filtered_repository.get_user_by_email(taken_user.email)
+
+        assert repository.get_user_by_email.call_count == 2
+
+    def test_batch_lookup_leaves_out_the_unknown_emails(
+        self, filtered_repository: BloomFilteredUserRepository, repository: UserRepositoryInterface, user_dto: UserDTO
+    ):
+        """
+        Test that the emails the filter rules out are not sent to the database.
+
+        Args:
+            filtered_repository (BloomFilteredUserRepository): The decorated repository.
+            repository (UserRepositoryInterface): The mocked repository.
+            user_dto (UserDTO): The UserDTO fixture, whose email is in the database.
+        """
+        repository.get_users_by_emails.return_value = [user_dto]
+
+        assert filtered_repository.get_users_by_emails([user_dto.email, "unknown@example.com"]) == [user_dto]
+        assert filtered_repository.get_users_by_emails(["unknown@example.com"]) == []
+
+        repository.get_users_by_emails.assert_called_once_with([user_dto.email])
+        assert filtered_repository.stats.definite_misses == 2
+
+    def test_emails_created_during_a_rebuild_are_kept(
+        self, filtered_repository: BloomFilteredUserRepository, repository: UserRepositoryInterface
+    ):
+        """
+        Test that an email created while the filter is rebuilt is in the new filter.
+
+        Args:
+            filtered_repository (BloomFilteredUserRepository): The decorated repository.
+            repository (UserRepositoryInterface): The mocked repository.
+        """
+        created_user = UserDTO(id=2, name="Jane Doe", email="jane@example.com", password="secret", created_at=None)
+        repository.create_user.return_value = created_user
+
+        def email_source(batch_size):
+            filtered_repository.create_user(created_user)
+            return iter([])
+
+        filtered_repository.email_filter.email_source = email_source
+        assert filtered_repository.email_filter.rebuild()
+        filtered_repository.get_user_by_email(created_user.email)
+
+        repository.get_user_by_email.assert_called_once_with(created_user.email)
+        assert filtered_repository.stats.rebuilds == 2
+
+    def test_email_committed_after_a_rebuild_read_the_database_is_kept(
+        self,
+        mocker: MockerFixture,
+        filtered_repository: BloomFilteredUserRepository,
+        repository: UserRepositoryInterface,
+    ):
+        """
+        Test that an email created before a rebuild, and committed after the rebuild read the database, is in
+        the new filter.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+            filtered_repository (BloomFilteredUserRepository): The decorated repository.
+            repository (UserRepositoryInterface): The mocked repository.
+        """
+        unit_of_work = mocker.MagicMock(spec=UnitOfWorkInterface)
+        filtered_repository.unit_of_work = unit_of_work
+        created_user = UserDTO(id=2, name="Jane Doe", email="jane@example.com", password="secret", created_at=None)
+        repository.create_user.return_value = created_user
+
+        filtered_repository.create_user(created_user)
+        filtered_repository.email_filter.email_source = lambda batch_size: iter([])
+        assert filtered_repository.email_filter.rebuild()
+        (after_commit,), _ = unit_of_work.after_commit.call_args
+        after_commit()
+        filtered_repository.get_user_by_email(created_user.email)
+
+        repository.get_user_by_email.assert_called_once_with(created_user.email)
+
+    def test_lookups_go_to_the_database_until_a_build_succeeds(self, repository: UserRepositoryInterface):
+        """
+        Test that a failed build leaves every lookup going to the decorated repository.
+
+        Args:
+            repository (UserRepositoryInterface): The mocked repository.
+        """
+
+        def email_source(batch_size):
+            raise ConnectionError("database unavailable")
+
+        email_filter = EmailFilter(
+            email_source=email_source, settings=EmailFilterSettings(enabled=True, rebuild_interval=0)
+        )
+        email_filter.start()
+        filtered_repository = BloomFilteredUserRepository(repository=repository, email_filter=email_filter)
+
+        filtered_repository.get_user_by_email("unknown@example.com")
+
+        repository.get_user_by_email.assert_called_once_with("unknown@example.com")
+        assert filtered_repository.stats.ready is False
+
+    def test_stats_report_the_filter_size_and_false_positives(
+        self, filtered_repository: BloomFilteredUserRepository, repository: UserRepositoryInterface, user_dto: UserDTO
+    ):
+        """
+        Test that the metrics expose the memory size and the observed false positives.
+
+        Args:
+            filtered_repository (BloomFilteredUserRepository): The decorated repository.
+            repository (UserRepositoryInterface): The mocked repository.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        repository.get_user_by_email.return_value = None
+
+        filtered_repository.get_user_by_email(user_dto.email)
+        stats = filtered_repository.stats
+
+        assert stats.ready is True
+        assert stats.items == 1
+        assert stats.memory_bytes > 0
+        assert stats.false_positives == 1
+        assert stats.observed_false_positive_rate == 1.0
+
+    def test_stats_count_every_lookup_of_concurrent_threads(self, filtered_repository: BloomFilteredUserRepository):
+        """
+        Test that the lookups made from several threads at once are all counted.
+
+        Args:
+            filtered_repository (BloomFilteredUserRepository): The decorated repository.
+        """
+        emails = [f"unknown{index}@example.com" for index in range(2_000)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(filtered_repository.get_user_by_email, emails * 4))
+
+        assert filtered_repository.stats.definite_misses + filtered_repository.stats.false_positives == 8_000
@@ -0,0 +1,173 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from src.applications.dtos import UserDTO
+from src.domain.exceptions import UserNotFoundError
+from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.unit_of_work import UnitOfWorkInterface
+from src.infra.cache import TTLCache
+from src.infra.repositories.cached_user import CachedUserRepository, UserCacheSettings
+
+
+class TestCachedUserRepository:
+    """Test cases for the CachedUserRepository class."""
+
+    @pytest.fixture
+    def user_dto(self) -> UserDTO:
+        """
+        Fixture that returns a sample UserDTO instance for testing.
+
+        Returns:
+            user_dto (UserDTO): A UserDTO instance representing a sample user.
+        """
+        return UserDTO(id=1, name="John Doe", email="johndoe@example.com", password="password123", created_at=None)
+
+    @pytest.fixture
+    def repository(self, mocker: MockerFixture, user_dto: UserDTO) -> UserRepositoryInterface:
+        """
+        Fixture that returns a mocked user repository holding the sample user.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+            user_dto (UserDTO): The UserDTO fixture.
+
+        Returns:
+            repository (UserRepositoryInterface): The mocked repository.
+        """
+        repository = mocker.Mock(spec=UserRepositoryInterface)
+        repository.get_user_by_email.return_value = user_dto
+        repository.get_user_by_id.return_value = user_dto
+        return repository
+
+    @pytest.fixture
+    def cached_repository(self, repository: UserRepositoryInterface) -> CachedUserRepository:
+        """
+        Fixture that returns the mocked repository decorated with the cache.
+
+        Args:
+            repository (UserRepositoryInterface): The mocked repository fixture.
+
+        Returns:
+            cached_repository (CachedUserRepository): The decorated repository.
+        """
+        return CachedUserRepository(repository=repository, cache=TTLCache(max_size=16, ttl=60))
+
+    def test_lookups_are_read_through(
+        self, cached_repository: CachedUserRepository, repository: UserRepositoryInterface, user_dto: UserDTO
+    ):
+        """
+        Test that repeated lookups reach the decorated repository once per key.
+
+        Args:
+            cached_repository (CachedUserRepository): The decorated repository.
+            repository (UserRepositoryInterface): The mocked repository.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        for _ in range(3):
+            assert cached_repository.get_user_by_email(user_dto.email) == user_dto
+            assert cached_repository.get_user_by_id(user_dto.id) == user_dto
+
+        repository.get_user_by_email.assert_called_once_with(user_dto.email)
+        repository.get_user_by_id.assert_called_once_with(user_dto.id)
+        assert (cached_repository.stats.hits, cached_repository.stats.misses) == (4, 2)
+
+    def test_delete_invalidates_every_entry_of_the_user(
+        self, cached_repository: CachedUserRepository, repository: UserRepositoryInterface, user_dto: UserDTO
+    ):
+        """
+        Test that deleting a user drops both its email and its ID entries.
+
+        Args:
+            cached_repository (CachedUserRepository): The decorated repository.
+            repository (UserRepositoryInterface): The mocked repository.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        cached_repository.get_user_by_email(user_dto.email)
+        cached_repository.get_user_by_id(user_dto.id)
+        repository.get_user_by_email.return_value = None
+        repository.get_user_by_id.return_value = None
+
+        cached_repository.delete_user(user_dto.id)
+
+        assert cached_repository.get_user_by_email(user_dto.email) is None
+        assert cached_repository.get_user_by_id(user_dto.id) is None
+        repository.delete_user.assert_called_once_with(user_dto.id)
+
+    def test_failed_delete_still_invalidates(
+        self, cached_repository: CachedUserRepository, repository: UserRepositoryInterface, user_dto: UserDTO
+    ):
+        """
+        Test that the entries are dropped even when the decorated repository fails to delete.
+
+        Args:
+            cached_repository (CachedUserRepository): The decorated repository.
+            repository (UserRepositoryInterface): The mocked repository.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        cached_repository.get_user_by_id(user_dto.id)
+        repository.delete_user.side_effect = UserNotFoundError(user_dto.id)
+
+        with pytest.raises(UserNotFoundError):
+            cached_repository.delete_user(user_dto.id)
+
+        assert len(cached_repository.cache) == 0
+
+    def test_create_invalidates_the_email_entry(
+        self, cached_repository: CachedUserRepository, repository: UserRepositoryInterface, user_dto: UserDTO
+    ):
+        """
+        Test that creating a user drops the entry of its email.
+
+        Args:
+            cached_repository (CachedUserRepository): The decorated repository.
+            repository (UserRepositoryInterface): The mocked repository.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        cached_repository.get_user_by_email(user_dto.email)
+        repository.create_user.return_value = user_dto
+
+        assert cached_repository.create_user(user_dto) == user_dto
+        cached_repository.get_user_by_email(user_dto.email)
+
+        assert repository.get_user_by_email.call_count == 2
+
+    def test_delete_invalidates_again_after_the_commit(
+        self, mocker: MockerFixture, repository: UserRepositoryInterface, user_dto: UserDTO
+    ):
+        """
+        Test that a user read back between the delete and its commit is not served once the delete is committed.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+            repository (UserRepositoryInterface): The mocked repository.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        unit_of_work = mocker.MagicMock(spec=UnitOfWorkInterface)
+        cached_repository = CachedUserRepository(
+            repository=repository, cache=TTLCache(max_size=16, ttl=60), unit_of_work=unit_of_work
+        )
+
+        cached_repository.delete_user(user_dto.id)
+        assert cached_repository.get_user_by_id(user_dto.id) == user_dto
+        repository.get_user_by_id.return_value = None
+        (after_commit,), _ = unit_of_work.after_commit.call_args
+        after_commit()
+
+        assert cached_repository.get_user_by_id(user_dto.id) is None
+
+    def test_settings_are_read_from_the_environment(self, monkeypatch: pytest.MonkeyPatch):
+        """
+        Test that the cache settings are read from the environment variables.
+
+        Args:
+            monkeypatch (MonkeyPatch): Pytest fixture to set environment variables.
+        """
+        monkeypatch.setenv("USER_CACHE_ENABLED", "true")
+        monkeypatch.setenv("USER_CACHE_MAX_SIZE", "10")
+        monkeypatch.setenv("USER_CACHE_TTL", "5")
+        monkeypatch.setenv("USER_CACHE_STALE_IF_ERROR", "60")
+
+        settings = UserCacheSettings.from_env()
+
+        assert settings == UserCacheSettings(enabled=True, max_size=10, ttl=5.0, stale_if_error=60.0)
+        assert settings.build_cache().max_size == 10
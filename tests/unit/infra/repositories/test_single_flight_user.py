@@ -0,0 +1,135 @@
+import threading
+import time
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.applications.dtos import UserDTO
+from src.domain.repositories.user import UserRepositoryInterface
+from src.infra.cache import SingleFlight
+from src.infra.repositories.single_flight_user import SingleFlightUserRepository
+
+
+class TestSingleFlightUserRepository:
+    """Test cases for the SingleFlightUserRepository class."""
+
+    @pytest.fixture
+    def user_dto(self) -> UserDTO:
+        """
+        Fixture that returns a sample UserDTO instance for testing.
+
+        Returns:
+            user_dto (UserDTO): A UserDTO instance representing a sample user.
+        """
+        return UserDTO(id=1, name="John Doe", email="johndoe@example.com", password="password123", created_at=None)
+
+    @pytest.fixture
+    def repository(self, mocker: MockerFixture, user_dto: UserDTO) -> UserRepositoryInterface:
+        """
+        Fixture that returns a mocked user repository holding the sample user.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+            user_dto (UserDTO): The UserDTO fixture.
+
+        Returns:
+            repository (UserRepositoryInterface): The mocked repository.
+        """
+        repository = mocker.Mock(spec=UserRepositoryInterface)
+        repository.get_user_by_email.return_value = user_dto
+        repository.get_user_by_id.return_value = user_dto
+        return repository
+
+    def test_concurrent_lookups_share_one_query(self, repository: UserRepositoryInterface, user_dto: UserDTO):
+        """
+        Test that the lookups of one email made while a query is in flight receive its result.
+
+        Args:
+            repository (UserRepositoryInterface): The mocked repository.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        group = SingleFlight()
+        single_flight_repository = SingleFlightUserRepository(repository=repository, group=group)
+        started, release = threading.Event(), threading.Event()
+
+        def slow_lookup(email):
+            started.set()
+            release.wait(timeout=5)
+            return user_dto
+
+        repository.get_user_by_email.side_effect = slow_lookup
+        results = []
+        lookups = [
+            threading.Thread(target=lambda: results.append(single_flight_repository.get_user_by_email(user_dto.email)))
+            for _ in range(3)
+        ]
+        lookups[0].start()
+        started.wait(timeout=5)
+        for lookup in lookups[1:]:
+            lookup.start()
+        while group.stats.shared < 2:
+            time.sleep(0.001)
+        release.set()
+        for lookup in lookups:
+            lookup.join(timeout=5)
+
+        assert results == [user_dto] * 3
+        repository.get_user_by_email.assert_called_once_with(user_dto.email)
+        assert single_flight_repository.stats.shared == 2
+
+    def test_emails_and_ids_are_coalesced_apart(self, repository: UserRepositoryInterface, user_dto: UserDTO):
+        """
+        Test that an email and an ID equal to each other are not coalesced.
+
+        Args:
+            repository (UserRepositoryInterface): The mocked repository.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        single_flight_repository = SingleFlightUserRepository(repository=repository)
+
+        assert single_flight_repository.get_user_by_email("1") == user_dto
+        assert single_flight_repository.get_user_by_id(1) == user_dto
+        assert single_flight_repository.stats.calls == 2
+
+    def test_writes_forget_the_lookups_in_flight(
+        self, mocker: MockerFixture, repository: UserRepositoryInterface, user_dto: UserDTO
+    ):
+        """
+        Test that creating and deleting users stop sharing the lookups they make stale.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+            repository (UserRepositoryInterface): The mocked repository.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        group = mocker.Mock(spec=SingleFlight)
+        single_flight_repository = SingleFlightUserRepository(repository=repository, group=group)
+
+        single_flight_repository.create_user(user_dto)
+        single_flight_repository.create_users([user_dto])
+        single_flight_repository.delete_user(user_dto.id)
+
+        assert group.forget.call_args_list == [
+            mocker.call(("email", user_dto.email)),
+            mocker.call(("email", user_dto.email)),
+            mocker.call(("id", user_dto.id)),
+        ]
+
+    def test_other_methods_pass_through(self, repository: UserRepositoryInterface):
+        """
+        Test that the listing, search and batch lookups reach the decorated repository.
+
+        Args:
+            repository (UserRepositoryInterface): The mocked repository.
+        """
+        single_flight_repository = SingleFlightUserRepository(repository=repository)
+
+        single_flight_repository.get_users_by_ids([1, 2])
+        single_flight_repository.get_users_by_emails(["johndoe@example.com"])
+        single_flight_repository.list_users(after_id=3, limit=10)
+        single_flight_repository.search_users("john", limit=5)
+
+        repository.get_users_by_ids.assert_called_once_with([1, 2])
+        repository.get_users_by_emails.assert_called_once_with(["johndoe@example.com"])
+        repository.list_users.assert_called_once_with(after_id=3, limit=10)
+        repository.search_users.assert_called_once_with("john", limit=5)
@@ -0,0 +1,68 @@
+import pytest
+
+from src.infra.tracing import ParentBasedRatioSampler, SpanContext, format_traceparent, parse_traceparent
+
+TRACEPARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+def test_traceparent_is_parsed_into_a_remote_context():
+    """Test that a valid traceparent header gives the trace ID, the parent span ID and the sampled flag."""
+    context = parse_traceparent(TRACEPARENT, "vendor=value")
+
+    assert context.trace_id_hex == "0af7651916cd43dd8448eb211c80319c"
+    assert context.span_id_hex == "b7ad6b7169203331"
+    assert context.sampled
+    assert context.remote
+    assert context.trace_state == "vendor=value"
+    assert format_traceparent(context) == TRACEPARENT
+
+
+@pytest.mark.parametrize(
+    "traceparent",
+    [
+        None,
+        "",
+        "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331",
+        "ff-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01",
+        "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01-extra",
+        "00-00000000000000000000000000000000-b7ad6b7169203331-01",
+        "00-0af7651916cd43dd8448eb211c80319c-0000000000000000-01",
+    ],
+)
+def test_invalid_traceparent_is_ignored(traceparent):
+    """Test that a missing or malformed traceparent header starts a new trace."""
+    assert parse_traceparent(traceparent) is None
+
+
+def test_future_versions_may_carry_more_fields():
+    """Test that a traceparent of a later version is read up to the fields of version 00."""
+    context = parse_traceparent("01-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-00-extra")
+
+    assert context is not None
+    assert not context.sampled
+
+
+def test_sampler_follows_the_parent_decision():
+    """Test that a trace sampled or dropped by the caller keeps its decision whatever the ratio."""
+    parent = SpanContext(trace_id=1, span_id=1, sampled=False, remote=True)
+
+    assert not ParentBasedRatioSampler(1.0).should_sample(1, parent)
+    assert ParentBasedRatioSampler(0.0).should_sample(1, SpanContext(trace_id=1, span_id=1, sampled=True))
+
+
+def test_sampler_records_the_configured_ratio_of_new_traces():
+    """Test that the root traces are sampled from their trace ID, in the configured ratio."""
+    sampler = ParentBasedRatioSampler(0.25)
+    trace_ids = [index * 0x9E3779B97F4A7C15 % 2**64 for index in range(10000)]
+
+    sampled = sum(sampler.should_sample(trace_id, None) for trace_id in trace_ids)
+
+    assert ParentBasedRatioSampler(0.0).should_sample(2**64 - 1, None) is False
+    assert ParentBasedRatioSampler(1.0).should_sample(2**64 - 1, None) is True
+    assert 2300 < sampled < 2700
+
+
+def test_sampler_rejects_a_ratio_outside_zero_and_one():
+    """Test that a sampling ratio outside [0, 1] is refused."""
+    with pytest.raises(ValueError):
+        ParentBasedRatioSampler(1.5)
@@ -0,0 +1,89 @@
+import pytest
+
+from src.infra.tracing import (
+    InMemorySpanExporter,
+    ParentBasedRatioSampler,
+    SpanKind,
+    StatusCode,
+    Tracer,
+    TracingSettings,
+    current_span,
+    parse_traceparent,
+)
+
+
+@pytest.fixture
+def exporter() -> InMemorySpanExporter:
+    """Fixture providing an in-memory span exporter."""
+    return InMemorySpanExporter()
+
+
+def test_disabled_tracer_is_off_by_default():
+    """Test that a tracer without exporter, as configured by default, does not trace."""
+    assert not Tracer().enabled
+    assert TracingSettings().build_exporter() is None
+
+
+def test_nested_spans_share_the_trace_and_link_to_their_parent(exporter):
+    """Test that a span started inside another one is its child, and that both are exported once ended."""
+    tracer = Tracer(exporter)
+
+    with tracer.start_as_current_span("parent", kind=SpanKind.SERVER) as parent:
+        with tracer.start_as_current_span("child", attributes={"key": "value"}) as child:
+            assert current_span() is child
+        assert current_span() is parent
+    assert current_span() is None
+
+    assert [span.name for span in exporter.get_finished_spans()] == ["child", "parent"]
+    assert child.context.trace_id == parent.context.trace_id
+    assert child.parent == parent.context
+    assert parent.parent is None
+    assert child.attributes == {"key": "value"}
+    assert child.duration is not None
+
+
+def test_remote_parent_continues_the_trace_of_the_caller(exporter):
+    """Test that a span started from a remote context belongs to the trace of the caller."""
+    remote = parse_traceparent("00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01")
+
+    with Tracer(exporter).start_as_current_span("server", parent=remote) as span:
+        pass
+
+    assert span.context.trace_id == remote.trace_id
+    assert span.parent == remote
+    assert span.to_dict()["parent_id"] == "0xb7ad6b7169203331"
+
+
+def test_exception_is_recorded_on_the_span(exporter):
+    """Test that an exception raised inside a span marks it as failed before it propagates."""
+    with pytest.raises(RuntimeError):
+        with Tracer(exporter).start_as_current_span("failing"):
+            raise RuntimeError("boom")
+
+    (span,) = exporter.get_finished_spans()
+    assert span.status is StatusCode.ERROR
+    assert span.status_description == "RuntimeError: boom"
+    assert span.attributes["exception.type"] == "RuntimeError"
+
+
+def test_unsampled_trace_records_nothing(exporter):
+    """Test that no span of a trace left out by the sampler is recorded or exported."""
+    tracer = Tracer(exporter, ParentBasedRatioSampler(0.0))
+
+    with tracer.start_as_current_span("root") as root:
+        with tracer.start_as_current_span("child") as child:
+            child.set_attribute("key", "value")
+
+    assert not root.recording
+    assert child is root
+    assert exporter.get_finished_spans() == []
+
+
+def test_span_is_exported_once(exporter):
+    """Test that ending a span twice exports it once."""
+    span = Tracer(exporter).start_span("operation")
+
+    span.end()
+    span.end()
+
+    assert len(exporter.get_finished_spans()) == 1
@@ -0,0 +1,298 @@
+import pytest
+
+from src.infra.repositories.async_bloom_filtered_user import AsyncBloomFilteredUserRepository
+from src.infra.repositories.async_cache_invalidating_user import AsyncCacheInvalidatingUserRepository
+from src.infra.repositories.async_single_flight_user import AsyncSingleFlightUserRepository
+from src.infra.repositories.bloom_filtered_user import BloomFilteredUserRepository, EmailFilterSettings
+from src.infra.repositories.cached_user import CachedUserRepository, UserCacheSettings
+from src.infra.repositories.single_flight_user import SingleFlightUserRepository
+from src.infra.repositories.user import UserRepository
+from src.main.container import Container, Lifetime, build_container
+from src.presenters.controllers.user.get_user import GetUserController
+
+
+class TestContainer:
+    """Test cases for the Container class."""
+
+    @pytest.fixture
+    def container(self) -> Container:
+        """
+        Fixture that returns an empty Container.
+
+        Returns:
+            container (Container): An empty container.
+        """
+        return Container()
+
+    def test_singleton_is_built_once(self, container: Container):
+        """
+        Test that a singleton dependency is built once and shared.
+
+        Args:
+            container (Container): The Container fixture.
+        """
+        container.register("dependency", lambda _: object(), Lifetime.SINGLETON)
+
+        assert container.resolve("dependency") is container.resolve("dependency")
+
+    def test_transient_is_built_on_every_resolution(self, container: Container):
+        """
+        Test that a transient dependency is built every time it is resolved.
+
+        Args:
+            container (Container): The Container fixture.
+        """
+        container.register("dependency", lambda _: object(), Lifetime.TRANSIENT)
+
+        assert container.resolve("dependency") is not container.resolve("dependency")
+
+    def test_request_scoped_is_shared_within_a_scope(self, container: Container):
+        """
+        Test that a request-scoped dependency is shared within a scope and rebuilt in the next one.
+
+        Args:
+            container (Container): The Container fixture.
+        """
+        finalized = []
+        container.register("dependency", lambda _: object(), Lifetime.REQUEST, finalizer=finalized.append)
+
+        with container.request_scope():
+            first = container.resolve("dependency")
+            assert container.resolve("dependency") is first
+        with container.request_scope():
+            second = container.resolve("dependency")
+
+        assert second is not first
+        assert finalized == [first, second]
+
+    def test_request_scoped_outside_of_a_scope_raises(self, container: Container):
+        """
+        Test that resolving a request-scoped dependency outside of a request scope raises an error.
+
+        Args:
+            container (Container): The Container fixture.
+        """
+        container.register("dependency", lambda _: object(), Lifetime.REQUEST)
+
+        with pytest.raises(RuntimeError):
+            container.resolve("dependency")
+
+    def test_resolve_unknown_dependency_raises(self, container: Container):
+        """
+        Test that resolving a dependency without a provider raises a KeyError.
+
+        Args:
+            container (Container): The Container fixture.
+        """
+        with pytest.raises(KeyError):
+            container.resolve("unknown")
+
+    def test_override_rebuilds_the_dependents(self, container: Container):
+        """
+        Test that overriding a dependency replaces it in the singletons that depend on it.
+
+        Args:
+            container (Container): The Container fixture.
+        """
+        container.register("repository", lambda _: "database", Lifetime.SINGLETON)
+        container.register("use_case", lambda c: ("use_case", c.resolve("repository")), Lifetime.SINGLETON)
+        assert container.resolve("use_case") == ("use_case", "database")
+
+        container.override("repository", lambda _: "fake")
+        assert container.resolve("use_case") == ("use_case", "fake")
+
+        container.reset_overrides()
+        assert container.resolve("use_case") == ("use_case", "database")
+
+    def test_override_finalizes_only_the_overridden_singleton_and_its_dependents(self, container: Container):
+        """
+        Test that an override finalizes the singletons it drops and keeps the ones not built on it.
+
+        Args:
+            container (Container): The Container fixture.
+        """
+        finalized = []
+        container.register("repository", lambda _: "database", finalizer=finalized.append)
+        container.register("use_case", lambda c: ("use_case", c.resolve("repository")), finalizer=finalized.append)
+        container.register("hasher", lambda _: object(), finalizer=finalized.append)
+        hasher = container.resolve("hasher")
+        container.resolve("use_case")
+
+        container.override("repository", lambda _: "fake", finalizer=finalized.append)
+
+        assert finalized == [("use_case", "database"), "database"]
+        assert container.resolve("hasher") is hasher
+        assert container.resolve("use_case") == ("use_case", "fake")
+
+        container.reset_overrides()
+
+        assert finalized[2:] == [("use_case", "fake"), "fake"]
+        assert container.resolve("hasher") is hasher
+
+    def test_override_reaches_the_dependents_through_transient_dependencies(self, container: Container):
+        """
+        Test that a singleton built on a transient dependency of the overridden one is rebuilt.
+
+        Args:
+            container (Container): The Container fixture.
+        """
+        container.register("repository", lambda _: "database")
+        container.register("use_case", lambda c: ("use_case", c.resolve("repository")), Lifetime.TRANSIENT)
+        container.register("controller", lambda c: ("controller", c.resolve("use_case")))
+        container.resolve("controller")
+
+        container.override("repository", lambda _: "fake")
+
+        assert container.resolve("controller") == ("controller", ("use_case", "fake"))
+
+    def test_singleton_is_finalized_by_the_provider_that_built_it(self, container: Container):
+        """
+        Test that a singleton built before an override of another dependency keeps its own finalizer.
+
+        Args:
+            container (Container): The Container fixture.
+        """
+        finalized = []
+        container.register("dependency", lambda _: "instance", finalizer=lambda instance: finalized.append("built"))
+        container.resolve("dependency")
+        container.override("dependency", lambda _: "fake", finalizer=lambda instance: finalized.append("override"))
+
+        assert finalized == ["built"]
+
+        container.shutdown()
+
+        assert finalized == ["built"]
+
+    def test_shutdown_finalizes_the_singletons(self, container: Container):
+        """
+        Test that shutting down the container runs the finalizers of the built singletons.
+
+        Args:
+            container (Container): The Container fixture.
+        """
+        finalized = []
+        container.register("dependency", lambda _: "instance", Lifetime.SINGLETON, finalizer=finalized.append)
+        container.resolve("dependency")
+
+        container.shutdown()
+
+        assert finalized == ["instance"]
+
+    def test_build_container_shares_the_user_repository(self, db_connection):
+        """
+        Test that the application container builds the user controllers on top of one repository.
+
+        Args:
+            db_connection (DBConnectionHandler): A database connection handler for the test database.
+        """
+        container = build_container()
+        container.override("db_connection", lambda _: db_connection)
+
+        get_user_controller = container.resolve("get_user_controller")
+        delete_user_controller = container.resolve("delete_user_controller")
+
+        assert isinstance(get_user_controller, GetUserController)
+        assert get_user_controller is container.resolve("get_user_controller")
+        assert (
+            get_user_controller.get_user_use_case.user_repository
+            is delete_user_controller.delete_user_use_case.user_repository
+        )
+
+    def test_build_container_wraps_the_user_repository_with_the_cache(self, db_connection):
+        """
+        Test that enabling the user cache plugs CachedUserRepository into the user controllers.
+
+        Args:
+            db_connection (DBConnectionHandler): A database connection handler for the test database.
+        """
+        container = build_container(user_cache_settings=UserCacheSettings(enabled=True))
+        container.override("db_connection", lambda _: db_connection)
+
+        get_user_controller = container.resolve("get_user_controller")
+
+        assert isinstance(get_user_controller.get_user_use_case.user_repository, CachedUserRepository)
+        container.shutdown()
+
+    def test_build_container_stacks_the_email_filter_on_the_cache(self, db_connection):
+        """
+        Test that enabling the email filter builds it on top of the cached user repository.
+
+        Args:
+            db_connection (DBConnectionHandler): A database connection handler for the test database.
+        """
+        container = build_container(
+            user_cache_settings=UserCacheSettings(enabled=True),
+            email_filter_settings=EmailFilterSettings(enabled=True, expected_items=100, rebuild_interval=0),
+        )
+        container.override("db_connection", lambda _: db_connection)
+
+        user_repository = container.resolve("user_repository")
+
+        assert isinstance(user_repository, BloomFilteredUserRepository)
+        assert isinstance(user_repository.repository, CachedUserRepository)
+        assert user_repository.stats.ready is True
+        container.shutdown()
+
+    def test_build_container_shares_the_email_filter_with_the_async_repository(self, db_connection):
+        """
+        Test that the asynchronous repository adds its users to the filter the synchronous repository reads.
+
+        Args:
+            db_connection (DBConnectionHandler): A database connection handler for the test database.
+        """
+        container = build_container(
+            email_filter_settings=EmailFilterSettings(enabled=True, expected_items=100, rebuild_interval=0)
+        )
+        container.override("db_connection", lambda _: db_connection)
+
+        async_user_repository = container.resolve("async_user_repository")
+
+        assert isinstance(async_user_repository, AsyncBloomFilteredUserRepository)
+        assert async_user_repository.email_filter is container.resolve("user_repository").email_filter
+        container.shutdown()
+
+    def test_build_container_coalesces_the_lookups_under_the_cache(self, db_connection):
+        """
+        Test that single-flight sits between the user cache and the database repository.
+
+        Args:
+            db_connection (DBConnectionHandler): A database connection handler for the test database.
+        """
+        container = build_container(user_cache_settings=UserCacheSettings(enabled=True), single_flight=True)
+        container.override("db_connection", lambda _: db_connection)
+
+        user_repository = container.resolve("user_repository")
+
+        assert isinstance(user_repository, CachedUserRepository)
+        assert isinstance(user_repository.repository, SingleFlightUserRepository)
+        assert isinstance(container.resolve("async_user_repository").repository, AsyncSingleFlightUserRepository)
+        container.shutdown()
+
+    def test_build_container_shares_the_user_cache_with_the_async_writes(self, db_connection):
+        """
+        Test that the asynchronous repository invalidates the cache the synchronous repository reads through.
+
+        Args:
+            db_connection (DBConnectionHandler): A database connection handler for the test database.
+        """
+        container = build_container(user_cache_settings=UserCacheSettings(enabled=True))
+        container.override("db_connection", lambda _: db_connection)
+
+        async_user_repository = container.resolve("async_user_repository")
+
+        assert isinstance(async_user_repository, AsyncCacheInvalidatingUserRepository)
+        assert async_user_repository.cache is container.resolve("user_repository").cache
+        assert async_user_repository.unit_of_work is container.resolve("async_unit_of_work")
+        container.shutdown()
+
+    def test_build_container_without_single_flight(self, db_connection):
+        """
+        Test that disabling single-flight plugs the database repository in directly.
+
+        Args:
+            db_connection (DBConnectionHandler): A database connection handler for the test database.
+        """
+        container = build_container(single_flight=False)
+        container.override("db_connection", lambda _: db_connection)
+
+        assert isinstance(container.resolve("user_repository"), UserRepository)
@@ -0,0 +1,113 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.infra.profiling import sign_profile_token
+from src.main.fast_api.middlewares import ProfilingMiddleware, ProfilingSettings
+
+SECRET = "profiling-secret"
+
+
+def build_client(**settings) -> TestClient:
+    """
+    Build a client of an application profiled with the given settings.
+
+    Args:
+        **settings: The profiler settings.
+
+    Returns:
+        (TestClient): The client.
+    """
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, settings=ProfilingSettings(**settings))
+
+    @app.get("/api/users/")
+    async def users():
+        return {"users": []}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    return TestClient(app)
+
+
+def test_signed_header_writes_the_profile_to_the_directory(tmp_path):
+    """Test that a request with a valid token is profiled and told the name of the profile file."""
+    client = build_client(secret=SECRET, directory=str(tmp_path))
+
+    response = client.get("/api/users/", headers={"X-Profile": sign_profile_token(SECRET)})
+
+    assert response.json() == {"users": []}
+    assert response.headers["X-Profile"].endswith(".speedscope.json")
+    assert [path.name for path in tmp_path.iterdir()] == [response.headers["X-Profile"]]
+
+
+def test_query_flag_returns_the_profile_inline(tmp_path):
+    """Test that a request asking for inline output gets the profile instead of the response."""
+    client = build_client(secret=SECRET, directory=str(tmp_path), format="collapsed")
+
+    response = client.get("/api/users/", params={"profile": sign_profile_token(SECRET), "profile_output": "inline"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/plain; charset=utf-8"
+    assert response.headers["X-Profile-Status"] == "200"
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("token", ["1.forged", sign_profile_token("another-secret")])
+def test_invalid_token_is_not_profiled(tmp_path, token):
+    """Test that a request with a forged token is served without being profiled."""
+    client = build_client(secret=SECRET, directory=str(tmp_path))
+
+    response = client.get("/api/users/", headers={"X-Profile": token, "X-Profile-Output": "inline"})
+
+    assert response.json() == {"users": []}
+    assert "X-Profile" not in response.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sampled_requests_are_profiled_silently(tmp_path):
+    """Test that the requests drawn by the sample rate are profiled to the directory, without telling the caller."""
+    client = build_client(sample_rate=1.0, directory=str(tmp_path))
+
+    response = client.get("/api/users/")
+
+    assert response.json() == {"users": []}
+    assert "X-Profile" not in response.headers
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_profile_that_cannot_be_written_does_not_fail_the_request(tmp_path, caplog):
+    """Test that a failure to write a profile is logged, the response being already sent."""
+    directory = tmp_path / "profiles"
+    directory.write_text("a file where the directory should be")
+    client = build_client(sample_rate=1.0, directory=str(directory))
+
+    response = client.get("/api/users/")
+
+    assert response.json() == {"users": []}
+    assert "Could not write the profile of GET /api/users/." in caplog.text
+
+
+def test_paths_outside_the_prefix_are_not_profiled(tmp_path):
+    """Test that only the requests under the path prefix may be profiled."""
+    client = build_client(secret=SECRET, sample_rate=1.0, directory=str(tmp_path))
+
+    response = client.get("/health", headers={"X-Profile": sign_profile_token(SECRET)})
+
+    assert "X-Profile" not in response.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_profiling_is_off_by_default():
+    """Test that no request may be profiled without a secret or a sample rate."""
+    assert not ProfilingSettings().enabled
+
+
+def test_unsupported_format_is_refused(monkeypatch):
+    """Test that the settings refuse a profile format that is not supported."""
+    monkeypatch.setenv("PROFILING_FORMAT", "svg")
+
+    with pytest.raises(ValueError):
+        ProfilingSettings.from_env()
@@ -0,0 +1,82 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.infra.db.settings import EngineRegistry
+from src.main.fast_api.middlewares import QueryCountMiddleware, QueryCountSettings
+
+
+@pytest.fixture
+def engine():
+    """Fixture providing an instrumented in-memory SQLite engine."""
+    engine = EngineRegistry().get_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+def build_app(engine, settings: QueryCountSettings) -> FastAPI:
+    """
+    Build an application whose route runs a statement once per requested item.
+
+    Args:
+        engine (Engine): The engine the route queries.
+        settings (QueryCountSettings): The statement counter settings.
+
+    Returns:
+        (FastAPI): The application.
+    """
+    app = FastAPI()
+    app.add_middleware(QueryCountMiddleware, settings=settings)
+
+    @app.get("/items")
+    def items(count: int):
+        with engine.connect() as connection:
+            return [connection.execute(text("SELECT :item"), {"item": item}).scalar() for item in range(count)]
+
+    return app
+
+
+def test_debug_mode_exposes_the_counts_in_the_headers(engine):
+    """Test that the number of statements and the database time are sent as headers in debug mode."""
+    client = TestClient(build_app(engine, QueryCountSettings(expose_headers=True)))
+
+    response = client.get("/items", params={"count": 2})
+
+    assert response.json() == [0, 1]
+    assert response.headers["X-DB-Queries"] == "2"
+    assert float(response.headers["X-DB-Time"]) > 0
+
+
+def test_counts_are_not_exposed_outside_debug_mode(engine):
+    """Test that the responses carry no statement counts by default."""
+    client = TestClient(build_app(engine, QueryCountSettings()))
+
+    response = client.get("/items", params={"count": 1})
+
+    assert "X-DB-Queries" not in response.headers
+    assert "X-DB-Time" not in response.headers
+
+
+def test_repeated_statements_are_logged_as_likely_n_plus_one(engine, caplog: pytest.LogCaptureFixture):
+    """Test that the counts are logged, and a statement repeated up to the threshold is logged as a warning."""
+    client = TestClient(build_app(engine, QueryCountSettings(repeated_statement_threshold=3)))
+
+    with caplog.at_level(logging.DEBUG, logger="src.main.fast_api.middlewares.query_count"):
+        client.get("/items", params={"count": 2})
+        client.get("/items", params={"count": 3})
+
+    messages = [(record.levelname, record.getMessage()) for record in caplog.records]
+    assert ("DEBUG", "GET /items ran 2 queries in") == (messages[0][0], messages[0][1][:27])
+    warnings = [message for level, message in messages if level == "WARNING"]
+    assert warnings == ["GET /items ran the same statement 3 times, a likely N+1 query: SELECT ?"]
+
+
+def test_settings_are_read_from_the_environment(monkeypatch: pytest.MonkeyPatch):
+    """Test that debug mode and the repetition threshold are read from the environment."""
+    monkeypatch.setenv("DEBUG", "true")
+    monkeypatch.setenv("DB_QUERY_REPEAT_THRESHOLD", "10")
+
+    assert QueryCountSettings.from_env() == QueryCountSettings(expose_headers=True, repeated_statement_threshold=10)
@@ -0,0 +1,17 @@
+from datetime import datetime, timezone
+
+from src.applications.dtos import AccessTokenDTO
+from src.main.fast_api.responses import ORJSONResponse, encode_access_token
+from src.main.fast_api.schemas import AccessToken
+
+
+def test_access_token_matches_the_pydantic_schema():
+    """Test that the encoded token is the body `AccessToken` would serialize, byte for byte."""
+    token = AccessTokenDTO(
+        access_token="header.claims.signature",
+        token_type="bearer",
+        expires_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    )
+    expected = AccessToken(access_token=token.access_token, token_type=token.token_type, expires_at=token.expires_at)
+
+    assert ORJSONResponse(encode_access_token(token)).body == expected.model_dump_json().encode()
@@ -0,0 +1,90 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from src.applications.dtos import UserDTO
+from src.main.fast_api.responses import ORJSONResponse, encode_default_response, encode_user
+from src.main.fast_api.schemas import DefaultResponse, UserBatchResult, UserOut
+
+
+@pytest.fixture(params=[datetime(2024, 1, 2, 3, 4, 5, 678901), datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)])
+def user_dto(request: pytest.FixtureRequest) -> UserDTO:
+    """
+    Fixture that returns a sample user, created at a naive and at a UTC datetime.
+
+    Args:
+        request (pytest.FixtureRequest): The pytest request, carrying the creation datetime.
+
+    Returns:
+        user_dto (UserDTO): A UserDTO instance representing a sample user.
+    """
+    return UserDTO(id=1, name="Jöhn Doe", email="johndoe@example.com", password="hash", created_at=request.param)
+
+
+def render(content: dict) -> bytes:
+    """
+    Render content the way the routes do.
+
+    Args:
+        content (dict): The content of the response.
+
+    Returns:
+        (bytes): The body of the response.
+    """
+    return ORJSONResponse(content).body
+
+
+def test_default_response_matches_the_pydantic_schema(user_dto: UserDTO):
+    """
+    Test that the encoded user is the body `DefaultResponse` would serialize, byte for byte.
+
+    Args:
+        user_dto (UserDTO): The user fixture.
+    """
+    expected = DefaultResponse(
+        type="Users",
+        attributes=UserOut(id=user_dto.id, name=user_dto.name, email=user_dto.email, created_at=user_dto.created_at),
+    )
+
+    assert render(encode_default_response(user_dto)) == expected.model_dump_json().encode()
+    assert "password" not in encode_user(user_dto)
+
+
+def test_default_response_matches_the_response_model_rendering(user_dto: UserDTO):
+    """
+    Test that the encoded user is the body FastAPI renders from `response_model=DefaultResponse`.
+
+    Args:
+        user_dto (UserDTO): The user fixture.
+    """
+    user_out = UserOut(id=user_dto.id, email=user_dto.email, name=user_dto.name, created_at=user_dto.created_at)
+    validated = TypeAdapter(DefaultResponse).validate_python(DefaultResponse(type="Users", attributes=user_out))
+    content = jsonable_encoder(validated.model_dump(mode="json"))
+    expected = json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+    assert render(encode_default_response(user_dto)) == expected
+
+
+def test_integer_keys_match_the_pydantic_schema(user_dto: UserDTO):
+    """
+    Test that a mapping keyed by user ID is encoded as `UserBatchResult` would serialize it.
+
+    Args:
+        user_dto (UserDTO): The user fixture.
+    """
+    content = {
+        "users_by_id": {1: encode_user(user_dto)},
+        "users_by_email": {},
+        "missing_ids": [2],
+        "missing_emails": [],
+    }
+
+    assert render(content) == UserBatchResult.model_validate(content).model_dump_json().encode()
+
+
+def test_encoded_bytes_are_sent_as_is():
+    """Test that an already encoded body is not encoded again."""
+    assert render(b'{"already":"encoded"}') == b'{"already":"encoded"}'
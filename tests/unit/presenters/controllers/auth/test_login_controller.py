@@ -0,0 +1,71 @@
+from datetime import datetime, timezone
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.applications.dtos import AccessTokenDTO
+from src.applications.enums.auth.errors import AuthErrorsEnum
+from src.domain.use_cases.auth.login import LoginUseCaseInterface
+from src.presenters.controllers.auth import LoginController
+from src.presenters.helpers.http_types import HttpRequest
+
+
+class TestLoginController:
+    """Test cases for the LoginController class."""
+
+    @pytest.fixture
+    def login_use_case(self, mocker: MockerFixture) -> LoginUseCaseInterface:
+        """
+        Fixture that returns a mocked login use case.
+
+        Args:
+            mocker (MockerFixture): The pytest mocker fixture.
+
+        Returns:
+            login_use_case (LoginUseCaseInterface): The mocked use case.
+        """
+        return mocker.Mock(spec=LoginUseCaseInterface)
+
+    def test_right_credentials_get_a_token(self, login_use_case: LoginUseCaseInterface):
+        """
+        Test that a successful login is answered with a 200 response carrying the token.
+
+        Args:
+            login_use_case (LoginUseCaseInterface): The mocked use case fixture.
+        """
+        access_token = AccessTokenDTO(access_token="token", token_type="bearer", expires_at=datetime.now(timezone.utc))
+        login_use_case.login.return_value = {"data": access_token, "success": True}
+
+        response = LoginController(login_use_case=login_use_case).route(
+            HttpRequest(body={"email": "johndoe@example.com", "password": "password123"})
+        )
+
+        assert (response.status_code, response.body) == (200, access_token)
+        login_use_case.login.assert_called_once_with("johndoe@example.com", "password123")
+
+    def test_wrong_credentials_get_a_401(self, login_use_case: LoginUseCaseInterface):
+        """
+        Test that a failed login is answered with a 401 response.
+
+        Args:
+            login_use_case (LoginUseCaseInterface): The mocked use case fixture.
+        """
+        login_use_case.login.return_value = {"data": AuthErrorsEnum.INVALID_CREDENTIALS.value, "success": False}
+
+        response = LoginController(login_use_case=login_use_case).route(
+            HttpRequest(body={"email": "johndoe@example.com", "password": "wrong"})
+        )
+
+        assert (response.status_code, response.body) == (401, AuthErrorsEnum.INVALID_CREDENTIALS.value)
+
+    def test_missing_field_gets_a_422(self, login_use_case: LoginUseCaseInterface):
+        """
+        Test that a body without a password is answered with a 422 response.
+
+        Args:
+            login_use_case (LoginUseCaseInterface): The mocked use case fixture.
+        """
+        response = LoginController(login_use_case=login_use_case).route(HttpRequest(body={"email": "a@b.c"}))
+
+        assert response.status_code == 422
+        login_use_case.login.assert_not_called()
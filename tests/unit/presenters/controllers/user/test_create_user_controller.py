@@ -1,15 +1,20 @@
+from dataclasses import asdict
+
 import pytest
 from pytest_mock import MockerFixture
 
 from src.applications.dtos.user import UserDTO
 from src.applications.use_cases.user.create_user import CreateUserUseCase
 from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.password_hasher import PasswordHasherInterface
+from src.domain.unit_of_work import UnitOfWorkInterface
 from src.domain.use_cases.user.create_user import CreateUserUseCaseInterface
 from src.infra.db.settings.connection import DBConnectionHandler
 from src.infra.repositories.user import UserRepository
 from src.domain.controller import ControllerInterface
 from src.presenters.controllers.user.create_user import CreateUserController
 from src.presenters.helpers.http_types import HttpRequest, HttpErrors
+from src.main.fast_api.schemas import UserCreate
 
 
 class TestCreateUserController:
@@ -64,7 +69,13 @@ class TestCreateUserController:
         Returns:
             CreateUserUseCaseInterface: An instance of CreateUserUseCase with the mock UserRepository.
         """
-        create_user_use_case = mocker.Mock(CreateUserUseCase(user_repository=user_repository))
+        create_user_use_case = mocker.Mock(
+            CreateUserUseCase(
+                user_repository=user_repository,
+                unit_of_work=mocker.MagicMock(spec=UnitOfWorkInterface),
+                password_hasher=mocker.Mock(spec=PasswordHasherInterface),
+            )
+        )
         return create_user_use_case
 
     @pytest.fixture
@@ -89,7 +100,7 @@ class TestCreateUserController:
             create_user_controller (CreateUserController): The CreateUserController fixture.
             user_dto (UserDTO): The UserDTO fixture.
         """
-        user_dict = user_dto.__dict__
+        user_dict = asdict(user_dto)
         http_request = HttpRequest(body=user_dict)
         create_user_controller.create_user_use_case.create_user.return_value = {
             "data": user_dto,
@@ -99,6 +110,41 @@ class TestCreateUserController:
         assert response.status_code == 201
         assert response.body == user_dto
 
+    def test_route_create_user_from_validated_model(
+        self, create_user_controller: CreateUserController, user_dto: UserDTO
+    ):
+        """
+        Test that a model already validated by the web framework is used without reading the body.
+
+        Args:
+            create_user_controller (CreateUserController): The CreateUserController fixture.
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        model = UserCreate(name=user_dto.name, email=user_dto.email, password=user_dto.password)
+        create_user_controller.create_user_use_case.create_user.return_value = {"data": user_dto, "success": True}
+
+        response = create_user_controller.route(http_request=HttpRequest(model=model))
+
+        assert response.status_code == 201
+        create_user_controller.create_user_use_case.create_user.assert_called_once_with(
+            user_dto=UserDTO(
+                id=None, name=user_dto.name, email=user_dto.email, password=user_dto.password, created_at=None
+            )
+        )
+
+    def test_user_dto_is_the_same_from_the_model_and_from_the_body(self, user_dto: UserDTO):
+        """
+        Test that the user read from a validated model is the one read from the body dictionary.
+
+        Args:
+            user_dto (UserDTO): The UserDTO fixture.
+        """
+        model = UserCreate(name=user_dto.name, email=user_dto.email, password=user_dto.password)
+
+        assert CreateUserController.user_dto_from_request(
+            HttpRequest(model=model)
+        ) == CreateUserController.user_dto_from_request(HttpRequest(body=model.__dict__))
+
     def test_route_when_body_params_are_not_passed(self, create_user_controller: ControllerInterface):
         """
         Test that the route method of CreateUserController handles missing body parameters correctly.
@@ -5,6 +5,7 @@ from src.applications.dtos.user import UserDTO
 from src.applications.use_cases.user.delete_user import DeleteUserUseCase
 from src.applications.enums.user.success import UserSuccessEnum
 from src.domain.repositories.user import UserRepositoryInterface
+from src.domain.unit_of_work import UnitOfWorkInterface
 from src.domain.use_cases.user.delete_user import DeleteUserUseCaseInterface
 from src.infra.db.settings.connection import DBConnectionHandler
 from src.infra.repositories.user import UserRepository
@@ -65,7 +66,9 @@ class TestDeleteController:
         Returns:
             DeleteUserUseCaseInterface: An instance of DeleteUserUseCase with the mock UserRepository.
         """
-        delete_user_use_case = mocker.Mock(DeleteUserUseCase(user_repository=user_repository))
+        delete_user_use_case = mocker.Mock(
+            DeleteUserUseCase(user_repository=user_repository, unit_of_work=mocker.MagicMock(spec=UnitOfWorkInterface))
+        )
         return delete_user_use_case
 
     @pytest.fixture
@@ -105,6 +108,34 @@ class TestDeleteController:
         assert response.status_code == 200
         assert response.body == UserSuccessEnum.DELETE_SUCCESS.value
 
+    def test_route_converts_the_path_user_id_to_an_integer(self, delete_user_controller: ControllerInterface):
+        """
+        Test that the user ID read from the path, a string, is passed to the use case as an integer.
+
+        Args:
+            delete_user_controller (ControllerInterface): An instance of DeleteUserController.
+        """
+        delete_user_controller.delete_user_use_case.delete_user.return_value = {
+            "data": UserSuccessEnum.DELETE_SUCCESS.value,
+            "success": True,
+        }
+
+        delete_user_controller.route(http_request=HttpRequest(path={"user_id": "7"}))
+
+        delete_user_controller.delete_user_use_case.delete_user.assert_called_once_with(user_id=7)
+
+    def test_route_refuses_a_user_id_that_is_not_an_integer(self, delete_user_controller: ControllerInterface):
+        """
+        Test that a user ID that is not an integer is answered with a 400 without calling the use case.
+
+        Args:
+            delete_user_controller (ControllerInterface): An instance of DeleteUserController.
+        """
+        response = delete_user_controller.route(http_request=HttpRequest(path={"user_id": "abc"}))
+
+        assert response.status_code == HttpErrors.error_400()["status_code"]
+        delete_user_controller.delete_user_use_case.delete_user.assert_not_called()
+
     def test_route_path_not_passed(self, delete_user_controller: ControllerInterface):
         """
         Test the route behavior when the path is not passed.
@@ -0,0 +1,85 @@
+from datetime import datetime
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.applications.dtos.user import UserDTO
+from src.applications.use_cases.user.export_users import ExportUsersUseCase
+from src.domain.repositories.user import UserRepositoryInterface
+from src.presenters.controllers.user.export_users import ExportUsersController
+from src.presenters.helpers.http_types import HttpRequest, HttpErrors
+
+
+class TestExportUsersController:
+    """Test suite for ExportUsersController."""
+
+    @pytest.fixture
+    def controller(self, mocker: MockerFixture) -> ExportUsersController:
+        """
+        Fixture that returns the controller on a mocked repository holding three users.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+
+        Returns:
+            controller (ExportUsersController): The controller, encoding two users per chunk.
+        """
+        user_repository = mocker.Mock(spec=UserRepositoryInterface)
+        user_repository.iter_users.side_effect = lambda batch_size: iter(
+            UserDTO(
+                id=index,
+                name=f"User, {index}",
+                email=f"user{index}@example.com",
+                password="secret",
+                created_at=datetime(2023, 7, 21, 12, 34, 56),
+            )
+            for index in range(1, 4)
+        )
+        use_case = ExportUsersUseCase(user_repository=user_repository)
+        return ExportUsersController(export_users_use_case=use_case, chunk_size=2)
+
+    def test_export_ndjson(self, controller: ExportUsersController):
+        """
+        Test that the users are exported as NDJSON by default, in chunks and without their password.
+
+        Args:
+            controller (ExportUsersController): The controller fixture.
+        """
+        response = controller.route(HttpRequest(query={}))
+
+        assert response.status_code == 200
+        assert response.body["media_type"] == "application/x-ndjson"
+        chunks = list(response.body["content"])
+        assert len(chunks) == 2
+        lines = "".join(chunks).splitlines()
+        assert len(lines) == 3
+        assert lines[0] == (
+            '{"id": 1, "name": "User, 1", "email": "user1@example.com", "created_at": "2023-07-21T12:34:56"}'
+        )
+
+    def test_export_csv(self, controller: ExportUsersController):
+        """
+        Test that the users are exported as CSV with a header row and quoted fields.
+
+        Args:
+            controller (ExportUsersController): The controller fixture.
+        """
+        response = controller.route(HttpRequest(query={"format": "csv"}))
+
+        assert response.body["media_type"] == "text/csv"
+        lines = "".join(response.body["content"]).splitlines()
+        assert lines[0] == "id,name,email,created_at"
+        assert lines[1] == '1,"User, 1",user1@example.com,2023-07-21T12:34:56'
+        assert len(lines) == 4
+
+    def test_export_with_unsupported_format(self, controller: ExportUsersController):
+        """
+        Test that an unsupported format is rejected.
+
+        Args:
+            controller (ExportUsersController): The controller fixture.
+        """
+        response = controller.route(HttpRequest(query={"format": "xml"}))
+
+        assert response.status_code == 422
+        assert response.body == HttpErrors.error_422()["body"]
@@ -0,0 +1,81 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from src.domain.use_cases.user.list_users import ListUsersUseCaseInterface
+from src.presenters.controllers.user.list_users import ListUsersController
+from src.presenters.helpers.cursor import decode_cursor, encode_cursor
+from src.presenters.helpers.http_types import HttpRequest
+
+
+class TestListUsersController:
+    """Test suite for ListUsersController."""
+
+    @pytest.fixture
+    def use_case(self, mocker: MockerFixture) -> ListUsersUseCaseInterface:
+        """
+        Fixture that returns a mocked use case returning a page with a next page.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+
+        Returns:
+            use_case (ListUsersUseCaseInterface): The mocked use case.
+        """
+        use_case = mocker.Mock(spec=ListUsersUseCaseInterface)
+        use_case.list_users.return_value = {
+            "data": {"users": [], "next_after_id": 42, "total_estimate": None},
+            "success": True,
+        }
+        return use_case
+
+    def test_route_returns_an_opaque_next_cursor(self, use_case: ListUsersUseCaseInterface):
+        """
+        Test that the next page is returned as a cursor that decodes to the last ID of the page.
+
+        Args:
+            use_case (ListUsersUseCaseInterface): The mocked use case.
+        """
+        controller = ListUsersController(list_users_use_case=use_case)
+
+        response = controller.route(HttpRequest(query={"limit": "10", "include_total": "true"}))
+
+        assert response.status_code == 200
+        assert decode_cursor(response.body["next_cursor"]) == 42
+        use_case.list_users.assert_called_once_with(after_id=None, limit=10, include_total=True)
+
+    @pytest.mark.parametrize(
+        "query, after_id",
+        [({"cursor": encode_cursor(7)}, 7), ({"after_id": "7"}, 7), ({}, None)],
+    )
+    def test_route_reads_the_page_position(self, use_case: ListUsersUseCaseInterface, query: dict, after_id: int):
+        """
+        Test that the page starts after the cursor or the raw ID.
+
+        Args:
+            use_case (ListUsersUseCaseInterface): The mocked use case.
+            query (dict): The query parameters of the request.
+            after_id (int): The ID the page is expected to start after.
+        """
+        controller = ListUsersController(list_users_use_case=use_case)
+
+        controller.route(HttpRequest(query=query))
+
+        use_case.list_users.assert_called_once_with(after_id=after_id, limit=50, include_total=False)
+
+    @pytest.mark.parametrize(
+        "query", [{"limit": "0"}, {"limit": "501"}, {"limit": "ten"}, {"cursor": "not-a-cursor"}, {"after_id": "x"}]
+    )
+    def test_route_rejects_invalid_parameters(self, use_case: ListUsersUseCaseInterface, query: dict):
+        """
+        Test that invalid page parameters are rejected without querying the use case.
+
+        Args:
+            use_case (ListUsersUseCaseInterface): The mocked use case.
+            query (dict): The query parameters of the request.
+        """
+        controller = ListUsersController(list_users_use_case=use_case)
+
+        response = controller.route(HttpRequest(query=query))
+
+        assert response.status_code == 422
+        use_case.list_users.assert_not_called()
@@ -0,0 +1,56 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from src.domain.use_cases.user.search_users import SearchUsersUseCaseInterface
+from src.presenters.controllers.user.search_users import SearchUsersController
+from src.presenters.helpers.http_types import HttpRequest
+
+
+class TestSearchUsersController:
+    """Test suite for SearchUsersController."""
+
+    @pytest.fixture
+    def use_case(self, mocker: MockerFixture) -> SearchUsersUseCaseInterface:
+        """
+        Fixture that returns a mocked use case finding no user.
+
+        Args:
+            mocker (MockerFixture): Pytest-mock fixture for creating mock objects.
+
+        Returns:
+            use_case (SearchUsersUseCaseInterface): The mocked use case.
+        """
+        use_case = mocker.Mock(spec=SearchUsersUseCaseInterface)
+        use_case.search_users.return_value = {"data": [], "success": True}
+        return use_case
+
+    def test_route_searches_with_the_query_parameters(self, use_case: SearchUsersUseCaseInterface):
+        """
+        Test that the text and the limit are read from the query parameters.
+
+        Args:
+            use_case (SearchUsersUseCaseInterface): The mocked use case.
+        """
+        controller = SearchUsersController(search_users_use_case=use_case)
+
+        response = controller.route(HttpRequest(query={"q": " john ", "limit": "5"}))
+
+        assert response.status_code == 200
+        assert response.body == []
+        use_case.search_users.assert_called_once_with("john", limit=5)
+
+    @pytest.mark.parametrize("query", [{}, {"q": "  "}, {"q": "john", "limit": "0"}, {"q": "john", "limit": "x"}])
+    def test_route_rejects_invalid_parameters(self, use_case: SearchUsersUseCaseInterface, query: dict):
+        """
+        Test that a blank text or an invalid limit is rejected without searching.
+
+        Args:
+            use_case (SearchUsersUseCaseInterface): The mocked use case.
+            query (dict): The query parameters of the request.
+        """
+        controller = SearchUsersController(search_users_use_case=use_case)
+
+        response = controller.route(HttpRequest(query=query))
+
+        assert response.status_code == 422
+        use_case.search_users.assert_not_called()
@@ -0,0 +1,37 @@
+import pytest
+
+from src.presenters.helpers.http_types import HttpRequest, Lazy
+
+
+class TestHttpRequest:
+    """Test cases for the HttpRequest class."""
+
+    def test_lazy_parts_are_read_once_on_first_access(self):
+        """Test that a lazy part is only read when it is used, and then only once."""
+        reads = []
+        http_request = HttpRequest(query=Lazy(lambda: reads.append("query") or {"email": "johndoe@example.com"}))
+
+        assert reads == []
+        assert "lazy" in repr(http_request)
+        assert http_request.query["email"] == "johndoe@example.com"
+        assert http_request.query["email"] == "johndoe@example.com"
+        assert reads == ["query"]
+
+    def test_dictionaries_are_read_only_views(self):
+        """Test that a dictionary is wrapped in a read-only view instead of being copied."""
+        path = {"user_id": 1}
+        http_request = HttpRequest(path=path, body={"name": "John Doe"})
+
+        with pytest.raises(TypeError):
+            http_request.path["user_id"] = 2
+        path["user_id"] = 3
+        assert http_request.path == {"user_id": 3}
+        assert http_request.body == {"name": "John Doe"}
+
+    def test_model_is_carried_as_is(self):
+        """Test that the validated model is passed through untouched, and the missing parts default to None."""
+        model = object()
+        http_request = HttpRequest(model=model)
+
+        assert http_request.model is model
+        assert (http_request.header, http_request.body, http_request.query, http_request.path) == (None,) * 4